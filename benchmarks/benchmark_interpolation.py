@@ -52,3 +52,32 @@ class InterpolationResize:
         .. [1]: https://asv.readthedocs.io/en/stable/writing_benchmarks.html#peak-memory
         """  # noqa
         pass
+
+
+class InterpolationResizeSeparable:
+
+    param_names = ['new_shape', 'kernel', 'dtype']
+    params = [
+        ((500, 800), (2000, 4000), (80, 80, 80), (150, 150, 150)),  # new_shape
+        ('linear', 'cubic', 'lanczos'),  # kernel
+        (np.float32, np.float64),        # dtype
+    ]
+
+    """Benchmark for separable resampling, to compare with `resize`."""
+    def setup(self, new_shape, kernel, dtype):
+        if not hasattr(transform, 'resize_separable'):
+            raise NotImplementedError("resize_separable unavailable")
+        ndim = len(new_shape)
+        if ndim == 2:
+            image = np.random.random((1000, 1000))
+        else:
+            image = np.random.random((100, 100, 100))
+        self.image = image.astype(dtype, copy=False)
+
+    def time_resize_separable(self, new_shape, kernel, dtype):
+        transform.resize_separable(self.image, new_shape, kernel=kernel,
+                                   mode='symmetric')
+
+    def peakmem_resize_separable(self, new_shape, kernel, dtype):
+        transform.resize_separable(self.image, new_shape, kernel=kernel,
+                                   mode='symmetric')
@@ -4,8 +4,9 @@ from ._canny import canny
 from ._cascade import Cascade
 from ._daisy import daisy
 from ._hog import hog
-from .texture import (greycomatrix, greycoprops,
+from .texture import (greycomatrix, greycoprops, greycoprops_map,
                       local_binary_pattern,
+                      multiscale_local_binary_pattern,
                       multiblock_lbp,
                       draw_multiblock_lbp)
 
@@ -18,7 +19,7 @@ from .corner import (corner_kitchen_rosenfeld, corner_harris,
                      hessian_matrix_eigvals, hessian_matrix_det,
                      corner_moravec, corner_orientations,
                      shape_index)
-from .template import match_template
+from .template import match_template, TemplateMatcher
 from .brief import BRIEF
 from .censure import CENSURE
 from .orb import ORB
@@ -26,8 +27,9 @@ from .match import match_descriptors
 from .util import plot_matches
 from .blob import blob_dog, blob_log, blob_doh
 from .haar import (haar_like_feature, haar_like_feature_coord,
-                   draw_haar_like_feature)
-from ._basic_features import multiscale_basic_features
+                   haar_like_feature_batch, draw_haar_like_feature)
+from ._basic_features import (multiscale_basic_features,
+                              multiscale_basic_features_tiles)
 
 
 @deprecated(alt_func='skimage.registration.phase_cross_correlation',
@@ -57,7 +59,9 @@ __all__ = ['canny',
            'hog',
            'greycomatrix',
            'greycoprops',
+           'greycoprops_map',
            'local_binary_pattern',
+           'multiscale_local_binary_pattern',
            'multiblock_lbp',
            'draw_multiblock_lbp',
            'peak_local_max',
@@ -78,6 +82,7 @@ __all__ = ['canny',
            'corner_fast',
            'corner_orientations',
            'match_template',
+           'TemplateMatcher',
            'register_translation',
            'masked_register_translation',
            'BRIEF',
@@ -90,6 +95,8 @@ __all__ = ['canny',
            'blob_log',
            'haar_like_feature',
            'haar_like_feature_coord',
+           'haar_like_feature_batch',
            'draw_haar_like_feature',
            'multiscale_basic_features',
+           'multiscale_basic_features_tiles',
            ]
@@ -15,6 +15,29 @@ def _texture_filter(gaussian_filtered):
     return eigvals
 
 
+def _sigmas(sigma_min, sigma_max, num_sigma):
+    """Gaussian scales used by `multiscale_basic_features`."""
+    if num_sigma is None:
+        num_sigma = int(np.log2(sigma_max) - np.log2(sigma_min) + 1)
+    return np.logspace(
+        np.log2(sigma_min),
+        np.log2(sigma_max),
+        num=num_sigma,
+        base=2,
+        endpoint=True,
+    )
+
+
+def _features_halo(sigma_max, truncate=4.0):
+    """Number of pixels a tile must be extended by on each side so that the
+    features of its inner part do not depend on the tile boundaries.
+
+    This is the radius of the largest Gaussian kernel, plus 2 pixels for the
+    Sobel filter and the second order finite differences of the Hessian.
+    """
+    return int(truncate * sigma_max + 0.5) + 2
+
+
 def _singlescale_basic_features_singlechannel(
     img, sigma, intensity=True, edges=True, texture=True
 ):
@@ -74,15 +97,7 @@ def _mutiscale_basic_features_singlechannel(
     """
     # computations are faster as float32
     img = np.ascontiguousarray(img_as_float32(img))
-    if num_sigma is None:
-        num_sigma = int(np.log2(sigma_max) - np.log2(sigma_min) + 1)
-    sigmas = np.logspace(
-        np.log2(sigma_min),
-        np.log2(sigma_max),
-        num=num_sigma,
-        base=2,
-        endpoint=True,
-    )
+    sigmas = _sigmas(sigma_min, sigma_max, num_sigma)
     with ThreadPoolExecutor(max_workers=num_workers) as ex:
         out_sigmas = list(
             ex.map(
@@ -106,6 +121,9 @@ def multiscale_basic_features(
     sigma_max=16,
     num_sigma=None,
     num_workers=None,
+    *,
+    dtype=np.float64,
+    tile_shape=None,
 ):
     """Local features for a single- or multi-channel nd image.
 
@@ -139,7 +157,15 @@ def multiscale_basic_features(
     num_workers : int or None, optional
         The number of parallel threads to use. If set to ``None``, the full
         set of available cores are used.
-
+    dtype : {np.float64, np.float32}, optional
+        Data type of the output array. Features are computed in single
+        precision, so ``np.float32`` halves the memory footprint without
+        loss of accuracy.
+    tile_shape : tuple of int, optional
+        If given, features are computed tile by tile (see
+        :func:`multiscale_basic_features_tiles`) and written into the
+        output array, so that only the features of one tile are held in
+        memory as temporaries.
 
     Returns
     -------
@@ -155,6 +181,32 @@ def multiscale_basic_features(
         multichannel = False
     if not multichannel:
         image = image[..., np.newaxis]
+
+    n_features = (
+        image.shape[-1]
+        * len(_sigmas(sigma_min, sigma_max, num_sigma))
+        * (int(intensity) + int(edges) + (image.ndim - 1) * int(texture))
+    )
+    features = np.empty(image.shape[:-1] + (n_features,), dtype=dtype)
+
+    if tile_shape is not None:
+        tiles = multiscale_basic_features_tiles(
+            image,
+            tile_shape,
+            multichannel=True,
+            intensity=intensity,
+            edges=edges,
+            texture=texture,
+            sigma_min=sigma_min,
+            sigma_max=sigma_max,
+            num_sigma=num_sigma,
+            num_workers=num_workers,
+            dtype=dtype,
+        )
+        for tile_slices, tile_features in tiles:
+            features[tile_slices] = tile_features
+        return features
+
     all_results = (
         _mutiscale_basic_features_singlechannel(
             image[..., dim],
@@ -168,5 +220,100 @@ def multiscale_basic_features(
         )
         for dim in range(image.shape[-1])
     )
-    features = list(itertools.chain.from_iterable(all_results))
-    return np.stack(features, axis=-1)
+    for i, channel_feature in enumerate(
+            itertools.chain.from_iterable(all_results)):
+        features[..., i] = channel_feature
+    return features
+
+
+def multiscale_basic_features_tiles(
+    image,
+    tile_shape,
+    multichannel=False,
+    intensity=True,
+    edges=True,
+    texture=True,
+    sigma_min=0.5,
+    sigma_max=16,
+    num_sigma=None,
+    num_workers=None,
+    *,
+    dtype=np.float32,
+):
+    """Generate the local features of an image tile by tile.
+
+    Each tile is extended by a halo large enough for the largest Gaussian
+    kernel, so that the features of a tile are the same as those computed
+    on the whole image with :func:`multiscale_basic_features`. Only the
+    features of one tile are held in memory at a time.
+
+    Parameters
+    ----------
+    image : ndarray
+        Input image, which can be grayscale or multichannel. It can be a
+        memory-mapped array.
+    tile_shape : tuple of int
+        Shape of the tiles along the spatial dimensions of `image`. Tiles on
+        the far edges of the image may be smaller.
+    multichannel : bool, default False
+        True if the last dimension corresponds to color channels.
+    intensity, edges, texture, sigma_min, sigma_max, num_sigma, num_workers
+        See :func:`multiscale_basic_features`.
+    dtype : {np.float32, np.float64}, optional
+        Data type of the generated features.
+
+    Yields
+    ------
+    tile_slices : tuple of slice
+        Location of the tile in the spatial dimensions of `image`.
+    features : ndarray
+        Array of shape ``tile.shape + (n_features,)``, the features of the
+        tile.
+
+    Examples
+    --------
+    >>> image = np.random.random((300, 200))
+    >>> out = np.empty(image.shape, dtype=np.float32)
+    >>> for sl, features in multiscale_basic_features_tiles(
+    ...         image, (128, 128), sigma_max=4):
+    ...     out[sl] = features.mean(axis=-1)
+    """
+    if image.ndim < 3:
+        multichannel = False
+    spatial_shape = image.shape[:-1] if multichannel else image.shape
+    tile_shape = tuple(tile_shape)
+    if len(tile_shape) != len(spatial_shape):
+        raise ValueError(
+            "tile_shape must have one entry per spatial dimension of image."
+        )
+
+    halo = _features_halo(sigma_max)
+    tile_starts = itertools.product(
+        *(range(0, n, t) for n, t in zip(spatial_shape, tile_shape))
+    )
+    for starts in tile_starts:
+        tile_slices = tuple(
+            slice(start, min(start + t, n))
+            for start, t, n in zip(starts, tile_shape, spatial_shape)
+        )
+        halo_slices = tuple(
+            slice(max(sl.start - halo, 0), min(sl.stop + halo, n))
+            for sl, n in zip(tile_slices, spatial_shape)
+        )
+        inner_slices = tuple(
+            slice(sl.start - hsl.start, sl.stop - hsl.start)
+            for sl, hsl in zip(tile_slices, halo_slices)
+        )
+        features = multiscale_basic_features(
+            np.asarray(image[halo_slices]),
+            multichannel=multichannel,
+            intensity=intensity,
+            edges=edges,
+            texture=texture,
+            sigma_min=sigma_min,
+            sigma_max=sigma_max,
+            num_sigma=num_sigma,
+            num_workers=num_workers,
+            dtype=dtype,
+        )
+        yield tile_slices, features[inner_slices]
@@ -13,11 +13,11 @@ Original author: Lee Kamentsky
 """
 
 import numpy as np
-import scipy.ndimage as ndi
-from scipy.ndimage import generate_binary_structure, binary_erosion, label
 from ..filters import gaussian
 from .. import dtype_limits, img_as_float
 from .._shared.utils import check_nD
+from ._canny_cy import (_gradient_magnitude, _nonmaximum_suppression,
+                        _hysteresis)
 
 
 def smooth_with_function_and_mask(image, function, mask):
@@ -173,98 +173,29 @@ def canny(image, sigma=1., low_threshold=None, high_threshold=None, mask=None,
     else:
         high_threshold = high_threshold / dtype_max
 
-    if mask is None:
-        mask = np.ones(image.shape, dtype=bool)
-
     def fsmooth(x):
         return img_as_float(gaussian(x, sigma, mode='constant'))
 
-    smoothed = smooth_with_function_and_mask(image, fsmooth, mask)
-    jsobel = ndi.sobel(smoothed, axis=1)
-    isobel = ndi.sobel(smoothed, axis=0)
-    abs_isobel = np.abs(isobel)
-    abs_jsobel = np.abs(jsobel)
-    magnitude = np.hypot(isobel, jsobel)
+    if mask is None:
+        # the bleed-over still has to be computed for the image border
+        bleed_over = fsmooth(np.ones(image.shape))
+        smoothed = fsmooth(image) / (bleed_over + np.finfo(float).eps)
+        mask = np.empty((0, 0), dtype=np.uint8)
+        use_mask = False
+    else:
+        mask = np.ascontiguousarray(mask, dtype=bool)
+        smoothed = smooth_with_function_and_mask(image, fsmooth, mask)
+        mask = mask.view(np.uint8)
+        use_mask = True
+    smoothed = np.ascontiguousarray(smoothed)
+    if smoothed.dtype not in (np.float32, np.float64):
+        smoothed = smoothed.astype(np.float64)
 
     #
-    # Make the eroded mask. Setting the border value to zero will wipe
-    # out the image edges for us.
-    #
-    s = generate_binary_structure(2, 2)
-    eroded_mask = binary_erosion(mask, s, border_value=0)
-    eroded_mask = eroded_mask & (magnitude > 0)
-    #
-    #--------- Find local maxima --------------
+    # Gradient magnitude, computed with the Sobel operators.
     #
-    # Assign each point to have a normal of 0-45 degrees, 45-90 degrees,
-    # 90-135 degrees and 135-180 degrees.
-    #
-    local_maxima = np.zeros(image.shape, bool)
-    #----- 0 to 45 degrees ------
-    pts_plus = (isobel >= 0) & (jsobel >= 0) & (abs_isobel >= abs_jsobel)
-    pts_minus = (isobel <= 0) & (jsobel <= 0) & (abs_isobel >= abs_jsobel)
-    pts = pts_plus | pts_minus
-    pts = eroded_mask & pts
-    # Get the magnitudes shifted left to make a matrix of the points to the
-    # right of pts. Similarly, shift left and down to get the points to the
-    # top right of pts.
-    c1 = magnitude[1:, :][pts[:-1, :]]
-    c2 = magnitude[1:, 1:][pts[:-1, :-1]]
-    m = magnitude[pts]
-    w = abs_jsobel[pts] / abs_isobel[pts]
-    c_plus = c2 * w + c1 * (1 - w) <= m
-    c1 = magnitude[:-1, :][pts[1:, :]]
-    c2 = magnitude[:-1, :-1][pts[1:, 1:]]
-    c_minus = c2 * w + c1 * (1 - w) <= m
-    local_maxima[pts] = c_plus & c_minus
-    #----- 45 to 90 degrees ------
-    # Mix diagonal and vertical
-    #
-    pts_plus = (isobel >= 0) & (jsobel >= 0) & (abs_isobel <= abs_jsobel)
-    pts_minus = (isobel <= 0) & (jsobel <= 0) & (abs_isobel <= abs_jsobel)
-    pts = pts_plus | pts_minus
-    pts = eroded_mask & pts
-    c1 = magnitude[:, 1:][pts[:, :-1]]
-    c2 = magnitude[1:, 1:][pts[:-1, :-1]]
-    m = magnitude[pts]
-    w = abs_isobel[pts] / abs_jsobel[pts]
-    c_plus = c2 * w + c1 * (1 - w) <= m
-    c1 = magnitude[:, :-1][pts[:, 1:]]
-    c2 = magnitude[:-1, :-1][pts[1:, 1:]]
-    c_minus = c2 * w + c1 * (1 - w) <= m
-    local_maxima[pts] = c_plus & c_minus
-    #----- 90 to 135 degrees ------
-    # Mix anti-diagonal and vertical
-    #
-    pts_plus = (isobel <= 0) & (jsobel >= 0) & (abs_isobel <= abs_jsobel)
-    pts_minus = (isobel >= 0) & (jsobel <= 0) & (abs_isobel <= abs_jsobel)
-    pts = pts_plus | pts_minus
-    pts = eroded_mask & pts
-    c1a = magnitude[:, 1:][pts[:, :-1]]
-    c2a = magnitude[:-1, 1:][pts[1:, :-1]]
-    m = magnitude[pts]
-    w = abs_isobel[pts] / abs_jsobel[pts]
-    c_plus = c2a * w + c1a * (1.0 - w) <= m
-    c1 = magnitude[:, :-1][pts[:, 1:]]
-    c2 = magnitude[1:, :-1][pts[:-1, 1:]]
-    c_minus = c2 * w + c1 * (1.0 - w) <= m
-    local_maxima[pts] = c_plus & c_minus
-    #----- 135 to 180 degrees ------
-    # Mix anti-diagonal and anti-horizontal
-    #
-    pts_plus = (isobel <= 0) & (jsobel >= 0) & (abs_isobel >= abs_jsobel)
-    pts_minus = (isobel >= 0) & (jsobel <= 0) & (abs_isobel >= abs_jsobel)
-    pts = pts_plus | pts_minus
-    pts = eroded_mask & pts
-    c1 = magnitude[:-1, :][pts[1:, :]]
-    c2 = magnitude[:-1, 1:][pts[1:, :-1]]
-    m = magnitude[pts]
-    w = abs_jsobel[pts] / abs_isobel[pts]
-    c_plus = c2 * w + c1 * (1 - w) <= m
-    c1 = magnitude[1:, :][pts[:-1, :]]
-    c2 = magnitude[1:, :-1][pts[:-1, 1:]]
-    c_minus = c2 * w + c1 * (1 - w) <= m
-    local_maxima[pts] = c_plus & c_minus
+    magnitude = np.empty_like(smoothed)
+    _gradient_magnitude(smoothed, magnitude)
 
     #
     #---- If use_quantiles is set then calculate the thresholds to use
@@ -274,24 +205,14 @@ def canny(image, sigma=1., low_threshold=None, high_threshold=None, mask=None,
         low_threshold = np.percentile(magnitude, 100.0 * low_threshold)
 
     #
-    #---- Create two masks at the two thresholds.
+    # Find the local maxima in the gradient direction, away from the image
+    # border and the masked pixels, and classify them with the thresholds.
     #
-    high_mask = local_maxima & (magnitude >= high_threshold)
-    low_mask = local_maxima & (magnitude >= low_threshold)
+    local_maxima = np.empty(image.shape, dtype=np.uint8)
+    _nonmaximum_suppression(smoothed, magnitude, mask, use_mask,
+                            low_threshold, high_threshold, local_maxima)
 
     #
-    # Segment the low-mask, then only keep low-segments that have
-    # some high_mask component in them
+    # Only keep the weak edges that are connected to a strong edge.
     #
-    strel = np.ones((3, 3), bool)
-    labels, count = label(low_mask, strel)
-    if count == 0:
-        return low_mask
-
-    sums = (np.array(ndi.sum(high_mask, labels,
-                             np.arange(count, dtype=np.int32) + 1),
-                     copy=False, ndmin=1))
-    good_label = np.zeros((count + 1,), bool)
-    good_label[1:] = sums > 0
-    output_mask = good_label[labels]
-    return output_mask
+    return _hysteresis(local_maxima)
@@ -0,0 +1,261 @@
+#cython: cdivision=True
+#cython: boundscheck=False
+#cython: nonecheck=False
+#cython: wraparound=False
+import numpy as np
+cimport numpy as cnp
+from cython.parallel cimport prange
+from libc.math cimport hypot
+from libc.stdlib cimport malloc, realloc, free
+
+from .._shared.fused_numerics cimport np_floats
+
+cnp.import_array()
+
+
+cdef extern from "math.h" nogil:
+    float hypotf(float x, float y)
+
+
+cdef inline Py_ssize_t _reflect(Py_ssize_t i, Py_ssize_t n) nogil:
+    """Index of a neighbour in ``'reflect'`` mode, as in `ndi.sobel`."""
+    if i < 0:
+        return 0
+    if i >= n:
+        return n - 1
+    return i
+
+
+cdef inline void _sobel(np_floats[:, ::1] image,
+                        Py_ssize_t r, Py_ssize_t c,
+                        np_floats* isobel, np_floats* jsobel) nogil:
+    """Sobel derivatives of a pixel, with the arithmetic of `ndi.sobel`.
+
+    `ndi.sobel` first correlates with [-1, 0, 1] along the derivative axis
+    and then with [1, 2, 1] along the other axis, each pass being computed
+    in double precision and stored in the image type.
+    """
+    cdef:
+        Py_ssize_t rows = image.shape[0]
+        Py_ssize_t cols = image.shape[1]
+        Py_ssize_t rm = _reflect(r - 1, rows)
+        Py_ssize_t rp = _reflect(r + 1, rows)
+        Py_ssize_t cm = _reflect(c - 1, cols)
+        Py_ssize_t cp = _reflect(c + 1, cols)
+        np_floats d_m, d_0, d_p
+
+    d_m = <np_floats>(<double>image[rm, cp] - <double>image[rm, cm])
+    d_0 = <np_floats>(<double>image[r, cp] - <double>image[r, cm])
+    d_p = <np_floats>(<double>image[rp, cp] - <double>image[rp, cm])
+    jsobel[0] = <np_floats>(<double>d_0 * 2 + (<double>d_m + <double>d_p))
+
+    d_m = <np_floats>(<double>image[rp, cm] - <double>image[rm, cm])
+    d_0 = <np_floats>(<double>image[rp, c] - <double>image[rm, c])
+    d_p = <np_floats>(<double>image[rp, cp] - <double>image[rm, cp])
+    isobel[0] = <np_floats>(<double>d_0 * 2 + (<double>d_m + <double>d_p))
+
+
+def _gradient_magnitude(np_floats[:, ::1] image, np_floats[:, ::1] out,
+                        int num_threads=0):
+    """Norm of the Sobel gradient, equal to
+    ``np.hypot(ndi.sobel(image, 0), ndi.sobel(image, 1))``."""
+    cdef:
+        Py_ssize_t rows = image.shape[0]
+        Py_ssize_t cols = image.shape[1]
+        Py_ssize_t r, c
+        np_floats isobel, jsobel
+
+    with nogil:
+        for r in prange(rows, schedule='static', num_threads=num_threads):
+            for c in range(cols):
+                _sobel(image, r, c, &isobel, &jsobel)
+                if np_floats is cnp.float32_t:
+                    out[r, c] = hypotf(isobel, jsobel)
+                else:
+                    out[r, c] = hypot(isobel, jsobel)
+
+
+cdef inline bint _interpolated_maximum(np_floats m, np_floats w,
+                                       np_floats c1_plus, np_floats c2_plus,
+                                       np_floats c1_minus,
+                                       np_floats c2_minus) nogil:
+    """Whether `m` is at least as large as its two interpolated neighbours
+    along the gradient direction."""
+    cdef np_floats one_minus_w = 1 - w
+    cdef np_floats plus = c2_plus * w
+    cdef np_floats minus = c2_minus * w
+    plus = plus + c1_plus * one_minus_w
+    minus = minus + c1_minus * one_minus_w
+    return plus <= m and minus <= m
+
+
+def _nonmaximum_suppression(np_floats[:, ::1] image,
+                            np_floats[:, ::1] magnitude,
+                            cnp.uint8_t[:, ::1] mask, bint use_mask,
+                            double low_threshold, double high_threshold,
+                            cnp.uint8_t[:, ::1] out, int num_threads=0):
+    """Thin the edges and classify the local maxima with the thresholds.
+
+    Parameters
+    ----------
+    image : (M, N) ndarray
+        Smoothed image.
+    magnitude : (M, N) ndarray
+        Gradient magnitude of `image`, see `_gradient_magnitude`.
+    mask : (M, N) ndarray of uint8
+        Pixels to consider, only read when `use_mask` is True. A pixel is
+        only considered when its 8 neighbours are also in the mask.
+    use_mask : bool
+        Whether to use `mask`.
+    low_threshold, high_threshold : float
+        Hysteresis thresholds.
+    out : (M, N) ndarray of uint8
+        Output array, set to 2 for the local maxima above the high threshold,
+        1 for the other local maxima above the low threshold and 0 elsewhere.
+    num_threads : int, optional
+        Maximum number of threads. 0 uses the OpenMP default.
+    """
+    cdef:
+        Py_ssize_t rows = image.shape[0]
+        Py_ssize_t cols = image.shape[1]
+        Py_ssize_t r, c, i, j
+        np_floats isobel, jsobel, abs_isobel, abs_jsobel, m, w
+        bint same_sign, opposite_sign, is_maximum, inside
+        unsigned char code
+
+    with nogil:
+        for r in prange(rows, schedule='static', num_threads=num_threads):
+            for c in range(cols):
+                out[r, c] = 0
+                # the image border is never an edge
+                if r == 0 or c == 0 or r == rows - 1 or c == cols - 1:
+                    continue
+                m = magnitude[r, c]
+                if not m > 0:
+                    continue
+                if use_mask:
+                    # erosion of the mask by a 3x3 square
+                    inside = True
+                    for i in range(r - 1, r + 2):
+                        for j in range(c - 1, c + 2):
+                            if not mask[i, j]:
+                                inside = False
+                    if not inside:
+                        continue
+
+                _sobel(image, r, c, &isobel, &jsobel)
+                abs_isobel = isobel if isobel >= 0 else -isobel
+                abs_jsobel = jsobel if jsobel >= 0 else -jsobel
+                same_sign = ((isobel >= 0 and jsobel >= 0) or
+                             (isobel <= 0 and jsobel <= 0))
+                opposite_sign = ((isobel <= 0 and jsobel >= 0) or
+                                 (isobel >= 0 and jsobel <= 0))
+
+                # When a gradient direction lies between two of the four
+                # sectors, the last one is used.
+                if opposite_sign and abs_isobel >= abs_jsobel:
+                    # 135 to 180 degrees: anti-diagonal and anti-horizontal
+                    w = abs_jsobel / abs_isobel
+                    is_maximum = _interpolated_maximum(
+                        m, w,
+                        magnitude[r - 1, c], magnitude[r - 1, c + 1],
+                        magnitude[r + 1, c], magnitude[r + 1, c - 1])
+                elif opposite_sign and abs_isobel <= abs_jsobel:
+                    # 90 to 135 degrees: anti-diagonal and vertical
+                    w = abs_isobel / abs_jsobel
+                    is_maximum = _interpolated_maximum(
+                        m, w,
+                        magnitude[r, c + 1], magnitude[r - 1, c + 1],
+                        magnitude[r, c - 1], magnitude[r + 1, c - 1])
+                elif same_sign and abs_isobel <= abs_jsobel:
+                    # 45 to 90 degrees: diagonal and vertical
+                    w = abs_isobel / abs_jsobel
+                    is_maximum = _interpolated_maximum(
+                        m, w,
+                        magnitude[r, c + 1], magnitude[r + 1, c + 1],
+                        magnitude[r, c - 1], magnitude[r - 1, c - 1])
+                elif same_sign and abs_isobel >= abs_jsobel:
+                    # 0 to 45 degrees: diagonal and horizontal
+                    w = abs_jsobel / abs_isobel
+                    is_maximum = _interpolated_maximum(
+                        m, w,
+                        magnitude[r + 1, c], magnitude[r + 1, c + 1],
+                        magnitude[r - 1, c], magnitude[r - 1, c - 1])
+                else:
+                    is_maximum = False
+
+                if is_maximum:
+                    code = 0
+                    if m >= <np_floats>low_threshold:
+                        code = 1
+                    if m >= <np_floats>high_threshold:
+                        code = 2
+                    out[r, c] = code
+
+
+def _hysteresis(cnp.uint8_t[:, ::1] maxima):
+    """Keep the weak edges that are 8-connected to a strong edge.
+
+    Parameters
+    ----------
+    maxima : (M, N) ndarray of uint8
+        Output of `_nonmaximum_suppression`.
+
+    Returns
+    -------
+    edges : (M, N) ndarray of bool
+        The binary edge map.
+    """
+    cdef:
+        Py_ssize_t rows = maxima.shape[0]
+        Py_ssize_t cols = maxima.shape[1]
+        Py_ssize_t r, c, i, j, idx
+        Py_ssize_t stack_size = 0
+        Py_ssize_t stack_capacity = 1024
+        Py_ssize_t* stack
+        Py_ssize_t* new_stack
+        cnp.uint8_t[:, ::1] edges
+
+    edges_array = np.zeros((rows, cols), dtype=bool)
+    edges = edges_array.view(np.uint8)
+
+    stack = <Py_ssize_t*>malloc(stack_capacity * sizeof(Py_ssize_t))
+    if stack is NULL:
+        raise MemoryError()
+
+    try:
+        with nogil:
+            for r in range(rows):
+                for c in range(cols):
+                    if maxima[r, c] != 2 or edges[r, c]:
+                        continue
+                    # flood fill the weak edges from this strong edge
+                    edges[r, c] = 1
+                    stack[0] = r * cols + c
+                    stack_size = 1
+                    while stack_size > 0:
+                        stack_size -= 1
+                        idx = stack[stack_size]
+                        for i in range(idx // cols - 1, idx // cols + 2):
+                            if i < 0 or i >= rows:
+                                continue
+                            for j in range(idx % cols - 1, idx % cols + 2):
+                                if (j < 0 or j >= cols or edges[i, j]
+                                        or maxima[i, j] == 0):
+                                    continue
+                                edges[i, j] = 1
+                                if stack_size == stack_capacity:
+                                    stack_capacity *= 2
+                                    new_stack = <Py_ssize_t*>realloc(
+                                        stack,
+                                        stack_capacity * sizeof(Py_ssize_t))
+                                    if new_stack is NULL:
+                                        with gil:
+                                            raise MemoryError()
+                                    stack = new_stack
+                                stack[stack_size] = i * cols + j
+                                stack_size += 1
+    finally:
+        free(stack)
+
+    return edges_array
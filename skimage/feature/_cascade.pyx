@@ -7,8 +7,6 @@
 
 import numpy as np
 cimport numpy as cnp
-cimport safe_openmp as openmp
-from safe_openmp cimport have_openmp
 from libc.stdlib cimport malloc, free
 from libcpp.vector cimport vector
 from skimage._shared.transform cimport integrate
@@ -92,7 +90,7 @@ cdef struct Stage:
 
 cdef vector[Detection] _group_detections(vector[Detection] detections,
                                          cnp.float32_t intersection_score_threshold=0.5,
-                                         int min_neighbour_number=4):
+                                         int min_neighbour_number=4) nogil:
     """Group similar detections into a single detection and eliminate weak
     (non-overlapping) detections.
 
@@ -177,7 +175,7 @@ cdef vector[Detection] _group_detections(vector[Detection] detections,
 
 
 cdef DetectionsCluster update_cluster(DetectionsCluster cluster,
-                                      Detection detection):
+                                      Detection detection) nogil:
     """Updated the cluster by adding new detection.
 
     Updates the cluster by adding new detection to it. The added
@@ -207,7 +205,7 @@ cdef DetectionsCluster update_cluster(DetectionsCluster cluster,
     return updated_cluster
 
 
-cdef Detection mean_detection_from_cluster(DetectionsCluster cluster):
+cdef Detection mean_detection_from_cluster(DetectionsCluster cluster) nogil:
     """Compute the mean detection from the cluster.
 
     Returns the mean detection computed from the all rectangles that
@@ -234,7 +232,7 @@ cdef Detection mean_detection_from_cluster(DetectionsCluster cluster):
     return mean
 
 
-cdef DetectionsCluster cluster_from_detection(Detection detection):
+cdef DetectionsCluster cluster_from_detection(Detection detection) nogil:
     """Create a cluster from a single detection.
 
     Creates a cluster with count one and values that are taken from detection.
@@ -262,7 +260,7 @@ cdef DetectionsCluster cluster_from_detection(Detection detection):
 
 
 cdef vector[DetectionsCluster] threshold_clusters(vector[DetectionsCluster] clusters,
-                                                  int count_threshold):
+                                                  int count_threshold) nogil:
     """Threshold clusters depending on the amount of rectangles in them.
 
     Only the clusters with the amount of rectangles greater than the threshold
@@ -296,7 +294,7 @@ cdef vector[DetectionsCluster] threshold_clusters(vector[DetectionsCluster] clus
     return output
 
 
-cdef vector[Detection] get_mean_detections(vector[DetectionsCluster] clusters):
+cdef vector[Detection] get_mean_detections(vector[DetectionsCluster] clusters) nogil:
     """Computes the mean of each cluster of detections in the array.
 
     Each cluster is replaced with a single detection that represents
@@ -328,7 +326,7 @@ cdef vector[Detection] get_mean_detections(vector[DetectionsCluster] clusters):
     return detections
 
 
-cdef cnp.float32_t rect_intersection_area(Detection rect_a, Detection rect_b):
+cdef cnp.float32_t rect_intersection_area(Detection rect_a, Detection rect_b) nogil:
     """Computes the intersection area of two rectangles.
 
 
@@ -360,7 +358,7 @@ cdef cnp.float32_t rect_intersection_area(Detection rect_a, Detection rect_b):
             fmax(0, fmin(r_a_2, r_b_2) - fmax(r_a_1, r_b_1)))
 
 
-cdef cnp.float32_t rect_intersection_score(Detection rect_a, Detection rect_b):
+cdef cnp.float32_t rect_intersection_score(Detection rect_a, Detection rect_b) nogil:
     """Computes the intersection score of two rectangles.
 
     The score is computed by dividing the intersection area of rectangles
@@ -444,6 +442,7 @@ cdef class Cascade:
         MBLBPStump* stumps
         MBLBP* features
         cnp.uint32_t* LUTs
+        dict _scale_factors_cache
 
     def __dealloc__(self):
 
@@ -469,12 +468,33 @@ cdef class Cascade:
         """
 
         self._load_xml(xml_file, eps)
+        self._scale_factors_cache = {}
 
     cdef bint classify(self, cnp.float32_t[:, ::1] int_img, Py_ssize_t row,
                        Py_ssize_t col, cnp.float32_t scale) nogil:
         """Classify the provided image patch i.e. check if the classifier
         detects an object in the given image patch.
 
+        See `passed_stages` for the description of the parameters.
+
+        Returns
+        -------
+        result : int
+            The binary output that takes only 0 or 1. Gives 1 if the classifier
+            detects the object in specified region and 0 otherwise.
+        """
+
+        return self.passed_stages(int_img, row, col,
+                                  scale) == self.stages_number
+
+    cdef Py_ssize_t passed_stages(self, cnp.float32_t[:, ::1] int_img,
+                                  Py_ssize_t row, Py_ssize_t col,
+                                  cnp.float32_t scale) nogil:
+        """Count the stages of the cascade passed by the provided image patch.
+
+        The patch is rejected by the first stage it does not pass, so that
+        a patch where the object is detected passes all the stages.
+
         The function takes the original window size that is stored in the
         trained file, scales it and places in the specified part of the
         provided image, carries out classification and gives a binary result.
@@ -495,9 +515,9 @@ cdef class Cascade:
 
         Returns
         -------
-        result : int
-            The binary output that takes only 0 or 1. Gives 1 if the classifier
-            detects the object in specified region and 0 otherwise.
+        result : Py_ssize_t
+            The index of the stage that rejected the patch, or the number of
+            stages if the classifier detects the object in the patch.
         """
 
         cdef:
@@ -549,9 +569,9 @@ cdef class Cascade:
 
             if stage_points < (current_stage.threshold - self.eps):
 
-                return False
+                return stage_number
 
-        return True
+        return self.stages_number
 
     def _get_valid_scale_factors(self, min_size, max_size, scale_step):
         """Get the valid scale multipliers for the original window size.
@@ -575,9 +595,15 @@ cdef class Cascade:
         -------
         scale_factors : 1-D cnp.float32_ts ndarray
             The scale factors that give the window sizes that are in the
-            specified interval after multiplying the search window.
+            specified interval after multiplying the search window. They
+            are cached for subsequent calls with the same arguments.
         """
 
+        key = (tuple(min_size), tuple(max_size), scale_step)
+        scale_factors = self._scale_factors_cache.get(key)
+        if scale_factors is not None:
+            return scale_factors
+
         current_size = np.array((self.window_height, self.window_width))
         min_size = np.array(min_size, dtype=np.float32)
         max_size = np.array(max_size, dtype=np.float32)
@@ -594,6 +620,7 @@ cdef class Cascade:
         powers = np.arange(mn, mx)
 
         scale_factors = np.power(scale_step, powers, dtype=np.float32)
+        self._scale_factors_cache[key] = scale_factors
 
         return scale_factors
 
@@ -627,7 +654,9 @@ cdef class Cascade:
     def detect_multi_scale(self, img, cnp.float32_t scale_factor,
                            cnp.float32_t step_ratio, min_size, max_size,
                            min_neighbour_number=4,
-                           intersection_score_threshold=0.5):
+                           intersection_score_threshold=0.5,
+                           num_threads=None,
+                           return_stage_rejections=False):
         """Search for the object on multiple scales of input image.
 
         The function takes the input image, the scale factor by which the
@@ -658,6 +687,14 @@ cdef class Cascade:
             The minimum value of value of ratio
             (intersection area) / (small rectangle ratio) in order to merge
             two detections into one.
+        num_threads : int, optional
+            The maximum number of threads to use. If ``None`` use the OpenMP
+            default value; typically equal to the maximum number of virtual
+            cores.
+        return_stage_rejections : bool, optional
+            If True, also return the number of search windows rejected by
+            each stage of the cascade, which helps choosing `min_size` and
+            `scale_factor` for a good throughput.
 
         Returns
         -------
@@ -666,6 +703,96 @@ cdef class Cascade:
             where 'r' represents row position of top left corner of detected
             window, 'c' - col position, 'width' - width of detected window,
             'height' - height of detected window.
+        stage_rejections : (stages_number + 1,) ndarray of int
+            Only returned if `return_stage_rejections` is True. Element ``i``
+            is the number of windows rejected by stage ``i``; the last
+            element is the number of windows that passed all the stages.
+        """
+
+        int_img = self._get_contiguous_integral_image(img)
+        detections, stage_rejections = self._detect(
+            int_img[np.newaxis], scale_factor, step_ratio, min_size,
+            max_size, min_neighbour_number, intersection_score_threshold,
+            num_threads)
+
+        if return_stage_rejections:
+            return detections[0], stage_rejections
+        return detections[0]
+
+    def detect_multi_scale_batch(self, imgs, cnp.float32_t scale_factor,
+                                 cnp.float32_t step_ratio, min_size, max_size,
+                                 min_neighbour_number=4,
+                                 intersection_score_threshold=0.5,
+                                 num_threads=None,
+                                 return_stage_rejections=False):
+        """Search for the object on multiple scales of a batch of images.
+
+        This is equivalent to calling `detect_multi_scale` on each image,
+        but all the (image, scale) pairs are processed by the same pool of
+        threads and detections of the different images are grouped in
+        parallel.
+
+        Parameters
+        ----------
+        imgs : sequence of 2-D or 3-D ndarrays, or ndarray
+            The input images, all of the same shape. An ndarray is
+            interpreted as a stack of images along its first axis.
+        scale_factor, step_ratio, min_size, max_size, min_neighbour_number,
+        intersection_score_threshold, num_threads
+            See `detect_multi_scale`.
+        return_stage_rejections : bool, optional
+            If True, also return the number of search windows rejected by
+            each stage of the cascade, summed over all images.
+
+        Returns
+        -------
+        output : list of lists of dicts
+            The detections of each image, see `detect_multi_scale`.
+        stage_rejections : (stages_number + 1,) ndarray of int
+            Only returned if `return_stage_rejections` is True. See
+            `detect_multi_scale`.
+        """
+
+        int_imgs = None
+        for frame_number, img in enumerate(imgs):
+            int_img = self._get_contiguous_integral_image(img)
+            if int_imgs is None:
+                int_imgs = np.empty((len(imgs),) + int_img.shape,
+                                    dtype=np.float32)
+            elif int_img.shape != int_imgs.shape[1:]:
+                raise ValueError("All images must have the same shape.")
+            int_imgs[frame_number] = int_img
+
+        if int_imgs is None:
+            detections = []
+            stage_rejections = np.zeros(self.stages_number + 1, dtype=np.intp)
+        else:
+            detections, stage_rejections = self._detect(
+                int_imgs, scale_factor, step_ratio, min_size, max_size,
+                min_neighbour_number, intersection_score_threshold,
+                num_threads)
+
+        if return_stage_rejections:
+            return detections, stage_rejections
+        return detections
+
+    def _detect(self, cnp.float32_t[:, :, ::1] int_imgs,
+                cnp.float32_t scale_factor, cnp.float32_t step_ratio,
+                min_size, max_size, int min_neighbour_number,
+                cnp.float32_t intersection_score_threshold, num_threads):
+        """Detect objects in a stack of integral images.
+
+        Each (image, scale) pair is an independent task. The detections of
+        a task are stored separately and concatenated in task order, so that
+        the result does not depend on the number of threads.
+
+        Returns
+        -------
+        detections : list of lists of dicts
+            The grouped detections of each image.
+        stage_rejections : (stages_number + 1,) ndarray of int
+            The number of windows rejected by each stage, and the number of
+            windows that passed all the stages.
         """
 
         cdef:
@@ -677,40 +804,42 @@ cdef class Cascade:
             Py_ssize_t current_col
             Py_ssize_t current_step
             Py_ssize_t number_of_scales
-            Py_ssize_t img_height
-            Py_ssize_t img_width
+            Py_ssize_t number_of_frames = int_imgs.shape[0]
+            Py_ssize_t img_height = int_imgs.shape[1]
+            Py_ssize_t img_width = int_imgs.shape[2]
             Py_ssize_t scale_number
+            Py_ssize_t frame_number
+            Py_ssize_t task_number
+            Py_ssize_t number_of_tasks
             Py_ssize_t window_height = self.window_height
             Py_ssize_t window_width = self.window_width
-            int result
+            Py_ssize_t stage
+            int n_threads = 0 if num_threads is None else num_threads
             cnp.float32_t[::1] scale_factors
-            cnp.float32_t[:, ::1] int_img
             cnp.float32_t current_scale_factor
-            vector[Detection] output
+            Py_ssize_t[:, ::1] rejections
+            vector[vector[Detection]] task_outputs
+            vector[vector[Detection]] outputs
             Detection new_detection
 
-        int_img = self._get_contiguous_integral_image(img)
-        img_height = int_img.shape[0]
-        img_width = int_img.shape[1]
-
         scale_factors = self._get_valid_scale_factors(min_size,
                                                       max_size, scale_factor)
         number_of_scales = scale_factors.shape[0]
+        number_of_tasks = number_of_frames * number_of_scales
 
-        # Initialize lock to enable thread-safe writes to the array
-        # in concurrent loop.
-        cdef openmp.omp_lock_t mylock
-
-        if have_openmp:
-            openmp.omp_init_lock(&mylock)
-
+        task_outputs.resize(number_of_tasks)
+        outputs.resize(number_of_frames)
+        rejections = np.zeros((max(number_of_tasks, 1),
+                               self.stages_number + 1), dtype=np.intp)
 
         # As the amount of work between the threads is not equal we
         # use `dynamic` schedule which enables them to use computing
         # power on demand.
-        for scale_number in prange(0, number_of_scales,
-                                   schedule='dynamic', nogil=True):
+        for task_number in prange(0, number_of_tasks, schedule='dynamic',
+                                  nogil=True, num_threads=n_threads):
 
+            frame_number = task_number // number_of_scales
+            scale_number = task_number % number_of_scales
             current_scale_factor = scale_factors[scale_number]
             current_step = <Py_ssize_t>round(current_scale_factor * step_ratio)
             current_height = <Py_ssize_t>(window_height * current_scale_factor)
@@ -728,11 +857,12 @@ cdef class Cascade:
             while current_row < max_row:
                 while current_col < max_col:
 
-                    result = self.classify(int_img, current_row,
-                                           current_col,
-                                           scale_factors[scale_number])
+                    stage = self.passed_stages(int_imgs[frame_number],
+                                               current_row, current_col,
+                                               current_scale_factor)
+                    rejections[task_number, stage] += 1
 
-                    if result:
+                    if stage == self.stages_number:
 
                         new_detection = Detection()
                         new_detection.r = current_row
@@ -740,24 +870,27 @@ cdef class Cascade:
                         new_detection.width = current_width
                         new_detection.height = current_height
 
-                        if have_openmp:
-                            openmp.omp_set_lock(&mylock)
-
-                        output.push_back(new_detection)
-
-                        if have_openmp:
-                            openmp.omp_unset_lock(&mylock)
+                        task_outputs[task_number].push_back(new_detection)
 
                     current_col = current_col + current_step
 
                 current_row = current_row + current_step
                 current_col = 0
 
-        if have_openmp:
-            openmp.omp_destroy_lock(&mylock)
-
-        return list(_group_detections(output, intersection_score_threshold,
-                                      min_neighbour_number))
+        for frame_number in prange(number_of_frames, schedule='dynamic',
+                                   nogil=True, num_threads=n_threads):
+            for scale_number in range(number_of_scales):
+                task_number = frame_number * number_of_scales + scale_number
+                outputs[frame_number].insert(
+                    outputs[frame_number].end(),
+                    task_outputs[task_number].begin(),
+                    task_outputs[task_number].end())
+            outputs[frame_number] = _group_detections(
+                outputs[frame_number], intersection_score_threshold,
+                min_neighbour_number)
+
+        detections = [list(output) for output in outputs]
+        return detections, np.asarray(rejections).sum(axis=0)
 
     def _load_xml(self, xml_file, eps=1e-5):
         """Load the parameters of cascade classifier into the class.
@@ -8,6 +8,7 @@ import numpy as np
 
 cimport numpy as cnp
 from libcpp.vector cimport vector
+from cython.parallel cimport prange
 
 from .._shared.fused_numerics cimport np_real_numeric
 from .._shared.transform cimport integrate
@@ -21,6 +22,20 @@ N_RECTANGLE = {'type-2-x': 2, 'type-2-y': 2,
                'type-4': 4}
 
 
+ctypedef fused integral_t:
+    cnp.float32_t
+    cnp.float64_t
+    cnp.int64_t
+    cnp.uint64_t
+
+
+ctypedef fused feature_t:
+    cnp.float32_t
+    cnp.float64_t
+    cnp.int32_t
+    cnp.int64_t
+
+
 cdef vector[vector[Rectangle]] _haar_like_feature_coord(
     Py_ssize_t width,
     Py_ssize_t height,
@@ -177,6 +192,134 @@ tuple coord
     return output, np.array([feature_type] * n_feature, dtype=object)
 
 
+cpdef haar_like_feature_coord_compact(width, height, feature_type):
+    """Compute the coordinates of Haar-like features as an integer array.
+
+    Parameters
+    ----------
+    width : int
+        Width of the detection window.
+    height : int
+        Height of the detection window.
+    feature_type : str
+        The type of feature to consider, see `haar_like_feature_coord_wrapper`.
+
+    Returns
+    -------
+    coord : (n_features, 4, 4) ndarray of intp
+        ``coord[f, i]`` holds the top-left row and column and the
+        bottom-right row and column of the i-th rectangle of feature ``f``.
+        Only the first ``N_RECTANGLE[feature_type]`` rectangles are set.
+    """
+    cdef:
+        vector[vector[Rectangle]] rect
+        Py_ssize_t n_rectangle, n_feature
+        Py_ssize_t i, j
+        Py_ssize_t[:, :, ::1] coord
+
+    rect = _haar_like_feature_coord(width, height,
+                                    FEATURE_TYPE[feature_type])
+    n_feature = rect[0].size()
+    n_rectangle = rect.size()
+
+    coord_array = np.zeros((n_feature, 4, 4), dtype=np.intp)
+    coord = coord_array
+    for j in range(n_feature):
+        for i in range(n_rectangle):
+            coord[j, i, 0] = rect[i][j].top_left.row
+            coord[j, i, 1] = rect[i][j].top_left.col
+            coord[j, i, 2] = rect[i][j].bottom_right.row
+            coord[j, i, 3] = rect[i][j].bottom_right.col
+
+    return coord_array
+
+
+cdef inline integral_t _integrate_window(integral_t[:, :, ::1] sat,
+                                         Py_ssize_t k,
+                                         Py_ssize_t r, Py_ssize_t c,
+                                         Py_ssize_t r0, Py_ssize_t c0,
+                                         Py_ssize_t r1, Py_ssize_t c1) nogil:
+    """Same as `integrate` on ``sat[k, r:, c:]``, without the copy."""
+    cdef integral_t S = 0
+
+    S += sat[k, r + r1, c + c1]
+
+    if (r0 - 1 >= 0) and (c0 - 1 >= 0):
+        S += sat[k, r + r0 - 1, c + c0 - 1]
+
+    if (r0 - 1 >= 0):
+        S -= sat[k, r + r0 - 1, c + c1]
+
+    if (c0 - 1 >= 0):
+        S -= sat[k, r + r1, c + c0 - 1]
+
+    return S
+
+
+def _haar_like_feature_batch(integral_t[:, :, ::1] int_images,
+                             const Py_ssize_t[::1] image_idx,
+                             const Py_ssize_t[::1] rows,
+                             const Py_ssize_t[::1] cols,
+                             const Py_ssize_t[:, :, ::1] coord,
+                             const Py_ssize_t[::1] n_rectangles,
+                             feature_t[:, ::1] out, int num_threads=0):
+    """Evaluate Haar-like features for many windows in parallel.
+
+    Parameters
+    ----------
+    int_images : (K, M, N) ndarray
+        Integral images.
+    image_idx : (W,) ndarray
+        Index in `int_images` of the integral image of each window.
+    rows, cols : (W,) ndarray
+        Top-left corner of each window.
+    coord : (F, 4, 4) ndarray
+        Rectangles of each feature, see `haar_like_feature_coord_compact`.
+    n_rectangles : (F,) ndarray
+        Number of rectangles of each feature.
+    out : (W, F) ndarray
+        Output array.
+    num_threads : int, optional
+        Maximum number of threads. 0 uses the OpenMP default.
+    """
+    cdef:
+        Py_ssize_t n_windows = out.shape[0]
+        Py_ssize_t n_features = out.shape[1]
+        Py_ssize_t idx, w, f, i, k, r, c
+        integral_t rect
+        double value_float
+        cnp.int64_t value_int
+
+    for idx in prange(n_windows * n_features, nogil=True, schedule='static',
+                      num_threads=num_threads):
+        w = idx // n_features
+        f = idx % n_features
+        k = image_idx[w]
+        r = rows[w]
+        c = cols[w]
+        value_float = 0
+        value_int = 0
+        # the rectangles with odd indices are the positive ones
+        for i in range(n_rectangles[f]):
+            rect = _integrate_window(int_images, k, r, c,
+                                     coord[f, i, 0], coord[f, i, 1],
+                                     coord[f, i, 2], coord[f, i, 3])
+            if integral_t is cnp.float32_t or integral_t is cnp.float64_t:
+                if i % 2:
+                    value_float = value_float + rect
+                else:
+                    value_float = value_float - rect
+            else:
+                if i % 2:
+                    value_int = value_int + <cnp.int64_t>rect
+                else:
+                    value_int = value_int - <cnp.int64_t>rect
+        if integral_t is cnp.float32_t or integral_t is cnp.float64_t:
+            out[w, f] = <feature_t>value_float
+        else:
+            out[w, f] = <feature_t>value_int
+
+
 cdef np_real_numeric[:, ::1] _haar_like_feature(
         np_real_numeric[:, ::1] int_image,
         vector[vector[Rectangle]] coord,
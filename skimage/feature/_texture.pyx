@@ -4,7 +4,10 @@
 #cython: wraparound=False
 import numpy as np
 cimport numpy as cnp
-from libc.math cimport sin, cos, abs
+from libc.math cimport sin, cos, abs, sqrt
+from libc.stdlib cimport malloc, free
+from libc.string cimport memset
+from cython.parallel cimport prange, parallel
 from .._shared.interpolation cimport bilinear_interpolation, round
 from .._shared.transform cimport integrate
 
@@ -71,6 +74,175 @@ def _glcm_loop(any_int[:, ::1] image, double[:] distances,
                             out[i, j, d_idx, a_idx] += 1
 
 
+cdef inline void _glcm_pair_update(Py_ssize_t i, Py_ssize_t j,
+                                   Py_ssize_t levels, Py_ssize_t sign,
+                                   cnp.int64_t* sums, double* homogeneity,
+                                   cnp.int64_t* hist) nogil:
+    """Add (``sign=1``) or remove (``sign=-1``) one pair from the running
+    co-occurrence statistics of a window.
+
+    ``sums`` holds, in order, the number of pairs and the sums of ``i``,
+    ``j``, ``i**2``, ``j**2``, ``i*j``, ``(i-j)**2`` and ``|i-j|``. If
+    ``hist`` is not NULL, it is the flat ``levels x levels`` co-occurrence
+    histogram and ``sums[8]`` holds the sum of its squared counts.
+    """
+    cdef Py_ssize_t diff = i - j
+    cdef Py_ssize_t idx
+    sums[0] += sign
+    sums[1] += sign * i
+    sums[2] += sign * j
+    sums[3] += sign * i * i
+    sums[4] += sign * j * j
+    sums[5] += sign * i * j
+    sums[6] += sign * diff * diff
+    sums[7] += sign * (diff if diff >= 0 else -diff)
+    homogeneity[0] += sign / (1. + diff * diff)
+    if hist != NULL:
+        idx = i * levels + j
+        # (c + 1) ** 2 - c ** 2 = 2 * c + 1 and c ** 2 - (c - 1) ** 2 = 2 * c - 1
+        if sign > 0:
+            sums[8] += 2 * hist[idx] + 1
+        else:
+            sums[8] -= 2 * hist[idx] - 1
+        hist[idx] += sign
+
+
+cdef inline void _glcm_column_update(any_int[:, ::1] image, Py_ssize_t col,
+                                     Py_ssize_t row_start,
+                                     Py_ssize_t row_end,
+                                     Py_ssize_t offset_row,
+                                     Py_ssize_t offset_col,
+                                     Py_ssize_t levels, bint symmetric,
+                                     Py_ssize_t sign, cnp.int64_t* sums,
+                                     double* homogeneity,
+                                     cnp.int64_t* hist) nogil:
+    """Add or remove all pairs whose first pixel lies in one column segment."""
+    cdef Py_ssize_t r, i, j
+    for r in range(row_start, row_end):
+        i = image[r, col]
+        j = image[r + offset_row, col + offset_col]
+        _glcm_pair_update(i, j, levels, sign, sums, homogeneity, hist)
+        if symmetric:
+            _glcm_pair_update(j, i, levels, sign, sums, homogeneity, hist)
+
+
+def _glcm_props_map(any_int[:, ::1] image, Py_ssize_t window_size,
+                    double distance, double angle, Py_ssize_t levels,
+                    bint symmetric, bint compute_asm,
+                    double[:, :, ::1] out, int num_threads=0):
+    """Compute GLCM properties for every window of an image.
+
+    The co-occurrence statistics are updated incrementally as the window
+    slides along each row: only the pairs whose first pixel enters or leaves
+    the window are added or removed. Rows of windows are processed in
+    parallel.
+
+    Parameters
+    ----------
+    image : ndarray
+        Integer typed input image with values in [0, `levels`-1].
+    window_size : int
+        Side length of the square windows.
+    distance : float
+        Pixel pair distance offset.
+    angle : float
+        Pixel pair angle in radians.
+    levels : int
+        Number of grey-levels.
+    symmetric : bool
+        Whether to accumulate both (i, j) and (j, i) for each pair.
+    compute_asm : bool
+        Whether to maintain the co-occurrence histogram needed for the
+        'ASM' and 'energy' properties. If False, these are set to 0.
+    out : (M, N, 6) ndarray
+        Output array, with ``M = rows - window_size + 1`` and
+        ``N = cols - window_size + 1``. On output, the last axis holds
+        'contrast', 'dissimilarity', 'homogeneity', 'ASM', 'energy' and
+        'correlation'.
+    num_threads : int, optional
+        Maximum number of threads. 0 uses the OpenMP default.
+
+    """
+    cdef:
+        Py_ssize_t offset_row = round(sin(angle) * distance)
+        Py_ssize_t offset_col = round(cos(angle) * distance)
+        # pair start positions relative to the top-left corner of a window
+        Py_ssize_t start_row = max(0, -offset_row)
+        Py_ssize_t end_row = min(window_size, window_size - offset_row)
+        Py_ssize_t start_col = max(0, -offset_col)
+        Py_ssize_t end_col = min(window_size, window_size - offset_col)
+        Py_ssize_t out_rows = out.shape[0]
+        Py_ssize_t out_cols = out.shape[1]
+        Py_ssize_t r, c, cc
+        cnp.int64_t* hist
+        cnp.int64_t* sums
+        double homogeneity, n, var_i, var_j, cov, std_i, std_j, asm
+        # number of rows skipped by threads that could not allocate buffers
+        Py_ssize_t failed = 0
+
+    if end_row <= start_row or end_col <= start_col:
+        # no pair fits into a window: match `greycoprops` on an empty GLCM
+        out[:, :, :] = 0
+        out[:, :, 5] = 1
+        return
+
+    with nogil, parallel(num_threads=num_threads):
+        sums = <cnp.int64_t*>malloc(9 * sizeof(cnp.int64_t))
+        hist = NULL
+        if compute_asm:
+            hist = <cnp.int64_t*>malloc(levels * levels *
+                                        sizeof(cnp.int64_t))
+        for r in prange(out_rows, schedule='dynamic'):
+            if sums == NULL or (compute_asm and hist == NULL):
+                failed += 1
+                continue
+            memset(sums, 0, 9 * sizeof(cnp.int64_t))
+            homogeneity = 0
+            if hist != NULL:
+                memset(hist, 0, levels * levels * sizeof(cnp.int64_t))
+            for cc in range(start_col, end_col):
+                _glcm_column_update(image, cc, r + start_row, r + end_row,
+                                    offset_row, offset_col, levels,
+                                    symmetric, 1, sums, &homogeneity, hist)
+            for c in range(out_cols):
+                if c > 0:
+                    _glcm_column_update(image, c - 1 + start_col,
+                                        r + start_row, r + end_row,
+                                        offset_row, offset_col, levels,
+                                        symmetric, -1, sums, &homogeneity,
+                                        hist)
+                    _glcm_column_update(image, c - 1 + end_col,
+                                        r + start_row, r + end_row,
+                                        offset_row, offset_col, levels,
+                                        symmetric, 1, sums, &homogeneity,
+                                        hist)
+                n = <double>sums[0]
+                out[r, c, 0] = sums[6] / n
+                out[r, c, 1] = sums[7] / n
+                out[r, c, 2] = homogeneity / n
+                if hist != NULL:
+                    asm = sums[8] / (n * n)
+                    out[r, c, 3] = asm
+                    out[r, c, 4] = sqrt(asm)
+                else:
+                    out[r, c, 3] = 0
+                    out[r, c, 4] = 0
+                var_i = (n * sums[3] - <double>sums[1] * sums[1]) / (n * n)
+                var_j = (n * sums[4] - <double>sums[2] * sums[2]) / (n * n)
+                cov = (n * sums[5] - <double>sums[1] * sums[2]) / (n * n)
+                std_i = sqrt(var_i) if var_i > 0 else 0
+                std_j = sqrt(var_j) if var_j > 0 else 0
+                if std_i < 1e-15 or std_j < 1e-15:
+                    out[r, c, 5] = 1
+                else:
+                    out[r, c, 5] = cov / (std_i * std_j)
+        free(hist)
+        free(sums)
+
+    if failed:
+        raise MemoryError('could not allocate the co-occurrence histograms')
+
+
 cdef inline int _bit_rotate_right(int value, int length) nogil:
     """Cyclic bit shift to the right.
 
@@ -85,6 +257,155 @@ cdef inline int _bit_rotate_right(int value, int length) nogil:
     return (value >> 1) | ((value & 1) << (length - 1))
 
 
+# Largest number of sampling points for which the 'ror', 'uniform' and
+# 'nri_uniform' mappings are tabulated (the table has 2 ** P entries).
+DEF LBP_LUT_MAX_P = 16
+
+
+cdef double _lbp_map_code(signed char* signed_texture, Py_ssize_t P,
+                          char method) nogil:
+    """Map a thresholded neighbourhood to its LBP code.
+
+    Parameters
+    ----------
+    signed_texture : (P,) array
+        Thresholded neighbour values (0 or 1).
+    P : int
+        Number of circularly symmetric neighbour set points.
+    method : {'D', 'R', 'U', 'N'}
+        Method to determine the pattern, see `_local_binary_pattern`.
+
+    Returns
+    -------
+    lbp : double
+        The LBP code.
+    """
+    cdef Py_ssize_t changes, i, rot_index, n_ones
+    cdef cnp.int8_t first_zero, first_one
+    cdef int rotated, code = 0
+    cdef double lbp = 0
+
+    # if method == b'uniform':
+    if method == b'U' or method == b'N':
+        # determine number of 0 - 1 changes
+        changes = 0
+        for i in range(P - 1):
+            changes += (signed_texture[i] - signed_texture[i + 1]) != 0
+        if method == b'N':
+            # Uniform local binary patterns are defined as patterns
+            # with at most 2 value changes (from 0 to 1 or from 1 to
+            # 0). Uniform patterns can be characterized by their
+            # number `n_ones` of 1.  The possible values for
+            # `n_ones` range from 0 to P.
+            #
+            # Here is an example for P = 4:
+            # n_ones=0: 0000
+            # n_ones=1: 0001, 1000, 0100, 0010
+            # n_ones=2: 0011, 1001, 1100, 0110
+            # n_ones=3: 0111, 1011, 1101, 1110
+            # n_ones=4: 1111
+            #
+            # For a pattern of size P there are 2 constant patterns
+            # corresponding to n_ones=0 and n_ones=P. For each other
+            # value of `n_ones` , i.e n_ones=[1..P-1], there are P
+            # possible patterns which are related to each other
+            # through circular permutations. The total number of
+            # uniform patterns is thus (2 + P * (P - 1)).
+
+            # Given any pattern (uniform or not) we must be able to
+            # associate a unique code:
+            #
+            # 1. Constant patterns patterns (with n_ones=0 and
+            # n_ones=P) and non uniform patterns are given fixed
+            # code values.
+            #
+            # 2. Other uniform patterns are indexed considering the
+            # value of n_ones, and an index called 'rot_index'
+            # reprenting the number of circular right shifts
+            # required to obtain the pattern starting from a
+            # reference position (corresponding to all zeros stacked
+            # on the right). This number of rotations (or circular
+            # right shifts) 'rot_index' is efficiently computed by
+            # considering the positions of the first 1 and the first
+            # 0 found in the pattern.
+
+            if changes <= 2:
+                # We have a uniform pattern
+                n_ones = 0  # determines the number of ones
+                first_one = -1  # position was the first one
+                first_zero = -1  # position of the first zero
+                for i in range(P):
+                    if signed_texture[i]:
+                        n_ones += 1
+                        if first_one == -1:
+                            first_one = i
+                    else:
+                        if first_zero == -1:
+                            first_zero = i
+                if n_ones == 0:
+                    lbp = 0
+                elif n_ones == P:
+                    lbp = P * (P - 1) + 1
+                else:
+                    if first_one == 0:
+                        rot_index = n_ones - first_zero
+                    else:
+                        rot_index = P - first_one
+                    lbp = 1 + (n_ones - 1) * P + rot_index
+            else:  # changes > 2
+                lbp = P * (P - 1) + 2
+        else:  # method != 'N'
+            if changes <= 2:
+                for i in range(P):
+                    lbp += signed_texture[i]
+            else:
+                lbp = P + 1
+    else:
+        # method == b'default'
+        for i in range(P):
+            code |= signed_texture[i] << i
+
+        # method == b'ror'
+        if method == b'R':
+            # shift LBP P times to the right and get minimum value
+            rotated = code
+            for i in range(1, P):
+                rotated = _bit_rotate_right(rotated, P)
+                code = min(code, rotated)
+        lbp = code
+
+    return lbp
+
+
+def _lbp_lookup_table(int P, char method):
+    """Tabulate the LBP code of every thresholded neighbourhood.
+
+    Parameters
+    ----------
+    P : int
+        Number of circularly symmetric neighbour set points.
+    method : {'D', 'R', 'U', 'N'}
+        Method to determine the pattern, see `_local_binary_pattern`.
+
+    Returns
+    -------
+    lut : (2 ** P,) array
+        ``lut[code]`` is the LBP value of the pattern whose i-th neighbour is
+        above the center if and only if bit i of ``code`` is set.
+    """
+    cdef double[::1] lut = np.empty(1 << P, dtype=np.double)
+    cdef signed char[::1] signed_texture = np.zeros(P, dtype=np.int8)
+    cdef Py_ssize_t code, i
+
+    with nogil:
+        for code in range(1 << P):
+            for i in range(P):
+                signed_texture[i] = (code >> i) & 1
+            lut[code] = _lbp_map_code(&signed_texture[0], P, method)
+
+    return np.asarray(lut)
+
+
 def _local_binary_pattern(double[:, ::1] image,
                           int P, float R, char method=b'D'):
     """Gray scale and rotation invariant LBP (Local Binary Patterns).
@@ -114,159 +435,166 @@ def _local_binary_pattern(double[:, ::1] image,
     output : (N, M) array
         LBP image.
     """
+    output = _multiscale_local_binary_pattern(
+        image, np.array([P], dtype=np.int32), np.array([R], dtype=np.double),
+        method)
+    return output[0]
 
-    # texture weights
-    cdef int[::1] weights = 2 ** np.arange(P, dtype=np.int32)
-    # local position of texture elements
-    rr = - R * np.sin(2 * np.pi * np.arange(P, dtype=np.double) / P)
-    cc = R * np.cos(2 * np.pi * np.arange(P, dtype=np.double) / P)
-    cdef double[::1] rp = np.round(rr, 5)
-    cdef double[::1] cp = np.round(cc, 5)
 
-    # pre-allocate arrays for computation
-    cdef double[::1] texture = np.zeros(P, dtype=np.double)
-    cdef signed char[::1] signed_texture = np.zeros(P, dtype=np.int8)
-    cdef int[::1] rotation_chain = np.zeros(P, dtype=np.int32)
+def _multiscale_local_binary_pattern(double[:, ::1] image, int[::1] Ps,
+                                     double[::1] Rs, char method=b'D'):
+    """LBP images for several (P, R) settings in one pass over the image.
 
-    output_shape = (image.shape[0], image.shape[1])
-    cdef double[:, ::1] output = np.zeros(output_shape, dtype=np.double)
+    The sampling offsets of every setting are computed once, and pixels
+    whose neighbours all lie inside the image are interpolated without
+    boundary checks. For the 'ror', 'uniform' and 'nri_uniform'
+    methods, the mapping from thresholded neighbourhoods to codes is read
+    from a lookup table when ``P <= 16``.
 
+    Parameters
+    ----------
+    image : (N, M) double array
+        Graylevel image.
+    Ps : (S,) int array
+        Number of circularly symmetric neighbour set points of each setting.
+    Rs : (S,) double array
+        Radius of circle of each setting.
+    method : {'D', 'R', 'U', 'N', 'V'}
+        Method to determine the pattern, see `_local_binary_pattern`.
+
+    Returns
+    -------
+    output : (S, N, M) array
+        LBP image of each setting.
+    """
+    cdef Py_ssize_t n_scales = Ps.shape[0]
+    cdef Py_ssize_t max_P = np.max(Ps)
     cdef Py_ssize_t rows = image.shape[0]
     cdef Py_ssize_t cols = image.shape[1]
 
-    cdef double lbp
-    cdef Py_ssize_t r, c, changes, i
-    cdef Py_ssize_t rot_index, n_ones
-    cdef cnp.int8_t first_zero, first_one
+    # The neighbours of all settings are stored contiguously in the arrays
+    # below, those of setting `s` starting at `start[s]`.
+    cdef Py_ssize_t[::1] start = np.concatenate(
+        ([0], np.cumsum(Ps))).astype(np.intp)
+
+    # local position of texture elements
+    rr = []
+    cc = []
+    for P, R in zip(np.asarray(Ps), np.asarray(Rs)):
+        angles = 2 * np.pi * np.arange(P, dtype=np.double) / P
+        rr.append(np.round(- R * np.sin(angles), 5))
+        cc.append(np.round(R * np.cos(angles), 5))
+
+    # margins within which all neighbours of a setting are inside the image
+    cdef Py_ssize_t[::1] margin_r = np.array(
+        [np.ceil(np.abs(x).max()) for x in rr], dtype=np.intp)
+    cdef Py_ssize_t[::1] margin_c = np.array(
+        [np.ceil(np.abs(x).max()) for x in cc], dtype=np.intp)
+
+    rr = np.concatenate(rr)
+    cc = np.concatenate(cc)
+    cdef double[::1] rp = rr
+    cdef double[::1] cp = cc
+    # bilinear interpolation offsets relative to the center
+    cdef Py_ssize_t[::1] r_lo = np.floor(rr).astype(np.intp)
+    cdef Py_ssize_t[::1] r_hi = np.ceil(rr).astype(np.intp)
+    cdef Py_ssize_t[::1] c_lo = np.floor(cc).astype(np.intp)
+    cdef Py_ssize_t[::1] c_hi = np.ceil(cc).astype(np.intp)
+
+    # lookup tables of the code mappings, concatenated over settings
+    cdef unsigned char[::1] scale_use_lut = np.zeros(n_scales, dtype=np.uint8)
+    cdef Py_ssize_t[::1] lut_start = np.zeros(n_scales, dtype=np.intp)
+    luts = []
+    lut_size = 0
+    if method != b'D' and method != b'V':
+        for scale, P in enumerate(np.asarray(Ps)):
+            if P <= LBP_LUT_MAX_P:
+                scale_use_lut[scale] = 1
+                lut_start[scale] = lut_size
+                luts.append(_lbp_lookup_table(P, method))
+                lut_size += 1 << P
+
+    cdef double[::1] lut = np.concatenate(luts) if luts else np.empty(0)
+
+    # pre-allocate arrays for computation
+    cdef double[::1] texture = np.zeros(max_P, dtype=np.double)
+    cdef signed char[::1] signed_texture = np.zeros(max_P, dtype=np.int8)
+
+    output_shape = (n_scales, rows, cols)
+    cdef double[:, :, ::1] output = np.zeros(output_shape, dtype=np.double)
+
+    cdef double lbp, center, top, bottom, dr, dc
+    cdef double* row_lo
+    cdef double* row_hi
+    cdef Py_ssize_t r, c, i, k, s_idx, n, code
 
     # To compute the variance features
     cdef double sum_, var_, texture_i
 
     with nogil:
-        for r in range(image.shape[0]):
-            for c in range(image.shape[1]):
-                for i in range(P):
-                    bilinear_interpolation[cnp.float64_t, double, double](
-                            &image[0, 0], rows, cols, r + rp[i], c + cp[i],
-                            b'C', 0, &texture[i])
-                # signed / thresholded texture
-                for i in range(P):
-                    if texture[i] - image[r, c] >= 0:
-                        signed_texture[i] = 1
+        for r in range(rows):
+            for c in range(cols):
+                center = image[r, c]
+                for s_idx in range(n_scales):
+                    n = start[s_idx + 1] - start[s_idx]
+                    if (margin_r[s_idx] <= r < rows - margin_r[s_idx] and
+                            margin_c[s_idx] <= c < cols - margin_c[s_idx]):
+                        for i in range(n):
+                            k = start[s_idx] + i
+                            # same rounding as `bilinear_interpolation`
+                            dr = (r + rp[k]) - <double>(r + r_lo[k])
+                            dc = (c + cp[k]) - <double>(c + c_lo[k])
+                            row_lo = &image[r + r_lo[k], 0]
+                            row_hi = &image[r + r_hi[k], 0]
+                            top = ((1 - dc) * row_lo[c + c_lo[k]]
+                                   + dc * row_lo[c + c_hi[k]])
+                            bottom = ((1 - dc) * row_hi[c + c_lo[k]]
+                                      + dc * row_hi[c + c_hi[k]])
+                            texture[i] = (1 - dr) * top + dr * bottom
                     else:
-                        signed_texture[i] = 0
-
-                lbp = 0
-
-                # if method == b'var':
-                if method == b'V':
-                    # Compute the variance without passing from numpy.
-                    # Following the LBP paper, we're taking a biased estimate
-                    # of the variance (ddof=0)
-                    sum_ = 0.0
-                    var_ = 0.0
-                    for i in range(P):
-                        texture_i = texture[i]
-                        sum_ += texture_i
-                        var_ += texture_i * texture_i
-                    var_ = (var_ - (sum_ * sum_) / P) / P
-                    if var_ != 0:
-                        lbp = var_
+                        for i in range(n):
+                            k = start[s_idx] + i
+                            bilinear_interpolation[cnp.float64_t, double,
+                                                   double](
+                                &image[0, 0], rows, cols, r + rp[k],
+                                c + cp[k], b'C', 0, &texture[i])
+
+                    # if method == b'var':
+                    if method == b'V':
+                        # Compute the variance without passing from numpy.
+                        # Following the LBP paper, we're taking a biased
+                        # estimate of the variance (ddof=0)
+                        sum_ = 0.0
+                        var_ = 0.0
+                        for i in range(n):
+                            texture_i = texture[i]
+                            sum_ += texture_i
+                            var_ += texture_i * texture_i
+                        var_ = (var_ - (sum_ * sum_) / n) / n
+                        if var_ != 0:
+                            lbp = var_
+                        else:
+                            lbp = NAN
+                    elif method == b'D' or scale_use_lut[s_idx]:
+                        # signed / thresholded texture, packed into bits
+                        code = 0
+                        for i in range(n):
+                            if texture[i] - center >= 0:
+                                code |= (<Py_ssize_t>1) << i
+                        if method == b'D':
+                            lbp = code
+                        else:
+                            lbp = lut[lut_start[s_idx] + code]
                     else:
-                        lbp = NAN
-                # if method == b'uniform':
-                elif method == b'U' or method == b'N':
-                    # determine number of 0 - 1 changes
-                    changes = 0
-                    for i in range(P - 1):
-                        changes += (signed_texture[i]
-                                    - signed_texture[i + 1]) != 0
-                    if method == b'N':
-                        # Uniform local binary patterns are defined as patterns
-                        # with at most 2 value changes (from 0 to 1 or from 1 to
-                        # 0). Uniform patterns can be characterized by their
-                        # number `n_ones` of 1.  The possible values for
-                        # `n_ones` range from 0 to P.
-                        #
-                        # Here is an example for P = 4:
-                        # n_ones=0: 0000
-                        # n_ones=1: 0001, 1000, 0100, 0010
-                        # n_ones=2: 0011, 1001, 1100, 0110
-                        # n_ones=3: 0111, 1011, 1101, 1110
-                        # n_ones=4: 1111
-                        #
-                        # For a pattern of size P there are 2 constant patterns
-                        # corresponding to n_ones=0 and n_ones=P. For each other
-                        # value of `n_ones` , i.e n_ones=[1..P-1], there are P
-                        # possible patterns which are related to each other
-                        # through circular permutations. The total number of
-                        # uniform patterns is thus (2 + P * (P - 1)).
-
-                        # Given any pattern (uniform or not) we must be able to
-                        # associate a unique code:
-                        #
-                        # 1. Constant patterns patterns (with n_ones=0 and
-                        # n_ones=P) and non uniform patterns are given fixed
-                        # code values.
-                        #
-                        # 2. Other uniform patterns are indexed considering the
-                        # value of n_ones, and an index called 'rot_index'
-                        # reprenting the number of circular right shifts
-                        # required to obtain the pattern starting from a
-                        # reference position (corresponding to all zeros stacked
-                        # on the right). This number of rotations (or circular
-                        # right shifts) 'rot_index' is efficiently computed by
-                        # considering the positions of the first 1 and the first
-                        # 0 found in the pattern.
-
-                        if changes <= 2:
-                            # We have a uniform pattern
-                            n_ones = 0  # determines the number of ones
-                            first_one = -1  # position was the first one
-                            first_zero = -1  # position of the first zero
-                            for i in range(P):
-                                if signed_texture[i]:
-                                    n_ones += 1
-                                    if first_one == -1:
-                                        first_one = i
-                                else:
-                                    if first_zero == -1:
-                                        first_zero = i
-                            if n_ones == 0:
-                                lbp = 0
-                            elif n_ones == P:
-                                lbp = P * (P - 1) + 1
+                        # signed / thresholded texture
+                        for i in range(n):
+                            if texture[i] - center >= 0:
+                                signed_texture[i] = 1
                             else:
-                                if first_one == 0:
-                                    rot_index = n_ones - first_zero
-                                else:
-                                    rot_index = P - first_one
-                                lbp = 1 + (n_ones - 1) * P + rot_index
-                        else:  # changes > 2
-                            lbp = P * (P - 1) + 2
-                    else:  # method != 'N'
-                        if changes <= 2:
-                            for i in range(P):
-                                lbp += signed_texture[i]
-                        else:
-                            lbp = P + 1
-                else:
-                    # method == b'default'
-                    for i in range(P):
-                        lbp += signed_texture[i] * weights[i]
-
-                    # method == b'ror'
-                    if method == b'R':
-                        # shift LBP P times to the right and get minimum value
-                        rotation_chain[0] = <int>lbp
-                        for i in range(1, P):
-                            rotation_chain[i] = \
-                                _bit_rotate_right(rotation_chain[i - 1], P)
-                        lbp = rotation_chain[0]
-                        for i in range(1, P):
-                            lbp = min(lbp, rotation_chain[i])
-
-                output[r, c] = lbp
+                                signed_texture[i] = 0
+                        lbp = _lbp_map_code(&signed_texture[0], n, method)
+
+                    output[s_idx, r, c] = lbp
 
     return np.asarray(output)
 
@@ -1,4 +1,4 @@
-from itertools import combinations_with_replacement
+from itertools import combinations, combinations_with_replacement
 
 import numpy as np
 from scipy import ndimage as ndi
@@ -13,6 +13,9 @@ from ._hessian_det_appx import _hessian_matrix_det
 from ..transform import integral_image
 from .._shared.utils import safe_as_int
 from .corner_cy import _corner_moravec, _corner_orientations
+from .corner_cy import (_symmetric_eigvals_22, _symmetric_eigvals_33,
+                        _corner_harris_response, _corner_shi_tomasi_response,
+                        _corner_foerstner_response)
 from warnings import warn
 
 
@@ -130,11 +133,20 @@ def structure_tensor(image, sigma=1, mode='constant', cval=0, order=None):
     derivatives = _compute_derivatives(image, mode=mode, cval=cval)
 
     if order == 'xy':
-        derivatives = reversed(derivatives)
+        derivatives = derivatives[::-1]
 
-    # structure tensor
-    A_elems = [ndi.gaussian_filter(der0 * der1, sigma, mode=mode, cval=cval)
-               for der0, der1 in combinations_with_replacement(derivatives, 2)]
+    # structure tensor: the products are smoothed in place and the squared
+    # derivatives reuse the memory of the derivatives, once they are no
+    # longer needed for the off-diagonal elements.
+    products = {(i, j): derivatives[i] * derivatives[j]
+                for i, j in combinations(range(image.ndim), 2)}
+    for i, der in enumerate(derivatives):
+        products[i, i] = np.square(der, out=der)
+
+    A_elems = [ndi.gaussian_filter(products[i, j], sigma,
+                                   output=products[i, j], mode=mode,
+                                   cval=cval)
+               for i, j in combinations_with_replacement(range(image.ndim), 2)]
 
     return A_elems
 
@@ -259,6 +271,47 @@ def _image_orthogonal_matrix22_eigvals(M00, M01, M11):
     return l1, l2
 
 
+def _flat_float_elems(S_elems):
+    """Contiguous, flattened copies (or views) of matrix elements, in a
+    common floating point type."""
+    dtype = np.result_type(*S_elems)
+    if dtype not in (np.float32, np.float64):
+        dtype = np.float64
+    return [np.ascontiguousarray(elem, dtype=dtype).reshape(-1)
+            for elem in S_elems]
+
+
+def _symmetric_eigvals_inplace(S_elems):
+    """Eigenvalues of 2x2 and 3x3 symmetric matrices, computed in place.
+
+    The eigenvalues are written, in decreasing order, in the diagonal
+    elements of `S_elems` when these are C-contiguous float32 or float64
+    arrays, and in copies of them otherwise. The off-diagonal elements are
+    left untouched.
+
+    Parameters
+    ----------
+    S_elems : list of ndarray
+        The upper-diagonal elements of the matrix, as returned by
+        `hessian_matrix` or `structure_tensor`.
+
+    Returns
+    -------
+    eigs : list of ndarray
+        The eigenvalues, in decreasing order. These are the diagonal elements
+        of `S_elems`.
+    """
+    shape = np.shape(S_elems[0])
+    flat = _flat_float_elems(S_elems)
+    if len(S_elems) == 3:
+        _symmetric_eigvals_22(*flat, flat[0], flat[2])
+        diagonal = (0, 2)
+    else:
+        _symmetric_eigvals_33(*flat, flat[0], flat[3], flat[5])
+        diagonal = (0, 3, 5)
+    return [flat[idx].reshape(shape) for idx in diagonal]
+
+
 def _symmetric_compute_eigenvalues(S_elems):
     """Compute eigenvalues from the upperdiagonal entries of a symmetric matrix
 
@@ -276,8 +329,15 @@ def _symmetric_compute_eigenvalues(S_elems):
         ith-largest eigenvalue at position (j, k).
     """
 
-    if len(S_elems) == 3:  # Use fast Cython code for 2D
-        eigs = np.stack(_image_orthogonal_matrix22_eigvals(*S_elems))
+    if len(S_elems) == 3:  # closed-form solution in 2D
+        flat = _flat_float_elems(S_elems)
+        eigs = np.empty((2,) + np.shape(S_elems[0]), dtype=flat[0].dtype)
+        _symmetric_eigvals_22(*flat, *eigs.reshape(2, -1))
+    elif len(S_elems) == 6:  # closed-form solution in 3D
+        flat = [np.ascontiguousarray(elem, dtype=np.float64).reshape(-1)
+                for elem in S_elems]
+        eigs = np.empty((3,) + np.shape(S_elems[0]), dtype=np.float64)
+        _symmetric_eigvals_33(*flat, *eigs.reshape(3, -1))
     else:
         matrices = _symmetric_image(S_elems)
         # eigvalsh returns eigenvalues in increasing order. We want decreasing
@@ -489,7 +549,7 @@ def shape_index(image, sigma=1, mode='constant', cval=0):
     """
 
     H = hessian_matrix(image, sigma=sigma, mode=mode, cval=cval, order='rc')
-    l1, l2 = hessian_matrix_eigvals(H)
+    l1, l2 = _symmetric_eigvals_inplace(H)
 
     return (2.0 / np.pi) * np.arctan((l2 + l1) / (l2 - l1))
 
@@ -609,17 +669,12 @@ def corner_harris(image, method='k', k=0.05, eps=1e-6, sigma=1):
 
     Arr, Arc, Acc = structure_tensor(image, sigma, order='rc')
 
-    # determinant
-    detA = Arr * Acc - Arc ** 2
-    # trace
-    traceA = Arr + Acc
-
-    if method == 'k':
-        response = detA - k * traceA ** 2
-    else:
-        response = 2 * detA / (traceA + eps)
+    # det(A) and trace(A) are combined pixel by pixel, in place
+    Arr_flat, Arc_flat, Acc_flat = (A.reshape(-1) for A in (Arr, Arc, Acc))
+    _corner_harris_response(Arr_flat, Arc_flat, Acc_flat, method == 'k', k,
+                            eps, Arr_flat)
 
-    return response
+    return Arr
 
 
 def corner_shi_tomasi(image, sigma=1):
@@ -678,10 +733,11 @@ def corner_shi_tomasi(image, sigma=1):
 
     Arr, Arc, Acc = structure_tensor(image, sigma, order='rc')
 
-    # minimum eigenvalue of A
-    response = ((Arr + Acc) - np.sqrt((Arr - Acc) ** 2 + 4 * Arc ** 2)) / 2
+    # minimum eigenvalue of A, computed in place
+    Arr_flat, Arc_flat, Acc_flat = (A.reshape(-1) for A in (Arr, Arc, Acc))
+    _corner_shi_tomasi_response(Arr_flat, Arc_flat, Acc_flat, Arr_flat)
 
-    return response
+    return Arr
 
 
 def corner_foerstner(image, sigma=1):
@@ -752,18 +808,12 @@ def corner_foerstner(image, sigma=1):
 
     Arr, Arc, Acc = structure_tensor(image, sigma, order='rc')
 
-    # determinant
-    detA = Arr * Acc - Arc ** 2
-    # trace
-    traceA = Arr + Acc
-
-    w = np.zeros_like(image, dtype=np.double)
-    q = np.zeros_like(image, dtype=np.double)
-
-    mask = traceA != 0
-
-    w[mask] = detA[mask] / traceA[mask]
-    q[mask] = 4 * detA[mask] / traceA[mask] ** 2
+    # w and q are computed in place, from det(A) and trace(A)
+    Arr_flat, Arc_flat, Acc_flat = (A.reshape(-1) for A in (Arr, Arc, Acc))
+    _corner_foerstner_response(Arr_flat, Arc_flat, Acc_flat,
+                               Arr_flat, Acc_flat)
+    w = Arr.astype(np.double, copy=False)
+    q = Acc.astype(np.double, copy=False)
 
     return w, q
 
@@ -4,8 +4,9 @@
 #cython: wraparound=False
 import numpy as np
 cimport numpy as cnp
+from cython.parallel cimport prange
 from libc.float cimport DBL_MAX
-from libc.math cimport atan2, fabs
+from libc.math cimport atan2, fabs, sqrt, acos, cos, hypot, M_PI
 
 from .._shared.fused_numerics cimport np_floats
 from ..util import img_as_float64
@@ -289,3 +290,284 @@ def _corner_orientations(np_floats[:, ::1] image, Py_ssize_t[:, :] corners,
             orientations[i] = atan2(m01, m10)
 
     return np.asarray(orientations)
+
+
+def _symmetric_eigvals_22(np_floats[::1] M00, np_floats[::1] M01,
+                          np_floats[::1] M11, np_floats[::1] l1,
+                          np_floats[::1] l2, int num_threads=0):
+    """Closed-form eigenvalues of 2x2 symmetric matrices.
+
+    The outputs may share memory with the inputs, the eigenvalues of a
+    matrix being computed after all its elements have been read.
+
+    Parameters
+    ----------
+    M00, M01, M11 : (P,) ndarray
+        Upper-diagonal elements of the matrices.
+    l1, l2 : (P,) ndarray
+        Output arrays for the larger and the smaller eigenvalues.
+    num_threads : int, optional
+        Maximum number of threads. 0 uses the OpenMP default.
+    """
+    cdef:
+        Py_ssize_t i
+        np_floats m00, m01, m11, half_trace, half_gap
+        # typed constants keep the float32 arithmetic in single precision
+        np_floats two = 2, four = 4
+
+    for i in prange(M00.shape[0], nogil=True, schedule='static',
+                    num_threads=num_threads):
+        m00 = M00[i]
+        m01 = M01[i]
+        m11 = M11[i]
+        half_trace = (m00 + m11) / two
+        half_gap = <np_floats>sqrt(four * (m01 * m01) +
+                                   (m00 - m11) * (m00 - m11)) / two
+        l1[i] = half_trace + half_gap
+        l2[i] = half_trace - half_gap
+
+
+cdef inline void _sort3(double* a, double* b, double* c) nogil:
+    """Sort three values in decreasing order."""
+    cdef double tmp
+    if a[0] < b[0]:
+        tmp = a[0]; a[0] = b[0]; b[0] = tmp
+    if b[0] < c[0]:
+        tmp = b[0]; b[0] = c[0]; c[0] = tmp
+    if a[0] < b[0]:
+        tmp = a[0]; a[0] = b[0]; b[0] = tmp
+
+
+cdef inline void _cross(double* a, double* b, double* out) nogil:
+    """Cross product of two 3-vectors."""
+    out[0] = a[1] * b[2] - a[2] * b[1]
+    out[1] = a[2] * b[0] - a[0] * b[2]
+    out[2] = a[0] * b[1] - a[1] * b[0]
+
+
+cdef inline void _deflate_33(double b00, double b01, double b02, double b11,
+                            double b12, double b22, double e,
+                            double* f, double* g) nogil:
+    """Remaining eigenvalues of a 3x3 symmetric matrix, given the one of
+    its eigenvalues that is farthest from the others.
+
+    The eigenvector of `e` is the largest cross product of two rows of
+    ``B - e I``, and the other eigenvalues are those of the restriction of
+    `B` to the plane orthogonal to it, which are well conditioned even when
+    they are nearly equal.
+    """
+    cdef:
+        double r0[3]
+        double r1[3]
+        double r2[3]
+        double v[3]
+        double u[3]
+        double w[3]
+        double c[3]
+        double bu[3]
+        double bw[3]
+        double norm, best, m00, m01, m11, half_trace, half_gap
+        int k
+
+    r0[0] = b00 - e; r0[1] = b01; r0[2] = b02
+    r1[0] = b01; r1[1] = b11 - e; r1[2] = b12
+    r2[0] = b02; r2[1] = b12; r2[2] = b22 - e
+
+    best = -1
+    _cross(r0, r1, c)
+    norm = c[0] * c[0] + c[1] * c[1] + c[2] * c[2]
+    if norm > best:
+        best = norm
+        v[0] = c[0]; v[1] = c[1]; v[2] = c[2]
+    _cross(r0, r2, c)
+    norm = c[0] * c[0] + c[1] * c[1] + c[2] * c[2]
+    if norm > best:
+        best = norm
+        v[0] = c[0]; v[1] = c[1]; v[2] = c[2]
+    _cross(r1, r2, c)
+    norm = c[0] * c[0] + c[1] * c[1] + c[2] * c[2]
+    if norm > best:
+        best = norm
+        v[0] = c[0]; v[1] = c[1]; v[2] = c[2]
+
+    if best == 0:
+        # B - e I has rank at most 1: e is a double eigenvalue
+        f[0] = e
+        g[0] = b00 + b11 + b22 - 2 * e
+        return
+    norm = sqrt(best)
+    for k in range(3):
+        v[k] /= norm
+
+    # orthonormal basis (u, w) of the plane orthogonal to v
+    if fabs(v[0]) <= fabs(v[1]) and fabs(v[0]) <= fabs(v[2]):
+        c[0] = 1; c[1] = 0; c[2] = 0
+    elif fabs(v[1]) <= fabs(v[2]):
+        c[0] = 0; c[1] = 1; c[2] = 0
+    else:
+        c[0] = 0; c[1] = 0; c[2] = 1
+    _cross(v, c, u)
+    norm = sqrt(u[0] * u[0] + u[1] * u[1] + u[2] * u[2])
+    for k in range(3):
+        u[k] /= norm
+    _cross(v, u, w)
+
+    bu[0] = b00 * u[0] + b01 * u[1] + b02 * u[2]
+    bu[1] = b01 * u[0] + b11 * u[1] + b12 * u[2]
+    bu[2] = b02 * u[0] + b12 * u[1] + b22 * u[2]
+    bw[0] = b00 * w[0] + b01 * w[1] + b02 * w[2]
+    bw[1] = b01 * w[0] + b11 * w[1] + b12 * w[2]
+    bw[2] = b02 * w[0] + b12 * w[1] + b22 * w[2]
+    m00 = u[0] * bu[0] + u[1] * bu[1] + u[2] * bu[2]
+    m01 = w[0] * bu[0] + w[1] * bu[1] + w[2] * bu[2]
+    m11 = w[0] * bw[0] + w[1] * bw[1] + w[2] * bw[2]
+    half_trace = (m00 + m11) / 2
+    half_gap = hypot((m00 - m11) / 2, m01)
+    f[0] = half_trace + half_gap
+    g[0] = half_trace - half_gap
+
+
+def _symmetric_eigvals_33(np_floats[::1] M00, np_floats[::1] M01,
+                          np_floats[::1] M02, np_floats[::1] M11,
+                          np_floats[::1] M12, np_floats[::1] M22,
+                          np_floats[::1] l1, np_floats[::1] l2,
+                          np_floats[::1] l3, int num_threads=0):
+    """Closed-form eigenvalues of 3x3 symmetric matrices.
+
+    The trigonometric solution of the characteristic polynomial, see [1]_,
+    only gives accurately the eigenvalue farthest from the two others: when
+    two eigenvalues are nearly equal, as for tubular structures, the
+    arccosine loses about half of the significant digits. These two are
+    computed instead from the 2x2 matrix deflated by the eigenvector of the
+    first one. The eigenvalues then agree with `numpy.linalg.eigvalsh` to
+    about 1e-15 times the norm of the matrix. The computation is done in
+    double precision and the outputs may share memory with the inputs.
+
+    Parameters
+    ----------
+    M00, M01, M02, M11, M12, M22 : (P,) ndarray
+        Upper-diagonal elements of the matrices.
+    l1, l2, l3 : (P,) ndarray
+        Output arrays for the eigenvalues, in decreasing order.
+    num_threads : int, optional
+        Maximum number of threads. 0 uses the OpenMP default.
+
+    References
+    ----------
+    .. [1] Smith, O. K. (1961). Eigenvalues of a symmetric 3 x 3 matrix.
+           Communications of the ACM, 4(4), 168.
+           :DOI:`10.1145/355578.366316`
+    """
+    cdef:
+        Py_ssize_t i
+        double a00, a01, a02, a11, a12, a22
+        double off_diag, q, b00, b11, b22, p, det, r, phi
+        double e1, e2, e3
+
+    for i in prange(M00.shape[0], nogil=True, schedule='static',
+                    num_threads=num_threads):
+        a00 = M00[i]
+        a01 = M01[i]
+        a02 = M02[i]
+        a11 = M11[i]
+        a12 = M12[i]
+        a22 = M22[i]
+        off_diag = a01 * a01 + a02 * a02 + a12 * a12
+        if off_diag == 0:
+            e1 = a00
+            e2 = a11
+            e3 = a22
+        else:
+            q = (a00 + a11 + a22) / 3
+            b00 = a00 - q
+            b11 = a11 - q
+            b22 = a22 - q
+            p = sqrt((b00 * b00 + b11 * b11 + b22 * b22 + 2 * off_diag) / 6)
+            # half the determinant of (A - q I) / p
+            det = (b00 * (b11 * b22 - a12 * a12)
+                   - a01 * (a01 * b22 - a12 * a02)
+                   + a02 * (a01 * a12 - b11 * a02))
+            r = det / (2 * p * p * p)
+            if r <= -1:
+                phi = M_PI / 3
+            elif r >= 1:
+                phi = 0
+            else:
+                phi = acos(r) / 3
+            # eigenvalues of A - q I: the largest one is the farthest from
+            # the others if r >= 0, and the smallest one otherwise
+            if r >= 0:
+                e1 = 2 * p * cos(phi)
+            else:
+                e1 = 2 * p * cos(phi + 2 * M_PI / 3)
+            _deflate_33(b00, a01, a02, b11, a12, b22, e1, &e2, &e3)
+            e1 = q + e1
+            e2 = q + e2
+            e3 = q + e3
+        _sort3(&e1, &e2, &e3)
+        l1[i] = <np_floats>e1
+        l2[i] = <np_floats>e2
+        l3[i] = <np_floats>e3
+
+
+def _corner_harris_response(np_floats[::1] Arr, np_floats[::1] Arc,
+                            np_floats[::1] Acc, bint use_k, double k,
+                            double eps, np_floats[::1] out,
+                            int num_threads=0):
+    """Harris response from the structure tensor elements, see
+    `corner_harris`. `out` may share memory with the inputs."""
+    cdef:
+        Py_ssize_t i
+        np_floats det, trace
+        np_floats k_ = <np_floats>k
+        np_floats eps_ = <np_floats>eps
+        np_floats two = 2
+
+    for i in prange(Arr.shape[0], nogil=True, schedule='static',
+                    num_threads=num_threads):
+        det = Arr[i] * Acc[i] - Arc[i] * Arc[i]
+        trace = Arr[i] + Acc[i]
+        if use_k:
+            out[i] = det - k_ * (trace * trace)
+        else:
+            out[i] = two * det / (trace + eps_)
+
+
+def _corner_shi_tomasi_response(np_floats[::1] Arr, np_floats[::1] Arc,
+                                np_floats[::1] Acc, np_floats[::1] out,
+                                int num_threads=0):
+    """Smaller eigenvalue of the structure tensor, see `corner_shi_tomasi`.
+    `out` may share memory with the inputs."""
+    cdef:
+        Py_ssize_t i
+        np_floats diff, arc
+        np_floats two = 2, four = 4
+
+    for i in prange(Arr.shape[0], nogil=True, schedule='static',
+                    num_threads=num_threads):
+        diff = Arr[i] - Acc[i]
+        arc = Arc[i]
+        out[i] = ((Arr[i] + Acc[i])
+                  - <np_floats>sqrt(diff * diff + four * (arc * arc))) / two
+
+
+def _corner_foerstner_response(np_floats[::1] Arr, np_floats[::1] Arc,
+                               np_floats[::1] Acc, np_floats[::1] w,
+                               np_floats[::1] q, int num_threads=0):
+    """Error ellipse size and roundness, see `corner_foerstner`. `w` and `q`
+    may share memory with the inputs."""
+    cdef:
+        Py_ssize_t i
+        np_floats det, trace
+        np_floats four = 4
+
+    for i in prange(Arr.shape[0], nogil=True, schedule='static',
+                    num_threads=num_threads):
+        det = Arr[i] * Acc[i] - Arc[i] * Arc[i]
+        trace = Arr[i] + Acc[i]
+        if trace != 0:
+            w[i] = det / trace
+            q[i] = four * det / (trace * trace)
+        else:
+            w[i] = 0
+            q[i] = 0
@@ -1,11 +1,14 @@
 
+from functools import lru_cache
 from itertools import chain
 from operator import add
 
 import numpy as np
 
 from ._haar import haar_like_feature_coord_wrapper
+from ._haar import haar_like_feature_coord_compact
 from ._haar import haar_like_feature_wrapper
+from ._haar import _haar_like_feature_batch, N_RECTANGLE
 from ..color import gray2rgb
 from ..draw import rectangle
 from .._shared.utils import check_random_state
@@ -33,6 +36,37 @@ def _validate_feature_type(feature_type):
     return feature_type_
 
 
+@lru_cache(maxsize=32)
+def _cached_feature_coord(width, height, feat_t):
+    """Coordinates of a single feature type, computed once per window."""
+    feat_coord, feat_type = haar_like_feature_coord_wrapper(width, height,
+                                                            feat_t)
+    feat_coord.flags.writeable = False
+    feat_type.flags.writeable = False
+    return feat_coord, feat_type
+
+
+@lru_cache(maxsize=32)
+def _cached_feature_coord_compact(width, height, feat_t):
+    """Integer coordinates of a single feature type, see
+    `haar_like_feature_coord_compact`."""
+    coord = haar_like_feature_coord_compact(width, height, feat_t)
+    coord.flags.writeable = False
+    return coord
+
+
+def _compact_feature_coord(feature_coord):
+    """Convert the output of `haar_like_feature_coord` to integer arrays."""
+    n_features = len(feature_coord)
+    coord = np.zeros((n_features, 4, 4), dtype=np.intp)
+    n_rectangles = np.zeros(n_features, dtype=np.intp)
+    for idx_feature, rects in enumerate(feature_coord):
+        n_rectangles[idx_feature] = len(rects)
+        for idx_rect, ((r0, c0), (r1, c1)) in enumerate(rects):
+            coord[idx_feature, idx_rect] = r0, c0, r1, c1
+    return coord, n_rectangles
+
+
 def haar_like_feature_coord(width, height, feature_type=None):
     """Compute the coordinates of Haar-like features.
 
@@ -76,9 +110,7 @@ tuple coord
     """
     feature_type_ = _validate_feature_type(feature_type)
 
-    feat_coord, feat_type = zip(*[haar_like_feature_coord_wrapper(width,
-                                                                  height,
-                                                                  feat_t)
+    feat_coord, feat_type = zip(*[_cached_feature_coord(width, height, feat_t)
                                   for feat_t in feature_type_])
 
     return np.concatenate(feat_coord), np.hstack(feat_type)
@@ -219,6 +251,146 @@ def haar_like_feature(int_image, r, c, width, height, feature_type=None,
         return haar_feature
 
 
+def haar_like_feature_batch(int_images, r, c, width, height,
+                            feature_type=None, feature_coord=None,
+                            dtype=None, out=None, num_threads=None):
+    """Compute the Haar-like features for many detection windows at once.
+
+    The features of all the windows are evaluated in parallel and written
+    in a single feature matrix, which is what is needed to train a
+    classifier on a large set of windows.
+
+    Parameters
+    ----------
+    int_images : (M, N) or (K, M, N) ndarray
+        Integral image or stack of integral images of the same shape.
+    r : int or (W,) array of int
+        Row-coordinate of top left corner of each detection window.
+    c : int or (W,) array of int
+        Column-coordinate of top left corner of each detection window.
+    width : int
+        Width of the detection window.
+    height : int
+        Height of the detection window.
+    feature_type : str or list of str or None, optional
+        The type of feature to consider, see :func:`haar_like_feature`.
+        By default all features are extracted. Ignored when `feature_coord`
+        is given.
+    feature_coord : ndarray of list of tuples or None, optional
+        The array of coordinates to be extracted, as returned by
+        :func:`haar_like_feature_coord`. By default, the coordinates of the
+        features given by `feature_type` are used.
+    dtype : dtype, optional
+        Data type of the feature matrix. By default, ``np.float32`` for
+        floating point integral images and ``np.int32`` otherwise. Use a 64
+        bits type when the sums over the rectangles may overflow.
+    out : (W, n_features) ndarray, optional
+        C-contiguous array in which to write the features. Its data type
+        overrides `dtype`.
+    num_threads : int, optional
+        The maximum number of threads to use. By default, the OpenMP
+        default is used.
+
+    Returns
+    -------
+    haar_features : (W, n_features) ndarray
+        Features of each window, in the order of :func:`haar_like_feature`.
+        When a stack of ``K`` integral images is given, window ``i`` is taken
+        in the ``i``-th integral image and ``W`` is equal to ``K``.
+
+    See also
+    --------
+    haar_like_feature
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from skimage.transform import integral_image
+    >>> from skimage.feature import haar_like_feature_batch
+    >>> imgs = np.ones((2, 5, 5), dtype=np.uint8)
+    >>> imgs[1, :, 1:] = 2
+    >>> imgs_ii = np.stack([integral_image(img) for img in imgs])
+    >>> features = haar_like_feature_batch(imgs_ii, 0, 0, 2, 2, 'type-2-x')
+    >>> features
+    array([[0, 0],
+           [1, 1]], dtype=int32)
+
+    """
+    int_images = np.asarray(int_images)
+    if int_images.ndim == 2:
+        int_images = int_images[np.newaxis]
+    elif int_images.ndim != 3:
+        raise ValueError('`int_images` must be a 2D integral image or a '
+                         'stack of 2D integral images.')
+
+    if int_images.dtype.kind == 'f':
+        int_images = np.ascontiguousarray(
+            int_images, dtype=np.promote_types(int_images.dtype, np.float32))
+        default_dtype = np.float32
+    elif int_images.dtype.kind == 'u':
+        int_images = np.ascontiguousarray(int_images, dtype=np.uint64)
+        default_dtype = np.int32
+    else:
+        int_images = np.ascontiguousarray(int_images, dtype=np.int64)
+        default_dtype = np.int32
+
+    n_images, n_rows, n_cols = int_images.shape
+    rows = np.atleast_1d(np.asarray(r, dtype=np.intp))
+    cols = np.atleast_1d(np.asarray(c, dtype=np.intp))
+    n_windows = max(rows.size, cols.size, n_images)
+    if (rows.ndim != 1 or cols.ndim != 1 or
+            rows.size not in (1, n_windows) or
+            cols.size not in (1, n_windows) or
+            n_images not in (1, n_windows)):
+        raise ValueError('`r` and `c` must give one window per integral '
+                         'image.')
+    rows = np.ascontiguousarray(np.broadcast_to(rows, n_windows))
+    cols = np.ascontiguousarray(np.broadcast_to(cols, n_windows))
+    if n_images > 1:
+        image_idx = np.arange(n_windows, dtype=np.intp)
+    else:
+        image_idx = np.zeros(n_windows, dtype=np.intp)
+
+    if (np.any(rows < 0) or np.any(cols < 0) or
+            np.any(rows + height > n_rows) or np.any(cols + width > n_cols)):
+        raise ValueError('The detection windows must be inside the integral '
+                         'images.')
+
+    if feature_coord is None:
+        feature_type_ = _validate_feature_type(feature_type)
+        coord = [_cached_feature_coord_compact(width, height, feat_t)
+                 for feat_t in feature_type_]
+        n_rectangles = np.concatenate([
+            np.full(len(feat_coord), N_RECTANGLE[feat_t], dtype=np.intp)
+            for feat_coord, feat_t in zip(coord, feature_type_)])
+        coord = np.concatenate(coord)
+    else:
+        coord, n_rectangles = _compact_feature_coord(feature_coord)
+        # the unused rectangles are zeros, which pass these checks
+        if (np.any(coord < 0) or np.any(coord[..., 2] >= height) or
+                np.any(coord[..., 3] >= width) or
+                np.any(coord[..., 0] > coord[..., 2]) or
+                np.any(coord[..., 1] > coord[..., 3])):
+            raise ValueError('The feature coordinates must be rectangles '
+                             'inside the detection window.')
+
+    shape = (n_windows, coord.shape[0])
+    if out is None:
+        out = np.empty(shape,
+                       dtype=default_dtype if dtype is None else dtype)
+    elif out.shape != shape:
+        raise ValueError('`out` must have shape {}, got {} instead.'
+                         .format(shape, out.shape))
+    if out.dtype not in (np.float32, np.float64, np.int32, np.int64):
+        raise ValueError('The features can only be computed as float32, '
+                         'float64, int32 or int64, got {}.'.format(out.dtype))
+
+    _haar_like_feature_batch(int_images, image_idx, rows, cols, coord,
+                             n_rectangles, out,
+                             0 if num_threads is None else num_threads)
+    return out
+
+
 def draw_haar_like_feature(image, r, c, width, height,
                            feature_coord,
                            color_positive_block=(1., 0., 0.),
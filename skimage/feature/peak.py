@@ -1,7 +1,6 @@
 from warnings import warn
 import numpy as np
 import scipy.ndimage as ndi
-from .. import measure
 from .._shared.utils import remove_arg
 from .._shared.coord import ensure_spacing
 
@@ -346,77 +345,120 @@ def _prominent_peaks(image, min_xdistance=1, min_ydistance=1,
     intensity, xcoords, ycoords : tuple of array
         Peak intensity values, x and y indices.
     """
+    return _prominent_peaks_stack(image[np.newaxis], min_xdistance,
+                                  min_ydistance, threshold, num_peaks)[0]
 
-    img = image.copy()
-    rows, cols = img.shape
+
+def _prominent_peaks_stack(images, min_xdistance=1, min_ydistance=1,
+                           threshold=None, num_peaks=np.inf):
+    """Return peaks with non-maximum suppression in each image of a stack.
+
+    The local maxima of all the images are found with a single maximum
+    filter and labelling pass, see `_prominent_peaks`.
+
+    Parameters
+    ----------
+    images : (K, M, N) ndarray
+        Input images.
+    min_xdistance : int
+        Minimum distance separating features in the x dimension.
+    min_ydistance : int
+        Minimum distance separating features in the y dimension.
+    threshold : float or (K,) array
+        Minimum intensity of peaks in each image. Default is
+        `0.5 * max(image)` for each image.
+    num_peaks : int
+        Maximum number of peaks in each image. When the number of peaks
+        exceeds `num_peaks`, return `num_peaks` coordinates based on peak
+        intensity.
+
+    Returns
+    -------
+    peaks : list of tuple of array
+        For each image, the peak intensity values, x and y indices.
+    """
+
+    img = np.array(images, copy=True)
+    n_images, rows, cols = img.shape
 
     if threshold is None:
-        threshold = 0.5 * np.max(img)
+        threshold = 0.5 * np.max(img, axis=(1, 2))
+    threshold = np.broadcast_to(threshold, (n_images,))
 
     ycoords_size = 2 * min_ydistance + 1
     xcoords_size = 2 * min_xdistance + 1
-    img_max = ndi.maximum_filter1d(img, size=ycoords_size, axis=0,
-                                   mode='constant', cval=0)
-    img_max = ndi.maximum_filter1d(img_max, size=xcoords_size, axis=1,
-                                   mode='constant', cval=0)
+    img_max = ndi.maximum_filter(img, size=(1, ycoords_size, xcoords_size),
+                                 mode='constant', cval=0)
     mask = (img == img_max)
     img *= mask
-    img_t = img > threshold
-
-    label_img = measure.label(img_t)
-    props = measure.regionprops(label_img, img_max)
-
-    # Sort the list of peaks by intensity, not left-right, so larger peaks
-    # in Hough space cannot be arbitrarily suppressed by smaller neighbors
-    props = sorted(props, key=lambda x: x.max_intensity)[::-1]
-    coords = np.array([np.round(p.centroid) for p in props], dtype=int)
-
-    img_peaks = []
-    ycoords_peaks = []
-    xcoords_peaks = []
-
-    # relative coordinate grid for local neighbourhood suppression
-    ycoords_ext, xcoords_ext = np.mgrid[-min_ydistance:min_ydistance + 1,
-                                        -min_xdistance:min_xdistance + 1]
-
-    for ycoords_idx, xcoords_idx in coords:
-        accum = img_max[ycoords_idx, xcoords_idx]
-        if accum > threshold:
-            # absolute coordinate grid for local neighbourhood suppression
-            ycoords_nh = ycoords_idx + ycoords_ext
-            xcoords_nh = xcoords_idx + xcoords_ext
-
-            # no reflection for distance neighbourhood
-            ycoords_in = np.logical_and(ycoords_nh > 0, ycoords_nh < rows)
-            ycoords_nh = ycoords_nh[ycoords_in]
-            xcoords_nh = xcoords_nh[ycoords_in]
-
-            # reflect xcoords and assume xcoords are continuous,
-            # e.g. for angles:
-            # (..., 88, 89, -90, -89, ..., 89, -90, -89, ...)
-            xcoords_low = xcoords_nh < 0
-            ycoords_nh[xcoords_low] = rows - ycoords_nh[xcoords_low]
-            xcoords_nh[xcoords_low] += cols
-            xcoords_high = xcoords_nh >= cols
-            ycoords_nh[xcoords_high] = rows - ycoords_nh[xcoords_high]
-            xcoords_nh[xcoords_high] -= cols
-
-            # suppress neighbourhood
-            img_max[ycoords_nh, xcoords_nh] = 0
-
-            # add current feature to peaks
-            img_peaks.append(accum)
-            ycoords_peaks.append(ycoords_idx)
-            xcoords_peaks.append(xcoords_idx)
-
-    img_peaks = np.array(img_peaks)
-    ycoords_peaks = np.array(ycoords_peaks)
-    xcoords_peaks = np.array(xcoords_peaks)
-
-    if num_peaks < len(img_peaks):
-        idx_maxsort = np.argsort(img_peaks)[::-1][:num_peaks]
-        img_peaks = img_peaks[idx_maxsort]
-        ycoords_peaks = ycoords_peaks[idx_maxsort]
-        xcoords_peaks = xcoords_peaks[idx_maxsort]
-
-    return img_peaks, xcoords_peaks, ycoords_peaks
+    img_t = img > threshold[:, np.newaxis, np.newaxis]
+
+    # the centroid and maximum of each connected group of local maxima, the
+    # groups being labelled image by image
+    structure = np.zeros((3, 3, 3), dtype=bool)
+    structure[1] = True
+    label_img, n_labels = ndi.label(img_t, structure)
+    idx = np.flatnonzero(label_img)
+    labels = label_img.ravel()[idx]
+    label_layers, ycoords, xcoords = np.unravel_index(idx, img.shape)
+    counts = np.bincount(labels, minlength=n_labels + 1)[1:]
+    centroids = np.stack([np.bincount(labels, weights=coord,
+                                      minlength=n_labels + 1)[1:] / counts
+                          for coord in (ycoords, xcoords)], axis=1)
+    max_intensity = ndi.maximum(img_max, label_img,
+                                np.arange(1, n_labels + 1))
+    layer_starts = np.zeros(n_labels, dtype=np.intp)
+    layer_starts[labels - 1] = label_layers
+    layer_starts = np.searchsorted(layer_starts, np.arange(n_images + 1))
+
+    peaks = []
+    for layer in range(n_images):
+        start, stop = layer_starts[layer], layer_starts[layer + 1]
+        layer_max = img_max[layer]
+        layer_threshold = threshold[layer]
+
+        # Sort the peaks by intensity, not left-right, so larger peaks
+        # in Hough space cannot be arbitrarily suppressed by smaller neighbors
+        order = np.argsort(max_intensity[start:stop], kind='stable')[::-1]
+        coords = np.round(centroids[start + order]).astype(int)
+
+        img_peaks = []
+        ycoords_peaks = []
+        xcoords_peaks = []
+
+        for ycoords_idx, xcoords_idx in coords.tolist():
+            accum = layer_max[ycoords_idx, xcoords_idx]
+            if accum > layer_threshold:
+                # suppress neighbourhood, with no reflection for distance
+                y0 = max(ycoords_idx - min_ydistance, 1)
+                y1 = min(ycoords_idx + min_ydistance + 1, rows)
+                x0 = xcoords_idx - min_xdistance
+                x1 = xcoords_idx + min_xdistance + 1
+                layer_max[y0:y1, max(x0, 0):min(x1, cols)] = 0
+
+                # reflect xcoords and assume xcoords are continuous,
+                # e.g. for angles:
+                # (..., 88, 89, -90, -89, ..., 89, -90, -89, ...)
+                if x0 < 0:
+                    layer_max[rows - y1 + 1:rows - y0 + 1, x0 + cols:] = 0
+                if x1 > cols:
+                    layer_max[rows - y1 + 1:rows - y0 + 1, :x1 - cols] = 0
+
+                # add current feature to peaks
+                img_peaks.append(accum)
+                ycoords_peaks.append(ycoords_idx)
+                xcoords_peaks.append(xcoords_idx)
+
+        img_peaks = np.array(img_peaks)
+        ycoords_peaks = np.array(ycoords_peaks)
+        xcoords_peaks = np.array(xcoords_peaks)
+
+        if num_peaks < len(img_peaks):
+            idx_maxsort = np.argsort(img_peaks)[::-1][:num_peaks]
+            img_peaks = img_peaks[idx_maxsort]
+            ycoords_peaks = ycoords_peaks[idx_maxsort]
+            xcoords_peaks = xcoords_peaks[idx_maxsort]
+
+        peaks.append((img_peaks, xcoords_peaks, ycoords_peaks))
+
+    return peaks
@@ -19,6 +19,7 @@ def configuration(parent_package='', top_path=None):
             '_texture.pyx',
             '_hessian_det_appx.pyx',
             '_hoghistogram.pyx',
+            '_canny_cy.pyx',
             ], working_path=base_path)
     # _haar uses c++, so it must be cythonized separately
     cython(['_cascade.pyx',
@@ -41,6 +42,8 @@ def configuration(parent_package='', top_path=None):
                          include_dirs=[get_numpy_include_dirs()])
     config.add_extension('_hoghistogram', sources=['_hoghistogram.c'],
                          include_dirs=[get_numpy_include_dirs(), '../_shared'])
+    config.add_extension('_canny_cy', sources=['_canny_cy.c'],
+                         include_dirs=[get_numpy_include_dirs(), '../_shared'])
     config.add_extension('_haar', sources=['_haar.cpp'],
                          include_dirs=[get_numpy_include_dirs(), '../_shared'],
                          language="c++")
@@ -1,6 +1,7 @@
 import numpy as np
 from scipy.signal import fftconvolve
 
+from .._shared.fft import fftmodule, next_fast_len
 from .._shared.utils import check_nD
 
 
@@ -122,24 +123,12 @@ def match_template(image, template, pad_input=False, mode='constant',
 
     image = np.array(image, dtype=np.float64, copy=False)
 
-    pad_width = tuple((width, width) for width in template.shape)
-    if mode == 'constant':
-        image = np.pad(image, pad_width=pad_width, mode=mode,
-                       constant_values=constant_values)
-    else:
-        image = np.pad(image, pad_width=pad_width, mode=mode)
+    image = _pad_image(image, template.shape, mode, constant_values)
 
-    # Use special case for 2-D images for much better performance in
-    # computation of integral images
-    if image.ndim == 2:
-        image_window_sum = _window_sum_2d(image, template.shape)
-        image_window_sum2 = _window_sum_2d(image ** 2, template.shape)
-    elif image.ndim == 3:
-        image_window_sum = _window_sum_3d(image, template.shape)
-        image_window_sum2 = _window_sum_3d(image ** 2, template.shape)
+    image_window_sum, image_window_ssd = _image_window_stats(image,
+                                                             template.shape)
 
     template_mean = template.mean()
-    template_volume = np.prod(template.shape)
     template_ssd = np.sum((template - template_mean) ** 2)
 
     if image.ndim == 2:
@@ -149,14 +138,47 @@ def match_template(image, template, pad_input=False, mode='constant',
         xcorr = fftconvolve(image, template[::-1, ::-1, ::-1],
                             mode="valid")[1:-1, 1:-1, 1:-1]
 
+    response = _normalized_response(xcorr, image_window_sum,
+                                    image_window_ssd, template_mean,
+                                    template_ssd)
+
+    return response[_response_slices(image_shape, template.shape, pad_input)]
+
+
+def _pad_image(image, template_shape, mode, constant_values):
+    """Pad `image` by the template size on each side."""
+    pad_width = tuple((width, width) for width in template_shape)
+    if mode == 'constant':
+        return np.pad(image, pad_width=pad_width, mode=mode,
+                      constant_values=constant_values)
+    return np.pad(image, pad_width=pad_width, mode=mode)
+
+
+def _image_window_stats(image, window_shape):
+    """Sum and sum of squared deviations of the padded image in every window.
+    """
+    # Use special case for 2-D images for much better performance in
+    # computation of integral images
+    if image.ndim == 2:
+        image_window_sum = _window_sum_2d(image, window_shape)
+        image_window_sum2 = _window_sum_2d(image ** 2, window_shape)
+    elif image.ndim == 3:
+        image_window_sum = _window_sum_3d(image, window_shape)
+        image_window_sum2 = _window_sum_3d(image ** 2, window_shape)
+
+    image_window_ssd = image_window_sum2
+    image_window_ssd -= image_window_sum ** 2 / np.prod(window_shape)
+    # sqrt of negative number not allowed
+    np.maximum(image_window_ssd, 0, out=image_window_ssd)
+    return image_window_sum, image_window_ssd
+
+
+def _normalized_response(xcorr, image_window_sum, image_window_ssd,
+                         template_mean, template_ssd):
+    """Normalized correlation from the raw cross-correlation."""
     numerator = xcorr - image_window_sum * template_mean
 
-    denominator = image_window_sum2
-    np.multiply(image_window_sum, image_window_sum, out=image_window_sum)
-    np.divide(image_window_sum, template_volume, out=image_window_sum)
-    denominator -= image_window_sum
-    denominator *= template_ssd
-    np.maximum(denominator, 0, out=denominator)  # sqrt of negative number not allowed
+    denominator = image_window_ssd * template_ssd
     np.sqrt(denominator, out=denominator)
 
     response = np.zeros_like(xcorr, dtype=np.float64)
@@ -165,15 +187,151 @@ def match_template(image, template, pad_input=False, mode='constant',
     mask = denominator > np.finfo(np.float64).eps
 
     response[mask] = numerator[mask] / denominator[mask]
+    return response
+
 
+def _response_slices(image_shape, template_shape, pad_input):
+    """Crop of the response to the positions reported to the user."""
     slices = []
-    for i in range(template.ndim):
+    for i in range(len(template_shape)):
         if pad_input:
-            d0 = (template.shape[i] - 1) // 2
+            d0 = (template_shape[i] - 1) // 2
             d1 = d0 + image_shape[i]
         else:
-            d0 = template.shape[i] - 1
-            d1 = d0 + image_shape[i] - template.shape[i] + 1
+            d0 = template_shape[i] - 1
+            d1 = d0 + image_shape[i] - template_shape[i] + 1
         slices.append(slice(d0, d1))
+    return tuple(slices)
+
+
+class TemplateMatcher(object):
+    """Match a set of templates against many images.
+
+    The same computation as :func:`match_template` is performed, but the
+    spectra of the templates and their normalisation terms are computed once
+    at construction time. For each image, its spectrum and window statistics
+    are computed once and shared by all templates. FFTs use sizes given by
+    ``next_fast_len``.
+
+    Parameters
+    ----------
+    templates : (m, n[, d]) array or sequence of such arrays
+        Template or templates to locate. All templates must have the same
+        shape.
+    image_shape : tuple of int
+        Shape ``(M, N[, D])`` of the images that will be matched. It must be
+        `(m <= M, n <= N[, d <= D])`.
+    pad_input : bool, optional
+        See :func:`match_template`.
+    mode : see `numpy.pad`, optional
+        Padding mode.
+    constant_values : see `numpy.pad`, optional
+        Constant values used in conjunction with ``mode='constant'``.
+
+    Examples
+    --------
+    >>> templates = [np.eye(3), 1 - np.eye(3)]
+    >>> matcher = TemplateMatcher(templates, (6, 6))
+    >>> image = np.zeros((6, 6))
+    >>> image[1:4, 1:4] = np.eye(3)
+    >>> response = matcher.match(image)
+    >>> response.shape
+    (2, 4, 4)
+    >>> np.round(response[:, 1, 1], 3)
+    array([ 1., -1.])
+    """
 
-    return response[tuple(slices)]
+    def __init__(self, templates, image_shape, pad_input=False,
+                 mode='constant', constant_values=0):
+        if isinstance(templates, np.ndarray):
+            templates = [templates]
+        templates = [np.asarray(template, dtype=np.float64)
+                     for template in templates]
+        if len(templates) == 0:
+            raise ValueError("At least one template is required.")
+        template_shape = templates[0].shape
+        if any(template.shape != template_shape for template in templates):
+            raise ValueError("All templates must have the same shape.")
+
+        image_shape = tuple(image_shape)
+        if len(image_shape) not in (2, 3):
+            raise ValueError("Only 2-D and 3-D images are supported.")
+        if len(image_shape) != len(template_shape):
+            raise ValueError("Templates and images must have the same number "
+                             "of dimensions.")
+        if np.any(np.less(image_shape, template_shape)):
+            raise ValueError("Image must be larger than template.")
+
+        self.image_shape = image_shape
+        self.template_shape = template_shape
+        self.pad_input = pad_input
+        self.mode = mode
+        self.constant_values = constant_values
+
+        self._padded_shape = tuple(n + 2 * m for n, m
+                                   in zip(image_shape, template_shape))
+        # The valid part of a circular correlation of that size is not
+        # affected by wrap-around.
+        self._fft_shape = tuple(next_fast_len(n) for n in self._padded_shape)
+        axes = tuple(range(-len(image_shape), 0))
+        flipped = np.stack(templates)[(Ellipsis,)
+                                      + (slice(None, None, -1),) * len(axes)]
+        self._template_spectra = fftmodule.rfftn(flipped, s=self._fft_shape,
+                                                 axes=axes)
+        self._template_means = np.array([t.mean() for t in templates])
+        self._template_ssds = np.array([np.sum((t - t.mean()) ** 2)
+                                        for t in templates])
+        self._axes = axes
+        # the valid correlation, without its first and last element along
+        # each axis as in `match_template`
+        self._xcorr_slices = tuple(
+            slice(m, n - 1) for n, m in zip(self._padded_shape,
+                                            template_shape))
+        self._response_slices = _response_slices(image_shape, template_shape,
+                                                 pad_input)
+
+    def match(self, image):
+        """Match all templates against an image or a stack of images.
+
+        Parameters
+        ----------
+        image : (M, N[, D]) array or (K, M, N[, D]) array
+            Image, or stack of ``K`` images, of shape ``image_shape``.
+
+        Returns
+        -------
+        response : (T, ...) array or (K, T, ...) array
+            Response images of the ``T`` templates, with the same layout as
+            the output of :func:`match_template`. For a stack of images, the
+            first axis indexes the images.
+        """
+        image = np.asarray(image)
+        ndim = len(self.image_shape)
+        if image.shape[-ndim:] != self.image_shape or \
+                image.ndim not in (ndim, ndim + 1):
+            raise ValueError("Expected an image of shape {} or a stack of "
+                             "such images.".format(self.image_shape))
+        if image.ndim == ndim:
+            return self._match_single(image)
+        return np.stack([self._match_single(frame) for frame in image])
+
+    def _match_single(self, image):
+        image = np.array(image, dtype=np.float64, copy=False)
+        image = _pad_image(image, self.template_shape, self.mode,
+                           self.constant_values)
+        image_window_sum, image_window_ssd = _image_window_stats(
+            image, self.template_shape)
+
+        image_spectrum = fftmodule.rfftn(image, s=self._fft_shape,
+                                         axes=self._axes)
+        xcorrs = fftmodule.irfftn(self._template_spectra * image_spectrum,
+                                  s=self._fft_shape, axes=self._axes)
+
+        responses = []
+        for xcorr, mean, ssd in zip(xcorrs, self._template_means,
+                                    self._template_ssds):
+            response = _normalized_response(xcorr[self._xcorr_slices],
+                                            image_window_sum,
+                                            image_window_ssd, mean, ssd)
+            responses.append(response[self._response_slices])
+        return np.stack(responses)
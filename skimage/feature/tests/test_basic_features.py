@@ -1,6 +1,7 @@
 import pytest
 import numpy as np
-from skimage.feature import multiscale_basic_features
+from skimage.feature import (multiscale_basic_features,
+                             multiscale_basic_features_tiles)
 
 
 @pytest.mark.parametrize('edges', (False, True))
@@ -28,3 +29,38 @@ def test_multiscale_basic_features_channel():
     features = multiscale_basic_features(img, sigma_min=1, sigma_max=2)
     assert features.shape[-1] == n_sigmas * 5
     assert features.shape[:-1] == img.shape
+
+
+@pytest.mark.parametrize('dtype', (np.float32, np.float64))
+def test_multiscale_basic_features_dtype(dtype):
+    img = np.random.rand(20, 20)
+    features = multiscale_basic_features(img, sigma_max=4, dtype=dtype)
+    assert features.dtype == dtype
+    ref = multiscale_basic_features(img, sigma_max=4)
+    np.testing.assert_allclose(features, ref, rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize('multichannel', (False, True))
+def test_multiscale_basic_features_tiled(multichannel):
+    img = np.random.rand(70, 45, 2)
+    ref = multiscale_basic_features(img, sigma_max=4,
+                                    multichannel=multichannel)
+    features = multiscale_basic_features(img, sigma_max=4,
+                                         multichannel=multichannel,
+                                         tile_shape=(32, 20, 2)[:ref.ndim - 1])
+    np.testing.assert_array_equal(features, ref)
+
+
+def test_multiscale_basic_features_tiles():
+    img = np.random.rand(50, 40)
+    ref = multiscale_basic_features(img, sigma_max=2, dtype=np.float32)
+    covered = np.zeros(img.shape, dtype=int)
+    for tile_slices, features in multiscale_basic_features_tiles(
+            img, (16, 32), sigma_max=2):
+        assert features.dtype == np.float32
+        np.testing.assert_array_equal(features, ref[tile_slices])
+        covered[tile_slices] += 1
+    np.testing.assert_array_equal(covered, 1)
+
+    with pytest.raises(ValueError):
+        next(multiscale_basic_features_tiles(img, (16, 16, 16)))
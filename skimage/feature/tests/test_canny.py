@@ -1,6 +1,7 @@
 import unittest
 import numpy as np
 from skimage._shared.testing import assert_equal
+from scipy import ndimage as ndi
 from scipy.ndimage import binary_dilation, binary_erosion
 from skimage import data, feature
 from skimage.util import img_as_float
@@ -72,6 +73,16 @@ class TestCanny(unittest.TestCase):
         result2 = feature.canny(np.zeros((20, 20)), 4, 0, 0)
         self.assertTrue(np.all(result1 == result2))
 
+    def test_mask_not_contiguous(self):
+        image = img_as_float(data.camera()[::4, ::4])
+        mask = np.zeros(image.shape, bool)
+        mask[10:-20, 30:-5] = True
+        expected = feature.canny(image, 2, mask=mask)
+        assert_equal(feature.canny(image.T, 2, mask=mask.T), expected.T)
+        strided = np.repeat(np.repeat(mask, 2, axis=0), 2, axis=1)[::2, ::2]
+        assert not strided.flags.c_contiguous
+        assert_equal(feature.canny(image, 2, mask=strided), expected)
+
     def test_use_quantiles(self):
         image = img_as_float(data.camera()[::100, ::100])
 
@@ -119,3 +130,26 @@ class TestCanny(unittest.TestCase):
         result_float = feature.canny(image_float)
 
         assert_equal(result_uint8, result_float)
+
+    def test_gradient_magnitude(self):
+        """The fused gradient matches the Sobel operators of ndimage."""
+        from skimage.feature._canny_cy import _gradient_magnitude
+        rng = np.random.default_rng(0)
+        for dtype in (np.float32, np.float64):
+            image = rng.random((17, 23)).astype(dtype)
+            expected = np.hypot(ndi.sobel(image, axis=0),
+                                ndi.sobel(image, axis=1))
+            magnitude = np.empty_like(image)
+            _gradient_magnitude(image, magnitude)
+            assert_equal(magnitude, expected)
+
+    def test_hysteresis(self):
+        """Weak edges are kept when 8-connected to a strong edge."""
+        from skimage.feature._canny_cy import _hysteresis
+        rng = np.random.default_rng(0)
+        maxima = rng.integers(0, 3, size=(50, 50)).astype(np.uint8)
+        maxima[rng.random(maxima.shape) < 0.7] = 0
+        labels, count = ndi.label(maxima > 0, np.ones((3, 3), bool))
+        strong_labels = np.unique(labels[maxima == 2])
+        expected = np.isin(labels, strong_labels[strong_labels > 0])
+        assert_equal(_hysteresis(maxima), expected)
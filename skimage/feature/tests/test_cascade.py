@@ -21,3 +21,36 @@ def test_detector_astronaut():
                                            max_size=(123, 123))
 
     assert len(detected) == 1, 'One face should be detected.'
+
+
+def test_detector_astronaut_batch():
+
+    trained_file = data.lbp_frontal_face_cascade_filename()
+    detector = Cascade(trained_file)
+
+    img = data.astronaut()
+    params = dict(scale_factor=1.2, step_ratio=1, min_size=(60, 60),
+                  max_size=(123, 123))
+
+    expected, rejections = detector.detect_multi_scale(
+        img=img, return_stage_rejections=True, **params)
+    assert rejections.shape == (detector.stages_number + 1,)
+    assert rejections[-1] >= len(expected)
+
+    imgs = [img, np.ascontiguousarray(img[::-1]), img]
+    detected, batch_rejections = detector.detect_multi_scale_batch(
+        imgs, num_threads=2, return_stage_rejections=True, **params)
+
+    assert len(detected) == 3
+    assert detected[0] == expected
+    assert detected[2] == expected
+    assert len(detected[1]) == 0, 'Upside-down face should not be detected.'
+    assert np.all(batch_rejections >= 2 * rejections)
+    assert batch_rejections.sum() == (
+        2 * rejections.sum()
+        + detector.detect_multi_scale(imgs[1], return_stage_rejections=True,
+                                      **params)[1].sum())
+
+    for num_threads in (1, 2):
+        assert detector.detect_multi_scale(
+            img, num_threads=num_threads, **params) == expected
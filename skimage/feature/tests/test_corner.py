@@ -1,7 +1,9 @@
+from itertools import combinations_with_replacement
+
 import numpy as np
 
 from skimage._shared.testing import (assert_almost_equal, assert_array_equal,
-                                     assert_equal)
+                                     assert_equal, assert_allclose)
 from skimage import data
 from skimage import img_as_float
 from skimage import draw
@@ -218,6 +220,50 @@ def test_hessian_matrix_eigvals_3d(im3d):
     assert np.max(response0) > 0
 
 
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_symmetric_eigenvalues_closed_form(dtype):
+    rng = np.random.default_rng(0)
+    for ndim in (2, 3):
+        image = rng.standard_normal((9,) * ndim).astype(dtype)
+        H_elems = hessian_matrix(image, sigma=1)
+        matrices = np.zeros(image.shape + (ndim, ndim))
+        for idx, (row, col) in enumerate(
+                combinations_with_replacement(range(ndim), 2)):
+            matrices[..., row, col] = H_elems[idx]
+            matrices[..., col, row] = H_elems[idx]
+        expected = np.moveaxis(np.linalg.eigvalsh(matrices)[..., ::-1], -1, 0)
+        eigs = hessian_matrix_eigvals(H_elems)
+        assert_almost_equal(eigs, expected, decimal=5)
+
+
+def test_symmetric_eigenvalues_3d_degenerate():
+    ones = np.ones(4)
+    # diagonal matrices, and matrices with repeated eigenvalues
+    H_elems = [np.array([1, 2, 3, 3]), np.array([0, 0, 0, 1]),
+               np.array([0, 0, 0, 1]), np.array([3, 2, 1, 3]),
+               np.array([0, 0, 0, 1]), np.array([2, 2, 2, 3])]
+    eigs = hessian_matrix_eigvals(H_elems)
+    assert_almost_equal(eigs, [[3, 2, 3, 5], [2, 2, 2, 2], [1, 2, 1, 2]])
+    assert_almost_equal(hessian_matrix_eigvals([ones] * 6),
+                        [3 * ones, 0 * ones, 0 * ones])
+
+
+def test_symmetric_eigenvalues_3d_nearly_equal():
+    # two nearly equal eigenvalues, as in tubular structures
+    rng = np.random.default_rng(0)
+    n = 1000
+    eigvals = np.stack([np.full(n, 1e-3), rng.normal(size=n) * 1e-9 - 1,
+                        np.full(n, -1.)], axis=1) + 5
+    rotations, _ = np.linalg.qr(rng.normal(size=(n, 3, 3)))
+    matrices = (rotations * eigvals[:, np.newaxis, :]
+                @ np.swapaxes(rotations, 1, 2))
+    H_elems = [matrices[:, row, col] for row, col
+               in combinations_with_replacement(range(3), 2)]
+    expected = np.linalg.eigvalsh(matrices)[:, ::-1].T
+    assert_allclose(hessian_matrix_eigvals(H_elems), expected,
+                    rtol=0, atol=1e-13)
+
+
 @test_parallel()
 def test_hessian_matrix_det():
     image = np.zeros((5, 5))
@@ -10,6 +10,7 @@ from numpy.testing import assert_array_equal
 from skimage.transform import integral_image
 from skimage.feature import haar_like_feature
 from skimage.feature import haar_like_feature_coord
+from skimage.feature import haar_like_feature_batch
 from skimage.feature import draw_haar_like_feature
 
 
@@ -100,6 +101,76 @@ def test_haar_like_feature_precomputed(feature_type):
     assert_array_equal(haar_feature_precomputed, haar_feature)
 
 
+@pytest.mark.parametrize("dtype", [np.uint8, np.int8, np.float64])
+def test_haar_like_feature_batch(dtype):
+    rng = np.random.default_rng(0)
+    img = rng.integers(0, 100, size=(20, 30)).astype(dtype)
+    img_ii = integral_image(img)
+    rows = [0, 3, 12]
+    cols = [0, 7, 22]
+    features = haar_like_feature_batch(img_ii, rows, cols, 8, 6,
+                                       dtype=np.float64)
+    expected = np.stack([haar_like_feature(img_ii, r, c, 8, 6)
+                         for r, c in zip(rows, cols)])
+    assert_allclose(features, expected)
+
+    # one window per integral image of a stack
+    stack_ii = np.stack([integral_image(img[r:r + 6, c:c + 8])
+                         for r, c in zip(rows, cols)])
+    features = haar_like_feature_batch(stack_ii, 0, 0, 8, 6,
+                                       dtype=np.float64, num_threads=2)
+    expected = np.stack([haar_like_feature(ii, 0, 0, 8, 6)
+                         for ii in stack_ii])
+    assert_allclose(features, expected)
+
+
+def test_haar_like_feature_batch_dtype():
+    img_ii = integral_image(np.ones((5, 5), dtype=np.uint8))
+    assert haar_like_feature_batch(img_ii, 0, 0, 5, 5).dtype == np.int32
+    img_ii = integral_image(np.ones((5, 5), dtype=np.float64))
+    assert haar_like_feature_batch(img_ii, 0, 0, 5, 5).dtype == np.float32
+
+    out = np.zeros((2, 84), dtype=np.int64)
+    img_ii = integral_image(np.ones((5, 5), dtype=np.int8))
+    features = haar_like_feature_batch(img_ii, [0, 0], 0, 5, 5,
+                                       feature_type='type-2-x', out=out)
+    assert features is out
+    assert_array_equal(out[0], haar_like_feature(img_ii, 0, 0, 5, 5,
+                                                 'type-2-x'))
+
+    with pytest.raises(ValueError):
+        haar_like_feature_batch(img_ii, 0, 0, 5, 5, out=out)
+    with pytest.raises(ValueError):
+        haar_like_feature_batch(img_ii, 1, 0, 5, 5)
+
+
+def test_haar_like_feature_batch_precomputed():
+    img = np.arange(49, dtype=np.int32).reshape(7, 7) ** 2 % 13
+    img_ii = integral_image(img)
+    feature_coord, feature_type = haar_like_feature_coord(6, 6)
+    feature_coord = feature_coord[::7]
+    feature_type = feature_type[::7]
+    features = haar_like_feature_batch(img_ii, [0, 1], [1, 0], 6, 6,
+                                       feature_coord=feature_coord)
+    for window, (r, c) in enumerate([(0, 1), (1, 0)]):
+        expected = haar_like_feature(img_ii, r, c, 6, 6,
+                                     feature_type=feature_type,
+                                     feature_coord=feature_coord)
+        assert_array_equal(features[window], expected)
+
+
+@pytest.mark.parametrize("rect", [[(0, 0), (6, 2)], [(0, 0), (2, 6)],
+                                  [(-1, 0), (2, 2)], [(0, -1), (2, 2)],
+                                  [(3, 0), (2, 2)], [(0, 3), (2, 2)]])
+def test_haar_like_feature_batch_invalid_coord(rect):
+    img_ii = integral_image(np.ones((7, 7)))
+    feature_coord = np.empty(1, dtype=object)
+    feature_coord[0] = [[(0, 0), (1, 1)], rect]
+    with pytest.raises(ValueError):
+        haar_like_feature_batch(img_ii, 0, 0, 6, 6,
+                                feature_coord=feature_coord)
+
+
 @pytest.mark.parametrize("feature_type,height,width,expected_coord",
                          [('type-2-x', 2, 2,
                            [[[(0, 0), (0, 0)], [(0, 1), (0, 1)]],
@@ -559,6 +559,20 @@ class TestProminentPeaks(unittest.TestCase):
         assert_equal(out[1], np.array((x1,)))
         assert_equal(out[2], np.array((y1,)))
 
+    def test_stack(self):
+        images = np.random.rand(4, 20, 25)
+        images[images < 0.9] = 0
+        images[1] = 0
+        out = peak._prominent_peaks_stack(images, min_xdistance=2,
+                                          min_ydistance=3, num_peaks=5)
+        assert len(out) == 4
+        for image, peaks in zip(images, out):
+            expected = peak._prominent_peaks(image, min_xdistance=2,
+                                             min_ydistance=3, num_peaks=5)
+            for a, b in zip(peaks, expected):
+                assert_equal(a, b)
+        assert len(out[1][0]) == 0
+
     def test_input_labels_unmodified(self):
         image = np.zeros((10, 20))
         labels = np.zeros((10, 20), int)
@@ -3,7 +3,7 @@ from skimage._shared.testing import assert_almost_equal, assert_equal
 
 from skimage import data, img_as_float
 from skimage.morphology import diamond
-from skimage.feature import match_template, peak_local_max
+from skimage.feature import match_template, peak_local_max, TemplateMatcher
 from skimage._shared import testing
 
 
@@ -184,3 +184,47 @@ def test_bounding_values():
     print(result.max())
     assert result.max() < 1 + 1e-7
     assert result.min() > -1 - 1e-7
+
+
+@testing.parametrize('pad_input', [False, True])
+@testing.parametrize('mode', ['constant', 'reflect'])
+@testing.parametrize('image_shape, template_shape',
+                     [((40, 33), (7, 5)), ((20, 18, 15), (4, 5, 3))])
+def test_template_matcher(pad_input, mode, image_shape, template_shape):
+    rnd = np.random.RandomState(0)
+    images = rnd.random_sample((3,) + image_shape)
+    templates = [rnd.random_sample(template_shape) for _ in range(4)]
+    matcher = TemplateMatcher(templates, image_shape, pad_input=pad_input,
+                              mode=mode)
+
+    result = matcher.match(images)
+    expected = np.array([[match_template(image, template,
+                                         pad_input=pad_input, mode=mode)
+                          for template in templates] for image in images])
+    assert result.shape == expected.shape
+    assert_almost_equal(result, expected)
+
+    result = matcher.match(images[0])
+    assert_almost_equal(result, expected[0])
+
+
+def test_template_matcher_single_template():
+    image = img_as_float(data.coins())
+    template = image[170:220, 75:130]
+    matcher = TemplateMatcher(template, image.shape)
+    result = matcher.match(image)
+    assert result.shape == (1, 254, 330)
+    assert_equal(np.unravel_index(result[0].argmax(), result[0].shape),
+                 (170, 75))
+
+
+def test_template_matcher_wrong_input():
+    with testing.raises(ValueError):
+        TemplateMatcher([np.ones((3, 3)), np.ones((3, 4))], (5, 5))
+    with testing.raises(ValueError):
+        TemplateMatcher(np.ones((3, 3)), (5, 5, 5))
+    with testing.raises(ValueError):
+        TemplateMatcher(np.ones((6, 3)), (5, 5))
+    matcher = TemplateMatcher(np.ones((3, 3)), (5, 5))
+    with testing.raises(ValueError):
+        matcher.match(np.ones((5, 6)))
@@ -1,10 +1,13 @@
 import numpy as np
 from skimage.feature import (greycomatrix,
                              greycoprops,
+                             greycoprops_map,
                              local_binary_pattern,
+                             multiscale_local_binary_pattern,
                              multiblock_lbp)
 from skimage._shared.testing import test_parallel
 from skimage.transform import integral_image
+from skimage.util import view_as_windows
 from skimage._shared import testing
 
 
@@ -200,6 +203,75 @@ class TestGLCM():
             greycoprops(result, prop)
 
 
+class TestGLCMMap():
+
+    def setup(self):
+        rnd = np.random.RandomState(0)
+        self.image = rnd.randint(0, 8, size=(15, 12)).astype(np.uint8)
+        self.props = ['contrast', 'dissimilarity', 'homogeneity', 'ASM',
+                      'energy', 'correlation']
+
+    def _reference(self, image, window_size, distances, angles, levels,
+                   symmetric, prop):
+        windows = view_as_windows(image, (window_size, window_size))
+        result = np.empty(windows.shape[:2] + (len(distances), len(angles)))
+        for r in range(windows.shape[0]):
+            for c in range(windows.shape[1]):
+                P = greycomatrix(windows[r, c], distances, angles, levels,
+                                 symmetric=symmetric)
+                result[r, c] = greycoprops(P, prop)
+        return result
+
+    @testing.parametrize('symmetric', [False, True])
+    def test_matches_greycoprops(self, symmetric):
+        distances = [1, 2, 5]
+        angles = [0, np.pi / 4, np.pi / 2, 3 * np.pi / 4]
+        maps = greycoprops_map(self.image, 5, distances, angles, levels=8,
+                               symmetric=symmetric, props=self.props)
+        for prop in self.props:
+            expected = self._reference(self.image, 5, distances, angles, 8,
+                                       symmetric, prop)
+            assert maps[prop].shape == (11, 8, 3, 4)
+            np.testing.assert_allclose(maps[prop], expected, atol=1e-10)
+
+    @test_parallel()
+    def test_num_threads(self):
+        maps1 = greycoprops_map(self.image, 4, [1], [0], levels=8,
+                                num_threads=1)
+        maps2 = greycoprops_map(self.image, 4, [1], [0], levels=8,
+                                num_threads=2)
+        for prop in maps1:
+            np.testing.assert_array_equal(maps1[prop], maps2[prop])
+
+    def test_uniform_windows(self):
+        image = np.zeros((6, 6), dtype=np.uint16)
+        image[3:] = 300
+        maps = greycoprops_map(image, 3, [1], [0], levels=301,
+                               props=self.props)
+        np.testing.assert_array_equal(maps['contrast'][[0, 3], :], 0)
+        np.testing.assert_array_equal(maps['correlation'][[0, 3], :], 1)
+        np.testing.assert_array_equal(maps['energy'][[0, 3], :], 1)
+
+    def test_offset_larger_than_window(self):
+        maps = greycoprops_map(self.image, 3, [4], [0], levels=8,
+                               props=self.props)
+        expected = self._reference(self.image, 3, [4], [0], 8, False,
+                                   'correlation')
+        np.testing.assert_array_equal(maps['correlation'], expected)
+        np.testing.assert_array_equal(maps['contrast'], 0)
+
+    def test_errors(self):
+        with testing.raises(ValueError):
+            greycoprops_map(self.image.astype(float), 3, [1], [0], levels=8)
+        with testing.raises(ValueError):
+            greycoprops_map(self.image, 3, [1], [0], levels=4)
+        with testing.raises(ValueError):
+            greycoprops_map(self.image, 20, [1], [0], levels=8)
+        with testing.raises(ValueError):
+            greycoprops_map(self.image, 3, [1], [0], levels=8,
+                            props=['entropy'])
+
+
 class TestLBP():
 
     def setup(self):
@@ -275,6 +347,48 @@ class TestLBP():
         np.testing.assert_array_almost_equal(lbp, ref)
 
 
+class TestMultiscaleLBP():
+
+    def setup(self):
+        rnd = np.random.RandomState(0)
+        self.image = rnd.randint(0, 4, size=(30, 25)).astype(np.uint8)
+        self.scales = [(4, 1), (8, 1), (8, 2.5), (12, 3), (20, 2)]
+
+    @testing.parametrize('method',
+                         ['default', 'ror', 'uniform', 'nri_uniform', 'var'])
+    def test_matches_single_scale(self, method):
+        lbp = multiscale_local_binary_pattern(self.image, self.scales,
+                                              method)
+        assert lbp.shape == (len(self.scales),) + self.image.shape
+        for (P, R), result in zip(self.scales, lbp):
+            expected = local_binary_pattern(self.image, P, R, method)
+            np.testing.assert_array_equal(result, expected)
+
+    @testing.parametrize('method', ['default', 'uniform', 'nri_uniform'])
+    def test_histograms(self, method):
+        labels = np.zeros(self.image.shape, dtype=np.int32)
+        labels[10:, :] = 1
+        labels[20:, 12:] = 3
+        lbp, histograms = multiscale_local_binary_pattern(
+            self.image, self.scales[:3], method, labels=labels)
+        assert len(histograms) == 3
+        for (P, R), result, hist in zip(self.scales, lbp, histograms):
+            assert hist.shape[0] == 4
+            for label in range(4):
+                expected = np.bincount(
+                    result[labels == label].astype(int),
+                    minlength=hist.shape[1])
+                np.testing.assert_array_equal(hist[label], expected)
+
+    def test_errors(self):
+        with testing.raises(ValueError):
+            multiscale_local_binary_pattern(self.image, [], 'uniform')
+        with testing.raises(ValueError):
+            multiscale_local_binary_pattern(
+                self.image, [(8, 1)], 'var',
+                labels=np.zeros(self.image.shape, dtype=int))
+
+
 class TestMBLBP():
 
     def test_single_mblbp(self):
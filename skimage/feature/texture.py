@@ -8,7 +8,9 @@ from .._shared.utils import check_nD
 from ..util import img_as_float
 from ..color import gray2rgb
 from ._texture import (_glcm_loop,
+                       _glcm_props_map,
                        _local_binary_pattern,
+                       _multiscale_local_binary_pattern,
                        _multiblock_lbp)
 
 
@@ -278,6 +280,139 @@ def greycoprops(P, prop='contrast'):
     return results
 
 
+_GLCM_PROPS = ('contrast', 'dissimilarity', 'homogeneity', 'ASM', 'energy',
+               'correlation')
+
+
+def greycoprops_map(image, window_size, distances, angles, levels=None,
+                    symmetric=False,
+                    props=('contrast', 'homogeneity', 'energy', 'correlation'),
+                    num_threads=None):
+    """Calculate texture properties of the GLCM of every image window.
+
+    This is equivalent to calling :func:`greycomatrix` followed by
+    :func:`greycoprops` on every ``window_size x window_size`` patch of
+    `image` (as given by ``util.view_as_windows``), but much faster: the
+    co-occurrence statistics are updated incrementally as the window slides
+    along the image, and rows of windows are processed in parallel.
+
+    Parameters
+    ----------
+    image : (M, N) array_like
+        Integer typed input image. Only positive valued images are supported.
+        If type is other than uint8, the argument `levels` needs to be set.
+    window_size : int
+        Side length of the square window over which each GLCM is computed.
+    distances : array_like
+        List of pixel pair distance offsets.
+    angles : array_like
+        List of pixel pair angles in radians.
+    levels : int, optional
+        The input image should contain integers in [0, `levels`-1],
+        where levels indicate the number of grey-levels counted
+        (typically 256 for an 8-bit image). This argument is required for
+        16-bit images or higher.
+    symmetric : bool, optional
+        If True, both (i, j) and (j, i) are accumulated when (i, j) is
+        encountered for a given offset, as in :func:`greycomatrix`.
+    props : sequence of str, optional
+        The properties to compute, among 'contrast', 'dissimilarity',
+        'homogeneity', 'ASM', 'energy' and 'correlation'. See
+        :func:`greycoprops` for their definition.
+    num_threads : int, optional
+        The maximum number of threads to use. If ``None`` use the OpenMP
+        default value; typically equal to the maximum number of virtual cores.
+
+    Returns
+    -------
+    maps : dict of ndarray
+        Dictionary mapping each property name to a float64 array of shape
+        ``(M - window_size + 1, N - window_size + 1, len(distances),
+        len(angles))``. The value ``maps[prop][r, c, d, a]`` is the property
+        of the GLCM of ``image[r:r + window_size, c:c + window_size]`` for
+        the d'th distance and the a'th angle. Pad `image` beforehand (e.g.
+        with ``np.pad``) to obtain maps of the same size as the image.
+
+    Notes
+    -----
+    The 'ASM' and 'energy' properties require a ``levels x levels``
+    histogram per thread; the other properties are computed from running
+    sums only and their cost does not depend on `levels`.
+
+    Examples
+    --------
+    >>> image = np.array([[0, 0, 1, 1],
+    ...                   [0, 0, 1, 1],
+    ...                   [0, 2, 2, 2],
+    ...                   [2, 2, 3, 3]], dtype=np.uint8)
+    >>> maps = greycoprops_map(image, 3, [1], [0], levels=4,
+    ...                        props=['contrast'])
+    >>> maps['contrast'][..., 0, 0]
+    array([[1.        , 0.33333333],
+           [1.        , 0.33333333]])
+
+    """
+    check_nD(image, 2)
+    check_nD(distances, 1, 'distances')
+    check_nD(angles, 1, 'angles')
+
+    image = np.ascontiguousarray(image)
+
+    if np.issubdtype(image.dtype, np.floating):
+        raise ValueError("Float images are not supported by greycoprops_map. "
+                         "Convert the image to an unsigned integer type.")
+    if image.dtype not in (np.uint8, np.int8) and levels is None:
+        raise ValueError("The levels argument is required for data types "
+                         "other than uint8.")
+    if np.issubdtype(image.dtype, np.signedinteger) and np.any(image < 0):
+        raise ValueError("Negative-valued images are not supported.")
+    if levels is None:
+        levels = 256
+    if image.max() >= levels:
+        raise ValueError("The maximum grayscale value in the image should be "
+                         "smaller than the number of levels.")
+
+    window_size = int(window_size)
+    if window_size < 1 or window_size > min(image.shape):
+        raise ValueError("window_size must be positive and not larger than "
+                         "the image.")
+
+    for prop in props:
+        if prop not in _GLCM_PROPS:
+            raise ValueError('%s is an invalid property' % (prop))
+    compute_asm = 'ASM' in props or 'energy' in props
+
+    if num_threads is None:
+        num_threads = 0
+
+    distances = np.asarray(distances, dtype=np.float64)
+    angles = np.asarray(angles, dtype=np.float64)
+    out_shape = (image.shape[0] - window_size + 1,
+                 image.shape[1] - window_size + 1)
+    maps = {prop: np.empty(out_shape + (len(distances), len(angles)))
+            for prop in props}
+
+    buffer = np.empty(out_shape + (len(_GLCM_PROPS),))
+    for d_idx, distance in enumerate(distances):
+        for a_idx, angle in enumerate(angles):
+            _glcm_props_map(image, window_size, distance, angle, levels,
+                            symmetric, compute_asm, buffer, num_threads)
+            for prop in props:
+                maps[prop][..., d_idx, a_idx] = \
+                    buffer[..., _GLCM_PROPS.index(prop)]
+
+    return maps
+
+
+_LBP_METHODS = {
+    'default': ord('D'),
+    'ror': ord('R'),
+    'uniform': ord('U'),
+    'nri_uniform': ord('N'),
+    'var': ord('V')
+}
+
+
 def local_binary_pattern(image, P, R, method='default'):
     """Gray scale and rotation invariant LBP (Local Binary Patterns).
 
@@ -325,18 +460,95 @@ def local_binary_pattern(image, P, R, method='default'):
     """
     check_nD(image, 2)
 
-    methods = {
-        'default': ord('D'),
-        'ror': ord('R'),
-        'uniform': ord('U'),
-        'nri_uniform': ord('N'),
-        'var': ord('V')
-    }
     image = np.ascontiguousarray(image, dtype=np.double)
-    output = _local_binary_pattern(image, P, R, methods[method.lower()])
+    output = _local_binary_pattern(image, P, R,
+                                   _LBP_METHODS[method.lower()])
     return output
 
 
+def _lbp_n_bins(P, method):
+    """Number of distinct LBP codes for `P` points with the given method."""
+    if method == 'uniform':
+        return P + 2
+    elif method == 'nri_uniform':
+        return P * (P - 1) + 3
+    else:
+        return 2 ** P
+
+
+def multiscale_local_binary_pattern(image, scales, method='default',
+                                    labels=None):
+    """Local binary patterns for several (P, R) settings at once.
+
+    This is equivalent to calling :func:`local_binary_pattern` once per
+    setting, but the image is traversed only once, sampling offsets are
+    computed once per setting and, for the 'ror', 'uniform' and
+    'nri_uniform' methods, codes are mapped with precomputed lookup tables.
+
+    Parameters
+    ----------
+    image : (N, M) array
+        Graylevel image.
+    scales : sequence of (int, float) tuples
+        The ``(P, R)`` settings, where ``P`` is the number of circularly
+        symmetric neighbour set points and ``R`` the radius of the circle.
+    method : {'default', 'ror', 'uniform', 'nri_uniform', 'var'}
+        Method to determine the pattern, see :func:`local_binary_pattern`.
+    labels : (N, M) array of int, optional
+        Label image of non-negative integers. If given, the histogram of the
+        LBP codes of every label is returned as well. Not supported for the
+        'var' method.
+
+    Returns
+    -------
+    output : (S, N, M) array
+        LBP image of each of the ``S`` settings.
+    histograms : list of ndarray
+        Only returned if `labels` is given. ``histograms[s][l]`` is the
+        histogram of the LBP codes of setting ``s`` over the pixels of
+        label ``l``. Its length is ``P + 2`` for 'uniform',
+        ``P * (P - 1) + 3`` for 'nri_uniform' and ``2 ** P`` otherwise.
+
+    Examples
+    --------
+    >>> from skimage import data
+    >>> image = data.brick()
+    >>> lbp = multiscale_local_binary_pattern(image, [(8, 1), (16, 2)],
+    ...                                       method='uniform')
+    >>> lbp.shape
+    (2, 512, 512)
+    """
+    check_nD(image, 2)
+
+    method = method.lower()
+    Ps = np.array([P for P, _ in scales], dtype=np.int32)
+    Rs = np.array([R for _, R in scales], dtype=np.double)
+    if Ps.size == 0:
+        raise ValueError("At least one (P, R) setting is required.")
+
+    image = np.ascontiguousarray(image, dtype=np.double)
+    output = _multiscale_local_binary_pattern(image, Ps, Rs,
+                                              _LBP_METHODS[method])
+    if labels is None:
+        return output
+
+    if method == 'var':
+        raise ValueError("Histograms are not supported for the 'var' "
+                         "method.")
+    labels = np.asarray(labels)
+    if labels.shape != image.shape:
+        raise ValueError("labels must have the same shape as image.")
+    labels = labels.ravel().astype(np.intp)
+    n_labels = labels.max() + 1
+    histograms = []
+    for P, lbp in zip(Ps, output):
+        n_bins = _lbp_n_bins(P, method)
+        hist = np.bincount(labels * n_bins + lbp.ravel().astype(np.intp),
+                           minlength=n_labels * n_bins)
+        histograms.append(hist.reshape(n_labels, n_bins))
+    return output, histograms
+
+
 def multiblock_lbp(int_image, r, c, width, height):
     """Multi-block local binary pattern (MB-LBP).
 
@@ -13,6 +13,7 @@ class DummyNNClassifier(object):
         self.tree = spatial.cKDTree(self.X)
 
     def predict(self, X):
+        self.predicted_dtype = X.dtype
         nearest_neighbors = self.tree.query(X)[1]
         return self.labels[nearest_neighbors]
 
@@ -106,3 +107,33 @@ def test_trainable_segmentation_oo():
     out = segmenter.predict(img)
     assert np.all(out[:10] == 1)
     assert np.all(out[10:] == 2)
+
+
+def test_trainable_segmentation_oo_tiled():
+    img = np.zeros((20, 20, 3))
+    img[:10] = 1
+    img += 0.05 * np.random.randn(*img.shape)
+    labels = np.zeros(img.shape[:-1], dtype=np.uint8)
+    labels[:2] = 1
+    labels[-2:] = 2
+    clf = DummyNNClassifier()
+    features_func = partial(
+        multiscale_basic_features,
+        edges=False,
+        texture=False,
+        sigma_min=0.5,
+        sigma_max=2,
+        multichannel=True,
+    )
+    segmenter = TrainableSegmenter(clf=clf, features_func=features_func)
+    segmenter.fit(img, labels)
+    out = segmenter.predict(img, tile_shape=(8, 8))
+    # the tiles are predicted in the dtype of the training features
+    assert clf.predicted_dtype == segmenter.features.dtype == np.float64
+    np.testing.assert_array_equal(out, segmenter.predict(img))
+    assert np.all(out[:10] == 1)
+    assert np.all(out[10:] == 2)
+
+    segmenter.features_func = lambda image: features_func(image)
+    with pytest.raises(ValueError):
+        segmenter.predict(img, tile_shape=(8, 8))
@@ -1,4 +1,6 @@
-from skimage.feature import multiscale_basic_features
+import numpy as np
+from skimage.feature import (multiscale_basic_features,
+                             multiscale_basic_features_tiles)
 
 try:
     from sklearn.exceptions import NotFittedError
@@ -67,7 +69,7 @@ class TrainableSegmenter(object):
         self.compute_features(image)
         clf = fit_segmenter(labels, self.features, self.clf)
 
-    def predict(self, image):
+    def predict(self, image, tile_shape=None):
         """Segment new image using trained internal classifier.
 
         Parameters
@@ -75,6 +77,12 @@ class TrainableSegmenter(object):
         image : ndarray
             Input image, which can be grayscale or multichannel, and must have a
             number of dimensions compatible with ``self.features_func``.
+        tile_shape : tuple of int, optional
+            If given, the image is segmented tile by tile, so that the
+            features of the whole image are never held in memory at once.
+            Only supported with the default ``features_func``, or with a
+            ``functools.partial`` of
+            :func:`skimage.feature.multiscale_basic_features`.
 
         Raises
         ------
@@ -82,8 +90,34 @@ class TrainableSegmenter(object):
         """
         if self.features_func is None:
             self.features_func = multiscale_basic_features
-        features = self.features_func(image)
-        return predict_segmenter(features, self.clf)
+        if tile_shape is None:
+            features = self.features_func(image)
+            return predict_segmenter(features, self.clf)
+
+        func = getattr(self.features_func, 'func', self.features_func)
+        if func is not multiscale_basic_features:
+            raise ValueError(
+                "Tiled prediction requires `features_func` to be "
+                "`multiscale_basic_features`."
+            )
+        args = getattr(self.features_func, 'args', ())
+        kwargs = dict(getattr(self.features_func, 'keywords', {}))
+        kwargs.pop('tile_shape', None)
+        # compute the features of the tiles in the dtype used for training
+        train_features = getattr(self, 'features', None)
+        kwargs.setdefault('dtype', np.float64 if train_features is None
+                          else train_features.dtype)
+        # the channel axis, if any, is the last one
+        spatial_shape = image.shape[:len(tile_shape)]
+        output = None
+        tiles = multiscale_basic_features_tiles(image, tile_shape, *args,
+                                                **kwargs)
+        for tile_slices, features in tiles:
+            labels = predict_segmenter(features, self.clf)
+            if output is None:
+                output = np.empty(spatial_shape, dtype=labels.dtype)
+            output[tile_slices] = labels
+        return output
 
 
 def fit_segmenter(labels, features, clf):
@@ -4,11 +4,15 @@ from ._marching_cubes_classic import (marching_cubes_classic,
                                       mesh_surface_area)
 from ._regionprops import (regionprops, perimeter,
                            perimeter_crofton, euler_number, regionprops_table)
+from ._regionprops_utils import (perimeter_labels, perimeter_crofton_labels,
+                                 euler_number_labels)
 from ._polygon import approximate_polygon, subdivide_polygon
 from .pnpoly import points_in_poly, grid_points_in_poly
 from ._moments import (moments, moments_central, moments_coords,
                        moments_coords_central, moments_normalized, centroid,
-                       moments_hu, inertia_tensor, inertia_tensor_eigvals)
+                       moments_hu, inertia_tensor, inertia_tensor_eigvals,
+                       moments_labels, moments_central_labels,
+                       inertia_tensor_labels, inertia_tensor_eigvals_labels)
 from .profile import profile_line
 from .fit import LineModelND, CircleModel, EllipseModel, ransac
 from .block import block_reduce
@@ -22,6 +26,9 @@ __all__ = ['find_contours',
            'perimeter',
            'perimeter_crofton',
            'euler_number',
+           'perimeter_labels',
+           'perimeter_crofton_labels',
+           'euler_number_labels',
            'approximate_polygon',
            'subdivide_polygon',
            'LineModelND',
@@ -37,6 +44,10 @@ __all__ = ['find_contours',
            'moments_hu',
            'inertia_tensor',
            'inertia_tensor_eigvals',
+           'moments_labels',
+           'moments_central_labels',
+           'inertia_tensor_labels',
+           'inertia_tensor_eigvals_labels',
            'marching_cubes',
            'marching_cubes_lewiner',
            'marching_cubes_classic',
@@ -1,9 +1,7 @@
 import numpy as np
 from skimage._shared.utils import deprecate_kwarg
 
-from ._find_contours_cy import _get_contour_segments
-
-from collections import deque
+from ._find_contours_cy import _find_contours
 
 _param_options = ('high', 'low')
 
@@ -17,15 +15,17 @@ def find_contours(image, level=None,
 
     Uses the "marching squares" method to compute a the iso-valued contours of
     the input 2D array for a particular level value. Array values are linearly
-    interpolated to provide better precision for the output contours.
+    interpolated to provide better precision for the output contours. Several
+    levels can be given at once, and their contours are then found in a
+    single pass over the array.
 
     Parameters
     ----------
     image : 2D ndarray of double
         Input image in which to find contours.
-    level : float, optional
-        Value along which to find contours in the array. By default, the level
-        is set to (max(image) + min(image)) / 2
+    level : float or sequence of float, optional
+        Value along which to find contours in the array, or sequence of such
+        values. By default, the level is set to (max(image) + min(image)) / 2
 
         .. versionchanged:: 0.18
             This parameter is now optional.
@@ -49,6 +49,8 @@ def find_contours(image, level=None,
     contours : list of (n,2)-ndarrays
         Each contour is an ndarray of shape ``(n, 2)``,
         consisting of n ``(row, column)`` coordinates along the contour.
+        When `level` is a sequence, a list of the contours of each level is
+        returned instead.
 
     See Also
     --------
@@ -125,6 +127,8 @@ def find_contours(image, level=None,
     >>> find_contours(a, 0.5)
     [array([[0. , 0.5],
            [0.5, 0. ]])]
+    >>> [len(contours) for contours in find_contours(a, [0.25, 0.5, 2])]
+    [1, 1, 0]
     """
     if fully_connected not in _param_options:
         raise ValueError('Parameters "fully_connected" must be either '
@@ -145,76 +149,15 @@ def find_contours(image, level=None,
         mask = mask.astype(np.uint8, copy=False)
     if level is None:
         level = (np.nanmin(image) + np.nanmax(image)) / 2.0
+    levels = np.atleast_1d(np.asarray(level, dtype=np.double))
+    if levels.ndim != 1:
+        raise ValueError('"level" must be a scalar or a sequence of scalars.')
 
-    segments = _get_contour_segments(image.astype(np.double), float(level),
-                                     fully_connected == 'high', mask=mask)
-    contours = _assemble_contours(segments)
+    contours = _find_contours(image.astype(np.double), levels,
+                              fully_connected == 'high', mask=mask)
     if positive_orientation == 'high':
-        contours = [c[::-1] for c in contours]
+        contours = [[c[::-1] for c in level_contours]
+                    for level_contours in contours]
+    if np.ndim(level) == 0:
+        return contours[0]
     return contours
-
-
-def _assemble_contours(segments):
-    current_index = 0
-    contours = {}
-    starts = {}
-    ends = {}
-    for from_point, to_point in segments:
-        # Ignore degenerate segments.
-        # This happens when (and only when) one vertex of the square is
-        # exactly the contour level, and the rest are above or below.
-        # This degenerate vertex will be picked up later by neighboring
-        # squares.
-        if from_point == to_point:
-            continue
-
-        tail, tail_num = starts.pop(to_point, (None, None))
-        head, head_num = ends.pop(from_point, (None, None))
-
-        if tail is not None and head is not None:
-            # We need to connect these two contours.
-            if tail is head:
-                # We need to closed a contour.
-                # Add the end point
-                head.append(to_point)
-            else:  # tail is not head
-                # We need to join two distinct contours.
-                # We want to keep the first contour segment created, so that
-                # the final contours are ordered left->right, top->bottom.
-                if tail_num > head_num:
-                    # tail was created second. Append tail to head.
-                    head.extend(tail)
-                    # remove all traces of tail:
-                    ends.pop(tail[-1])
-                    contours.pop(tail_num, None)
-                    # Update contour starts end ends
-                    starts[head[0]] = (head, head_num)
-                    ends[head[-1]] = (head, head_num)
-                else:  # tail_num <= head_num
-                    # head was created second. Prepend head to tail.
-                    tail.extendleft(reversed(head))
-                    # remove all traces of head:
-                    starts.pop(head[0])
-                    contours.pop(head_num, None)
-                    # Update contour starts end ends
-                    starts[tail[0]] = (tail, tail_num)
-                    ends[tail[-1]] = (tail, tail_num)
-        elif tail is None and head is None:
-            # we need to add a new contour
-            new_contour = deque((from_point, to_point))
-            contours[current_index] = new_contour
-            starts[from_point] = (new_contour, current_index)
-            ends[to_point] = (new_contour, current_index)
-            current_index += 1
-        elif head is None:  # tail is not None
-            # We've found a single contour to which the new segment should be
-            # prepended.
-            tail.appendleft(from_point)
-            starts[from_point] = (tail, tail_num)
-        else:  # tail is None and head is not None:
-            # We've found a single contour to which the new segment should be
-            # appended
-            head.append(to_point)
-            ends[to_point] = (head, head_num)
-
-    return [np.array(contour) for _, contour in sorted(contours.items())]
@@ -4,40 +4,102 @@
 #cython: wraparound=False
 import numpy as np
 cimport numpy as cnp
+from libc.stdint cimport uint64_t
+from libc.stdlib cimport malloc, calloc, realloc, free
+from libc.string cimport memcpy
 cnp.import_array()
 
-cdef extern from "numpy/npy_math.h":
+cdef extern from "numpy/npy_math.h" nogil:
     bint npy_isnan(double x)
 
+
+cdef struct Point:
+    double r
+    double c
+
+
+cdef struct Segments:
+    # growable array of segments, two points per segment
+    Point* points
+    Py_ssize_t size
+    Py_ssize_t capacity
+
+
+cdef struct Contour:
+    # double-ended array of points, as a deque
+    Point* points
+    Py_ssize_t start
+    Py_ssize_t stop
+    Py_ssize_t capacity
+    bint alive
+
+
+cdef struct Entry:
+    Point key
+    # index of a contour, or EMPTY
+    Py_ssize_t value
+
+
+cdef struct PointMap:
+    # open addressing hash map from points to contours, with linear probing
+    Entry* entries
+    uint64_t mask
+    Py_ssize_t size
+
+
+cdef enum:
+    EMPTY = -1
+
+
 cdef inline double _get_fraction(double from_value, double to_value,
-                                 double level):
+                                 double level) nogil:
     if (to_value == from_value):
         return 0
     return ((level - from_value) / (to_value - from_value))
 
 
-def _get_contour_segments(double[:, :] array,
-                          double level, bint vertex_connect_high,
-                          cnp.uint8_t[:, :] mask):
+cdef inline bint _points_equal(Point a, Point b) nogil:
+    return a.r == b.r and a.c == b.c
+
+
+cdef int _add_segment(Segments* segments, Point from_point,
+                      Point to_point) nogil:
+    cdef Point* points
+    cdef Py_ssize_t capacity
+    if segments.size + 2 > segments.capacity:
+        capacity = 2 * segments.capacity + 2
+        points = <Point*>realloc(segments.points, capacity * sizeof(Point))
+        if points is NULL:
+            return -1
+        segments.points = points
+        segments.capacity = capacity
+    segments.points[segments.size] = from_point
+    segments.points[segments.size + 1] = to_point
+    segments.size += 2
+    return 0
+
+
+cdef int _get_contour_segments(double[:, :] array, double[::1] levels,
+                               bint vertex_connect_high,
+                               cnp.uint8_t[:, :] mask, bint use_mask,
+                               Segments* segments) nogil:
     """Iterate across the given array in a marching-squares fashion,
-    looking for segments that cross 'level'. If such a segment is
-    found, its coordinates are added to a growing list of segments,
-    which is returned by the function.  if vertex_connect_high is
-    nonzero, high-values pixels are considered to be face+vertex
-    connected into objects; otherwise low-valued pixels are.
-
-    Positions where the boolean array ``mask`` is ``False`` are considered
-    as not containing data.
+    looking for segments that cross each of the levels. If such a segment is
+    found, its coordinates are added to the growing array of segments of the
+    level. If vertex_connect_high is nonzero, high-values pixels are
+    considered to be face+vertex connected into objects; otherwise low-valued
+    pixels are.
+
+    Positions where ``mask`` is zero are considered as not containing data.
+
+    Returns -1 when memory cannot be allocated, 0 otherwise.
     """
 
     # The plan is to iterate a 2x2 square across the input array. This means
     # that the upper-left corner of the square needs to iterate across a
     # sub-array that's one-less-large in each direction (so that the square
-    # never steps out of bounds). The square is represented by four pointers:
-    # ul, ur, ll, and lr (for 'upper left', etc.). We also maintain the current
-    # 2D coordinates for the position of the upper-left pointer. Note that we
-    # ensured that the array is of type 'double' and is C-contiguous (last
-    # index varies the fastest).
+    # never steps out of bounds). The values of the square are read once,
+    # and then processed for every level.
     #
     # There are sixteen different possible square types, diagramed below.
     # A + indicates that the vertex is above the contour value, and a -
@@ -65,13 +127,12 @@ def _get_contour_segments(double[:, :] array,
     # example, case 1 entails a line slanting from the middle of the top of
     # the square to the middle of the left side of the square.
 
-    cdef list segments = []
-
-    cdef bint use_mask = mask is not None
     cdef unsigned char square_case = 0
-    cdef tuple top, bottom, left, right
-    cdef double ul, ur, ll, lr
-    cdef Py_ssize_t r0, r1, c0, c1
+    cdef Point top, bottom, left, right
+    cdef double ul, ur, ll, lr, level
+    cdef Py_ssize_t r0, r1, c0, c1, i
+    cdef Segments* level_segments
+    cdef int err = 0
 
     for r0 in range(array.shape[0] - 1):
         for c0 in range(array.shape[1] - 1):
@@ -91,71 +152,432 @@ def _get_contour_segments(double[:, :] array,
             if npy_isnan(ul) or npy_isnan(ur) or npy_isnan(ll) or npy_isnan(lr):
                 continue
 
-            square_case = 0
-            if (ul > level): square_case += 1
-            if (ur > level): square_case += 2
-            if (ll > level): square_case += 4
-            if (lr > level): square_case += 8
+            for i in range(levels.shape[0]):
+                level = levels[i]
+                level_segments = &segments[i]
 
-            if square_case in [0, 15]:
-                # only do anything if there's a line passing through the
-                # square. Cases 0 and 15 are entirely below/above the contour.
-                continue
+                square_case = 0
+                if (ul > level): square_case += 1
+                if (ur > level): square_case += 2
+                if (ll > level): square_case += 4
+                if (lr > level): square_case += 8
+
+                if square_case == 0 or square_case == 15:
+                    # only do anything if there's a line passing through the
+                    # square. Cases 0 and 15 are entirely below/above the
+                    # contour.
+                    continue
+
+                top.r = r0
+                top.c = c0 + _get_fraction(ul, ur, level)
+                bottom.r = r1
+                bottom.c = c0 + _get_fraction(ll, lr, level)
+                left.r = r0 + _get_fraction(ul, ll, level)
+                left.c = c0
+                right.r = r0 + _get_fraction(ur, lr, level)
+                right.c = c1
+
+                if (square_case == 1):
+                    # top to left
+                    err |= _add_segment(level_segments, top, left)
+                elif (square_case == 2):
+                    # right to top
+                    err |= _add_segment(level_segments, right, top)
+                elif (square_case == 3):
+                    # right to left
+                    err |= _add_segment(level_segments, right, left)
+                elif (square_case == 4):
+                    # left to bottom
+                    err |= _add_segment(level_segments, left, bottom)
+                elif (square_case == 5):
+                    # top to bottom
+                    err |= _add_segment(level_segments, top, bottom)
+                elif (square_case == 6):
+                    if vertex_connect_high:
+                        err |= _add_segment(level_segments, left, top)
+                        err |= _add_segment(level_segments, right, bottom)
+                    else:
+                        err |= _add_segment(level_segments, right, top)
+                        err |= _add_segment(level_segments, left, bottom)
+                elif (square_case == 7):
+                    # right to bottom
+                    err |= _add_segment(level_segments, right, bottom)
+                elif (square_case == 8):
+                    # bottom to right
+                    err |= _add_segment(level_segments, bottom, right)
+                elif (square_case == 9):
+                    if vertex_connect_high:
+                        err |= _add_segment(level_segments, top, right)
+                        err |= _add_segment(level_segments, bottom, left)
+                    else:
+                        err |= _add_segment(level_segments, top, left)
+                        err |= _add_segment(level_segments, bottom, right)
+                elif (square_case == 10):
+                    # bottom to top
+                    err |= _add_segment(level_segments, bottom, top)
+                elif (square_case == 11):
+                    # bottom to left
+                    err |= _add_segment(level_segments, bottom, left)
+                elif (square_case == 12):
+                    # lef to right
+                    err |= _add_segment(level_segments, left, right)
+                elif (square_case == 13):
+                    # top to right
+                    err |= _add_segment(level_segments, top, right)
+                elif (square_case == 14):
+                    # left to top
+                    err |= _add_segment(level_segments, left, top)
+
+                if err:
+                    return -1
+    return 0
+
+
+cdef inline uint64_t _hash_point(Point p) nogil:
+    """Hash of the bit patterns of the coordinates of a point.
+
+    The coordinates are never -0, so equal points have equal bit patterns.
+    """
+    cdef uint64_t r, c, h
+    memcpy(&r, &p.r, sizeof(double))
+    memcpy(&c, &p.c, sizeof(double))
+    h = r * <uint64_t>0x9E3779B97F4A7C15 + c
+    # finalizer of splitmix64
+    h = (h ^ (h >> 30)) * <uint64_t>0xBF58476D1CE4E5B9
+    h = (h ^ (h >> 27)) * <uint64_t>0x94D049BB133111EB
+    return h ^ (h >> 31)
+
+
+cdef int _map_init(PointMap* point_map, Py_ssize_t capacity) nogil:
+    """Allocate an empty map, `capacity` being a power of two."""
+    cdef Py_ssize_t i
+    point_map.entries = <Entry*>malloc(capacity * sizeof(Entry))
+    if point_map.entries is NULL:
+        return -1
+    for i in range(capacity):
+        point_map.entries[i].value = EMPTY
+    point_map.mask = capacity - 1
+    point_map.size = 0
+    return 0
+
+
+cdef Py_ssize_t _map_find(PointMap* point_map, Point key) nogil:
+    """Slot of `key` in the map, or -1."""
+    cdef uint64_t slot = _hash_point(key) & point_map.mask
+    cdef Entry* entry
+    while True:
+        entry = &point_map.entries[slot]
+        if entry.value == EMPTY:
+            return -1
+        if _points_equal(entry.key, key):
+            return slot
+        slot = (slot + 1) & point_map.mask
+
+
+cdef Py_ssize_t _map_pop(PointMap* point_map, Point key) nogil:
+    """Remove `key` from the map, returning its contour or -1."""
+    cdef Py_ssize_t slot = _map_find(point_map, key)
+    cdef Py_ssize_t value
+    cdef uint64_t hole, probe, home
+    if slot == -1:
+        return -1
+    value = point_map.entries[slot].value
+    point_map.size -= 1
+    # shift back the following entries of the probe sequence, so that no
+    # entry is separated from its home slot by an empty slot
+    hole = slot
+    probe = slot
+    while True:
+        probe = (probe + 1) & point_map.mask
+        if point_map.entries[probe].value == EMPTY:
+            break
+        home = _hash_point(point_map.entries[probe].key) & point_map.mask
+        # keep the entries whose home is cyclically in (hole, probe]
+        if ((probe - home) & point_map.mask) < ((probe - hole) & point_map.mask):
+            continue
+        point_map.entries[hole] = point_map.entries[probe]
+        hole = probe
+    point_map.entries[hole].value = EMPTY
+    return value
+
+
+cdef int _map_set(PointMap* point_map, Point key, Py_ssize_t value) nogil:
+    """Map `key` to the contour `value`, replacing any previous contour.
+
+    The map grows to stay at most half full. Returns -1 when memory cannot
+    be allocated, 0 otherwise.
+    """
+    cdef uint64_t slot
+    cdef Py_ssize_t i, found = _map_find(point_map, key)
+    cdef PointMap grown
+    if found != -1:
+        point_map.entries[found].value = value
+        return 0
+    if 2 * (point_map.size + 1) > point_map.mask + 1:
+        if _map_init(&grown, 2 * (point_map.mask + 1)):
+            return -1
+        for i in range(point_map.mask + 1):
+            if point_map.entries[i].value != EMPTY:
+                _map_set(&grown, point_map.entries[i].key,
+                         point_map.entries[i].value)
+        free(point_map.entries)
+        point_map[0] = grown
+    slot = _hash_point(key) & point_map.mask
+    while point_map.entries[slot].value != EMPTY:
+        slot = (slot + 1) & point_map.mask
+    point_map.entries[slot].key = key
+    point_map.entries[slot].value = value
+    point_map.size += 1
+    return 0
+
+
+cdef int _reserve(Contour* contour, Py_ssize_t front, Py_ssize_t back) nogil:
+    """Make room for `front` points before and `back` points after the
+    points of a contour."""
+    cdef Py_ssize_t size = contour.stop - contour.start
+    cdef Py_ssize_t capacity, start
+    cdef Point* points
+    if contour.start >= front and contour.capacity - contour.stop >= back:
+        return 0
+    capacity = 2 * (size + front + back) + 8
+    start = front + (capacity - size - front - back) // 2
+    points = <Point*>malloc(capacity * sizeof(Point))
+    if points is NULL:
+        return -1
+    memcpy(&points[start], &contour.points[contour.start],
+           size * sizeof(Point))
+    free(contour.points)
+    contour.points = points
+    contour.stop = start + size
+    contour.start = start
+    contour.capacity = capacity
+    return 0
+
+
+cdef inline int _append(Contour* contour, Point point) nogil:
+    if _reserve(contour, 0, 1):
+        return -1
+    contour.points[contour.stop] = point
+    contour.stop += 1
+    return 0
+
+
+cdef inline int _appendleft(Contour* contour, Point point) nogil:
+    if _reserve(contour, 1, 0):
+        return -1
+    contour.start -= 1
+    contour.points[contour.start] = point
+    return 0
+
+
+cdef int _extend(Contour* contour, Contour* other) nogil:
+    """Append the points of `other` to `contour`."""
+    cdef Py_ssize_t size = other.stop - other.start
+    if _reserve(contour, 0, size):
+        return -1
+    memcpy(&contour.points[contour.stop], &other.points[other.start],
+           size * sizeof(Point))
+    contour.stop += size
+    return 0
+
+
+cdef int _extendleft(Contour* contour, Contour* other) nogil:
+    """Prepend the points of `other` to `contour`."""
+    cdef Py_ssize_t size = other.stop - other.start
+    if _reserve(contour, size, 0):
+        return -1
+    contour.start -= size
+    memcpy(&contour.points[contour.start], &other.points[other.start],
+           size * sizeof(Point))
+    return 0
+
+
+cdef int _assemble_contours(Segments* segments, Contour* contours,
+                            Py_ssize_t* num_contours,
+                            PointMap* starts, PointMap* ends) nogil:
+    """Join the segments of a level into contours.
+
+    The contours are created in `contours` in the order of their first
+    segment, and those absorbed by joins are marked as not alive.
+
+    Returns -1 when memory cannot be allocated, 0 otherwise.
+    """
+    cdef Py_ssize_t i, tail_num, head_num, current_index = 0
+    cdef Point from_point, to_point
+    cdef Contour* tail
+    cdef Contour* head
+    cdef Contour* new_contour
+
+    for i in range(0, segments.size, 2):
+        from_point = segments.points[i]
+        to_point = segments.points[i + 1]
+        # Ignore degenerate segments.
+        # This happens when (and only when) one vertex of the square is
+        # exactly the contour level, and the rest are above or below.
+        # This degenerate vertex will be picked up later by neighboring
+        # squares.
+        if _points_equal(from_point, to_point):
+            continue
+
+        tail_num = _map_pop(starts, to_point)
+        head_num = _map_pop(ends, from_point)
+
+        if tail_num != -1 and head_num != -1:
+            tail = &contours[tail_num]
+            head = &contours[head_num]
+            # We need to connect these two contours.
+            if tail_num == head_num:
+                # We need to closed a contour.
+                # Add the end point
+                if _append(head, to_point):
+                    return -1
+            elif tail_num > head_num:
+                # We need to join two distinct contours.
+                # We want to keep the first contour segment created, so that
+                # the final contours are ordered left->right, top->bottom.
+                # tail was created second. Append tail to head.
+                if _extend(head, tail):
+                    return -1
+                # remove all traces of tail:
+                _map_pop(ends, tail.points[tail.stop - 1])
+                tail.alive = False
+                # Update contour starts end ends
+                if (_map_set(starts, head.points[head.start], head_num)
+                        or _map_set(ends, head.points[head.stop - 1],
+                                    head_num)):
+                    return -1
+            else:  # tail_num < head_num
+                # head was created second. Prepend head to tail.
+                if _extendleft(tail, head):
+                    return -1
+                # remove all traces of head:
+                _map_pop(starts, head.points[head.start])
+                head.alive = False
+                # Update contour starts end ends
+                if (_map_set(starts, tail.points[tail.start], tail_num)
+                        or _map_set(ends, tail.points[tail.stop - 1],
+                                    tail_num)):
+                    return -1
+        elif tail_num == -1 and head_num == -1:
+            # we need to add a new contour
+            new_contour = &contours[current_index]
+            new_contour.alive = True
+            if _append(new_contour, from_point) or _append(new_contour,
+                                                           to_point):
+                return -1
+            if (_map_set(starts, from_point, current_index)
+                    or _map_set(ends, to_point, current_index)):
+                return -1
+            current_index += 1
+        elif head_num == -1:  # tail is not None
+            # We've found a single contour to which the new segment should be
+            # prepended.
+            tail = &contours[tail_num]
+            if (_appendleft(tail, from_point)
+                    or _map_set(starts, from_point, tail_num)):
+                return -1
+        else:  # tail is None and head is not None:
+            # We've found a single contour to which the new segment should be
+            # appended
+            head = &contours[head_num]
+            if _append(head, to_point) or _map_set(ends, to_point, head_num):
+                return -1
+
+    num_contours[0] = current_index
+    return 0
+
+
+cdef list _contours_to_arrays(Contour* contours, Py_ssize_t num_contours):
+    cdef list out = []
+    cdef Py_ssize_t i, size
+    cdef cnp.ndarray[double, ndim=2] points
+    for i in range(num_contours):
+        if not contours[i].alive:
+            continue
+        size = contours[i].stop - contours[i].start
+        points = np.empty((size, 2), dtype=np.double)
+        memcpy(<void*>points.data, &contours[i].points[contours[i].start],
+               size * sizeof(Point))
+        out.append(points)
+    return out
+
+
+def _find_contours(double[:, :] array, double[::1] levels,
+                   bint vertex_connect_high, cnp.uint8_t[:, :] mask):
+    """Find the contours of several levels in a single pass over an array.
+
+    Parameters
+    ----------
+    array : (M, N) ndarray of double
+        Input array.
+    levels : (L,) ndarray of double
+        Values along which to find contours.
+    vertex_connect_high : bool
+        Whether the high-valued elements are fully connected.
+    mask : (M, N) ndarray of uint8 or None
+        Positions where ``mask`` is zero are considered as not containing
+        data.
+
+    Returns
+    -------
+    contours : list of lists of (n, 2) ndarrays
+        The contours of each level, in the order of the first point found
+        by the scan of the array, oriented with the low values on their
+        left.
+    """
+    cdef Py_ssize_t n_levels = levels.shape[0]
+    cdef Py_ssize_t i, j, num_contours, n_segments
+    cdef bint use_mask = mask is not None
+    cdef Segments* segments = NULL
+    cdef Contour* contours = NULL
+    cdef PointMap starts, ends
+    cdef int err = 0
+    cdef list out = []
+
+    starts.entries = NULL
+    ends.entries = NULL
+    segments = <Segments*>calloc(max(n_levels, 1), sizeof(Segments))
+    if segments is NULL:
+        raise MemoryError()
+    try:
+        with nogil:
+            err = _get_contour_segments(array, levels, vertex_connect_high,
+                                        mask, use_mask, segments)
+        if err:
+            raise MemoryError()
+
+        for i in range(n_levels):
+            n_segments = segments[i].size // 2
+            contours = <Contour*>calloc(n_segments + 1, sizeof(Contour))
+            if (contours is NULL or _map_init(&starts, 1024)
+                    or _map_init(&ends, 1024)):
+                raise MemoryError()
+
+            num_contours = 0
+            with nogil:
+                err = _assemble_contours(&segments[i], contours,
+                                         &num_contours, &starts, &ends)
+            if err:
+                raise MemoryError()
+            out.append(_contours_to_arrays(contours, num_contours))
+
+            for j in range(n_segments + 1):
+                free(contours[j].points)
+            free(contours)
+            free(starts.entries)
+            free(ends.entries)
+            contours = NULL
+            starts.entries = NULL
+            ends.entries = NULL
+    finally:
+        if contours is not NULL:
+            for j in range(segments[i].size // 2 + 1):
+                free(contours[j].points)
+            free(contours)
+        free(starts.entries)
+        free(ends.entries)
+        for i in range(n_levels):
+            free(segments[i].points)
+        free(segments)
 
-            top = r0, c0 + _get_fraction(ul, ur, level)
-            bottom = r1, c0 + _get_fraction(ll, lr, level)
-            left = r0 + _get_fraction(ul, ll, level), c0
-            right = r0 + _get_fraction(ur, lr, level), c1
-
-            if (square_case == 1):
-                # top to left
-                segments.append((top, left))
-            elif (square_case == 2):
-                # right to top
-                segments.append((right, top))
-            elif (square_case == 3):
-                # right to left
-                segments.append((right, left))
-            elif (square_case == 4):
-                # left to bottom
-                segments.append((left, bottom))
-            elif (square_case == 5):
-                # top to bottom
-                segments.append((top, bottom))
-            elif (square_case == 6):
-                if vertex_connect_high:
-                    segments.append((left, top))
-                    segments.append((right, bottom))
-                else:
-                    segments.append((right, top))
-                    segments.append((left, bottom))
-            elif (square_case == 7):
-                # right to bottom
-                segments.append((right, bottom))
-            elif (square_case == 8):
-                # bottom to right
-                segments.append((bottom, right))
-            elif (square_case == 9):
-                if vertex_connect_high:
-                    segments.append((top, right))
-                    segments.append((bottom, left))
-                else:
-                    segments.append((top, left))
-                    segments.append((bottom, right))
-            elif (square_case == 10):
-                # bottom to top
-                segments.append((bottom, top))
-            elif (square_case == 11):
-                # bottom to left
-                segments.append((bottom, left))
-            elif (square_case == 12):
-                # lef to right
-                segments.append((left, right))
-            elif (square_case == 13):
-                # top to right
-                segments.append((top, right))
-            elif (square_case == 14):
-                # left to top
-                segments.append((left, top))
-
-    return segments
+    return out
@@ -1,5 +1,7 @@
+import os
 import warnings
 import base64
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -10,7 +12,8 @@ from ._marching_cubes_classic import _marching_cubes_classic
 
 def marching_cubes(volume, level=None, *, spacing=(1., 1., 1.),
                    gradient_direction='descent', step_size=1,
-                   allow_degenerate=True, method='lewiner', mask=None):
+                   allow_degenerate=True, method='lewiner', mask=None,
+                   chunk_size=None, num_workers=None):
     """Marching cubes algorithm to find surfaces in 3d volumetric data.
 
     In contrast with Lorensen et al. approach [2]_, Lewiner et
@@ -55,6 +58,17 @@ def marching_cubes(volume, level=None, *, spacing=(1., 1., 1.),
         are located within certain region of the volume M, N, P-e.g. the top
         half of the cube-and also allow to compute finite surfaces-i.e. open
         surfaces that do not end at the border of the cube.
+    chunk_size : int, optional
+        Number of planes along the first axis of `volume` processed at once
+        by the 'lewiner' and 'lorensen' methods. Only the current chunks are
+        converted to float32, so that `volume` can e.g. be a memory-mapped
+        array larger than the memory. The chunks are processed in parallel
+        and their meshes are welded on their common planes. By default, the
+        whole volume is processed at once.
+    num_workers : int, optional
+        The number of parallel threads processing the chunks. If set to
+        ``None``, one thread per CPU core is used. Only used with
+        `chunk_size`.
 
     Returns
     -------
@@ -91,6 +105,11 @@ def marching_cubes(volume, level=None, *, spacing=(1., 1., 1.),
     To quantify the area of an isosurface generated by this algorithm, pass
     verts and faces to `skimage.measure.mesh_surface_area`.
 
+    With `chunk_size`, the vertices, faces and values are identical to the
+    ones found by processing the whole volume at once. The normals of the
+    vertices on the planes between chunks may differ by rounding errors, the
+    contributions of both chunks being summed in a different order.
+
     Regarding visualization of algorithm output, to contour a volume
     named `myvolume` about the level 0.0, using the ``mayavi`` package::
 
@@ -134,18 +153,25 @@ def marching_cubes(volume, level=None, *, spacing=(1., 1., 1.),
         return _marching_cubes_lewiner(volume, level, spacing,
                                        gradient_direction, step_size,
                                        allow_degenerate, use_classic=False,
-                                       mask=mask)
+                                       mask=mask, chunk_size=chunk_size,
+                                       num_workers=num_workers)
     elif method == 'lorensen':
         return _marching_cubes_lewiner(volume, level, spacing,
                                        gradient_direction, step_size,
                                        allow_degenerate, use_classic=True,
-                                       mask=mask)
+                                       mask=mask, chunk_size=chunk_size,
+                                       num_workers=num_workers)
     elif method == '_lorensen':
         if mask is not None:
             raise NotImplementedError(
                 'Parameter `mask` is not implemented for method "_lorensen" '
                 'and will be ignored.'
             )
+        if chunk_size is not None:
+            raise NotImplementedError(
+                'Parameter `chunk_size` is not implemented for method '
+                '"_lorensen".'
+            )
         return _marching_cubes_classic(volume, level, spacing,
                                        gradient_direction)
     else:
@@ -278,7 +304,8 @@ def marching_cubes_lewiner(volume, level=None, spacing=(1., 1., 1.),
 
 
 def _marching_cubes_lewiner(volume, level, spacing, gradient_direction,
-                            step_size, allow_degenerate, use_classic, mask):
+                            step_size, allow_degenerate, use_classic, mask,
+                            chunk_size=None, num_workers=None):
     """Lewiner et al. algorithm for marching cubes. See
     marching_cubes_lewiner for documentation.
 
@@ -289,16 +316,25 @@ def _marching_cubes_lewiner(volume, level, spacing, gradient_direction,
         raise ValueError('Input volume should be a 3D numpy array.')
     if volume.shape[0] < 2 or volume.shape[1] < 2 or volume.shape[2] < 2:
         raise ValueError("Input array must be at least 2x2x2.")
-    volume = np.ascontiguousarray(volume,
-                                  np.float32)  # no copy if not necessary
+    if chunk_size is None:
+        volume = np.ascontiguousarray(volume,
+                                      np.float32)  # no copy if not necessary
+        vmin, vmax = volume.min(), volume.max()
+    else:
+        # The chunks are converted when they are processed. The conversion
+        # to float32 preserves the order, hence the extrema.
+        vmin, vmax = np.float32(volume.min()), np.float32(volume.max())
+        chunk_size = int(chunk_size)
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least one.')
 
     # Check/convert other inputs:
     # level
     if level is None:
-        level = 0.5 * (volume.min() + volume.max())
+        level = 0.5 * (vmin + vmax)
     else:
         level = float(level)
-        if level < volume.min() or level > volume.max():
+        if level < vmin or level > vmax:
             raise ValueError("Surface level must be within volume data range.")
     # spacing
     if len(spacing) != 3:
@@ -319,9 +355,14 @@ def _marching_cubes_lewiner(volume, level, spacing, gradient_direction,
             raise ValueError('volume and mask must have the same shape.')
 
     # Apply algorithm
-    func = _marching_cubes_lewiner_cy.marching_cubes
-    vertices, faces, normals, values = func(volume, level, L,
-                                            step_size, use_classic, mask)
+    if chunk_size is None:
+        func = _marching_cubes_lewiner_cy.marching_cubes
+        vertices, faces, normals, values = func(volume, level, L,
+                                                step_size, use_classic, mask)
+    else:
+        vertices, faces, normals, values = _marching_cubes_chunked(
+            volume, level, L, step_size, use_classic, mask, chunk_size,
+            num_workers)
 
     if not len(vertices):
         raise RuntimeError('No surface found at the given iso value.')
@@ -349,6 +390,91 @@ def _marching_cubes_lewiner(volume, level, spacing, gradient_direction,
         return fun(vertices.astype(np.float32), faces, normals, values)
 
 
+def _marching_cubes_chunked(volume, level, luts, step_size, use_classic, mask,
+                            chunk_size, num_workers):
+    """Apply the marching cubes to slabs of the volume in parallel and weld
+    the meshes of the slabs.
+
+    Each slab holds complete layers of cubes, the layers of consecutive
+    slabs sharing a plane of voxels.
+    """
+    n_planes = volume.shape[0]
+    if n_planes > step_size:
+        n_layers = (n_planes - step_size - 1) // step_size + 1
+    else:
+        n_layers = 0
+    layers_per_chunk = max(chunk_size // step_size, 1)
+    starts = range(0, n_layers, layers_per_chunk)
+
+    def march_chunk(start):
+        stop = min(start + layers_per_chunk, n_layers)
+        planes = slice(start * step_size, stop * step_size + 1)
+        chunk = np.ascontiguousarray(volume[planes], np.float32)
+        chunk_mask = None
+        if mask is not None:
+            chunk_mask = np.ascontiguousarray(mask[planes], dtype=bool)
+        return _marching_cubes_lewiner_cy.marching_cubes_chunk(
+            chunk, level, luts, step_size, use_classic, chunk_mask,
+            start * step_size)
+
+    if num_workers is None:
+        num_workers = os.cpu_count()
+    with ThreadPoolExecutor(max_workers=num_workers) as ex:
+        chunks = list(ex.map(march_chunk, starts))
+
+    return _weld_chunks(chunks)
+
+
+def _weld_chunks(chunks):
+    """Concatenate the meshes of consecutive slabs, merging the vertices on
+    the plane between two slabs.
+
+    The vertices of a slab which are already in the previous slab are
+    removed, so that the vertices are in the order of their creation by the
+    marching through the whole volume.
+    """
+    if not chunks:
+        return (np.empty((0, 3), np.float32), np.empty(0, np.int32),
+                np.empty((0, 3), np.float32), np.empty(0, np.float32))
+
+    vertices, faces, normals, values, welds = [], [], [], [], []
+    n_vertices = 0
+    previous_top = None
+    for verts, chunk_faces, chunk_normals, chunk_values, bottom, top in chunks:
+        index_map = np.empty(len(verts), dtype=np.intp)
+        keep = np.ones(len(verts), dtype=bool)
+        if previous_top is not None:
+            _, in_top, in_bottom = np.intersect1d(
+                previous_top[0], bottom[0], assume_unique=True,
+                return_indices=True)
+            duplicates = bottom[1][in_bottom]
+            targets = previous_top[1][in_top]
+            keep[duplicates] = False
+            index_map[duplicates] = targets
+            welds.append((targets, chunk_normals[duplicates],
+                          chunk_values[duplicates]))
+        n_kept = np.count_nonzero(keep)
+        index_map[keep] = np.arange(n_vertices, n_vertices + n_kept)
+        n_vertices += n_kept
+        vertices.append(verts[keep])
+        normals.append(chunk_normals[keep])
+        values.append(chunk_values[keep])
+        faces.append(index_map[chunk_faces])
+        previous_top = (top[0], index_map[top[1]])
+
+    vertices = np.concatenate(vertices)
+    normals = np.concatenate(normals)
+    values = np.concatenate(values)
+    index_dtype = np.int32 if n_vertices <= np.iinfo(np.int32).max else np.intp
+    faces = np.concatenate(faces).astype(index_dtype, copy=False)
+    # each vertex is welded at most once
+    for targets, weld_normals, weld_values in welds:
+        normals[targets] += weld_normals
+        values[targets] = np.maximum(values[targets], weld_values)
+    _marching_cubes_lewiner_cy.normalize_normals(normals)
+    return vertices, faces, normals, values
+
+
 def _to_array(args):
     shape, text = args
     byts = base64.decodebytes(text.encode('utf-8'))
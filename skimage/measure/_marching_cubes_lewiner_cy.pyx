@@ -32,8 +32,8 @@ from libc.stdlib cimport malloc, free
 cdef double FLT_EPSILON = np.spacing(1.0) #0.0000001
 
 # Define abs function for doubles
-cdef inline double dabs(double a): return a if a>=0 else -a
-cdef inline int imin(int a, int b): return a if a<b else b
+cdef inline double dabs(double a) nogil: return a if a>=0 else -a
+cdef inline int imin(int a, int b) nogil: return a if a<b else b
 
 # todo: allow dynamic isovalue?
 # todo: can we disable Cython from checking for zero division? Sometimes we know that it never happens!
@@ -94,6 +94,9 @@ cdef class Cell:
     -----------------
     The vertices are stored in a C-array that is increased in size with
     factors of two if needed. The same applies to the faces and normals.
+    The methods adding results do not hold the GIL, so that cells can
+    march in parallel: when an array cannot be increased, the cell stops
+    adding results and sets a flag, which is checked by the caller.
 
     Notes on faces
     --------------
@@ -180,6 +183,9 @@ cdef class Cell:
     cdef int _faceCount
     cdef int _faceMaxCount
 
+    # Whether an array could not be increased in size
+    cdef bint _failed
+
 
     def __init__(self, LutProvider luts, int nx, int ny, int nz):
         self.luts = luts
@@ -226,6 +232,8 @@ cdef class Cell:
                 for j in range(3):
                     self._normals[i*3+j] = 0.0
 
+        self._failed = False
+
         # Init faces
         self._faceCount = 0
         self._faceMaxCount = 8
@@ -243,8 +251,9 @@ cdef class Cell:
         free(self._faces)
 
 
-    cdef void _increase_size_vertices(self):
+    cdef int _increase_size_vertices(self) nogil:
         """ Increase the size of the vertices array by a factor two.
+        Return -1 if memory cannot be allocated.
         """
         # Allocate new array
         cdef int newMaxCount = self._vertexMaxCount * 2
@@ -255,7 +264,8 @@ cdef class Cell:
             free(newVertices)
             free(newNormals)
             free(newValues)
-            raise MemoryError()
+            self._failed = True
+            return -1
         # Clear
         cdef int i, j
         for i in range(self._vertexCount, newMaxCount):
@@ -273,16 +283,19 @@ cdef class Cell:
         free(self._normals); self._normals = newNormals
         free(self._values); self._values = newValues
         self._vertexMaxCount = newMaxCount
+        return 0
 
 
-    cdef void _increase_size_faces(self):
+    cdef int _increase_size_faces(self) nogil:
         """ Increase the size of the faces array by a factor two.
+        Return -1 if memory cannot be allocated.
         """
         # Allocate new array
         cdef int newMaxCount = self._faceMaxCount * 2
         cdef int *newFaces = <int *>malloc(newMaxCount * sizeof(int))
         if newFaces is NULL:
-            raise MemoryError()
+            self._failed = True
+            return -1
         # Copy
         cdef int i
         for i in range(self._faceCount):
@@ -291,16 +304,19 @@ cdef class Cell:
         free(self._faces)
         self._faces = newFaces
         self._faceMaxCount = newMaxCount
+        return 0
 
 
     ## Adding results
 
-    cdef int add_vertex(self, float x, float y, float z):
-        """ Add a vertex to the result. Return index in vertex array.
+    cdef int add_vertex(self, float x, float y, float z) nogil:
+        """ Add a vertex to the result. Return index in vertex array,
+        or -1 if the vertex could not be added.
         """
         # Check if array is large enough
         if self._vertexCount >= self._vertexMaxCount:
-            self._increase_size_vertices()
+            if self._failed or self._increase_size_vertices():
+                return -1
         # Add vertex
         self._vertices[self._vertexCount*3+0] = x
         self._vertices[self._vertexCount*3+1] = y
@@ -309,15 +325,17 @@ cdef class Cell:
         return self._vertexCount -1
 
 
-    cdef void add_gradient(self, int vertexIndex, float gx, float gy, float gz):
+    cdef void add_gradient(self, int vertexIndex, float gx, float gy, float gz) nogil:
         """ Add a gradient value to the vertex corresponding to the given index.
         """
+        if vertexIndex < 0:
+            return
         self._normals[vertexIndex*3+0] += gx
         self._normals[vertexIndex*3+1] += gy
         self._normals[vertexIndex*3+2] += gz
 
 
-    cdef void add_gradient_from_index(self, int vertexIndex, int i, float strength):
+    cdef void add_gradient_from_index(self, int vertexIndex, int i, float strength) nogil:
         """ Add a gradient value to the vertex corresponding to the given index.
         vertexIndex is the index in the large array of vertices that is returned.
         i is the index of the array of vertices 0-7 for the current cell.
@@ -325,12 +343,15 @@ cdef class Cell:
         self.add_gradient(vertexIndex, self.vg[i*3+0] * strength, self.vg[i*3+1] * strength, self.vg[i*3+2] * strength)
 
 
-    cdef add_face(self, int index):
+    cdef void add_face(self, int index) nogil:
         """ Add a face to the result. Also updates the value.
         """
+        if index < 0:
+            return
         # Check if array is large enough
         if self._faceCount >= self._faceMaxCount:
-            self._increase_size_faces()
+            if self._failed or self._increase_size_faces():
+                return
         # Add face
         self._faces[self._faceCount] = index
         self._faceCount += 1
@@ -352,26 +373,47 @@ cdef class Cell:
                 vertices_[i, j] = self._vertices[i*3+j]
         return vertices
 
-    def get_normals(self):
+    def get_normals(self, bint normalize=True):
         """ Get the final normals array.
-        The normals are normalized to unit length.
+        The normals are normalized to unit length, unless `normalize` is
+        False, e.g. to add the contributions of other cells first.
         """
         normals = np.empty((self._vertexCount,3), np.float32)
         cdef float [:, :] normals_ = normals
-
         cdef int i, j
-        cdef double length, dtmp
         for i in range(self._vertexCount):
-            length = 0.0
             for j in range(3):
-                dtmp = self._normals[i*3+j] # Make it double before taking **2!
-                length +=  dtmp*dtmp
-            if length > 0.0:
-                length = 1.0 / length**0.5
-            for j in range(3):
-                normals_[i,j] = self._normals[i*3+j] * length
+                normals_[i, j] = self._normals[i*3+j]
+        if normalize:
+            normalize_normals(normals)
         return normals
 
+    def get_plane_vertices(self, bint top):
+        """ Get the vertices on the horizontal edges of the bottom or top
+        plane of the current layer.
+
+        Returns the keys of the edges, ``2 * (nx * y + x) + d`` for the
+        edge along the axis ``d`` (0 for x and 1 for y) starting at
+        ``(x, y)``, and the indices of the vertices, both sorted by key.
+        """
+        cdef int *faceLayer = self.faceLayer2 if top else self.faceLayer1
+        cdef Py_ssize_t i, count = 0
+        cdef Py_ssize_t n = self.nx * self.ny * 4
+        for i in range(n):
+            if i % 4 < 2 and faceLayer[i] >= 0:
+                count += 1
+        keys = np.empty(count, np.intp)
+        indices = np.empty(count, np.int32)
+        cdef Py_ssize_t [:] keys_ = keys
+        cdef int [:] indices_ = indices
+        count = 0
+        for i in range(n):
+            if i % 4 < 2 and faceLayer[i] >= 0:
+                keys_[count] = (i // 4) * 2 + i % 4
+                indices_[count] = faceLayer[i]
+                count += 1
+        return keys, indices
+
     def get_faces(self):
         faces = np.empty((self._faceCount,), np.int32)
         cdef int [:] faces_ = faces
@@ -391,7 +433,7 @@ cdef class Cell:
 
     ## Called from marching cube function
 
-    cdef void new_z_value(self):
+    cdef void new_z_value(self) nogil:
         """ This method should be called each time a new z layer is entered.
         We will swap the layers with face information and empty the second.
         """
@@ -405,7 +447,7 @@ cdef class Cell:
 
     cdef void set_cube(self,    double isovalue, int x, int y, int z, int step,
                                 double v0, double v1, double v2, double v3,
-                                double v4, double v5, double v6, double v7):
+                                double v4, double v5, double v6, double v7) nogil:
         """ Set the cube to the new location.
 
         Set the values of the cube corners. The isovalue is subtracted
@@ -448,7 +490,7 @@ cdef class Cell:
         self.v12_calculated = 0
 
 
-    cdef void add_triangles(self, Lut lut, int lutIndex, int nt):
+    cdef void add_triangles(self, Lut lut, int lutIndex, int nt) nogil:
         """ Add triangles.
 
         The vertices for the triangles are specified in the given
@@ -471,7 +513,7 @@ cdef class Cell:
                 self._add_face_from_edge_index(vi)
 
 
-    cdef void add_triangles2(self, Lut lut, int lutIndex, int lutIndex2, int nt):
+    cdef void add_triangles2(self, Lut lut, int lutIndex, int lutIndex2, int nt) nogil:
         """ Same as add_triangles, except that now the geometry is in a LUT
         with 3 dimensions, and an extra index is provided.
 
@@ -489,7 +531,7 @@ cdef class Cell:
 
     ## Used internally
 
-    cdef void _add_face_from_edge_index(self, int vi):
+    cdef void _add_face_from_edge_index(self, int vi) nogil:
         """ Add one face from an edge index. Only adds a face if the
         vertex already exists. Otherwise also adds a vertex and applies
         interpolation.
@@ -575,8 +617,7 @@ cdef class Cell:
 #                         self.z + 0.5* dz1 + 0.5 * dz2 )
 
 
-
-    cdef int get_index_in_facelayer(self, int vi):
+    cdef int get_index_in_facelayer(self, int vi) nogil:
         """
         Get the index of a vertex position, given the edge on which it lies.
         We keep a list of faces so we can reuse vertices. This improves
@@ -653,7 +694,7 @@ cdef class Cell:
         return 4*i + j
 
 
-    cdef void prepare_for_adding_triangles(self):
+    cdef void prepare_for_adding_triangles(self) nogil:
         """ Calculates some things to help adding the triangles:
         array with corner values, max corner value, gradient at each corner.
         """
@@ -696,7 +737,7 @@ cdef class Cell:
         self.vg[7*3+0], self.vg[7*3+1], self.vg[7*3+2] = self.v7-self.v6, self.v4-self.v7, self.v3-self.v7
 
 
-    cdef void calculate_center_vertex(self):
+    cdef void calculate_center_vertex(self) nogil:
         """ Calculate interpolated center vertex and its gradient.
         """
         cdef double v0, v1, v2, v3, v4, v5, v6, v7
@@ -785,13 +826,13 @@ cdef class Lut:
         if self.VALUES is not NULL:
             free(self.VALUES)
 
-    cdef int get1(self, int i0):
+    cdef int get1(self, int i0) nogil:
         return self.VALUES[i0]
 
-    cdef int get2(self, int i0, int i1):
+    cdef int get2(self, int i0, int i1) nogil:
         return self.VALUES[i0*self.L1 + i1]
 
-    cdef int get3(self, int i0, int i1, int i2):
+    cdef int get3(self, int i0, int i1, int i2) nogil:
         return self.VALUES[i0*self.L1*self.L2 + i1*self.L2 + i2]
 
 
@@ -930,42 +971,53 @@ cdef class LutProvider:
 
         self.SUBCONFIG13 = Lut(SUBCONFIG13)
 
-def marching_cubes(float[:, :, :] im not None, double isovalue,
-                   LutProvider luts, int st=1, int classic=0,
-                   np.ndarray[np.npy_bool, ndim=3, cast=True] mask=None):
-    """ marching_cubes(im, double isovalue, LutProvider luts, int st=1, int classic=0)
-    Main entry to apply marching cubes.
-
-    Masked version of marching cubes. This function will check a
-    masking array (same size as im) to decide if the algorithm must be
-    computed for a given voxel. This adds a small overhead that
-    rapidly gets compensated by the fewer computed cubes
-    Returns (vertices, faces, normals, values)
+def normalize_normals(float[:, :] normals):
+    """ Normalize the normals to unit length, in place.
+    """
+    cdef Py_ssize_t i, j
+    cdef double length, dtmp
+    for i in range(normals.shape[0]):
+        length = 0.0
+        for j in range(3):
+            dtmp = normals[i, j] # Make it double before taking **2!
+            length +=  dtmp*dtmp
+        if length > 0.0:
+            length = 1.0 / length**0.5
+        for j in range(3):
+            normals[i, j] = normals[i, j] * length
+
+
+cdef inline int _num_layers(int n, int st) nogil:
+    """ Number of cubes of size `st` along an axis of size `n`.
+    """
+    if n <= st:
+        return 0
+    return (n - st - 1) // st + 1
+
+
+cdef void _march_layers(LutProvider luts, Cell cell, float[:, :, :] im,
+                        double isovalue, int st, bint classic,
+                        np.uint8_t[:, :, :] mask, bint use_mask,
+                        int layer_start, int layer_stop, int z_offset) nogil:
+    """ March through the layers of cubes `layer_start` to `layer_stop`
+    (excluded) of `im`, the layer ``l`` lying between the planes ``l * st``
+    and ``(l + 1) * st``. `z_offset` is added to the z coordinates of the
+    vertices.
     """
-    # Get dimemsnions
-    cdef int Nx, Ny, Nz
-    Nx, Ny, Nz = im.shape[2], im.shape[1], im.shape[0]
-
-    # Create cell to use throughout
-    cdef Cell cell = Cell(luts, Nx, Ny, Nz)
-
     # Typedef variables
-    cdef int x, y, z, x_st, y_st, z_st
+    cdef int x, y, z, x_st, y_st, z_st, layer
     cdef int nt
-    cdef int case, config, subconfig
-    cdef bint no_mask = mask is None
+    cdef int case, config
     # Unfortunately specifying a step in range() significantly degrades
     # performance. Therefore we use a while loop.
     # we have:  max_x = Nx_bound + st + st - 1
     #       ->  Nx_bound = max_allowable_x + 1 - 2 * st
     #       ->  Nx_bound = Nx - 2 * st
-    assert st > 0
-    cdef int Nx_bound, Ny_bound, Nz_bound
-    Nx_bound, Ny_bound, Nz_bound = Nx - 2 * st, Ny - 2 * st, Nz - 2 * st  # precalculated index range
+    cdef int Nx_bound = cell.nx - 2 * st
+    cdef int Ny_bound = cell.ny - 2 * st
 
-    z = -st
-    while z < Nz_bound:
-        z += st
+    for layer in range(layer_start, layer_stop):
+        z = layer * st
         z_st = z + st
 
         cell.new_z_value()  # Indicate that we enter a new layer
@@ -978,9 +1030,9 @@ def marching_cubes(float[:, :, :] im not None, double isovalue,
             while x < Nx_bound:
                 x += st
                 x_st = x + st
-                if no_mask or mask[z_st, y_st, x_st]:
+                if not use_mask or mask[z_st, y_st, x_st]:
                     # Initialize cell
-                    cell.set_cube(isovalue, x, y, z, st,
+                    cell.set_cube(isovalue, x, y, z + z_offset, st,
                         im[z   ,y, x], im[z   ,y, x_st], im[z   ,y_st, x_st], im[z   ,y_st, x],
                         im[z_st,y, x], im[z_st,y, x_st], im[z_st,y_st, x_st], im[z_st,y_st, x] )
 
@@ -1000,12 +1052,89 @@ def marching_cubes(float[:, :, :] im not None, double isovalue,
                             config = luts.CASES.get2(cell.index, 1)
                             the_big_switch(luts, cell, case, config)
 
+
+def marching_cubes(float[:, :, :] im not None, double isovalue,
+                   LutProvider luts, int st=1, int classic=0,
+                   np.ndarray[np.npy_bool, ndim=3, cast=True] mask=None):
+    """ marching_cubes(im, double isovalue, LutProvider luts, int st=1, int classic=0)
+    Main entry to apply marching cubes.
+
+    Masked version of marching cubes. This function will check a
+    masking array (same size as im) to decide if the algorithm must be
+    computed for a given voxel. This adds a small overhead that
+    rapidly gets compensated by the fewer computed cubes
+    Returns (vertices, faces, normals, values)
+    """
+    assert st > 0
+    # Get dimemsnions
+    cdef int Nx, Ny, Nz
+    Nx, Ny, Nz = im.shape[2], im.shape[1], im.shape[0]
+
+    # Create cell to use throughout
+    cdef Cell cell = Cell(luts, Nx, Ny, Nz)
+
+    cdef bint use_mask = mask is not None
+    cdef np.uint8_t[:, :, :] mask_ = _mask_view(mask)
+    cdef int n_layers = _num_layers(Nz, st)
+
+    with nogil:
+        _march_layers(luts, cell, im, isovalue, st, classic, mask_,
+                      use_mask, 0, n_layers, 0)
+    if cell._failed:
+        raise MemoryError()
+
     # Done
     return cell.get_vertices(), cell.get_faces(), cell.get_normals(), cell.get_values()
 
 
+def marching_cubes_chunk(float[:, :, :] im not None, double isovalue,
+                         LutProvider luts, int st, int classic, mask,
+                         int z_offset):
+    """ marching_cubes_chunk(im, isovalue, luts, st, classic, mask, z_offset)
+    Apply marching cubes to a slab of a larger volume.
+
+    The slab holds complete layers of cubes, its first plane being the plane
+    `z_offset` of the volume. The vertices are in the coordinates of the
+    volume, and the vertices on the first and last planes of the slab are
+    returned to weld them with the neighbouring slabs (see
+    `Cell.get_plane_vertices`). The normals are not normalized, so that
+    the contributions of both slabs can be added to the welded vertices.
+
+    Returns (vertices, faces, normals, values, bottom, top)
+    """
+    assert st > 0
+    cdef int Nx, Ny, Nz
+    Nx, Ny, Nz = im.shape[2], im.shape[1], im.shape[0]
+    cdef Cell cell = Cell(luts, Nx, Ny, Nz)
+
+    cdef bint use_mask = mask is not None
+    cdef np.uint8_t[:, :, :] mask_ = _mask_view(mask)
+    cdef int n_layers = _num_layers(Nz, st)
+
+    with nogil:
+        _march_layers(luts, cell, im, isovalue, st, classic, mask_,
+                      use_mask, 0, 1, z_offset)
+    bottom = cell.get_plane_vertices(False)
+    with nogil:
+        _march_layers(luts, cell, im, isovalue, st, classic, mask_,
+                      use_mask, 1, n_layers, z_offset)
+    top = cell.get_plane_vertices(True)
+    if cell._failed:
+        raise MemoryError()
+
+    return (cell.get_vertices(), cell.get_faces(),
+            cell.get_normals(False), cell.get_values(), bottom, top)
+
+
+cdef np.uint8_t[:, :, :] _mask_view(mask):
+    """ View of a boolean mask as uint8, usable without the GIL.
+    """
+    if mask is None:
+        return np.ones((1, 1, 1), np.uint8)
+    return np.asarray(mask).view(np.uint8)
+
 
-cdef void the_big_switch(LutProvider luts, Cell cell, int case, int config):
+cdef void the_big_switch(LutProvider luts, Cell cell, int case, int config) nogil:
     """ The big switch (i.e. if-statement) that I meticulously ported from
     the source code provided by Lewiner et. al.
 
@@ -1268,13 +1397,14 @@ cdef void the_big_switch(LutProvider luts, Cell cell, int case, int config):
             cell.add_triangles(luts.TILING13_1_, config, 4)
         #
         else:
-            print("Marching Cubes: Impossible case 13?" )
+            with gil:
+                print("Marching Cubes: Impossible case 13?" )
 
     elif case == 14 :
         cell.add_triangles(luts.TILING14, config, 4)
 
 
-cdef int test_face(Cell cell, int face):
+cdef int test_face(Cell cell, int face) nogil:
     """ Return True of the face contains part of the surface.
     """
 
@@ -1306,7 +1436,7 @@ cdef int test_face(Cell cell, int face):
         return face * A * AC_BD >= 0;  # face and A invert signs
 
 
-cdef int test_internal(Cell cell, LutProvider luts, int case, int config, int subconfig, int s):
+cdef int test_internal(Cell cell, LutProvider luts, int case, int config, int subconfig, int s) nogil:
     """ Return True of the face contains part of the surface.
     """
 
@@ -1411,9 +1541,11 @@ cdef int test_internal(Cell cell, LutProvider luts, int case, int config, int su
             Ct = cell.v1 + ( cell.v5 - cell.v1 ) * t
             Dt = cell.v0 + ( cell.v4 - cell.v0 ) * t
         else:
-            print( "Invalid edge %i." % edge )
+            with gil:
+                print( "Invalid edge %i." % edge )
     else:
-        print( "Invalid ambiguous case %i." % case )
+        with gil:
+            print( "Invalid ambiguous case %i." % case )
 
     # Process results
     if At >= 0: test += 1
@@ -468,3 +468,243 @@ def inertia_tensor_eigvals(image, mu=None, T=None):
     # very near zero to zero.
     eigvals = np.clip(eigvals, 0, None, out=eigvals)
     return sorted(eigvals, reverse=True)
+
+
+def _label_moments(label_image, order, intensity_image):
+    """Power sums of the coordinates of every label, about the first pixel
+    of each label. See `_moments_cy._label_power_sums`.
+    """
+    label_image = np.asarray(label_image)
+    if not np.issubdtype(label_image.dtype, np.integer):
+        raise TypeError('Non-integer label_image types are ambiguous')
+    if intensity_image is not None:
+        intensity_image = np.asarray(intensity_image)
+        if intensity_image.shape != label_image.shape:
+            raise ValueError('Label and intensity image shapes must match.')
+        weights = np.ascontiguousarray(intensity_image,
+                                       dtype=np.float64).ravel()
+    else:
+        weights = np.empty(0, dtype=np.float64)
+    labels = np.ascontiguousarray(label_image, dtype=np.intp).ravel()
+    n_labels = max(int(labels.max()), 0) + 1 if labels.size else 1
+    shape = np.asarray(label_image.shape, dtype=np.intp)
+    sums, origins = _moments_cy._label_power_sums(
+        labels, weights, intensity_image is not None, shape, n_labels, order)
+    sums = sums.reshape((n_labels,) + (order + 1,) * label_image.ndim)
+    return sums, origins
+
+
+def _shift_moments(M, delta):
+    """Move the origin of the moments of several regions.
+
+    Parameters
+    ----------
+    M : (L, ``order + 1``, ...) array
+        Moments of L regions about their own origin.
+    delta : (L, D) array
+        Position of the current origin of each region relative to the new
+        one.
+
+    Returns
+    -------
+    M : (L, ``order + 1``, ...) array
+        Moments about the new origins, using the binomial expansion of
+        ``(x + delta) ** p`` along each axis.
+    """
+    n_regions, n_powers = M.shape[0], M.shape[1]
+    ndim = M.ndim - 1
+    powers = np.arange(n_powers)
+    binomial = np.ones((n_powers, n_powers))
+    for p in range(1, n_powers):
+        binomial[p, 1:p] = binomial[p - 1, :p - 1] + binomial[p - 1, 1:p]
+    binomial = np.tril(binomial)
+    exponents = np.maximum(powers[:, np.newaxis] - powers, 0)
+    for axis in range(ndim):
+        d = delta[:, axis].reshape(-1, 1, 1)
+        # transform[l, p, a] = C(p, a) * d[l] ** (p - a)
+        transform = binomial * d ** exponents
+        M = np.moveaxis(M, axis + 1, -1)
+        shape = M.shape
+        M = M.reshape(n_regions, -1, n_powers) @ transform.transpose(0, 2, 1)
+        M = np.moveaxis(M.reshape(shape), -1, axis + 1)
+    return np.ascontiguousarray(M)
+
+
+def moments_labels(label_image, order=3, *, intensity_image=None):
+    """Calculate the raw moments of all labeled regions up to a certain order.
+
+    The moments of all regions are computed in a single pass over the label
+    image, which is much faster than calling `moments` on the image of each
+    region.
+
+    Parameters
+    ----------
+    label_image : nD array of int
+        Labeled input image. Labels with value 0 are ignored.
+    order : int, optional
+        Maximum order of moments. Default is 3.
+    intensity_image : nD array, optional
+        Weights of the pixels, with the same shape as `label_image`. By
+        default all pixels have unit weight.
+
+    Returns
+    -------
+    M : (L, ``order + 1``, ``order + 1``, ...) array
+        Raw moments of each label, ``M[l]`` holding the moments of the label
+        ``l``, where L is the largest label plus one. The coordinates are the
+        ones in `label_image`. The moments of labels absent from the image
+        are zero.
+
+    See Also
+    --------
+    moments, moments_central_labels
+
+    Examples
+    --------
+    >>> label_image = np.zeros((20, 20), dtype=int)
+    >>> label_image[13:17, 13:17] = 1
+    >>> label_image[2:4, 5:10] = 2
+    >>> M = moments_labels(label_image, order=1)
+    >>> M[1:, [1, 0], [0, 1]] / M[1:, 0, 0, np.newaxis]
+    array([[14.5, 14.5],
+           [ 2.5,  7. ]])
+    """
+    sums, origins = _label_moments(label_image, order, intensity_image)
+    return _shift_moments(sums, np.maximum(origins, 0).astype(float))
+
+
+def moments_central_labels(label_image, order=3, *, intensity_image=None):
+    """Calculate the central moments of all labeled regions up to a certain
+    order.
+
+    The moments of all regions are computed in a single pass over the label
+    image, which is much faster than calling `moments_central` on the image
+    of each region.
+
+    Parameters
+    ----------
+    label_image : nD array of int
+        Labeled input image. Labels with value 0 are ignored.
+    order : int, optional
+        Maximum order of moments. Default is 3.
+    intensity_image : nD array, optional
+        Weights of the pixels, with the same shape as `label_image`. The
+        moments are then taken about the weighted centroid of each region.
+        By default all pixels have unit weight.
+
+    Returns
+    -------
+    mu : (L, ``order + 1``, ``order + 1``, ...) array
+        Central moments of each label, ``mu[l]`` holding the moments of the
+        label ``l``, where L is the largest label plus one. The moments of
+        labels absent from the image are zero.
+
+    See Also
+    --------
+    moments_central, moments_labels
+
+    Examples
+    --------
+    >>> label_image = np.zeros((20, 20), dtype=int)
+    >>> label_image[13:17, 13:17] = 1
+    >>> mu = moments_central_labels(label_image)
+    >>> mu[1]
+    array([[16.,  0., 20.,  0.],
+           [ 0.,  0.,  0.,  0.],
+           [20.,  0., 25.,  0.],
+           [ 0.,  0.,  0.,  0.]])
+    """
+    # the first order moments are needed to find the centroids
+    sums, _ = _label_moments(label_image, max(order, 1), intensity_image)
+    ndim = sums.ndim - 1
+    mass = sums[(slice(None),) + (0,) * ndim]
+    first_order = np.stack([sums[(slice(None),) + tuple(unit)]
+                            for unit in np.eye(ndim, dtype=int)], axis=-1)
+    # offset of the centroid from the first pixel of each region
+    center = np.divide(first_order, mass[:, np.newaxis],
+                       out=np.zeros_like(first_order),
+                       where=mass[:, np.newaxis] != 0)
+    mu = _shift_moments(sums, -center)
+    return np.ascontiguousarray(
+        mu[(slice(None),) + (slice(order + 1),) * ndim])
+
+
+def inertia_tensor_labels(label_image, mu=None):
+    """Compute the inertia tensors of all labeled regions.
+
+    Parameters
+    ----------
+    label_image : nD array of int
+        Labeled input image. Labels with value 0 are ignored.
+    mu : array, optional
+        The pre-computed central moments of the regions, as returned by
+        `moments_central_labels` with an order of at least 2.
+
+    Returns
+    -------
+    T : (L, ``label_image.ndim``, ``label_image.ndim``) array
+        The inertia tensor of each label, ``T[l]`` being the one of the label
+        ``l`` as computed by `inertia_tensor`. The tensors of labels absent
+        from the image are NaN.
+
+    See Also
+    --------
+    inertia_tensor, inertia_tensor_eigvals_labels
+    """
+    ndim = np.ndim(label_image)
+    if mu is None:
+        mu = moments_central_labels(label_image, order=2)
+    mu0 = mu[(slice(None),) + (0,) * ndim]
+    result = np.zeros((mu.shape[0], ndim, ndim))
+
+    corners2 = (slice(None),) + tuple(2 * np.eye(ndim, dtype=int))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Iii is the sum of second-order moments of every axis *except* i,
+        # see `inertia_tensor`
+        diagonal = (np.sum(mu[corners2], axis=1, keepdims=True)
+                    - mu[corners2]) / mu0[:, np.newaxis]
+        result[:, np.arange(ndim), np.arange(ndim)] = diagonal
+        for dims in itertools.combinations(range(ndim), 2):
+            mu_index = np.zeros(ndim, dtype=int)
+            mu_index[list(dims)] = 1
+            value = -mu[(slice(None),) + tuple(mu_index)] / mu0
+            result[(slice(None),) + dims] = value
+            result[(slice(None),) + dims[::-1]] = value
+    return result
+
+
+def inertia_tensor_eigvals_labels(label_image, mu=None, T=None):
+    """Compute the eigenvalues of the inertia tensors of all labeled regions.
+
+    Parameters
+    ----------
+    label_image : nD array of int
+        Labeled input image. Labels with value 0 are ignored.
+    mu : array, optional
+        The pre-computed central moments of the regions, see
+        `moments_central_labels`.
+    T : (L, D, D) array, optional
+        The pre-computed inertia tensors of the regions. If ``T`` is given,
+        ``mu`` and ``label_image`` are ignored.
+
+    Returns
+    -------
+    eigvals : (L, ``label_image.ndim``) array
+        The eigenvalues of the inertia tensor of each label, in descending
+        order. The eigenvalues of labels absent from the image are NaN.
+
+    See Also
+    --------
+    inertia_tensor_eigvals, inertia_tensor_labels
+    """
+    if T is None:
+        T = inertia_tensor_labels(label_image, mu)
+    eigvals = np.full(T.shape[:2], np.nan)
+    valid = np.all(np.isfinite(T), axis=(1, 2))
+    if np.any(valid):
+        eigvals[valid] = np.linalg.eigvalsh(T[valid])
+    # Floating point precision problems could make a positive
+    # semidefinite matrix have an eigenvalue that is very slightly
+    # negative, see `inertia_tensor_eigvals`.
+    eigvals = np.clip(eigvals, 0, None, out=eigvals)
+    return np.ascontiguousarray(eigvals[:, ::-1])
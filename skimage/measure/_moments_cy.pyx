@@ -3,6 +3,7 @@
 #cython: wraparound=False
 import numpy as np
 cimport numpy as cnp
+cimport cython
 
 from .._shared.fused_numerics cimport np_floats
 cnp.import_array()
@@ -34,3 +35,92 @@ def moments_hu(np_floats[:, :] nu):
     hu[4] = q0 * t0 + q1 * t1
     hu[6] = q1 * t0 - q0 * t1
     return np.asarray(hu)
+
+
+@cython.boundscheck(False)
+def _label_power_sums(const cnp.intp_t[::1] labels, const double[::1] weights,
+                      bint use_weights, const Py_ssize_t[::1] shape,
+                      Py_ssize_t n_labels, int order):
+    """Power sums of the pixel coordinates of all labels in a single pass.
+
+    The coordinates of each label are taken relative to its first pixel in
+    raster order, which keeps the sums well conditioned far from the origin::
+
+        sums[l, ...] = sum_x weight(x) * prod_k (x_k - origins[l, k]) ** p_k
+
+    Parameters
+    ----------
+    labels : (N,) ndarray of intp
+        Raveled label image, in C order. Labels 0 and below are ignored.
+    weights : (N,) ndarray
+        Raveled weights of the pixels, only read when `use_weights` is True.
+    use_weights : bool
+        Whether to weight the pixels.
+    shape : (D,) ndarray of intp
+        Shape of the label image.
+    n_labels : int
+        Number of labels, larger than the largest label.
+    order : int
+        Maximum order of the powers along each axis.
+
+    Returns
+    -------
+    sums : (n_labels, (order + 1) ** D) ndarray
+        Power sums, the exponents ``(p_0, ..., p_{D-1})`` being raveled in C
+        order.
+    origins : (n_labels, D) ndarray of intp
+        First pixel of each label, -1 for the labels absent from the image.
+    """
+    cdef:
+        Py_ssize_t ndim = shape.shape[0]
+        Py_ssize_t n_powers = order + 1
+        Py_ssize_t n_terms = n_powers ** ndim
+        Py_ssize_t i, j, k, e, n
+        cnp.intp_t label
+        double d, p, t
+
+    sums = np.zeros((n_labels, n_terms), dtype=np.float64)
+    origins = np.full((n_labels, ndim), -1, dtype=np.intp)
+    cdef double[:, ::1] sums_ = sums
+    cdef Py_ssize_t[:, ::1] origins_ = origins
+    cdef Py_ssize_t[::1] coords = np.zeros(ndim, dtype=np.intp)
+    cdef double[:, ::1] powers = np.empty((ndim, n_powers), dtype=np.float64)
+    cdef double[::1] terms = np.empty(n_terms, dtype=np.float64)
+
+    if ndim == 0 or labels.shape[0] == 0:
+        return sums, origins
+
+    with nogil:
+        for i in range(labels.shape[0]):
+            label = labels[i]
+            if label > 0:
+                if origins_[label, 0] < 0:
+                    for k in range(ndim):
+                        origins_[label, k] = coords[k]
+                for k in range(ndim):
+                    d = coords[k] - origins_[label, k]
+                    p = 1
+                    for e in range(n_powers):
+                        powers[k, e] = p
+                        p = p * d
+                # outer product of the powers of each axis, expanded in place
+                terms[0] = weights[i] if use_weights else 1
+                n = 1
+                for k in range(ndim):
+                    for j in range(n - 1, -1, -1):
+                        t = terms[j]
+                        for e in range(n_powers):
+                            terms[j * n_powers + e] = t * powers[k, e]
+                    n = n * n_powers
+                for j in range(n_terms):
+                    sums_[label, j] += terms[j]
+
+            # next pixel in raster order
+            k = ndim - 1
+            coords[k] += 1
+            while k > 0 and coords[k] == shape[k]:
+                coords[k] = 0
+                k -= 1
+                coords[k] += 1
+
+    return sums, origins
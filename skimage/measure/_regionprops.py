@@ -1,4 +1,5 @@
 import inspect
+import itertools
 from warnings import warn
 from math import sqrt, atan2, pi as PI
 import numpy as np
@@ -8,6 +9,8 @@ from scipy.spatial.distance import pdist
 from . import _moments
 from ._find_contours import find_contours
 from ._marching_cubes_lewiner import marching_cubes
+from ._moments_cy import _label_power_sums
+from ._regionprops_cy import _label_bboxes, _label_intensity_stats
 from ._regionprops_utils import euler_number, perimeter, perimeter_crofton
 
 from functools import wraps
@@ -114,6 +117,41 @@ COL_DTYPES = {
 
 PROP_VALS = set(PROPS.values())
 
+# properties that `regionprops_table` can compute by chunks of the label
+# image, with the orders of the moments and of the weighted moments they need
+CHUNKED_PROPS = {
+    'area': (0, None),
+    'bbox': (None, None),
+    'bbox_area': (None, None),
+    'centroid': (1, None),
+    'eccentricity': (2, None),
+    'equivalent_diameter': (0, None),
+    'extent': (0, None),
+    'inertia_tensor': (2, None),
+    'inertia_tensor_eigvals': (2, None),
+    'label': (None, None),
+    'local_centroid': (1, None),
+    'major_axis_length': (2, None),
+    'max_intensity': (None, None),
+    'mean_intensity': (0, None),
+    'min_intensity': (None, None),
+    'minor_axis_length': (2, None),
+    'moments': (3, None),
+    'moments_central': (3, None),
+    'moments_hu': (3, None),
+    'moments_normalized': (3, None),
+    'orientation': (2, None),
+    'weighted_centroid': (None, 1),
+    'weighted_local_centroid': (None, 1),
+    'weighted_moments': (None, 3),
+    'weighted_moments_central': (None, 3),
+    'weighted_moments_hu': (None, 3),
+    'weighted_moments_normalized': (None, 3),
+}
+
+_2D_ONLY_PROPS = {'eccentricity', 'moments_hu', 'orientation',
+                  'weighted_moments_hu'}
+
 
 def _infer_number_of_required_args(func):
     """Infer the number of required arguments for a function
@@ -179,13 +217,21 @@ def _infer_regionprop_dtype(func, *, intensity, ndim):
 def _cached(f):
     @wraps(f)
     def wrapper(obj):
-        cache = obj._cache
-        prop = f.__name__
+        if not obj._cache_active:
+            return f(obj)
 
-        if not ((prop in cache) and obj._cache_active):
-            cache[prop] = f(obj)
+        # the values of all regions are stored in a single dictionary per
+        # property, allocated when the property is first accessed
+        caches = obj._regions.caches
+        prop = f.__name__
+        cache = caches.get(prop)
+        if cache is None:
+            cache = caches[prop] = {}
+        index = obj._index
+        if index not in cache:
+            cache[index] = f(obj)
 
-        return cache[prop]
+        return cache[index]
 
     return wrapper
 
@@ -200,57 +246,183 @@ def only2d(method):
     return func2d
 
 
-class RegionProperties:
-    """Please refer to `skimage.measure.regionprops` for more information
-    on the available region properties.
+def _ellipse_properties(inertia_tensors, eigvals):
+    """Properties of the ellipses with the same second moments as regions.
+
+    Vectorized version of the corresponding properties of
+    `RegionProperties`, for many regions at once.
+
+    Parameters
+    ----------
+    inertia_tensors : (L, D, D) ndarray
+        Inertia tensors of the regions, see `inertia_tensor_labels`.
+    eigvals : (L, D) ndarray
+        Eigenvalues of the inertia tensors in descending order, see
+        `inertia_tensor_eigvals_labels`.
+
+    Returns
+    -------
+    properties : dict of (L,) ndarrays
+        The ``'major_axis_length'`` and ``'minor_axis_length'`` of the
+        regions, and for 2D regions their ``'eccentricity'`` and
+        ``'orientation'``.
     """
+    out = {'major_axis_length': 4 * np.sqrt(eigvals[:, 0]),
+           'minor_axis_length': 4 * np.sqrt(eigvals[:, -1])}
+    if inertia_tensors.shape[-1] != 2:
+        return out
+
+    l1, l2 = eigvals[:, 0], eigvals[:, 1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        out['eccentricity'] = np.where(l1 == 0, 0., np.sqrt(1 - l2 / l1))
+    a = inertia_tensors[:, 0, 0]
+    b = inertia_tensors[:, 0, 1]
+    c = inertia_tensors[:, 1, 1]
+    out['orientation'] = np.where(a - c == 0,
+                                  np.where(b < 0, -PI / 4., PI / 4.),
+                                  0.5 * np.arctan2(-2 * b, c - a))
+    return out
 
-    def __init__(self, slice, label, label_image, intensity_image,
-                 cache_active, *, extra_properties=None):
 
-        if intensity_image is not None:
-            ndim = label_image.ndim
-            if not (
-                    intensity_image.shape[:ndim] == label_image.shape
-                    and intensity_image.ndim in [ndim, ndim + 1]
-                    ):
-                raise ValueError('Label and intensity image shapes must match,'
-                                 ' except for channel (last) axis.')
-            multichannel = label_image.shape < intensity_image.shape
+def _check_label_image(label_image):
+    """Raise a TypeError if `label_image` is not a 2D or 3D integer image."""
+    if label_image.ndim not in (2, 3):
+        raise TypeError('Only 2-D and 3-D images supported.')
+
+    if not np.issubdtype(label_image.dtype, np.integer):
+        if np.issubdtype(label_image.dtype, bool):
+            raise TypeError(
+                    'Non-integer image types are ambiguous: '
+                    'use skimage.measure.label to label the connected'
+                    'components of label_image,'
+                    'or label_image.astype(np.uint8) to interpret'
+                    'the True values as a single label.')
         else:
-            multichannel = False
+            raise TypeError(
+                    'Non-integer label_image types are ambiguous')
 
-        self.label = label
 
-        self._slice = slice
-        self.slice = slice
-        self._label_image = label_image
-        self._intensity_image = intensity_image
+def _check_intensity_image(label_image, intensity_image):
+    """Check the shape of the intensity image of a label image, and return
+    whether it has a channel axis."""
+    if intensity_image is None:
+        return False
+    ndim = label_image.ndim
+    if not (
+            intensity_image.shape[:ndim] == label_image.shape
+            and intensity_image.ndim in [ndim, ndim + 1]
+            ):
+        raise ValueError('Label and intensity image shapes must match,'
+                         ' except for channel (last) axis.')
+    return label_image.shape < intensity_image.shape
 
-        self._cache_active = cache_active
-        self._cache = {}
-        self._ndim = label_image.ndim
-        self._multichannel = multichannel
-        self._spatial_axes = tuple(range(self._ndim))
 
-        self._extra_properties = {}
+class _RegionData:
+    """Data shared by all the regions of a label image.
+
+    Parameters
+    ----------
+    label_image : (N, M[, P]) ndarray
+        Labeled input image.
+    intensity_image : (N, M[, P][, C]) ndarray or None
+        Intensity image.
+    labels : (R,) ndarray of intp
+        Label of each region.
+    bboxes : (R, 2 * ndim) ndarray of intp
+        Bounding box of each region, as in `RegionProperties.bbox`.
+    extra_properties : iterable of callables or None
+        Additional properties of the regions.
+    """
+
+    __slots__ = ('label_image', 'intensity_image', 'labels', 'bboxes',
+                 'ndim', 'multichannel', 'spatial_axes', 'extra_properties',
+                 'caches')
+
+    def __init__(self, label_image, intensity_image, labels, bboxes,
+                 extra_properties):
+        multichannel = _check_intensity_image(label_image, intensity_image)
+
+        self.label_image = label_image
+        self.intensity_image = intensity_image
+        self.labels = labels
+        self.bboxes = bboxes
+        self.ndim = label_image.ndim
+        self.multichannel = multichannel
+        self.spatial_axes = tuple(range(self.ndim))
+        # property name -> {region index: value}
+        self.caches = {}
+
         if extra_properties is None:
             extra_properties = []
         for func in extra_properties:
             name = func.__name__
-            if hasattr(self, name):
+            if hasattr(RegionProperties, name):
                 msg = (
                     f"Extra property '{name}' is shadowed by existing "
                     "property and will be inaccessible. Consider renaming it."
                 )
                 warn(msg)
-        self._extra_properties = {
+        self.extra_properties = {
             func.__name__: func for func in extra_properties
         }
 
+
+class RegionProperties:
+    """Please refer to `skimage.measure.regionprops` for more information
+    on the available region properties.
+    """
+
+    # A region only holds its index in the data shared by all the regions of
+    # the label image, so that millions of them stay cheap to create.
+    __slots__ = ('_regions', '_index', '_cache_active')
+
+    def __init__(self, slice, label, label_image, intensity_image,
+                 cache_active, *, extra_properties=None):
+        bbox = ([s.start for s in slice] + [s.stop for s in slice])
+        self._regions = _RegionData(label_image, intensity_image,
+                                    np.array([label], dtype=np.intp),
+                                    np.array([bbox], dtype=np.intp),
+                                    extra_properties)
+        self._index = 0
+        self._cache_active = cache_active
+
+    @classmethod
+    def _from_regions(cls, regions, index, cache_active):
+        """Region `index` of the shared region data `regions`."""
+        self = object.__new__(cls)
+        self._regions = regions
+        self._index = index
+        self._cache_active = cache_active
+        return self
+
+    @property
+    def _label_image(self):
+        return self._regions.label_image
+
+    @property
+    def _intensity_image(self):
+        return self._regions.intensity_image
+
+    @property
+    def _ndim(self):
+        return self._regions.ndim
+
+    @property
+    def _multichannel(self):
+        return self._regions.multichannel
+
+    @property
+    def _spatial_axes(self):
+        return self._regions.spatial_axes
+
+    @property
+    def _extra_properties(self):
+        return self._regions.extra_properties
+
     def __getattr__(self, attr):
-        if attr in self._extra_properties:
-            func = self._extra_properties[attr]
+        # `_regions` is unset while unpickling
+        if attr != '_regions' and attr in self._regions.extra_properties:
+            func = self._regions.extra_properties[attr]
             n_args = _infer_number_of_required_args(func)
             # determine whether func requires intensity image
             if n_args == 2:
@@ -285,8 +457,7 @@ class RegionProperties:
         A tuple of the bounding box's start coordinates for each dimension,
         followed by the end coordinates for each dimension
         """
-        return tuple([self.slice[i].start for i in range(self._ndim)] +
-                     [self.slice[i].stop for i in range(self._ndim)])
+        return tuple(self._regions.bboxes[self._index].tolist())
 
     @property
     def bbox_area(self):
@@ -390,6 +561,10 @@ class RegionProperties:
     def _intensity_image_double(self):
         return self.intensity_image.astype(np.double)
 
+    @property
+    def label(self):
+        return int(self._regions.labels[self._index])
+
     @property
     def local_centroid(self):
         M = self.moments
@@ -465,6 +640,12 @@ class RegionProperties:
     def perimeter_crofton(self):
         return perimeter_crofton(self.image, 4)
 
+    @property
+    def slice(self):
+        bbox = self._regions.bboxes[self._index].tolist()
+        ndim = self._ndim
+        return tuple([slice(bbox[i], bbox[ndim + i]) for i in range(ndim)])
+
     @property
     def solidity(self):
         return self.area / self.convex_area
@@ -707,7 +888,8 @@ def _props_to_dict(regions, properties=('label', 'bbox'), separator='-'):
 def regionprops_table(label_image, intensity_image=None,
                       properties=('label', 'bbox'),
                       *,
-                      cache=True, separator='-', extra_properties=None):
+                      cache=True, separator='-', extra_properties=None,
+                      chunk_size=None):
     """Compute image properties and return them as a pandas-compatible table.
 
     The table is a dictionary mapping column names to value arrays. See Notes
@@ -755,6 +937,23 @@ def regionprops_table(label_image, intensity_image=None,
         issued. A property computation function must take a region mask as its
         first argument. If the property requires an intensity image, it must
         accept the intensity image as the second argument.
+    chunk_size : int, optional
+        Number of planes along the first axis of `label_image` processed at
+        once. Additive statistics of the regions (pixel counts, bounding
+        boxes, moments and intensity sums and extrema) are accumulated over
+        the chunks, the regions spanning several chunks being merged, and the
+        properties are derived from them at the end. Only the current chunks
+        are loaded, so that `label_image` and `intensity_image` can e.g. be
+        memory-mapped arrays larger than the memory. By default, the whole
+        image is processed at once. Only the following properties are
+        supported, and `extra_properties` is not: ``area``, ``bbox``,
+        ``bbox_area``, ``centroid``, ``eccentricity``,
+        ``equivalent_diameter``, ``extent``, ``inertia_tensor``,
+        ``inertia_tensor_eigvals``, ``label``, ``local_centroid``,
+        ``major_axis_length``, ``max_intensity``, ``mean_intensity``,
+        ``min_intensity``, ``minor_axis_length``, ``moments``,
+        ``moments_central``, ``moments_hu``, ``moments_normalized``,
+        ``orientation`` and the ``weighted_*`` properties.
 
     Returns
     -------
@@ -785,6 +984,9 @@ def regionprops_table(label_image, intensity_image=None,
     size), an object array will be used, with the corresponding property name
     as the key.
 
+    With `chunk_size`, the columns are the same as without it, but the
+    properties derived from moments may differ by rounding errors.
+
     Examples
     --------
     >>> from skimage import data, util, measure
@@ -839,6 +1041,12 @@ def regionprops_table(label_image, intensity_image=None,
     4      5       112.50        113.0        114.0
 
     """
+    if chunk_size is not None:
+        if extra_properties is not None:
+            raise ValueError('extra_properties cannot be computed by chunks.')
+        return _regionprops_table_chunked(label_image, intensity_image,
+                                          properties, chunk_size, separator)
+
     regions = regionprops(label_image, intensity_image=intensity_image,
                           cache=cache, extra_properties=extra_properties)
     if extra_properties is not None:
@@ -866,6 +1074,328 @@ def regionprops_table(label_image, intensity_image=None,
     )
 
 
+def _normalize_moments_labels(mu, ndim):
+    """Vectorized `moments_normalized` of the central moments ``mu[l]`` of
+    several regions, the spatial axes of the moments being ``1 .. ndim``."""
+    order = mu.shape[1] - 1
+    mu0 = mu[(slice(None),) + (0,) * ndim]
+    nu = np.zeros_like(mu)
+    for powers in itertools.product(range(order + 1), repeat=ndim):
+        index = (slice(None),) + powers
+        if sum(powers) < 2:
+            nu[index] = np.nan
+        else:
+            nu[index] = mu[index] / mu0 ** (sum(powers) / ndim + 1)
+    return nu
+
+
+class _ChunkedRegionStats:
+    """Additive statistics of the regions of a label image, accumulated over
+    chunks of the image.
+
+    All statistics are stored in arrays indexed by label, which grow with
+    the largest label seen so far. The power sums of the coordinates of
+    each label are taken about its first pixel, see
+    `_moments_cy._label_power_sums`, and moved to the first pixel of the
+    label in the whole image when merging the chunks.
+
+    Parameters
+    ----------
+    ndim : int
+        Number of dimensions of the label image.
+    n_channels : int
+        Number of channels of the intensity image.
+    order : int
+        Maximum order of the power sums of the coordinates.
+    weighted_order : int or None
+        Maximum order of the power sums weighted by the intensities, None
+        not to compute them.
+    intensity : bool
+        Whether to compute the sum, minimum and maximum of the intensities.
+    multichannel : bool
+        Whether the intensity image has a channel axis.
+    """
+
+    def __init__(self, ndim, n_channels, order, weighted_order, intensity,
+                 multichannel):
+        self.ndim = ndim
+        self.n_channels = n_channels
+        self.multichannel = multichannel
+        self.order = order
+        self.weighted_order = weighted_order
+        self.intensity = intensity
+
+        # name of each array and value of the absent labels
+        self._fill_values = {'bboxes': -1, 'origins': -1, 'sums': 0}
+        self.bboxes = np.empty((0, 2 * ndim), dtype=np.intp)
+        self.origins = np.empty((0, ndim), dtype=np.intp)
+        self.sums = np.empty((0, (order + 1) ** ndim))
+        if weighted_order is not None:
+            self._fill_values['weighted_sums'] = 0
+            self.weighted_sums = np.empty(
+                (0, n_channels, (weighted_order + 1) ** ndim))
+        if intensity:
+            self._fill_values.update(intensity_sums=0, intensity_mins=np.inf,
+                                     intensity_maxs=-np.inf)
+            self.intensity_sums = np.empty((0, n_channels))
+            self.intensity_mins = np.empty((0, n_channels))
+            self.intensity_maxs = np.empty((0, n_channels))
+
+    def _grow(self, n_labels):
+        n_labels = max(n_labels, 2 * len(self.bboxes))
+        for name, fill_value in self._fill_values.items():
+            array = getattr(self, name)
+            grown = np.full((n_labels,) + array.shape[1:], fill_value,
+                            dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def add_chunk(self, labels, values, offset):
+        """Accumulate the statistics of a chunk of the label image.
+
+        Parameters
+        ----------
+        labels : ndarray of int
+            Chunk of the label image.
+        values : (N, C) ndarray or None
+            Raveled intensities of the chunk, as float64.
+        offset : int
+            Position of the chunk along the first axis of the label image.
+        """
+        ndim = self.ndim
+        # relabel the chunk with consecutive labels, so that the memory of
+        # its statistics only depends on its number of regions
+        uniq, inverse = np.unique(labels.ravel(), return_inverse=True)
+        foreground = uniq > 0
+        chunk_labels = uniq[foreground].astype(np.intp)
+        if chunk_labels.size == 0:
+            return
+        compact = np.cumsum(foreground) * foreground
+        compact = np.ascontiguousarray(compact[inverse], dtype=np.intp)
+        n_compact = chunk_labels.size + 1
+        shape = np.array(labels.shape, dtype=np.intp)
+        if chunk_labels[-1] >= len(self.bboxes):
+            self._grow(chunk_labels[-1] + 1)
+
+        bboxes = _label_bboxes(compact, shape, n_compact)[1:]
+        bboxes[:, [0, ndim]] += offset
+        previous = self.bboxes[chunk_labels]
+        new = previous[:, 0] < 0
+        previous[new] = bboxes[new]
+        self.bboxes[chunk_labels, :ndim] = np.minimum(previous[:, :ndim],
+                                                      bboxes[:, :ndim])
+        self.bboxes[chunk_labels, ndim:] = np.maximum(previous[:, ndim:],
+                                                      bboxes[:, ndim:])
+
+        sums, origins = _label_power_sums(
+            compact, np.empty(0), False, shape, n_compact, self.order)
+        origins = origins[1:]
+        origins[:, 0] += offset
+        reference = self.origins[chunk_labels]
+        reference[new] = origins[new]
+        self.origins[chunk_labels] = reference
+        delta = (origins - reference).astype(float)
+        self.sums[chunk_labels] += self._shift(sums[1:], delta, self.order)
+
+        if self.weighted_order is not None:
+            for c in range(self.n_channels):
+                weights = np.ascontiguousarray(values[:, c])
+                sums, _ = _label_power_sums(compact, weights, True, shape,
+                                            n_compact, self.weighted_order)
+                self.weighted_sums[chunk_labels, c] += self._shift(
+                    sums[1:], delta, self.weighted_order)
+
+        if self.intensity:
+            sums, mins, maxs = _label_intensity_stats(compact, values,
+                                                      n_compact)
+            self.intensity_sums[chunk_labels] += sums[1:]
+            self.intensity_mins[chunk_labels] = np.minimum(
+                self.intensity_mins[chunk_labels], mins[1:])
+            self.intensity_maxs[chunk_labels] = np.maximum(
+                self.intensity_maxs[chunk_labels], maxs[1:])
+
+    def _shift(self, sums, delta, order):
+        """Move the origin of raveled power sums by -`delta`."""
+        shape = (len(sums),) + (order + 1,) * self.ndim
+        return _moments._shift_moments(sums.reshape(shape),
+                                       delta).reshape(len(sums), -1)
+
+    def table(self, label_image, properties, separator):
+        """Finalize the properties of the regions as the columns of a table,
+        see `regionprops_table`."""
+        ndim = self.ndim
+        multichannel = self.multichannel
+        present = np.flatnonzero(self.bboxes[:, 0] >= 0)
+        n_regions = len(present)
+        bboxes = self.bboxes[present]
+        origins = self.origins[present]
+        # position of the first pixel of each region in its bounding box
+        local_origins = (origins - bboxes[:, :ndim]).astype(float)
+        S = self.sums[present].reshape(
+            (n_regions,) + (self.order + 1,) * ndim)
+        unit = tuple(np.eye(ndim, dtype=int))
+        values = {}
+
+        def weighted_sums():
+            n_channels = self.n_channels
+            W = self.weighted_sums[present].reshape(
+                (n_regions * n_channels,)
+                + (self.weighted_order + 1,) * ndim)
+            center = (np.stack([W[(slice(None),) + tuple(u)]
+                                for u in unit], axis=-1)
+                      / W[(slice(None),) + (0,) * ndim][:, np.newaxis])
+            return W, center
+
+        def by_channel(W):
+            # (R * C, ...) -> (R, ..., C), without channel axis if the
+            # intensity image has none
+            W = W.reshape((n_regions, self.n_channels) + W.shape[1:])
+            W = np.moveaxis(W, 1, -1)
+            return W if multichannel else W[..., 0]
+
+        def compute(prop):
+            if prop in values:
+                return values[prop]
+            if prop == 'label':
+                value = present
+            elif prop == 'bbox':
+                value = bboxes
+            elif prop == 'bbox_area':
+                value = np.prod(bboxes[:, ndim:] - bboxes[:, :ndim], axis=1)
+            elif prop == 'area':
+                value = np.rint(S[(slice(None),) + (0,) * ndim]).astype(int)
+            elif prop == 'equivalent_diameter':
+                value = (2 * ndim * compute('area') / PI) ** (1 / ndim)
+            elif prop == 'extent':
+                value = compute('area') / compute('bbox_area')
+            elif prop == '_center':
+                # centroid relative to the first pixel of each region
+                value = (np.stack([S[(slice(None),) + tuple(u)]
+                                   for u in unit], axis=-1)
+                         / S[(slice(None),) + (0,) * ndim][:, np.newaxis])
+            elif prop == 'centroid':
+                value = compute('_center') + origins
+            elif prop == 'local_centroid':
+                value = compute('_center') + local_origins
+            elif prop == 'moments':
+                value = _moments._shift_moments(S, local_origins)
+            elif prop == 'moments_central':
+                value = _moments._shift_moments(S, -compute('_center'))
+            elif prop == 'moments_normalized':
+                value = _normalize_moments_labels(
+                    compute('moments_central'), ndim)
+            elif prop == 'moments_hu':
+                value = np.array([_moments.moments_hu(nu) for nu in
+                                  compute('moments_normalized')])
+                value = value.reshape(n_regions, 7)
+            elif prop == 'inertia_tensor':
+                value = _moments.inertia_tensor_labels(
+                    label_image, mu=compute('moments_central'))
+            elif prop == 'inertia_tensor_eigvals':
+                value = _moments.inertia_tensor_eigvals_labels(
+                    label_image, T=compute('inertia_tensor'))
+            elif prop in ('major_axis_length', 'minor_axis_length',
+                          'eccentricity', 'orientation'):
+                value = _ellipse_properties(
+                    compute('inertia_tensor'),
+                    compute('inertia_tensor_eigvals'))[prop]
+            elif prop in ('mean_intensity', 'min_intensity',
+                          'max_intensity'):
+                if prop == 'mean_intensity':
+                    area = compute('area')[:, np.newaxis]
+                    value = self.intensity_sums[present] / area
+                elif prop == 'min_intensity':
+                    value = self.intensity_mins[present]
+                else:
+                    value = self.intensity_maxs[present]
+                if not multichannel:
+                    value = value[:, 0]
+            elif prop == 'weighted_moments':
+                W, _ = weighted_sums()
+                delta = np.repeat(local_origins, self.n_channels, axis=0)
+                value = by_channel(_moments._shift_moments(W, delta))
+            elif prop in ('weighted_centroid', 'weighted_local_centroid'):
+                _, center = weighted_sums()
+                start = origins if prop == 'weighted_centroid' else \
+                    local_origins
+                center = (center.reshape(n_regions, self.n_channels, ndim)
+                          + start[:, np.newaxis])
+                value = np.moveaxis(center, 1, -1)
+                if not multichannel:
+                    value = value[..., 0]
+            elif prop in ('weighted_moments_central',
+                          'weighted_moments_normalized',
+                          'weighted_moments_hu'):
+                W, center = weighted_sums()
+                mu = _moments._shift_moments(W, -center)
+                nu = _normalize_moments_labels(mu, ndim)
+                if prop == 'weighted_moments_central':
+                    value = by_channel(mu)
+                elif prop == 'weighted_moments_normalized':
+                    value = by_channel(nu)
+                else:
+                    hu = np.array([_moments.moments_hu(n) for n in nu])
+                    value = by_channel(hu.reshape(len(nu), 7))
+            values[prop] = value
+            return value
+
+        out = {}
+        for prop in properties:
+            if prop in _2D_ONLY_PROPS and ndim > 2:
+                raise NotImplementedError('Property %s is not implemented '
+                                          'for 3D images' % prop)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                value = compute(prop)
+            dtype = COL_DTYPES[prop]
+            if value.ndim == 1:
+                out[prop] = value.astype(dtype)
+                continue
+            for ind in np.ndindex(value.shape[1:]):
+                column = separator.join(map(str, (prop,) + ind))
+                out[column] = value[(slice(None),) + ind].astype(dtype)
+        return out
+
+
+def _regionprops_table_chunked(label_image, intensity_image, properties,
+                               chunk_size, separator):
+    """Compute the properties of the regions of a label image, by chunks of
+    `chunk_size` planes along its first axis. See `regionprops_table`.
+    """
+    _check_label_image(label_image)
+    multichannel = _check_intensity_image(label_image, intensity_image)
+    if int(chunk_size) != chunk_size or chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer.')
+    chunk_size = int(chunk_size)
+    unsupported = [prop for prop in properties if prop not in CHUNKED_PROPS]
+    if unsupported:
+        raise ValueError(f'Properties {unsupported} cannot be computed by '
+                         'chunks.')
+
+    orders = [CHUNKED_PROPS[prop] for prop in properties]
+    order = max([o for o, _ in orders if o is not None], default=0)
+    weighted_order = max([o for _, o in orders if o is not None],
+                         default=None)
+    intensity = any(prop in ('mean_intensity', 'min_intensity',
+                             'max_intensity') for prop in properties)
+    if (intensity or weighted_order is not None) and intensity_image is None:
+        raise AttributeError('No intensity image specified.')
+
+    n_channels = 1
+    if multichannel:
+        n_channels = intensity_image.shape[-1]
+    stats = _ChunkedRegionStats(label_image.ndim, n_channels, order,
+                                weighted_order, intensity, multichannel)
+    for start in range(0, label_image.shape[0], chunk_size):
+        planes = slice(start, start + chunk_size)
+        values = None
+        if intensity or weighted_order is not None:
+            values = np.asarray(intensity_image[planes], dtype=np.float64)
+            values = np.ascontiguousarray(values).reshape(-1, n_channels)
+        stats.add_chunk(np.asarray(label_image[planes]), values, start)
+
+    return stats.table(label_image, properties, separator)
+
+
 def regionprops(label_image, intensity_image=None, cache=True,
                 coordinates=None, *, extra_properties=None):
     r"""Measure properties of labeled image regions.
@@ -1114,20 +1644,7 @@ def regionprops(label_image, intensity_image=None, cache=True,
 
     """
 
-    if label_image.ndim not in (2, 3):
-        raise TypeError('Only 2-D and 3-D images supported.')
-
-    if not np.issubdtype(label_image.dtype, np.integer):
-        if np.issubdtype(label_image.dtype, bool):
-            raise TypeError(
-                    'Non-integer image types are ambiguous: '
-                    'use skimage.measure.label to label the connected'
-                    'components of label_image,'
-                    'or label_image.astype(np.uint8) to interpret'
-                    'the True values as a single label.')
-        else:
-            raise TypeError(
-                    'Non-integer label_image types are ambiguous')
+    _check_label_image(label_image)
 
     if coordinates is not None:
         if coordinates == 'rc':
@@ -1145,20 +1662,17 @@ def regionprops(label_image, intensity_image=None, cache=True,
                    'version 0.15.x or earlier.')
             raise ValueError(msg)
 
-    regions = []
-
-    objects = ndi.find_objects(label_image)
-    for i, sl in enumerate(objects):
-        if sl is None:
-            continue
-
-        label = i + 1
-
-        props = RegionProperties(sl, label, label_image, intensity_image,
-                                 cache, extra_properties=extra_properties)
-        regions.append(props)
-
-    return regions
+    # bounding boxes of all labels, without a slice object per label
+    n_labels = int(label_image.max()) + 1 if label_image.size else 1
+    bboxes = _label_bboxes(np.ascontiguousarray(label_image).ravel(),
+                           np.array(label_image.shape, dtype=np.intp),
+                           max(n_labels, 1))
+    labels = np.flatnonzero(bboxes[:, 0] >= 0)
+    regions = _RegionData(label_image, intensity_image, labels,
+                          bboxes[labels], extra_properties)
+
+    return [RegionProperties._from_regions(regions, i, cache)
+            for i in range(len(labels))]
 
 
 def _parse_docs():
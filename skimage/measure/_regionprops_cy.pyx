@@ -0,0 +1,169 @@
+#cython: cdivision=True
+#cython: boundscheck=False
+#cython: nonecheck=False
+#cython: wraparound=False
+import numpy as np
+cimport numpy as cnp
+
+from .._shared.fused_numerics cimport np_anyint
+
+cnp.import_array()
+
+
+cdef void _bboxes(const np_anyint* labels, Py_ssize_t size,
+                  const Py_ssize_t[::1] shape,
+                  Py_ssize_t[:, ::1] bboxes) nogil:
+    cdef:
+        Py_ssize_t ndim = shape.shape[0]
+        Py_ssize_t i, k, c, label
+        Py_ssize_t coords[32]
+
+    for k in range(ndim):
+        coords[k] = 0
+
+    for i in range(size):
+        if labels[i] > 0:
+            label = <Py_ssize_t>labels[i]
+            if bboxes[label, 0] < 0:
+                for k in range(ndim):
+                    bboxes[label, k] = coords[k]
+                    bboxes[label, ndim + k] = coords[k] + 1
+            else:
+                for k in range(ndim):
+                    c = coords[k]
+                    if c < bboxes[label, k]:
+                        bboxes[label, k] = c
+                    if c >= bboxes[label, ndim + k]:
+                        bboxes[label, ndim + k] = c + 1
+
+        # next pixel in raster order
+        k = ndim - 1
+        coords[k] += 1
+        while k > 0 and coords[k] == shape[k]:
+            coords[k] = 0
+            k -= 1
+            coords[k] += 1
+
+
+def _label_bboxes(cnp.ndarray labels, const Py_ssize_t[::1] shape,
+                  Py_ssize_t n_labels):
+    """Bounding boxes of all labels in a single pass.
+
+    Parameters
+    ----------
+    labels : (N,) ndarray of int
+        Raveled label image, C-contiguous and in C order, which may be
+        read-only. Labels 0 and below are ignored.
+    shape : (D,) ndarray of intp
+        Shape of the label image, with at most 32 dimensions.
+    n_labels : int
+        Number of labels, larger than the largest label.
+
+    Returns
+    -------
+    bboxes : (n_labels, 2 * D) ndarray of intp
+        Start coordinates of the bounding box of each label along each
+        dimension, followed by the stop coordinates, as in
+        `RegionProperties.bbox`. The start coordinates of the labels absent
+        from the image are -1.
+    """
+    if labels.ndim != 1 or not labels.flags.c_contiguous:
+        raise ValueError('labels must be a contiguous 1D array.')
+
+    cdef:
+        Py_ssize_t size = labels.shape[0]
+        void* data = cnp.PyArray_DATA(labels)
+        bint signed
+        Py_ssize_t itemsize
+
+    if shape.shape[0] > 32:
+        raise ValueError('At most 32 dimensions are supported.')
+
+    bboxes = np.full((n_labels, 2 * shape.shape[0]), -1, dtype=np.intp)
+    cdef Py_ssize_t[:, ::1] bboxes_ = bboxes
+
+    if shape.shape[0] == 0 or size == 0:
+        return bboxes
+
+    dtype = labels.dtype
+    if dtype.kind not in 'iu':
+        raise TypeError('labels must be of integer type.')
+    signed = dtype.kind == 'i'
+    itemsize = dtype.itemsize
+    with nogil:
+        if itemsize == 1:
+            if signed:
+                _bboxes(<const cnp.int8_t*>data, size, shape, bboxes_)
+            else:
+                _bboxes(<const cnp.uint8_t*>data, size, shape, bboxes_)
+        elif itemsize == 2:
+            if signed:
+                _bboxes(<const cnp.int16_t*>data, size, shape, bboxes_)
+            else:
+                _bboxes(<const cnp.uint16_t*>data, size, shape, bboxes_)
+        elif itemsize == 4:
+            if signed:
+                _bboxes(<const cnp.int32_t*>data, size, shape, bboxes_)
+            else:
+                _bboxes(<const cnp.uint32_t*>data, size, shape, bboxes_)
+        else:
+            if signed:
+                _bboxes(<const cnp.int64_t*>data, size, shape, bboxes_)
+            else:
+                _bboxes(<const cnp.uint64_t*>data, size, shape, bboxes_)
+
+    return bboxes
+
+
+def _label_intensity_stats(const cnp.intp_t[::1] labels,
+                           const double[:, ::1] values, Py_ssize_t n_labels):
+    """Sum, minimum and maximum of the intensities of all labels in a single
+    pass.
+
+    Parameters
+    ----------
+    labels : (N,) ndarray of intp
+        Raveled label image. Labels 0 and below are ignored.
+    values : (N, C) ndarray
+        Raveled intensities of the pixels, C being the number of channels.
+    n_labels : int
+        Number of labels, larger than the largest label.
+
+    Returns
+    -------
+    sums, mins, maxs : (n_labels, C) ndarrays
+        Sum, minimum and maximum of the intensities of each label and
+        channel. As with `np.min` and `np.max`, NaN intensities propagate.
+        The minima and maxima of the labels absent from the image are
+        infinite.
+    """
+    cdef:
+        Py_ssize_t n_channels = values.shape[1]
+        Py_ssize_t i, c
+        cnp.intp_t label
+        double v
+
+    sums = np.zeros((n_labels, n_channels), dtype=np.float64)
+    mins = np.full((n_labels, n_channels), np.inf, dtype=np.float64)
+    maxs = np.full((n_labels, n_channels), -np.inf, dtype=np.float64)
+    cdef double[:, ::1] sums_ = sums
+    cdef double[:, ::1] mins_ = mins
+    cdef double[:, ::1] maxs_ = maxs
+
+    with nogil:
+        for i in range(labels.shape[0]):
+            label = labels[i]
+            if label <= 0:
+                continue
+            for c in range(n_channels):
+                v = values[i, c]
+                sums_[label, c] += v
+                # once NaN, the extrema stay NaN
+                if v < mins_[label, c] or v != v:
+                    if mins_[label, c] == mins_[label, c]:
+                        mins_[label, c] = v
+                if v > maxs_[label, c] or v != v:
+                    if maxs_[label, c] == maxs_[label, c]:
+                        maxs_[label, c] = v
+
+    return sums, mins, maxs
@@ -1,4 +1,6 @@
 import math
+from copy import copy
+
 import numpy as np
 from numpy.linalg import inv, pinv
 from scipy import optimize
@@ -100,6 +102,68 @@ class LineModelND(BaseModel):
 
         return True
 
+    # methods whose batched versions are `_estimate_many` and
+    # `_residuals_many`, see `ransac`
+    _batched_methods = ('estimate', 'residuals')
+
+    def _estimate_many(self, data):
+        """Estimate many line models at once, as by `estimate`.
+
+        Parameters
+        ----------
+        data : (K, N, dim) array
+            K sets of N points in a space of dimensionality dim >= 2.
+
+        Returns
+        -------
+        params : (K, 2, dim) array
+            The `origin` and `direction` of each line.
+        success : (K,) array of bool
+            Whether the estimation of each line succeeds.
+        """
+        _check_data_atleast_2D(data[0])
+
+        origin = data.mean(axis=1)
+        data = data - origin[:, np.newaxis]
+
+        if data.shape[1] == 2:  # well determined
+            direction = data[:, 1] - data[:, 0]
+            norm = np.sqrt((direction[:, np.newaxis, :]
+                            @ direction[:, :, np.newaxis])[:, 0, 0])
+            nonzero = norm != 0
+            direction[nonzero] /= norm[nonzero, np.newaxis]
+        elif data.shape[1] > 2:  # over-determined
+            _, _, v = np.linalg.svd(data, full_matrices=False)
+            direction = v[:, 0]
+        else:  # under-determined
+            raise ValueError('At least 2 input points needed.')
+
+        params = np.stack([origin, direction], axis=1)
+        return params, np.ones(len(params), dtype=bool)
+
+    def _residuals_many(self, params, data):
+        """Residuals of many line models, as by `residuals`.
+
+        Parameters
+        ----------
+        params : (K, 2, dim) array
+            The `origin` and `direction` of each line.
+        data : (N, dim) array
+            N points in a space of dimension dim.
+
+        Returns
+        -------
+        residuals : (K, N) array
+            Residual for each data point, for each line.
+        """
+        _check_data_atleast_2D(data)
+        origin = params[:, np.newaxis, 0]
+        direction = params[:, 1]
+        centered = data - origin
+        res = centered - (
+            (centered @ direction[:, :, np.newaxis]) * direction[:, np.newaxis])
+        return np.sqrt(np.einsum('kij,kij->ki', res, res))
+
     def residuals(self, data, params=None):
         """Determine residuals of data to model.
 
@@ -626,6 +690,125 @@ def _dynamic_max_trials(n_inliers, n_samples, min_samples, probability):
     return int(np.ceil(nom / denom))
 
 
+def _batch_model(model_class):
+    """Instance of `model_class` estimating and scoring many models at once.
+
+    None is returned when `model_class` has no ``_estimate_many`` and
+    ``_residuals_many`` methods, or overrides one of the methods of which they
+    are the batched versions.
+    """
+    if not isinstance(model_class, type):
+        return None
+    owner = next((cls for cls in model_class.__mro__
+                  if '_estimate_many' in vars(cls)), None)
+    if owner is None:
+        return None
+    for name in owner._batched_methods:
+        if getattr(model_class, name) is not getattr(owner, name):
+            return None
+    return model_class()
+
+
+def _ransac_trials(data, model_class, min_samples, residual_threshold,
+                   is_data_valid, is_model_valid, random_state, spl_idxs,
+                   max_trials):
+    """Generate the trials of `ransac`.
+
+    None is yielded for the rejected trials, and otherwise the model with
+    its inliers and the sum of its squared residuals.
+    """
+    num_samples = len(data[0])
+    for _ in range(max_trials):
+        # do sample selection according data pairs
+        samples = [d[spl_idxs] for d in data]
+        # for next iteration choose random sample set and be sure that no
+        # samples repeat
+        spl_idxs = random_state.choice(num_samples, min_samples, replace=False)
+
+        # optional check if random sample set is valid
+        if is_data_valid is not None and not is_data_valid(*samples):
+            yield None
+            continue
+
+        # estimate model for current random sample set
+        sample_model = model_class()
+
+        success = sample_model.estimate(*samples)
+        # backwards compatibility
+        if success is not None and not success:
+            yield None
+            continue
+
+        # optional check if estimated model is valid
+        if (is_model_valid is not None
+                and not is_model_valid(sample_model, *samples)):
+            yield None
+            continue
+
+        sample_model_residuals = np.abs(sample_model.residuals(*data))
+        # consensus set / inliers
+        sample_model_inliers = sample_model_residuals < residual_threshold
+        sample_model_residuals_sum = np.sum(sample_model_residuals ** 2)
+        yield sample_model, sample_model_inliers, sample_model_residuals_sum
+
+
+def _ransac_batched_trials(data, batch_model, min_samples, residual_threshold,
+                           random_state, spl_idxs, max_trials):
+    """Generate the trials of `ransac` like `_ransac_trials`, estimating and
+    scoring the models of the trials by chunks.
+
+    The chunks grow geometrically, so that few trials are made in advance
+    when `ransac` stops early. The random draws of the trials made in advance
+    are undone when the generator is closed.
+    """
+    num_samples = len(data[0])
+    sample_size = sum(d[0].size for d in data)
+    max_chunk_size = max(1, 2 ** 22 // (num_samples * sample_size))
+    chunk_size = 16
+    num_trials = 0
+    while num_trials < max_trials:
+        # the initial inliers are not of the size of the random samples
+        if len(spl_idxs) != min_samples:
+            size = 1
+        else:
+            size = min(chunk_size, max_chunk_size, max_trials - num_trials)
+            chunk_size *= 2
+        num_trials += size
+
+        state = random_state.get_state()
+        indices = []
+        for _ in range(size):
+            indices.append(spl_idxs)
+            spl_idxs = random_state.choice(num_samples, min_samples,
+                                           replace=False)
+        indices = np.stack([np.flatnonzero(idxs) if idxs.dtype == bool
+                            else idxs for idxs in map(np.asarray, indices)])
+        samples = [d[indices] for d in data]
+
+        params, success = batch_model._estimate_many(*samples)
+        residuals = np.abs(batch_model._residuals_many(params, *data))
+        inliers = residuals < residual_threshold
+        residuals_sums = np.sum(residuals ** 2, axis=1)
+
+        done = 0
+        try:
+            for i in range(size):
+                done += 1
+                if not success[i]:
+                    yield None
+                    continue
+                sample_model = copy(batch_model)
+                sample_model.params = params[i]
+                yield sample_model, inliers[i], residuals_sums[i]
+        finally:
+            if done < size:
+                # only keep the draws of the trials that were made
+                random_state.set_state(state)
+                for _ in range(done):
+                    random_state.choice(num_samples, min_samples,
+                                        replace=False)
+
+
 def ransac(data, model_class, min_samples, residual_threshold,
            is_data_valid=None, is_model_valid=None,
            max_trials=100, stop_sample_num=np.inf, stop_residuals_sum=0,
@@ -654,6 +837,13 @@ def ransac(data, model_class, min_samples, residual_threshold,
     the special stop criteria are met. The final model is estimated using all
     inlier samples of the previously determined best model.
 
+    For `LineModelND`, ``AffineTransform``, ``SimilarityTransform``,
+    ``EuclideanTransform`` and ``ProjectiveTransform``, the models of many
+    iterations are estimated and scored at once, unless `is_data_valid` or
+    `is_model_valid` is given, so that these functions are called exactly
+    for the iterations made. The result, and the state of `random_state`
+    afterwards, are the same as with one iteration at a time.
+
     Parameters
     ----------
     data : [list, tuple of] (N, ...) array
@@ -827,32 +1017,23 @@ def ransac(data, model_class, min_samples, residual_threshold,
     spl_idxs = (initial_inliers if initial_inliers is not None
                 else random_state.choice(num_samples, min_samples, replace=False))
 
-    for num_trials in range(max_trials):
-        # do sample selection according data pairs
-        samples = [d[spl_idxs] for d in data]
-        # for next iteration choose random sample set and be sure that no samples repeat
-        spl_idxs = random_state.choice(num_samples, min_samples, replace=False)
-
-        # optional check if random sample set is valid
-        if is_data_valid is not None and not is_data_valid(*samples):
-            continue
-
-        # estimate model for current random sample set
-        sample_model = model_class()
-
-        success = sample_model.estimate(*samples)
-        # backwards compatibility
-        if success is not None and not success:
-            continue
+    batch_model = None
+    if is_data_valid is None and is_model_valid is None:
+        batch_model = _batch_model(model_class)
+    if batch_model is None:
+        trials = _ransac_trials(data, model_class, min_samples,
+                                residual_threshold, is_data_valid,
+                                is_model_valid, random_state, spl_idxs,
+                                max_trials)
+    else:
+        trials = _ransac_batched_trials(data, batch_model, min_samples,
+                                        residual_threshold, random_state,
+                                        spl_idxs, max_trials)
 
-        # optional check if estimated model is valid
-        if is_model_valid is not None and not is_model_valid(sample_model, *samples):
+    for num_trials, trial in enumerate(trials):
+        if trial is None:
             continue
-
-        sample_model_residuals = np.abs(sample_model.residuals(*data))
-        # consensus set / inliers
-        sample_model_inliers = sample_model_residuals < residual_threshold
-        sample_model_residuals_sum = np.sum(sample_model_residuals ** 2)
+        sample_model, sample_model_inliers, sample_model_residuals_sum = trial
 
         # choose as new best model if number of inliers is maximal
         sample_inlier_num = np.sum(sample_model_inliers)
@@ -875,6 +1056,7 @@ def ransac(data, model_class, min_samples, residual_threshold,
                 or best_inlier_residuals_sum <= stop_residuals_sum
                 or num_trials >= dynamic_max_trials):
                 break
+    trials.close()
 
     # estimate final model using all inliers
     if best_inliers is not None and any(best_inliers):
@@ -175,3 +175,48 @@ def test_level_default():
     contours = find_contours(image)  # use default level
     # many contours should be found
     assert len(contours) > 1
+
+
+@testing.parametrize("fully_connected", ['low', 'high'])
+@testing.parametrize("positive_orientation", ['low', 'high'])
+@testing.parametrize("use_mask", [False, True])
+def test_multiple_levels(fully_connected, positive_orientation, use_mask):
+    rng = np.random.RandomState(0)
+    image = rng.rand(40, 30)
+    mask = rng.rand(40, 30) > 0.1 if use_mask else None
+    levels = [0.2, 0.5, 0.8, 0.5]
+    contours = find_contours(image, levels, fully_connected,
+                             positive_orientation, mask=mask)
+    assert len(contours) == len(levels)
+    for level, level_contours in zip(levels, contours):
+        expected = find_contours(image, level, fully_connected,
+                                 positive_orientation, mask=mask)
+        assert len(level_contours) == len(expected)
+        for contour, expected_contour in zip(level_contours, expected):
+            assert_array_equal(contour, expected_contour)
+
+
+def test_multiple_levels_empty():
+    assert find_contours(r, []) == []
+    assert find_contours(r, [10, 0.5])[0] == []
+
+
+def test_invalid_levels():
+    with raises(ValueError, match='level'):
+        find_contours(r, [[0.5]])
+
+
+def test_degenerate_segments():
+    # the level crosses the image at pixel centers, so that several segments
+    # share their endpoints
+    image = np.array([[1, 1, 1, 2],
+                      [2, 0, 2, 1],
+                      [2, 2, 1, 1],
+                      [1, 2, 0, 1]], dtype=float)
+    mask = np.ones(image.shape, dtype=bool)
+    mask[3, 1] = False
+    contours = find_contours(image, 1, mask=mask)
+    assert len(contours) > 0
+    for contour in contours:
+        assert np.all(contour >= 0)
+        assert np.all(contour <= 3)
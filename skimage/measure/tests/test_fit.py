@@ -1,6 +1,7 @@
 import numpy as np
 from skimage.measure import LineModelND, CircleModel, EllipseModel, ransac
-from skimage.transform import AffineTransform
+from skimage.transform import (AffineTransform, EuclideanTransform,
+                               ProjectiveTransform, SimilarityTransform)
 from skimage.measure.fit import _dynamic_max_trials
 
 from skimage._shared import testing
@@ -292,6 +293,57 @@ def test_ransac_geometric():
     assert np.all(np.nonzero(inliers == False)[0] == outliers)
 
 
+@testing.parametrize('model_class', [AffineTransform, EuclideanTransform,
+                                     ProjectiveTransform, SimilarityTransform])
+@testing.parametrize('kwargs', [{}, {'stop_probability': 0.99},
+                                {'initial_inliers': np.arange(60) % 3 == 0}])
+def test_ransac_batched_trials(model_class, kwargs):
+    class SequentialModel(model_class):
+        # overriding `estimate` disables the batched trials
+        def estimate(self, src, dst):
+            return super().estimate(src, dst)
+
+    random_state = np.random.RandomState(0)
+    src = 100 * random_state.random_sample((60, 2))
+    dst = AffineTransform(scale=(0.5, 0.3), rotation=1,
+                          translation=(10, 20))(src)
+    dst += random_state.normal(scale=0.5, size=dst.shape)
+    dst[:25] = 100 * random_state.random_sample((25, 2))
+
+    results = []
+    for cls in (model_class, SequentialModel):
+        random_state = np.random.RandomState(1)
+        model, inliers = ransac((src, dst), cls, 4, 2, max_trials=300,
+                                random_state=random_state, **kwargs)
+        results.append((model.params, inliers, random_state.randint(1000)))
+    assert_equal(results[0][0], results[1][0])
+    assert_equal(results[0][1], results[1][1])
+    assert_equal(results[0][2], results[1][2])
+
+
+@testing.parametrize('min_samples', [2, 3])
+def test_ransac_batched_trials_line(min_samples):
+    class SequentialModel(LineModelND):
+        def estimate(self, data):
+            return super().estimate(data)
+
+    random_state = np.random.RandomState(0)
+    data = np.zeros((100, 3))
+    data[:, 0] = np.arange(100)
+    data[:, 1:] = random_state.normal(scale=0.1, size=(100, 2))
+    data[::2] = 100 * random_state.random_sample((50, 3))
+
+    results = []
+    for cls in (LineModelND, SequentialModel):
+        random_state = np.random.RandomState(1)
+        model, inliers = ransac(data, cls, min_samples, 1, max_trials=1000,
+                                stop_sample_num=45, random_state=random_state)
+        results.append((model.params, inliers, random_state.randint(1000)))
+    assert_equal(results[0][0], results[1][0])
+    assert_equal(results[0][1], results[1][1])
+    assert_equal(results[0][2], results[1][2])
+
+
 def test_ransac_is_data_valid():
     def is_data_valid(data):
         return data.shape[0] > 2
@@ -301,6 +353,20 @@ def test_ransac_is_data_valid():
     assert_equal(inliers, None)
 
 
+def test_ransac_is_data_valid_calls():
+    # is_data_valid is called once per iteration, even for batched models
+    calls = []
+
+    def is_data_valid(data):
+        calls.append(data)
+        return True
+
+    data = np.column_stack([np.arange(50.), 2 * np.arange(50.)])
+    ransac(data, LineModelND, 2, 1, is_data_valid=is_data_valid,
+           stop_sample_num=50, random_state=0)
+    assert len(calls) == 1
+
+
 def test_ransac_is_model_valid():
     def is_model_valid(model, data):
         return False
@@ -178,3 +178,47 @@ def test_masked_marching_cubes_all_true():
     np.testing.assert_allclose(ver_m, ver, rtol=.00001)
     np.testing.assert_allclose(faces_m, faces, rtol=.00001)
 
+
+@pytest.mark.parametrize('method', ['lewiner', 'lorensen'])
+@pytest.mark.parametrize('step_size', [1, 2, 3])
+@pytest.mark.parametrize('chunk_size', [1, 4, 7, 100])
+@pytest.mark.parametrize('use_mask', [False, True])
+def test_chunked_marching_cubes(method, step_size, chunk_size, use_mask):
+    rng = np.random.RandomState(0)
+    z, y, x = np.mgrid[:30, :25, :20]
+    volume = np.sin(x / 3.) + np.cos(y / 4.) + np.sin(z / 5.)
+    mask = rng.rand(*volume.shape) > 0.2 if use_mask else None
+    expected = marching_cubes(volume, 0.2, step_size=step_size,
+                              method=method, mask=mask)
+    result = marching_cubes(volume, 0.2, step_size=step_size, method=method,
+                            mask=mask, chunk_size=chunk_size, num_workers=2)
+    verts, faces, normals, values = result
+    assert_array_equal(verts, expected[0])
+    assert_array_equal(faces, expected[1])
+    np.testing.assert_allclose(normals, expected[2], atol=1e-6)
+    assert_array_equal(values, expected[3])
+    assert faces.dtype == expected[1].dtype
+
+
+def test_chunked_marching_cubes_memmap(tmpdir):
+    volume = ellipsoid(6, 10, 16, levelset=True)
+    filename = str(tmpdir.join('volume.dat'))
+    memmap = np.memmap(filename, dtype=volume.dtype, mode='w+',
+                       shape=volume.shape)
+    memmap[:] = volume
+    memmap.flush()
+    memmap = np.memmap(filename, dtype=volume.dtype, mode='r',
+                       shape=volume.shape)
+
+    expected = marching_cubes(volume, allow_degenerate=False)
+    result = marching_cubes(memmap, allow_degenerate=False, chunk_size=5)
+    assert_array_equal(result[0], expected[0])
+    assert_array_equal(result[1], expected[1])
+
+
+def test_chunked_marching_cubes_invalid_input():
+    volume = ellipsoid(6, 10, 16, levelset=True)
+    with pytest.raises(ValueError):
+        marching_cubes(volume, 0, chunk_size=0)
+    with pytest.raises(NotImplementedError):
+        marching_cubes(volume, 0, chunk_size=4, method='_lorensen')
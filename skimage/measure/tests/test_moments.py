@@ -5,7 +5,9 @@ from skimage import draw
 from skimage.measure import (moments, moments_central, moments_coords,
                              moments_coords_central, moments_normalized,
                              moments_hu, centroid, inertia_tensor,
-                             inertia_tensor_eigvals)
+                             inertia_tensor_eigvals, moments_labels,
+                             moments_central_labels, inertia_tensor_labels,
+                             inertia_tensor_eigvals_labels, label)
 
 from skimage._shared import testing
 from skimage._shared.testing import (assert_equal, assert_almost_equal,
@@ -196,3 +198,65 @@ def test_inertia_tensor_eigvals():
     # mu = np.array([[3, 0, 98], [0, 14, 0], [2, 0, 98]])
     eigvals = inertia_tensor_eigvals(image=image)
     assert (min(eigvals) >= 0)
+
+
+@pytest.mark.parametrize('ndim', [2, 3])
+@pytest.mark.parametrize('order', [0, 1, 3])
+@pytest.mark.parametrize('weighted', [False, True])
+def test_moments_labels(ndim, order, weighted):
+    rng = np.random.RandomState(0)
+    shape = (40, 30) if ndim == 2 else (12, 15, 10)
+    label_image = label(rng.rand(*shape) > 0.6)
+    intensity = rng.rand(*shape) if weighted else None
+    M = moments_labels(label_image, order, intensity_image=intensity)
+    mu = moments_central_labels(label_image, order,
+                                intensity_image=intensity)
+    n_labels = label_image.max() + 1
+    assert M.shape == mu.shape == (n_labels,) + (order + 1,) * ndim
+    assert_equal(M[0], 0)
+    assert_equal(mu[0], 0)
+    for i in range(1, n_labels):
+        mask = label_image == i
+        image = mask * intensity if weighted else mask.astype(np.uint8)
+        expected = moments(image, order)
+        assert_allclose(M[i], expected, atol=1e-10 * np.abs(expected).max())
+        expected = moments_central(image, order=order)
+        assert_allclose(mu[i], expected,
+                        atol=1e-10 * np.abs(expected).max())
+
+
+def test_moments_labels_offset():
+    # moments far from the origin keep their accuracy
+    label_image = np.zeros((10, 20000), dtype=np.uint8)
+    label_image[2:5, 19990:19995] = 3
+    mu = moments_central_labels(label_image)
+    expected = moments_central(label_image[:, 19980:] == 3)
+    assert_allclose(mu[3], expected, atol=1e-10)
+    assert mu.shape == (4, 4, 4)
+
+
+def test_moments_labels_invalid():
+    with pytest.raises(TypeError):
+        moments_labels(np.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        moments_labels(np.zeros((3, 3), dtype=int),
+                       intensity_image=np.zeros((3, 4)))
+
+
+@pytest.mark.parametrize('ndim', [2, 3])
+def test_inertia_tensor_labels(ndim):
+    rng = np.random.RandomState(0)
+    shape = (40, 30) if ndim == 2 else (12, 15, 10)
+    label_image = label(rng.rand(*shape) > 0.6)
+    T = inertia_tensor_labels(label_image)
+    eigvals = inertia_tensor_eigvals_labels(label_image, T=T)
+    assert T.shape == (label_image.max() + 1, ndim, ndim)
+    assert eigvals.shape == (label_image.max() + 1, ndim)
+    assert np.all(np.isnan(T[0]))
+    assert np.all(np.isnan(eigvals[0]))
+    for i in range(1, label_image.max() + 1):
+        mask = label_image == i
+        assert_allclose(T[i], inertia_tensor(mask), atol=1e-10)
+        assert_allclose(eigvals[i], inertia_tensor_eigvals(mask), atol=1e-10)
+    mu = moments_central_labels(label_image, order=2)
+    assert_equal(inertia_tensor_eigvals_labels(label_image, mu=mu), eigvals)
@@ -10,7 +10,11 @@ from skimage.measure._regionprops import (regionprops, PROPS, perimeter,
                                           perimeter_crofton, euler_number,
                                           _parse_docs, _props_to_dict,
                                           regionprops_table, OBJECT_COLUMNS,
-                                          COL_DTYPES)
+                                          COL_DTYPES, _ellipse_properties,
+                                          CHUNKED_PROPS)
+from skimage.measure import (inertia_tensor_labels,
+                             inertia_tensor_eigvals_labels, perimeter_labels,
+                             perimeter_crofton_labels, euler_number_labels)
 from skimage._shared import testing
 from skimage._shared.testing import (assert_array_equal, assert_almost_equal,
                                      assert_array_almost_equal, assert_equal)
@@ -526,6 +530,47 @@ def test_cache():
     assert np.any(f0 != f1)
 
 
+def test_compact_regions():
+    label_image = np.zeros((10, 12), dtype=np.uint16)
+    label_image[1:4, 2:5] = 3
+    label_image[6:9, 0:2] = 7
+    label_image[7, 11] = 7
+    regions = regionprops(label_image)
+
+    for region in regions:
+        assert not hasattr(region, '__dict__')
+    assert [r.label for r in regions] == [3, 7]
+    assert all(type(r.label) is int for r in regions)
+    assert regions[1].bbox == (6, 0, 9, 12)
+    assert regions[1].slice == (slice(6, 9), slice(0, 12))
+
+    # properties are cached per region, and only once accessed
+    assert regions[0]._regions is regions[1]._regions
+    assert regions[0]._regions.caches == {}
+    assert regions[1].area == 7
+    assert regions[0].area == 9
+    assert set(regions[0]._regions.caches) == {'area', 'image'}
+
+    regions[0]._label_image[7, 11] = 0
+    assert regions[1].area == 7
+    regions[1]._cache_active = False
+    assert regions[1].area == 6
+    assert regions[0].area == 9
+
+
+def test_regions_read_only_and_pickle():
+    import pickle
+    label_image = SAMPLE_MULTIPLE.copy()
+    label_image.setflags(write=False)
+    regions = regionprops(label_image,
+                          intensity_image=INTENSITY_SAMPLE_MULTIPLE,
+                          extra_properties=(median_intensity,))
+    unpickled = pickle.loads(pickle.dumps(regions))
+    for region, copy in zip(regions, unpickled):
+        assert region == copy
+        assert region.median_intensity == copy.median_intensity
+
+
 def test_docstrings_and_props():
     def foo():
         """foo"""
@@ -734,3 +779,124 @@ def test_multichannel():
             # property uses multiple channels, returns props stacked along
             # final axis
             assert_array_equal(p, np.asarray(p_multi)[..., 1])
+
+
+def test_ellipse_properties():
+    label_image = slic(data.astronaut()[::4, ::4], start_label=1)
+    T = inertia_tensor_labels(label_image)
+    eigvals = inertia_tensor_eigvals_labels(label_image, T=T)
+    out = _ellipse_properties(T, eigvals)
+    for region in regionprops(label_image):
+        for prop, values in out.items():
+            assert_almost_equal(values[region.label], region[prop])
+
+    out = _ellipse_properties(T[:, :1, :1], eigvals[:, :1])
+    assert set(out) == {'major_axis_length', 'minor_axis_length'}
+
+
+@testing.parametrize('chunk_size', [1, 3, 7, 100])
+@testing.parametrize('ndim', [2, 3])
+@testing.parametrize('multichannel', [False, True])
+def test_regionprops_table_chunked(chunk_size, ndim, multichannel):
+    rng = np.random.default_rng(0)
+    shape = (20, 24) if ndim == 2 else (10, 12, 14)
+    label_image = slic(rng.random(shape), n_segments=30, compactness=0.1,
+                       start_label=1, multichannel=False)
+    label_image[label_image == 3] = 0
+    intensity_image = rng.random(shape + ((3,) * multichannel))
+    properties = [prop for prop in sorted(CHUNKED_PROPS)
+                  if not (ndim == 3 and prop in ('eccentricity', 'moments_hu',
+                                                 'orientation',
+                                                 'weighted_moments_hu'))]
+    if multichannel:
+        # not supported by `regionprops_table` without chunks
+        properties.remove('weighted_centroid')
+
+    expected = regionprops_table(label_image, intensity_image, properties)
+    out = regionprops_table(label_image, intensity_image, properties,
+                            chunk_size=chunk_size)
+    assert list(out) == list(expected)
+    for column in expected:
+        assert out[column].dtype == expected[column].dtype
+        scale = max(1, np.nanmax(np.abs(expected[column]), initial=0))
+        np.testing.assert_allclose(out[column], expected[column],
+                                   rtol=1e-7, atol=1e-9 * scale)
+
+
+def test_regionprops_table_chunked_memmap(tmpdir):
+    label_image = SAMPLE_3D.astype(np.int32)
+    label_image[4:, 3:] = 2
+    filename = str(tmpdir.join('labels.dat'))
+    memmap = np.memmap(filename, dtype=label_image.dtype, mode='w+',
+                       shape=label_image.shape)
+    memmap[:] = label_image
+    memmap.flush()
+    memmap = np.memmap(filename, dtype=label_image.dtype, mode='r',
+                       shape=label_image.shape)
+    properties = ('label', 'area', 'bbox', 'centroid', 'max_intensity')
+    out = regionprops_table(memmap, INTENSITY_SAMPLE_3D, properties,
+                            chunk_size=2)
+    expected = regionprops_table(label_image, INTENSITY_SAMPLE_3D,
+                                 properties)
+    assert list(out) == list(expected)
+    for column in expected:
+        assert_almost_equal(out[column], expected[column])
+
+
+def test_regionprops_table_chunked_invalid():
+    with testing.raises(ValueError):
+        regionprops_table(SAMPLE, properties=('label', 'perimeter'),
+                          chunk_size=2)
+    with testing.raises(ValueError):
+        regionprops_table(SAMPLE, chunk_size=0)
+    with testing.raises(ValueError):
+        regionprops_table(SAMPLE, chunk_size=2,
+                          extra_properties=(pixelcount,))
+    with testing.raises(AttributeError):
+        regionprops_table(SAMPLE, properties=('mean_intensity',),
+                          chunk_size=2)
+
+
+@testing.parametrize('dtype', [np.int64, np.uint64])
+@testing.parametrize('ndim', [2, 3])
+def test_labels_perimeter_and_euler_number(ndim, dtype):
+    rng = np.random.default_rng(0)
+    shape = (30, 25) if ndim == 2 else (9, 10, 11)
+    # touching regions with holes
+    label_image = rng.integers(0, 6, shape).astype(dtype)
+    label_image[label_image == 4] = 0
+    regions = regionprops(label_image)
+
+    for connectivity in (1, ndim):
+        euler_numbers = euler_number_labels(label_image, connectivity)
+        assert euler_numbers.shape == (label_image.max() + 1,)
+        assert euler_numbers[4] == 0
+        for region in regions:
+            assert (euler_numbers[region.label]
+                    == euler_number(region.image, connectivity))
+
+    if ndim == 3:
+        with testing.raises(NotImplementedError):
+            perimeter_labels(label_image)
+        with testing.raises(NotImplementedError):
+            perimeter_crofton_labels(label_image)
+        return
+
+    for neighbourhood in (4, 8):
+        perimeters = perimeter_labels(label_image, neighbourhood)
+        for region in regions:
+            assert_almost_equal(perimeters[region.label],
+                                perimeter(region.image, neighbourhood))
+    for directions in (2, 4):
+        perimeters = perimeter_crofton_labels(label_image, directions)
+        for region in regions:
+            assert_almost_equal(perimeters[region.label],
+                                perimeter_crofton(region.image, directions))
+
+
+def test_labels_perimeter_and_euler_number_invalid():
+    with testing.raises(TypeError):
+        euler_number_labels(SAMPLE.astype(float))
+    with testing.raises(NotImplementedError):
+        euler_number_labels(SAMPLE_3D, connectivity=2)
+    assert_array_equal(perimeter_labels(np.zeros((3, 3), dtype=int)), [0])
@@ -11,10 +11,12 @@ from ._geometric import (estimate_transform,
                          ProjectiveTransform, FundamentalMatrixTransform,
                          EssentialMatrixTransform, PolynomialTransform,
                          PiecewiseAffineTransform)
-from ._warps import (swirl, resize, rotate, rescale,
-                     downscale_local_mean, warp, warp_coords, warp_polar)
+from ._warps import (swirl, resize, resize_separable, rotate, rescale,
+                     downscale_local_mean, warp, warp_coords, warp_polar,
+                     WarpPlan)
 from .pyramids import (pyramid_reduce, pyramid_expand,
-                       pyramid_gaussian, pyramid_laplacian)
+                       pyramid_gaussian, pyramid_laplacian,
+                       pyramid_binomial, PyramidBuilder)
 
 
 __all__ = ['hough_circle',
@@ -34,6 +36,7 @@ __all__ = ['hough_circle',
            'warp',
            'warp_coords',
            'warp_polar',
+           'WarpPlan',
            'estimate_transform',
            'matrix_transform',
            'EuclideanTransform',
@@ -46,10 +49,13 @@ __all__ = ['hough_circle',
            'PiecewiseAffineTransform',
            'swirl',
            'resize',
+           'resize_separable',
            'rotate',
            'rescale',
            'downscale_local_mean',
            'pyramid_reduce',
            'pyramid_expand',
            'pyramid_gaussian',
-           'pyramid_laplacian']
+           'pyramid_laplacian',
+           'pyramid_binomial',
+           'PyramidBuilder']
@@ -163,6 +163,156 @@ def _umeyama(src, dst, estimate_scale):
     return T
 
 
+def _center_and_normalize_points_many(points):
+    """Center and normalize many sets of image points at once.
+
+    Batched version of `_center_and_normalize_points`, with the same
+    arithmetic for each set.
+
+    Parameters
+    ----------
+    points : (K, N, D) array
+        The coordinates of the image points of each set.
+
+    Returns
+    -------
+    matrices : (K, D+1, D+1) array
+        The transformation matrices to obtain the new points, NaN for the
+        sets of identical points.
+    new_points : (K, N, D) array
+        The transformed image points.
+
+    """
+    k, n, d = points.shape
+    centroid = np.mean(points, axis=1)
+
+    centered = points - centroid[:, np.newaxis]
+    rms = np.sqrt(np.sum(centered ** 2, axis=(1, 2)) / n)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        norm_factor = np.sqrt(d) / rms
+
+        matrices = np.zeros((k, d + 1, d + 1))
+        matrices[:, :d, :d] = np.eye(d)
+        matrices[:, :d, d] = -centroid
+        matrices[:, :d] *= norm_factor[:, np.newaxis, np.newaxis]
+        matrices[:, d, d] = 1
+
+        points_h = np.concatenate([points.transpose(0, 2, 1),
+                                   np.ones((k, 1, n))], axis=1)
+
+        new_points_h = (matrices @ points_h).transpose(0, 2, 1)
+
+        new_points = new_points_h[..., :d] / new_points_h[..., d:]
+
+    degenerate = rms == 0
+    matrices[degenerate] = np.nan
+    new_points[degenerate] = np.nan
+
+    return matrices, new_points
+
+
+def _umeyama_many(src, dst, estimate_scale):
+    """Estimate many N-D similarity transformations at once.
+
+    Batched version of `_umeyama`, with the same arithmetic for each
+    transformation.
+
+    Parameters
+    ----------
+    src : (K, M, N) array
+        Source coordinates of each transformation.
+    dst : (K, M, N) array
+        Destination coordinates of each transformation.
+    estimate_scale : bool
+        Whether to estimate scaling factor.
+
+    Returns
+    -------
+    T : (K, N + 1, N + 1)
+        The homogeneous similarity transformation matrices.
+
+    """
+    k, num, dim = src.shape
+
+    src_mean = src.mean(axis=1)
+    dst_mean = dst.mean(axis=1)
+
+    src_demean = src - src_mean[:, np.newaxis]
+    dst_demean = dst - dst_mean[:, np.newaxis]
+
+    A = dst_demean.transpose(0, 2, 1) @ src_demean / num
+
+    d = np.ones((k, dim), dtype=np.double)
+    d[np.linalg.det(A) < 0, dim - 1] = -1
+
+    T = np.zeros((k, dim + 1, dim + 1), dtype=np.double)
+    T[:, dim, dim] = 1
+
+    U, S, V = np.linalg.svd(A)
+
+    # the rotation of each branch of `_umeyama`
+    rank = np.linalg.matrix_rank(A)
+    diagonal = np.zeros((k, dim, dim))
+    diagonal[:, range(dim), range(dim)] = d
+    rank_deficient = rank == dim - 1
+    same_sign = np.linalg.det(U) * np.linalg.det(V) > 0
+    T[:, :dim, :dim] = U @ diagonal @ V
+    diagonal[:, dim - 1, dim - 1] = -1
+    T[rank_deficient, :dim, :dim] = (U @ diagonal @ V)[rank_deficient]
+    keep = rank_deficient & same_sign
+    T[keep, :dim, :dim] = (U @ V)[keep]
+
+    # the transformations of rank 0 are NaN, as they are left out by
+    # `_umeyama` before these steps
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if estimate_scale:
+            scale = (1.0 / src_demean.var(axis=1).sum(axis=1)
+                     * (S[:, np.newaxis, :] @ d[:, :, np.newaxis])[:, 0, 0])
+        else:
+            scale = np.ones(k)
+
+        T[:, :dim, dim] = dst_mean - scale[:, np.newaxis] * (
+            T[:, :dim, :dim] @ src_mean[:, :, np.newaxis])[..., 0]
+        T[:, :dim, :dim] *= scale[:, np.newaxis, np.newaxis]
+
+    T[rank == 0] = np.nan
+
+    return T
+
+
+def _apply_mat_many(coords, matrices):
+    """Apply many homogeneous transformation matrices to the same coordinates.
+
+    Batched version of `ProjectiveTransform._apply_mat`.
+
+    Parameters
+    ----------
+    coords : (N, D) or (K, N, D) array
+        Coordinates, the same for all the matrices or one set per matrix.
+    matrices : (K, D+1, D+1) array
+        Homogeneous transformation matrices.
+
+    Returns
+    -------
+    coords_out : (K, N, D) array
+        The coordinates transformed by each matrix.
+
+    """
+    ndim = matrices.shape[-1] - 1
+    coords = np.array(coords, copy=False, ndmin=2)
+
+    src = np.concatenate([coords, np.ones(coords.shape[:-1] + (1,))],
+                         axis=-1)
+    dst = src @ matrices.transpose(0, 2, 1)
+
+    last = dst[..., ndim]
+    last[last == 0] = np.finfo(float).eps
+    dst[..., :ndim] /= dst[..., ndim:ndim+1]
+
+    return dst[..., :ndim]
+
+
 class GeometricTransform(object):
     """Base class for geometric transformations.
 
@@ -562,6 +712,10 @@ class ProjectiveTransform(GeometricTransform):
 
     """
 
+    # methods whose batched versions are `_estimate_many` and
+    # `_residuals_many`, see `skimage.measure.ransac`
+    _batched_methods = ('estimate', 'residuals', '__call__', '_apply_mat')
+
     def __init__(self, matrix=None, *, dimensionality=2):
         if matrix is None:
             # default to an identity transform
@@ -631,6 +785,90 @@ class ProjectiveTransform(GeometricTransform):
         """
         return self._apply_mat(coords, self._inv_matrix)
 
+    @classmethod
+    def estimate_many(cls, src, dst):
+        """Estimate many transformations from sets of corresponding points.
+
+        The transformations are estimated at once, each one as by `estimate`.
+
+        Parameters
+        ----------
+        src : (K, N, D) array
+            Source coordinates of each of the K transformations.
+        dst : (K, N, D) array
+            Destination coordinates of each of the K transformations.
+
+        Returns
+        -------
+        matrices : (K, D+1, D+1) array
+            Homogeneous transformation matrices, filled with NaN for the
+            transformations whose estimation fails.
+
+        Examples
+        --------
+        >>> from skimage.transform import SimilarityTransform
+        >>> src = np.random.random((1000, 4, 2))
+        >>> dst = 2 * src + 1
+        >>> matrices = SimilarityTransform.estimate_many(src, dst)
+        >>> matrices.shape
+        (1000, 3, 3)
+        >>> np.allclose(matrices[:, :2, :2], 2 * np.eye(2))
+        True
+        >>> dst = SimilarityTransform.apply_many(matrices, src)
+        >>> np.allclose(dst, 2 * src + 1)
+        True
+
+        """
+        src = np.asarray(src, dtype=np.double)
+        dst = np.asarray(dst, dtype=np.double)
+        if src.ndim != 3 or src.shape != dst.shape:
+            raise ValueError('src and dst must be (K, N, D) arrays of the '
+                             'same shape.')
+        tform = cls(dimensionality=src.shape[2])
+        matrices, success = tform._estimate_many(src, dst)
+        matrices[~success] = np.nan
+        return matrices
+
+    @staticmethod
+    def apply_many(matrices, coords):
+        """Apply many forward transformations at once.
+
+        Parameters
+        ----------
+        matrices : (K, D+1, D+1) array
+            Homogeneous transformation matrices, e.g. from `estimate_many`.
+        coords : (N, D) or (K, N, D) array
+            Source coordinates, the same for all the transformations or one
+            set per transformation.
+
+        Returns
+        -------
+        coords_out : (K, N, D) array
+            Destination coordinates of each transformation.
+
+        """
+        return _apply_mat_many(coords, np.asarray(matrices))
+
+    @staticmethod
+    def inverse_many(matrices, coords):
+        """Apply many inverse transformations at once.
+
+        Parameters
+        ----------
+        matrices : (K, D+1, D+1) array
+            Homogeneous transformation matrices, e.g. from `estimate_many`.
+        coords : (N, D) or (K, N, D) array
+            Destination coordinates, the same for all the transformations or
+            one set per transformation.
+
+        Returns
+        -------
+        coords_out : (K, N, D) array
+            Source coordinates of each transformation.
+
+        """
+        return _apply_mat_many(coords, np.linalg.inv(matrices))
+
     def estimate(self, src, dst):
         """Estimate the transformation from a set of corresponding points.
 
@@ -731,6 +969,80 @@ class ProjectiveTransform(GeometricTransform):
 
         return True
 
+    def _estimate_many(self, src, dst):
+        """Estimate many transformations at once, as by `estimate`.
+
+        Parameters
+        ----------
+        src : (K, N, D) array
+            Source coordinates of each transformation.
+        dst : (K, N, D) array
+            Destination coordinates of each transformation.
+
+        Returns
+        -------
+        params : (K, D+1, D+1) array
+            Homogeneous transformation matrices.
+        success : (K,) array of bool
+            Whether the estimation of each transformation succeeds.
+
+        """
+        k, n, d = src.shape
+
+        src_matrix, src = _center_and_normalize_points_many(src)
+        dst_matrix, dst = _center_and_normalize_points_many(dst)
+        success = np.all(np.isfinite(src_matrix + dst_matrix), axis=(1, 2))
+        # keep the degenerate problems away from the SVD
+        src[~success] = 0
+        dst[~success] = 0
+        src_matrix[~success] = np.eye(d + 1)
+        dst_matrix[~success] = np.eye(d + 1)
+
+        A = np.zeros((k, n * d, (d+1) ** 2))
+        for ddim in range(d):
+            A[:, ddim*n : (ddim+1)*n, ddim*(d+1) : ddim*(d+1) + d] = src
+            A[:, ddim*n : (ddim+1)*n, ddim*(d+1) + d] = 1
+            A[:, ddim*n : (ddim+1)*n, -d-1:-1] = src
+            A[:, ddim*n : (ddim+1)*n, -1] = -1
+            A[:, ddim*n : (ddim+1)*n, -d-1:] *= -dst[:, :, ddim:(ddim+1)]
+
+        A = A[:, :, list(self._coeffs) + [-1]]
+
+        _, _, V = np.linalg.svd(A)
+        success &= ~np.isclose(V[:, -1, -1], 0)
+
+        H = np.zeros((k, (d+1) ** 2))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            H[:, list(self._coeffs)] = - V[:, -1, :-1] / V[:, -1, -1:]
+        H = H.reshape(k, d+1, d+1)
+        H[:, d, d] = 1
+        H[~success] = np.nan
+
+        H = np.linalg.inv(dst_matrix) @ H @ src_matrix
+
+        return H, success
+
+    def _residuals_many(self, params, src, dst):
+        """Residuals of many transformations, as by `residuals`.
+
+        Parameters
+        ----------
+        params : (K, D+1, D+1) array
+            Homogeneous transformation matrices.
+        src : (N, D) array
+            Source coordinates.
+        dst : (N, D) array
+            Destination coordinates.
+
+        Returns
+        -------
+        residuals : (K, N) array
+            Residual for coordinate, for each transformation.
+
+        """
+        return np.sqrt(np.sum((_apply_mat_many(src, params) - dst) ** 2,
+                              axis=2))
+
     def __add__(self, other):
         """Combine this transformation with another."""
         if isinstance(other, ProjectiveTransform):
@@ -950,30 +1262,23 @@ class PiecewiseAffineTransform(GeometricTransform):
 
         """
 
-        ndim = src.shape[1]
         # forward piecewise affine
         # triangulate input positions into mesh
         self._tesselation = spatial.Delaunay(src)
         # find affine mapping from source positions to destination
-        self.affines = []
-        for tri in self._tesselation.vertices:
-            affine = AffineTransform(dimensionality=ndim)
-            affine.estimate(src[tri, :], dst[tri, :])
-            self.affines.append(affine)
+        self.affines = _estimate_affines(src, dst,
+                                         self._tesselation.simplices)
 
         # inverse piecewise affine
         # triangulate input positions into mesh
         self._inverse_tesselation = spatial.Delaunay(dst)
         # find affine mapping from source positions to destination
-        self.inverse_affines = []
-        for tri in self._inverse_tesselation.vertices:
-            affine = AffineTransform(dimensionality=ndim)
-            affine.estimate(dst[tri, :], src[tri, :])
-            self.inverse_affines.append(affine)
+        self.inverse_affines = _estimate_affines(
+            dst, src, self._inverse_tesselation.simplices)
 
         return True
 
-    def __call__(self, coords):
+    def __call__(self, coords, simplex=None):
         """Apply forward transformation.
 
         Coordinates outside of the mesh will be set to `- 1`.
@@ -982,6 +1287,10 @@ class PiecewiseAffineTransform(GeometricTransform):
         ----------
         coords : (N, D) array
             Source coordinates.
+        simplex : (N,) array of int, optional
+            Index of the mesh triangle of each coordinate, -1 outside of the
+            mesh, as given by `find_simplex`. Pass it to transform the same
+            coordinates repeatedly without looking up the triangles again.
 
         Returns
         -------
@@ -989,26 +1298,11 @@ class PiecewiseAffineTransform(GeometricTransform):
             Transformed coordinates.
 
         """
+        if simplex is None:
+            simplex = self._tesselation.find_simplex(coords)
+        return _apply_affines(coords, self.affines, simplex)
 
-        out = np.empty_like(coords, np.double)
-
-        # determine triangle index for each coordinate
-        simplex = self._tesselation.find_simplex(coords)
-
-        # coordinates outside of mesh
-        out[simplex == -1, :] = -1
-
-        for index in range(len(self._tesselation.vertices)):
-            # affine transform for triangle
-            affine = self.affines[index]
-            # all coordinates within triangle
-            index_mask = simplex == index
-
-            out[index_mask, :] = affine(coords[index_mask, :])
-
-        return out
-
-    def inverse(self, coords):
+    def inverse(self, coords, simplex=None):
         """Apply inverse transformation.
 
         Coordinates outside of the mesh will be set to `- 1`.
@@ -1017,6 +1311,11 @@ class PiecewiseAffineTransform(GeometricTransform):
         ----------
         coords : (N, D) array
             Source coordinates.
+        simplex : (N,) array of int, optional
+            Index of the mesh triangle of each coordinate, -1 outside of the
+            mesh, as given by ``find_simplex(coords, inverse=True)``. Pass it
+            to transform the same coordinates repeatedly without looking up
+            the triangles again.
 
         Returns
         -------
@@ -1024,24 +1323,158 @@ class PiecewiseAffineTransform(GeometricTransform):
             Transformed coordinates.
 
         """
+        if simplex is None:
+            simplex = self._inverse_tesselation.find_simplex(coords)
+        return _apply_affines(coords, self.inverse_affines, simplex)
+
+    def find_simplex(self, coords, inverse=False):
+        """Find the mesh triangle of each coordinate.
+
+        Parameters
+        ----------
+        coords : (N, D) array
+            Coordinates.
+        inverse : bool, optional
+            Whether to use the mesh of the inverse transformation.
+
+        Returns
+        -------
+        simplex : (N,) array of int
+            Index of the mesh triangle of each coordinate, -1 outside of the
+            mesh.
+
+        """
+        if inverse:
+            return self._inverse_tesselation.find_simplex(coords)
+        return self._tesselation.find_simplex(coords)
+
+    def inverse_map(self, output_shape):
+        """Inverse transformation for warping images of a fixed shape.
+
+        The mesh triangles of the output coordinates are looked up once, so
+        that the returned function can warp many images quickly.
+
+        Parameters
+        ----------
+        output_shape : tuple
+            Shape of the output images, as given to `warp`.
+
+        Returns
+        -------
+        inverse_map : callable
+            The `inverse` transformation of the output coordinates, to be
+            passed as `inverse_map` to `warp`.
+
+        Examples
+        --------
+        >>> from skimage.transform import warp
+        >>> src = np.array([[0, 0], [0, 50], [50, 0], [50, 50], [20, 30]])
+        >>> tform = PiecewiseAffineTransform()
+        >>> tform.estimate(src, src + 2)
+        True
+        >>> inverse_map = tform.inverse_map((50, 50))
+        >>> images = np.random.random((3, 50, 50))
+        >>> warped = [warp(image, inverse_map) for image in images]
+        >>> np.allclose(warped[0], warp(images[0], tform.inverse))
+        True
+
+        """
+        output_shape = tuple(output_shape)
+        rows, cols = output_shape[0], output_shape[1]
+        # the output coordinates, in the order of `warp_coords`
+        output_coords = np.indices((cols, rows),
+                                   dtype=np.double).reshape(2, -1).T
+        simplex = self.find_simplex(output_coords, inverse=True)
+
+        def inverse_map(coords):
+            if not np.array_equal(coords, output_coords):
+                raise ValueError('The coordinates do not match the output '
+                                 'shape {}.'.format(output_shape))
+            return self.inverse(coords, simplex=simplex)
+
+        return inverse_map
+
+
+def _estimate_affines(src, dst, simplices):
+    """Estimate the affine transformations of the triangles of a mesh.
+
+    Parameters
+    ----------
+    src : (N, D) array
+        Source coordinates.
+    dst : (N, D) array
+        Destination coordinates.
+    simplices : (M, D+1) array of int
+        Indices of the vertices of each triangle.
 
-        out = np.empty_like(coords, np.double)
+    Returns
+    -------
+    affines : list of AffineTransform objects
+        Affine transformation of each triangle, as if estimated one by one.
+
+    """
+    ndim = src.shape[1]
+    matrices, success = AffineTransform(dimensionality=ndim)._estimate_many(
+        src[simplices], dst[simplices])
+    affines = []
+    for tri, matrix, ok in zip(simplices, matrices, success):
+        affine = AffineTransform(dimensionality=ndim)
+        if ok:
+            affine.params = matrix
+        else:
+            # keep the parameters left by a failed estimation
+            affine.estimate(src[tri, :], dst[tri, :])
+        affines.append(affine)
+    return affines
 
-        # determine triangle index for each coordinate
-        simplex = self._inverse_tesselation.find_simplex(coords)
 
-        # coordinates outside of mesh
-        out[simplex == -1, :] = -1
+def _apply_affines(coords, affines, simplex):
+    """Apply to each coordinate the affine transformation of its triangle.
 
-        for index in range(len(self._inverse_tesselation.vertices)):
-            # affine transform for triangle
-            affine = self.inverse_affines[index]
-            # all coordinates within triangle
-            index_mask = simplex == index
+    Parameters
+    ----------
+    coords : (N, D) array
+        Coordinates.
+    affines : list of AffineTransform objects
+        Affine transformation of each triangle of a mesh.
+    simplex : (N,) array of int
+        Index of the triangle of each coordinate, -1 outside of the mesh.
 
-            out[index_mask, :] = affine(coords[index_mask, :])
+    Returns
+    -------
+    coords : (N, D) array
+        Transformed coordinates, -1 outside of the mesh.
 
+    """
+    coords = np.asarray(coords)
+    simplex = np.asarray(simplex)
+    out = np.empty_like(coords, np.double)
+
+    # coordinates outside of mesh
+    outside = simplex == -1
+    out[outside, :] = -1
+
+    inside = ~outside
+    coords = coords[inside]
+    simplex = simplex[inside]
+    if len(affines) == 0 or len(simplex) == 0:
         return out
+    ndim = coords.shape[1]
+    matrices = np.stack([affine.params for affine in affines])
+
+    # homogeneous coordinates, one matrix row at a time to only gather
+    # (N, D+1) parameters at once
+    src = np.concatenate([coords, np.ones((coords.shape[0], 1))], axis=1)
+    dst = np.empty_like(src)
+    for i in range(ndim + 1):
+        dst[:, i] = np.einsum('ij,ij->i', matrices[simplex, i], src)
+
+    # as in `ProjectiveTransform._apply_mat`
+    dst[dst[:, ndim] == 0, ndim] = np.finfo(float).eps
+    dst[:, :ndim] /= dst[:, ndim:ndim+1]
+
+    out[inside] = dst[:, :ndim]
+    return out
 
 
 def _euler_rotation(axis, angle):
@@ -1221,6 +1654,11 @@ class EuclideanTransform(ProjectiveTransform):
 
         return True
 
+    def _estimate_many(self, src, dst):
+        """Estimate many transformations at once, as by `estimate`."""
+        params = _umeyama_many(src, dst, False)
+        return params, np.ones(len(params), dtype=bool)
+
     @property
     def rotation(self):
         return math.atan2(self.params[1, 0], self.params[1, 1])
@@ -1337,6 +1775,11 @@ class SimilarityTransform(EuclideanTransform):
 
         return True
 
+    def _estimate_many(self, src, dst):
+        """Estimate many transformations at once, as by `estimate`."""
+        params = _umeyama_many(src, dst, estimate_scale=True)
+        return params, np.ones(len(params), dtype=bool)
+
     @property
     def scale(self):
         # det = scale**(# of dimensions), therefore scale = det**(1/2)
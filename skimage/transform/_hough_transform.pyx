@@ -9,6 +9,7 @@ cimport numpy as cnp
 from cpython.mem cimport PyMem_Malloc, PyMem_Free
 from libc.stdlib cimport abs
 from libc.math cimport fabs, sqrt, ceil, atan2, M_PI
+from cython.parallel cimport prange
 
 from ..draw import circle_perimeter
 
@@ -99,8 +100,56 @@ def _hough_circle(cnp.ndarray img,
     return acc
 
 
+cdef inline Py_ssize_t _histogram_bin(double value, double bin_size,
+                                      Py_ssize_t n_bins) nogil:
+    """Bin of `value` in the bins ``i * bin_size`` of `numpy.histogram`, the
+    last one being closed, or -1 if `value` is past the last bin."""
+    cdef Py_ssize_t i = <Py_ssize_t>(value / bin_size)
+    if i > n_bins:
+        i = n_bins
+    while i > 0 and value < i * bin_size:
+        i -= 1
+    while i < n_bins and value >= (i + 1) * bin_size:
+        i += 1
+    if i == n_bins:
+        if value == n_bins * bin_size:
+            return n_bins - 1
+        return -1
+    return i
+
+
+cdef inline double _ellipse_vote(Py_ssize_t p3x, Py_ssize_t p3y,
+                                 Py_ssize_t p1x, Py_ssize_t p1y,
+                                 double xc, double yc, double a,
+                                 Py_ssize_t min_size, double min_b_squared,
+                                 double max_b_squared, bint prune) nogil:
+    """Squared minor axis voted by a third pixel, or -1 without a vote."""
+    cdef double dx, dy, d, cos_tau_squared, k, b_squared
+    dx = p3x - xc
+    dy = p3y - yc
+    d = sqrt(dx * dx + dy * dy)
+    # no pixel of an ellipse is farther than `a` from its center
+    if d <= min_size or (prune and d > a):
+        return -1
+    dx = p3x - p1x
+    dy = p3y - p1y
+    cos_tau_squared = ((a*a + d*d - dx*dx - dy*dy)
+                       / (2 * a * d))
+    cos_tau_squared *= cos_tau_squared
+    # Consider b2 > 0 and avoid division by zero
+    k = a*a - d*d * cos_tau_squared
+    if k > 0 and cos_tau_squared < 1:
+        b_squared = a*a * d*d * (1 - cos_tau_squared) / k
+        # b2 range is limited to avoid histogram memory
+        # overflow
+        if min_b_squared <= b_squared <= max_b_squared:
+            return b_squared
+    return -1
+
+
 def _hough_ellipse(cnp.ndarray img, Py_ssize_t threshold=4, double accuracy=1,
-                   Py_ssize_t min_size=4, max_size=None):
+                   Py_ssize_t min_size=4, max_size=None, max_candidates=None,
+                   seed=None):
     """Perform an elliptical Hough transform.
 
     Parameters
@@ -117,6 +166,13 @@ def _hough_ellipse(cnp.ndarray img, Py_ssize_t threshold=4, double accuracy=1,
         Maximal minor axis length. (default None)
         If None, the value is set to the half of the smaller
         image dimension.
+    max_candidates : int, optional
+        If given, only this number of randomly drawn pairs of edge pixels
+        are considered as the ends of the major axis, and only the pixels
+        closer to the center than the semi-major axis vote, for a minor axis
+        of at least `accuracy`. Otherwise, all the pairs are considered.
+    seed : int, optional
+        Seed to initialize the random number generator.
 
     Returns
     -------
@@ -157,7 +213,6 @@ def _hough_ellipse(cnp.ndarray img, Py_ssize_t threshold=4, double accuracy=1,
     cdef Py_ssize_t[:, ::1] pixels = np.row_stack(np.nonzero(img))
 
     cdef Py_ssize_t num_pixels = pixels.shape[1]
-    cdef list acc = list()
     cdef list results = list()
     cdef double bin_size = accuracy * accuracy
 
@@ -171,68 +226,112 @@ def _hough_ellipse(cnp.ndarray img, Py_ssize_t threshold=4, double accuracy=1,
     else:
         max_b_squared = max_size * max_size
 
-    cdef Py_ssize_t p1, p2, p3, p1x, p1y, p2x, p2y, p3x, p3y
-    cdef double xc, yc, a, b, d, k, dx, dy
-    cdef double cos_tau_squared, b_squared, orientation
+    # votes of the third pixels, and their histogram
+    cdef double[::1] votes = np.empty(num_pixels, dtype=np.double)
+    cdef Py_ssize_t[::1] hist = np.zeros(
+        int(max_b_squared / bin_size) + 3, dtype=np.intp)
+
+    cdef bint randomized = max_candidates is not None
+    cdef Py_ssize_t num_candidates
+    cdef double[:, ::1] draws
+    # the pixels aligned with the major axis, voting for a degenerate
+    # ellipse, are ignored when drawing candidates
+    cdef double min_b_squared = bin_size if randomized else 0
+    if randomized:
+        num_candidates = max_candidates if num_pixels > 1 else 0
+        draws = np.random.RandomState(seed).random_sample((num_candidates, 2))
+    else:
+        num_candidates = num_pixels * (num_pixels - 1) // 2
+
+    cdef Py_ssize_t candidate, i1, i2, p1, p2, p3
+    cdef Py_ssize_t p1x, p1y, p2x, p2y
+    cdef Py_ssize_t num_votes, n_bins, bin_idx, hist_max, hist_argmax
+    cdef double xc, yc, a, b, dx, dy, max_vote
+    cdef double orientation
+
+    i1 = 1
+    i2 = 0
+    for candidate in range(num_candidates):
+        if randomized:
+            # two distinct pixels, p2 < p1 as in the exhaustive search
+            p1 = <Py_ssize_t>(draws[candidate, 0] * num_pixels)
+            p2 = <Py_ssize_t>(draws[candidate, 1] * (num_pixels - 1))
+            if p2 >= p1:
+                p2 += 1
+            if p1 < p2:
+                p1, p2 = p2, p1
+        else:
+            # all the pairs p2 < p1, in order
+            p1 = i1
+            p2 = i2
+            i2 += 1
+            if i2 == i1:
+                i1 += 1
+                i2 = 0
 
-    for p1 in range(num_pixels):
         p1x = pixels[1, p1]
         p1y = pixels[0, p1]
-
-        for p2 in range(p1):
-            p2x = pixels[1, p2]
-            p2y = pixels[0, p2]
-
-            # Candidate: center (xc, yc) and main axis a
-            dx = p1x - p2x
-            dy = p1y - p2y
-            a = 0.5 * sqrt(dx * dx + dy * dy)
-            if a > 0.5 * min_size:
-                xc = 0.5 * (p1x + p2x)
-                yc = 0.5 * (p1y + p2y)
-
-                for p3 in range(num_pixels):
-                    p3x = pixels[1, p3]
-                    p3y = pixels[0, p3]
-                    dx = p3x - xc
-                    dy = p3y - yc
-                    d = sqrt(dx * dx + dy * dy)
-                    if d > min_size:
-                        dx = p3x - p1x
-                        dy = p3y - p1y
-                        cos_tau_squared = ((a*a + d*d - dx*dx - dy*dy)
-                                           / (2 * a * d))
-                        cos_tau_squared *= cos_tau_squared
-                        # Consider b2 > 0 and avoid division by zero
-                        k = a*a - d*d * cos_tau_squared
-                        if k > 0 and cos_tau_squared < 1:
-                            b_squared = a*a * d*d * (1 - cos_tau_squared) / k
-                            # b2 range is limited to avoid histogram memory
-                            # overflow
-                            if b_squared <= max_b_squared:
-                                acc.append(b_squared)
-
-                if len(acc) > 0:
-                    bins = np.arange(0, np.max(acc) + bin_size, bin_size)
-                    hist, bin_edges = np.histogram(acc, bins=bins)
-                    hist_max = np.max(hist)
-                    if hist_max > threshold:
-                        orientation = atan2(p1x - p2x, p1y - p2y)
-                        b = sqrt(bin_edges[hist.argmax()])
-                        # to keep ellipse_perimeter() convention
-                        if orientation != 0:
-                            orientation = M_PI - orientation
-                            # When orientation is not in [-pi:pi]
-                            # it would mean in ellipse_perimeter()
-                            # that a < b. But we keep a > b.
-                            if orientation > M_PI:
-                                orientation = orientation - M_PI / 2.
-                                a, b = b, a
-                        results.append((hist_max, # Accumulator
-                                        yc, xc,
-                                        a, b,
-                                        orientation))
-                    acc = []
+        p2x = pixels[1, p2]
+        p2y = pixels[0, p2]
+
+        # Candidate: center (xc, yc) and main axis a
+        dx = p1x - p2x
+        dy = p1y - p2y
+        a = 0.5 * sqrt(dx * dx + dy * dy)
+        if a <= 0.5 * min_size:
+            continue
+        xc = 0.5 * (p1x + p2x)
+        yc = 0.5 * (p1y + p2y)
+
+        num_votes = 0
+        max_vote = 0
+        for p3 in range(num_pixels):
+            # early exit when the accumulator cannot exceed the threshold
+            if num_votes + num_pixels - p3 <= threshold:
+                break
+            votes[p3] = _ellipse_vote(pixels[1, p3], pixels[0, p3],
+                                      p1x, p1y, xc, yc, a, min_size,
+                                      min_b_squared, max_b_squared,
+                                      randomized)
+            if votes[p3] >= 0:
+                num_votes += 1
+                if votes[p3] > max_vote:
+                    max_vote = votes[p3]
+        if num_votes <= threshold:
+            continue
+
+        # histogram of the votes, with the bins of
+        # np.histogram(votes, np.arange(0, max_vote + bin_size, bin_size))
+        n_bins = <Py_ssize_t>ceil((max_vote + bin_size) / bin_size) - 1
+        hist[:n_bins] = 0
+        for p3 in range(num_pixels):
+            if votes[p3] >= 0:
+                bin_idx = _histogram_bin(votes[p3], bin_size, n_bins)
+                if bin_idx >= 0:
+                    hist[bin_idx] += 1
+        hist_max = 0
+        hist_argmax = 0
+        for bin_idx in range(n_bins):
+            if hist[bin_idx] > hist_max:
+                hist_max = hist[bin_idx]
+                hist_argmax = bin_idx
+
+        if hist_max > threshold:
+            orientation = atan2(p1x - p2x, p1y - p2y)
+            b = sqrt(hist_argmax * bin_size)
+            # to keep ellipse_perimeter() convention
+            if orientation != 0:
+                orientation = M_PI - orientation
+                # When orientation is not in [-pi:pi]
+                # it would mean in ellipse_perimeter()
+                # that a < b. But we keep a > b.
+                if orientation > M_PI:
+                    orientation = orientation - M_PI / 2.
+                    a, b = b, a
+            results.append((hist_max, # Accumulator
+                            yc, xc,
+                            a, b,
+                            orientation))
 
     return np.array(results, dtype=[('accumulator', np.intp),
                                     ('yc', np.double),
@@ -243,7 +342,8 @@ def _hough_ellipse(cnp.ndarray img, Py_ssize_t threshold=4, double accuracy=1,
 
 
 def _hough_line(cnp.ndarray img,
-                cnp.ndarray[ndim=1, dtype=cnp.double_t] theta):
+                cnp.ndarray[ndim=1, dtype=cnp.double_t] theta,
+                int num_threads=0):
     """Perform a straight line Hough transform.
 
     Parameters
@@ -252,6 +352,9 @@ def _hough_line(cnp.ndarray img,
         Input image with nonzero values representing edges.
     theta : 1D ndarray of double
         Angles at which to compute the transform, in radians.
+    num_threads : int, optional
+        Maximum number of threads, the angles being processed in parallel.
+        0 uses the OpenMP default.
 
     Returns
     -------
@@ -295,15 +398,17 @@ def _hough_line(cnp.ndarray img,
     ctheta = np.cos(theta)
     stheta = np.sin(theta)
 
-    # compute the bins and allocate the accumulator array
-    cdef cnp.ndarray[ndim=2, dtype=cnp.uint64_t] accum
+    # compute the bins and allocate the accumulator array, transposed so
+    # that each angle, processed by a single thread, owns a contiguous row
+    cdef cnp.uint64_t[:, ::1] accum_t
     cdef cnp.ndarray[ndim=1, dtype=cnp.double_t] bins
     cdef Py_ssize_t max_distance, offset
 
     offset = <Py_ssize_t>ceil(sqrt(img.shape[0] * img.shape[0] +
                                    img.shape[1] * img.shape[1]))
     max_distance = 2 * offset + 1
-    accum = np.zeros((max_distance, theta.shape[0]), dtype=np.uint64)
+    accum_array = np.zeros((theta.shape[0], max_distance), dtype=np.uint64)
+    accum_t = accum_array
     bins = np.linspace(-offset, offset, max_distance)
 
     # compute the nonzero indexes
@@ -316,14 +421,14 @@ def _hough_line(cnp.ndarray img,
     nidxs = y_idxs.shape[0]  # x and y are the same shape
     nthetas = theta.shape[0]
     with nogil:
-        for i in range(nidxs):
-            x = x_idxs[i]
-            y = y_idxs[i]
-            for j in range(nthetas):
+        for j in prange(nthetas, schedule='static', num_threads=num_threads):
+            for i in range(nidxs):
+                x = x_idxs[i]
+                y = y_idxs[i]
                 accum_idx = round((ctheta[j] * x + stheta[j] * y)) + offset
-                accum[accum_idx, j] += 1
+                accum_t[j, accum_idx] += 1
 
-    return accum, theta, bins
+    return np.ascontiguousarray(accum_array.T), theta, bins
 
 
 def _probabilistic_hough_line(cnp.ndarray img, Py_ssize_t threshold,
@@ -0,0 +1,56 @@
+#cython: cdivision=True
+#cython: boundscheck=False
+#cython: nonecheck=False
+#cython: wraparound=False
+import numpy as np
+cimport numpy as cnp
+from cython.parallel cimport prange
+
+from .._shared.fused_numerics cimport np_floats
+
+cnp.import_array()
+
+
+def _reduce_axis(np_floats[:, :, ::1] image, np_floats[:, :, ::1] out,
+                 const Py_ssize_t[:, ::1] taps, const double[:, ::1] weights,
+                 const double[::1] offset, int num_threads=0):
+    """Filter and decimate the middle axis of an image in a single pass.
+
+    Only the samples kept by the decimation are filtered::
+
+        out[a, m, b] = offset[m] + sum_t weights[m, t] * image[a, taps[m, t], b]
+
+    Parameters
+    ----------
+    image : (A, N, B) ndarray
+        Input image, the axis to reduce being in the middle.
+    out : (A, M, B) ndarray
+        Output image.
+    taps : (M, T) ndarray of intp
+        Indices along the middle axis of the samples of each output sample.
+    weights : (M, T) ndarray
+        Corresponding filter weights.
+    offset : (M,) ndarray
+        Constant term of each output sample, e.g. the contribution of the
+        samples outside the image in the ``'constant'`` mode.
+    num_threads : int, optional
+        Maximum number of threads. 0 uses the OpenMP default.
+    """
+    cdef:
+        Py_ssize_t n_outer = out.shape[0]
+        Py_ssize_t n_out = out.shape[1]
+        Py_ssize_t n_inner = out.shape[2]
+        Py_ssize_t n_taps = taps.shape[1]
+        Py_ssize_t i, a, m, b, t
+        double acc
+
+    with nogil:
+        for i in prange(n_outer * n_out, schedule='static',
+                        num_threads=num_threads):
+            a = i // n_out
+            m = i % n_out
+            for b in range(n_inner):
+                acc = offset[m]
+                for t in range(n_taps):
+                    acc = acc + weights[m, t] * image[a, taps[m, t], b]
+                out[a, m, b] = <np_floats>acc
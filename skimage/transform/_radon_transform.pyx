@@ -7,7 +7,9 @@ import numpy as np
 cimport numpy as cnp
 cimport cython
 from libc.math cimport cos, sin, floor, ceil, sqrt, abs, M_PI
+from cython.parallel cimport prange
 from .._shared.fused_numerics cimport np_floats
+from .._shared.interpolation cimport bilinear_interpolation
 
 cnp.import_array()
 
@@ -215,3 +217,97 @@ def sart_projection_update(np_floats[:, :] image not None,
         bilinear_ray_update[np_floats](
             image, image_update, theta, ray_position, projection[i])
     return np.asarray(image_update)
+
+
+def _radon_projections(np_floats[:, ::1] image, np_floats[:, :, ::1] matrices,
+                       np_floats[:, ::1] out, int num_threads=0):
+    """Project a square image along the columns of its rotations.
+
+    The image is rotated by bilinear interpolation, with zeros outside of
+    it, and the rows of the rotated image are summed in order, as in
+    ``warp(image, matrix, clip=False).sum(0)``.
+
+    Parameters
+    ----------
+    image : (N, N) ndarray
+        Image to project.
+    matrices : (A, 2, 3) ndarray
+        Affine matrices mapping the ``(col, row)`` coordinates of each
+        rotated image into the image.
+    out : (A, N) ndarray
+        Output array, the projection of each rotation.
+    num_threads : int, optional
+        Maximum number of threads, the rotations being processed in
+        parallel. 0 uses the OpenMP default.
+    """
+    cdef:
+        Py_ssize_t n = image.shape[0]
+        Py_ssize_t n_angles = matrices.shape[0]
+        Py_ssize_t i, r, c
+        np_floats row, col, value
+
+    with nogil:
+        for i in prange(n_angles, schedule='static', num_threads=num_threads):
+            for c in range(n):
+                out[i, c] = 0
+            for r in range(n):
+                for c in range(n):
+                    col = (matrices[i, 0, 0] * c + matrices[i, 0, 1] * r
+                           + matrices[i, 0, 2])
+                    row = (matrices[i, 1, 0] * c + matrices[i, 1, 1] * r
+                           + matrices[i, 1, 2])
+                    # assigned in the loop body to be thread private
+                    value = 0
+                    bilinear_interpolation[np_floats, np_floats, np_floats](
+                        &image[0, 0], n, n, row, col, b'C', 0, &value)
+                    out[i, c] += value
+
+
+def _backproject_linear(double[:, ::1] projections, double[::1] cos_theta,
+                        double[::1] sin_theta, np_floats[:, ::1] out,
+                        int num_threads=0):
+    """Add the linear backprojection of filtered projections to an image.
+
+    Each projection is interpolated as by
+    ``np.interp(t, np.arange(P) - P // 2, projection, left=0, right=0)``,
+    and the backprojections are added in order.
+
+    Parameters
+    ----------
+    projections : (A, P) ndarray
+        Filtered projections, one per angle.
+    cos_theta, sin_theta : (A,) ndarray
+        Cosine and sine of the projection angles.
+    out : (M, M) ndarray
+        Image to which the backprojections are added.
+    num_threads : int, optional
+        Maximum number of threads, the rows of `out` being processed in
+        parallel. 0 uses the OpenMP default.
+    """
+    cdef:
+        Py_ssize_t n_angles = projections.shape[0]
+        Py_ssize_t n_proj = projections.shape[1]
+        Py_ssize_t half = n_proj // 2
+        Py_ssize_t size = out.shape[0]
+        Py_ssize_t radius = size // 2
+        Py_ssize_t r, c, i, j
+        double t, t_floor, value
+
+    with nogil:
+        for r in prange(size, schedule='static', num_threads=num_threads):
+            for c in range(size):
+                for i in range(n_angles):
+                    t = ((c - radius) * cos_theta[i]
+                         - (r - radius) * sin_theta[i])
+                    t_floor = floor(t)
+                    j = <Py_ssize_t>t_floor + half
+                    if j < 0 or j >= n_proj or (j == n_proj - 1
+                                                 and t != t_floor):
+                        value = 0
+                    elif j == n_proj - 1 or t == t_floor:
+                        value = projections[i, j]
+                    else:
+                        value = ((projections[i, j + 1] - projections[i, j])
+                                 * (t - <double>(j - half))
+                                 + projections[i, j])
+                    out[r, c] = <np_floats>(<double>out[r, c] + value)
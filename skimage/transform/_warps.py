@@ -1,11 +1,14 @@
+from functools import lru_cache
+
 import numpy as np
 from numpy.lib import NumpyVersion
 import scipy
 from scipy import ndimage as ndi
+from scipy import sparse
 
 from ._geometric import (SimilarityTransform, AffineTransform,
                          ProjectiveTransform)
-from ._warps_cy import _warp_fast
+from ._warps_cy import _warp_fast, _warp_map
 from ..measure import block_reduce
 
 from .._shared.utils import (get_bound_method_class, safe_as_int, warn,
@@ -196,6 +199,183 @@ def resize(image, output_shape, order=None, mode='reflect', cval=0, clip=True,
     return out
 
 
+def _linear_kernel(x):
+    return np.maximum(0, 1 - np.abs(x))
+
+
+def _cubic_kernel(x):
+    # Keys cubic convolution kernel, with a = -0.5 (Catmull-Rom)
+    x = np.abs(x)
+    return np.where(x <= 1, (1.5 * x - 2.5) * x * x + 1,
+                    np.where(x < 2, ((-0.5 * x + 2.5) * x - 4) * x + 2, 0))
+
+
+def _lanczos_kernel(x):
+    return np.where(np.abs(x) < 3, np.sinc(x) * np.sinc(x / 3), 0)
+
+
+# kernel name: (support radius, kernel function)
+_RESAMPLING_KERNELS = {'linear': (1, _linear_kernel),
+                       'cubic': (2, _cubic_kernel),
+                       'lanczos': (3, _lanczos_kernel)}
+
+
+@lru_cache(maxsize=64)
+def _resampling_matrix(in_size, out_size, kernel, mode, anti_aliasing,
+                       dtype):
+    """Sparse matrix resampling an axis of size `in_size` to `out_size`.
+
+    When down-sampling with `anti_aliasing`, the kernel is stretched by the
+    down-sampling factor, so that it also acts as the low-pass filter.
+
+    Returns
+    -------
+    matrix : (out_size, in_size) scipy.sparse.csr_matrix
+        Resampling weights.
+    cval_weights : (out_size,) ndarray or None
+        For the 'constant' mode, the weight of the samples falling outside
+        of the axis.
+    """
+    radius, kernel_func = _RESAMPLING_KERNELS[kernel]
+    scale = in_size / out_size
+    stretch = max(scale, 1.) if anti_aliasing else 1.
+    support = radius * stretch
+
+    center = (np.arange(out_size) + 0.5) * scale - 0.5
+    first = np.floor(center - support).astype(np.intp) + 1
+    index = first[:, np.newaxis] + np.arange(int(np.ceil(2 * support)) + 1)
+    weights = kernel_func((index - center[:, np.newaxis]) / stretch)
+    weights /= weights.sum(axis=1, keepdims=True)
+
+    index, valid = _map_index(index, in_size, mode)
+    if valid is not None:
+        weights[~valid] = 0
+        cval_weights = (1 - weights.sum(axis=1)).astype(dtype)
+    else:
+        cval_weights = None
+
+    rows = np.repeat(np.arange(out_size), index.shape[1])
+    # the weights of the samples mapped to the same index are summed
+    matrix = sparse.csr_matrix(
+        (weights.ravel().astype(dtype), (rows, index.ravel())),
+        shape=(out_size, in_size))
+    matrix.eliminate_zeros()
+    return matrix, cval_weights
+
+
+def resize_separable(image, output_shape, kernel='linear', mode='reflect',
+                     cval=0, clip=True, preserve_range=False,
+                     anti_aliasing=True, dtype=None):
+    """Resize an image with separable resampling kernels.
+
+    Each axis is resampled in turn by a sparse matrix product. The weight
+    matrices only depend on the input and output sizes of an axis, the
+    kernel and the mode: they are cached, which makes repeated resizing of
+    images of the same shape cheap.
+
+    Parameters
+    ----------
+    image : ndarray
+        Input image.
+    output_shape : tuple or ndarray
+        Size of the generated output image `(rows, cols[, ...][, dim])`. If
+        `dim` is not provided, the number of channels is preserved.
+    kernel : {'linear', 'cubic', 'lanczos'}, optional
+        Resampling kernel: linear, Keys cubic convolution or Lanczos with 3
+        lobes.
+    mode : {'constant', 'edge', 'symmetric', 'reflect', 'wrap'}, optional
+        Points outside the boundaries of the input are filled according
+        to the given mode.  Modes match the behaviour of `numpy.pad`.
+    cval : float, optional
+        Used in conjunction with mode 'constant', the value outside
+        the image boundaries.
+    clip : bool, optional
+        Whether to clip the output to the range of values of the input image.
+    preserve_range : bool, optional
+        Whether to keep the original range of values. Otherwise, the input
+        image is converted according to the conventions of `img_as_float`.
+    anti_aliasing : bool, optional
+        Whether to stretch the kernel by the down-sampling factor along the
+        down-sampled axes, so that it also low-pass filters the image. This
+        avoids aliasing artifacts without a separate smoothing step.
+    dtype : {np.float32, np.float64}, optional
+        Data type of the computation and of the output. By default,
+        float32 images stay float32 and other images are converted to
+        float64.
+
+    Returns
+    -------
+    resized : ndarray
+        Resized version of the input.
+
+    See also
+    --------
+    resize
+
+    Notes
+    -----
+    With ``kernel='linear'`` and ``anti_aliasing=False``, the result is the
+    same as ``resize(image, output_shape, order=1, anti_aliasing=False)``.
+    With anti-aliasing, the smoothing differs from the Gaussian filter of
+    `resize`: the kernel is widened instead, as in most image processing
+    libraries.
+
+    Examples
+    --------
+    >>> from skimage import data
+    >>> from skimage.transform import resize_separable
+    >>> image = data.camera()
+    >>> resize_separable(image, (100, 100), kernel='lanczos').shape
+    (100, 100)
+
+    """
+    if kernel not in _RESAMPLING_KERNELS:
+        raise ValueError('Unknown kernel {}, expected one of {}.'.format(
+            kernel, tuple(_RESAMPLING_KERNELS)))
+
+    output_shape = tuple(safe_as_int(output_shape))
+    if len(output_shape) > image.ndim:
+        image = image.reshape(image.shape +
+                              (1,) * (len(output_shape) - image.ndim))
+    elif len(output_shape) == image.ndim - 1:
+        # multichannel case: append shape of last axis
+        output_shape = output_shape + (image.shape[-1],)
+    elif len(output_shape) < image.ndim - 1:
+        raise ValueError("len(output_shape) cannot be smaller than the image "
+                         "dimensions")
+
+    image = convert_to_float(image, preserve_range)
+    if dtype is None:
+        dtype = image.dtype
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError('`dtype` must be float32 or float64.')
+
+    out = image.astype(dtype, copy=False)
+    axes = [axis for axis in range(image.ndim)
+            if (image.shape[axis], output_shape[axis]) != (1, 1) and
+            (image.shape[axis] != output_shape[axis] or kernel != 'linear')]
+    # shrink the image as early as possible
+    axes.sort(key=lambda axis: output_shape[axis] / image.shape[axis])
+    for axis in axes:
+        matrix, cval_weights = _resampling_matrix(
+            image.shape[axis], output_shape[axis], kernel, mode,
+            anti_aliasing, dtype)
+        values = np.moveaxis(out, axis, 0)
+        rest_shape = values.shape[1:]
+        values = np.ascontiguousarray(values).reshape(values.shape[0], -1)
+        values = matrix @ values
+        if cval_weights is not None and cval != 0:
+            values += cval * cval_weights[:, np.newaxis]
+        out = np.moveaxis(values.reshape((-1,) + rest_shape), 0, axis)
+
+    out = np.ascontiguousarray(out)
+    if out is image:
+        out = out.copy()
+    _clip_warp_output(image, out, 1, mode, cval, clip)
+    return out
+
+
 def rescale(image, scale, order=None, mode='reflect', cval=0, clip=True,
             preserve_range=False, multichannel=False,
             anti_aliasing=None, anti_aliasing_sigma=None):
@@ -292,7 +472,8 @@ def rescale(image, scale, order=None, mode='reflect', cval=0, clip=True,
 
 
 def rotate(image, angle, resize=False, center=None, order=None,
-           mode='constant', cval=0, clip=True, preserve_range=False):
+           mode='constant', cval=0, clip=True, preserve_range=False,
+           num_threads=None):
     """Rotate image by a certain angle around its center.
 
     Parameters
@@ -337,6 +518,9 @@ def rotate(image, angle, resize=False, center=None, order=None,
         image is converted according to the conventions of `img_as_float`.
         Also see
         https://scikit-image.org/docs/dev/user_guide/data_types.html
+    num_threads : int, optional
+        The maximum number of threads used by the fast warping routine of
+        2-D homographies. By default, the OpenMP default is used.
 
     Notes
     -----
@@ -399,7 +583,8 @@ def rotate(image, angle, resize=False, center=None, order=None,
     tform.params[2] = (0, 0, 1)
 
     return warp(image, tform, output_shape=output_shape, order=order,
-                mode=mode, cval=cval, clip=clip, preserve_range=preserve_range)
+                mode=mode, cval=cval, clip=clip, preserve_range=preserve_range,
+                num_threads=num_threads)
 
 
 def downscale_local_mean(image, factors, cval=0, clip=True):
@@ -470,7 +655,7 @@ def _swirl_mapping(xy, center, rotation, strength, radius):
 
 def swirl(image, center=None, strength=1, radius=100, rotation=0,
           output_shape=None, order=None, mode='reflect', cval=0, clip=True,
-          preserve_range=False):
+          preserve_range=False, num_threads=None):
     """Perform a swirl transformation.
 
     Parameters
@@ -517,6 +702,9 @@ def swirl(image, center=None, strength=1, radius=100, rotation=0,
         image is converted according to the conventions of `img_as_float`.
         Also see
         https://scikit-image.org/docs/dev/user_guide/data_types.html
+    num_threads : int, optional
+        The maximum number of threads used by the fast warping routine, for
+        bi-linear interpolation. By default, the OpenMP default is used.
 
     """
     if center is None:
@@ -529,7 +717,8 @@ def swirl(image, center=None, strength=1, radius=100, rotation=0,
 
     return warp(image, _swirl_mapping, map_args=warp_args,
                 output_shape=output_shape, order=order, mode=mode, cval=cval,
-                clip=clip, preserve_range=preserve_range)
+                clip=clip, preserve_range=preserve_range,
+                num_threads=num_threads)
 
 
 def _stackcopy(a, b):
@@ -679,8 +868,41 @@ def _clip_warp_output(input_image, output_image, order, mode, cval, clip):
             output_image[cval_mask] = cval
 
 
+def _compiled_map(inverse_map, map_args):
+    """Name and parameters of the inverse maps implemented by `_warp_map`.
+
+    Parameters
+    ----------
+    inverse_map : callable or ndarray
+        Inverse coordinate map, as given to `warp`.
+    map_args : dict
+        Keyword arguments of `inverse_map`.
+
+    Returns
+    -------
+    compiled_map : tuple of (str, (P,) ndarray) or None
+        The name and parameters of the map, as expected by `_warp_map`, or
+        None if `inverse_map` has no compiled implementation.
+    """
+    if inverse_map is _swirl_mapping:
+        x0, y0 = map_args['center']
+        # the decay radius of `_swirl_mapping`
+        radius = map_args['radius'] / 5 * np.log(2)
+        params = [x0, y0, map_args['rotation'], map_args['strength'], radius]
+        return 'swirl', np.array(params, dtype=np.float64)
+    if (inverse_map is _linear_polar_mapping
+            or inverse_map is _log_polar_mapping):
+        kind = ('linear_polar' if inverse_map is _linear_polar_mapping
+                else 'log_polar')
+        r0, c0 = map_args['center']
+        params = [map_args['k_angle'], map_args['k_radius'], r0, c0]
+        return kind, np.array(params, dtype=np.float64)
+    return None
+
+
 def warp(image, inverse_map, map_args={}, output_shape=None, order=None,
-         mode='constant', cval=0., clip=True, preserve_range=False):
+         mode='constant', cval=0., clip=True, preserve_range=False,
+         num_threads=None):
     """Warp an image according to a given coordinate transformation.
 
     Parameters
@@ -750,6 +972,10 @@ def warp(image, inverse_map, map_args={}, output_shape=None, order=None,
         image is converted according to the conventions of `img_as_float`.
         Also see
         https://scikit-image.org/docs/dev/user_guide/data_types.html
+    num_threads : int, optional
+        The maximum number of threads used by the fast warping routines of
+        2-D homographies, and of the swirl and polar maps. By default, the
+        OpenMP default is used.
 
     Returns
     -------
@@ -762,7 +988,10 @@ def warp(image, inverse_map, map_args={}, output_shape=None, order=None,
     - In case of a `SimilarityTransform`, `AffineTransform` and
       `ProjectiveTransform` and `order` in [0, 3] this function uses the
       underlying transformation matrix to warp the image with a much faster
-      routine.
+      routine, which processes the rows of the output image in parallel.
+    - The inverse maps of `swirl` and `warp_polar` are also applied by a
+      parallel routine for `order` 1. Other orders use
+      `scipy.ndimage.map_coordinates`, which is single-threaded.
 
     Examples
     --------
@@ -871,18 +1100,24 @@ def warp(image, inverse_map, map_args={}, output_shape=None, order=None,
         if matrix is not None:
             matrix = matrix.astype(image.dtype)
             ctype = 'float32_t' if image.dtype == np.float32 else 'float64_t'
-            if image.ndim == 2:
-                warped = _warp_fast[ctype](image, matrix,
-                                           output_shape=output_shape,
-                                           order=order, mode=mode, cval=cval)
-            elif image.ndim == 3:
-                dims = []
-                for dim in range(image.shape[2]):
-                    dims.append(_warp_fast[ctype](image[..., dim], matrix,
-                                                  output_shape=output_shape,
-                                                  order=order, mode=mode,
-                                                  cval=cval))
-                warped = np.dstack(dims)
+            if image.ndim in (2, 3):
+                # the channels of a color image are warped together
+                warped = _warp_fast[ctype](
+                    image, matrix, output_shape=output_shape, order=order,
+                    mode=mode, cval=cval,
+                    num_threads=0 if num_threads is None else num_threads)
+
+    if warped is None and order == 1 and image.ndim in (2, 3):
+        # the inverse maps of `swirl` and `warp_polar` are compiled; order 0
+        # stays on `ndi.map_coordinates`, as nearest-neighbor sampling of
+        # ties depends on the last bit of the coordinates computed by NumPy
+        compiled_map = _compiled_map(inverse_map, map_args)
+        if compiled_map is not None:
+            kind, params = compiled_map
+            ctype = 'float32_t' if image.dtype == np.float32 else 'float64_t'
+            warped = _warp_map[ctype](
+                image, kind, params, output_shape, mode=mode, cval=cval,
+                num_threads=0 if num_threads is None else num_threads)
 
     if warped is None:
         # use ndi.map_coordinates
@@ -930,6 +1165,321 @@ def warp(image, inverse_map, map_args={}, output_shape=None, order=None,
     return warped
 
 
+def _map_index(index, size, mode):
+    """Map integer indices outside ``[0, size)`` inside the image.
+
+    Parameters
+    ----------
+    index : ndarray of int
+        Indices along one axis.
+    size : int
+        Size of the axis.
+    mode : {'constant', 'edge', 'symmetric', 'reflect', 'wrap'}
+        How to handle indices outside the axis, as in `numpy.pad`.
+
+    Returns
+    -------
+    index : ndarray of int
+        Mapped indices.
+    valid : ndarray of bool or None
+        For the 'constant' mode, whether each index is inside the axis.
+    """
+    if mode == 'constant':
+        valid = (index >= 0) & (index < size)
+        return np.clip(index, 0, size - 1), valid
+    if mode == 'edge':
+        index = np.clip(index, 0, size - 1)
+    elif mode == 'wrap':
+        index = np.mod(index, size)
+    elif mode == 'symmetric':
+        index = np.mod(index, 2 * size)
+        index = np.where(index >= size, 2 * size - 1 - index, index)
+    elif mode == 'reflect':
+        if size == 1:
+            index = np.zeros_like(index)
+        else:
+            index = np.mod(index, 2 * size - 2)
+            index = np.where(index >= size, 2 * size - 2 - index, index)
+    else:
+        raise ValueError("Invalid mode specified.  Please use `constant`, "
+                         "`edge`, `wrap`, `reflect` or `symmetric`.")
+    return index, None
+
+
+def _interpolation_taps(coord, order, spline=False):
+    """Indices and weights of the samples interpolated at `coord`.
+
+    Parameters
+    ----------
+    coord : (P,) ndarray
+        Coordinates along one axis.
+    order : {0, 1, 3}
+        Nearest-neighbor, linear or cubic convolution (Catmull-Rom)
+        interpolation, as in `_warp_fast`.
+    spline : bool, optional
+        For ``order=3``, use the weights of cubic B-spline interpolation
+        instead, to be applied to the spline coefficients of the image, as
+        in `ndi.map_coordinates`.
+
+    Returns
+    -------
+    index : (P, T) ndarray of int
+        Indices of the ``T`` samples used for each coordinate.
+    weights : (P, T) ndarray
+        Corresponding weights.
+    """
+    if order == 0:
+        # round half away from zero
+        index = np.where(coord > 0, coord + 0.5, coord - 0.5).astype(np.intp)
+        return index[:, np.newaxis], np.ones((coord.size, 1))
+
+    floor = np.floor(coord)
+    t = coord - floor
+    floor = floor.astype(np.intp)
+    if order == 1:
+        index = floor[:, np.newaxis] + np.arange(2)
+        weights = np.stack([1 - t, t], axis=1)
+    else:
+        index = floor[:, np.newaxis] + np.arange(-1, 3)
+        t2 = t * t
+        t3 = t2 * t
+        if spline:
+            weights = np.stack([(1 - t) ** 3,
+                                4 - 6 * t2 + 3 * t3,
+                                1 + 3 * t + 3 * t2 - 3 * t3,
+                                t3], axis=1) / 6
+        else:
+            weights = 0.5 * np.stack([-t + 2 * t2 - t3,
+                                      2 - 5 * t2 + 3 * t3,
+                                      t + 4 * t2 - 3 * t3,
+                                      t3 - t2], axis=1)
+    return index, weights
+
+
+class WarpPlan(object):
+    """Precomputed warp, to apply the same transformation to many images.
+
+    The source coordinates of every output pixel are computed once, and
+    stored along with the corresponding interpolation weights in a sparse
+    matrix. Warping an image, or all the channels of a stack of images,
+    then amounts to a single sparse matrix product.
+
+    Parameters
+    ----------
+    inverse_map : transformation object, callable ``cr = f(cr, **kwargs)``, or ndarray
+        Inverse coordinate map, which transforms coordinates in the output
+        images into their corresponding coordinates in the input image. See
+        `warp` for the supported forms. A callable or a transformation is
+        used for 2-D images, while an array of coordinates of shape
+        ``(ndim, ...)`` can be used for N-D images.
+    input_shape : tuple of int
+        Shape of the images to warp, without the channel axes.
+    output_shape : tuple of int, optional
+        Shape of the warped images, without the channel axes. By default
+        the input shape is used, or the shape given by the coordinates when
+        `inverse_map` is an array.
+    order : {0, 1, 3}, optional
+        The order of interpolation: nearest-neighbor, linear (default) or
+        cubic. As in `warp`, cubic interpolation is a cubic convolution for
+        homographies, and a cubic spline for other maps, in which case the
+        spline coefficients of each image are computed when it is warped.
+    mode : {'constant', 'edge', 'symmetric', 'reflect', 'wrap'}, optional
+        Points outside the boundaries of the input are filled according
+        to the given mode.  Modes match the behaviour of `numpy.pad`.
+    cval : float, optional
+        Used in conjunction with mode 'constant', the value outside
+        the image boundaries.
+    map_args : dict, optional
+        Keyword arguments passed to `inverse_map`.
+    dtype : {np.float32, np.float64}, optional
+        Data type of the interpolation weights and of the warped images.
+
+    Attributes
+    ----------
+    input_shape : tuple of int
+        Shape of the images to warp, without the channel axes.
+    output_shape : tuple of int
+        Shape of the warped images, without the channel axes.
+    matrix : (P_out, P_in) scipy.sparse.csr_matrix
+        Interpolation weights, from the flattened input image to the
+        flattened output image. For cubic splines, the weights apply to the
+        spline coefficients of the input image, padded for the 'constant'
+        and 'edge' modes.
+
+    See also
+    --------
+    warp
+
+    Examples
+    --------
+    >>> from skimage import data
+    >>> from skimage.transform import SimilarityTransform, WarpPlan, warp
+    >>> image = data.astronaut()
+    >>> tform = SimilarityTransform(rotation=0.1, translation=(20, -10))
+    >>> plan = WarpPlan(tform, image.shape[:2])
+    >>> warped = plan(image)
+    >>> warped.shape
+    (512, 512, 3)
+    >>> np.allclose(warped, warp(image, tform))
+    True
+
+    A stack of frames can be warped at once by moving the frames to the
+    last axes:
+
+    >>> frames = np.random.rand(10, 64, 64).astype(np.float32)
+    >>> plan = WarpPlan(tform, (64, 64), dtype=np.float32)
+    >>> warped = np.moveaxis(plan(np.moveaxis(frames, 0, -1)), -1, 0)
+    >>> warped.shape, warped.dtype
+    ((10, 64, 64), dtype('float32'))
+    """
+
+    def __init__(self, inverse_map, input_shape, output_shape=None, order=1,
+                 mode='constant', cval=0., map_args={}, dtype=np.float64):
+        if order not in (0, 1, 3):
+            raise ValueError('Only the interpolation orders 0, 1 and 3 are '
+                             'supported, got {}.'.format(order))
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError('`dtype` must be float32 or float64.')
+
+        self.input_shape = tuple(safe_as_int(input_shape))
+        self.order = order
+        self.mode = mode
+        self.cval = cval
+        self.dtype = dtype
+
+        # `warp` only uses cubic convolution for homographies, and splines
+        # otherwise
+        homography = not map_args and (
+            (isinstance(inverse_map, np.ndarray)
+             and inverse_map.shape == (3, 3))
+            or isinstance(inverse_map, HOMOGRAPHY_TRANSFORMS)
+            or (getattr(inverse_map, '__name__', None) == 'inverse'
+                and get_bound_method_class(inverse_map)
+                in HOMOGRAPHY_TRANSFORMS))
+        self._spline = order == 3 and not homography
+        # as in `ndi.map_coordinates`, the images are padded before
+        # computing their spline coefficients for these modes
+        self._npad = 12 if self._spline and mode in ('constant', 'edge') else 0
+
+        if isinstance(inverse_map, np.ndarray) and inverse_map.shape != (3, 3):
+            # coordinates given directly
+            coords = inverse_map
+            if coords.shape[0] != len(self.input_shape):
+                raise ValueError('The coordinates must have one row per '
+                                 'dimension of the input images.')
+            self.output_shape = coords.shape[1:]
+        else:
+            if len(self.input_shape) != 2:
+                raise ValueError('Only 2-D images are supported, when '
+                                 'providing a callable `inverse_map`.')
+            if isinstance(inverse_map, np.ndarray):
+                inverse_map = ProjectiveTransform(matrix=inverse_map)
+            if output_shape is None:
+                output_shape = self.input_shape
+            self.output_shape = tuple(safe_as_int(output_shape))[:2]
+
+            def coord_map(*args):
+                return inverse_map(*args, **map_args)
+
+            coords = warp_coords(coord_map, self.output_shape)
+
+        n_out = int(np.prod(self.output_shape))
+        coords = coords.reshape(len(self.input_shape), n_out)
+        padded_shape = tuple(size + 2 * self._npad
+                             for size in self.input_shape)
+
+        # combine the taps of each axis
+        flat_index = np.zeros((n_out, 1), dtype=np.intp)
+        weights = np.ones((n_out, 1))
+        valid = np.ones((n_out, 1), dtype=bool)
+        for axis, size in enumerate(padded_shape):
+            index, axis_weights = _interpolation_taps(
+                coords[axis].astype(np.float64) + self._npad, order,
+                spline=self._spline)
+            index, axis_valid = _map_index(index, size, mode)
+            n_taps = index.shape[1]
+            flat_index = (flat_index[:, :, np.newaxis] * size
+                          + index[:, np.newaxis, :]).reshape(n_out, -1)
+            weights = (weights[:, :, np.newaxis]
+                       * axis_weights[:, np.newaxis, :]).reshape(n_out, -1)
+            if axis_valid is not None:
+                valid = (valid[:, :, np.newaxis]
+                         & axis_valid[:, np.newaxis, :]).reshape(n_out, -1)
+            else:
+                valid = np.repeat(valid, n_taps, axis=1)
+
+        weights[~valid] = 0
+        if mode == 'constant' and cval != 0:
+            # the samples outside of the image contribute cval
+            self._cval_term = (cval * (1 - weights.sum(axis=1))
+                               ).astype(dtype)
+        else:
+            self._cval_term = None
+
+        rows = np.repeat(np.arange(n_out), weights.shape[1])
+        self.matrix = sparse.csr_matrix(
+            (weights.ravel().astype(dtype), (rows, flat_index.ravel())),
+            shape=(n_out, int(np.prod(padded_shape))))
+        self.matrix.eliminate_zeros()
+
+    def __call__(self, image, clip=True, preserve_range=False):
+        """Warp an image.
+
+        Parameters
+        ----------
+        image : ndarray
+            Input image, of shape ``input_shape`` followed by any number
+            of channel axes, which are all warped at once.
+        clip : bool, optional
+            Whether to clip the output to the range of values of the input
+            image, as in `warp`.
+        preserve_range : bool, optional
+            Whether to keep the original range of values. Otherwise, the
+            input image is converted according to the conventions of
+            `img_as_float`.
+
+        Returns
+        -------
+        warped : ndarray
+            The warped image, of shape ``output_shape`` followed by the
+            channel axes of `image`.
+        """
+        ndim = len(self.input_shape)
+        if image.shape[:ndim] != self.input_shape:
+            raise ValueError('Expected images of shape {}, got {} instead.'
+                             .format(self.input_shape, image.shape))
+        channel_shape = image.shape[ndim:]
+
+        image = convert_to_float(image, preserve_range)
+        values = image
+        if self._spline:
+            if self._npad:
+                pad_width = ([(self._npad, self._npad)] * ndim
+                             + [(0, 0)] * len(channel_shape))
+                if self.mode == 'constant':
+                    values = np.pad(values, pad_width, mode='constant',
+                                    constant_values=self.cval)
+                else:
+                    values = np.pad(values, pad_width, mode='edge')
+            ndi_mode = _to_ndimage_mode(self.mode)
+            for axis in range(ndim):
+                values = ndi.spline_filter1d(values, 3, axis=axis,
+                                             mode=ndi_mode,
+                                             output=np.float64)
+        values = np.ascontiguousarray(values, dtype=self.dtype)
+        values = values.reshape(self.matrix.shape[1], -1)
+
+        warped = self.matrix @ values
+        if self._cval_term is not None:
+            warped += self._cval_term[:, np.newaxis]
+        warped = np.asarray(warped).reshape(self.output_shape + channel_shape)
+
+        _clip_warp_output(image, warped, self.order, self.mode, self.cval,
+                          clip)
+        return warped
+
+
 def _linear_polar_mapping(output_coords, k_angle, k_radius, center):
     """Inverse mapping function to convert from cartesian to polar coordinates
 
@@ -4,14 +4,38 @@
 #cython: wraparound=False
 import numpy as np
 cimport numpy as cnp
+from libc.math cimport atan2, cos, exp, sin, sqrt
 from .._shared.interpolation cimport (nearest_neighbour_interpolation,
                                       bilinear_interpolation,
                                       biquadratic_interpolation,
                                       bicubic_interpolation)
 from .._shared.fused_numerics cimport np_floats
+from cython.parallel cimport prange
 
 cnp.import_array()
 
+
+cdef char _mode_char(mode) except 0:
+    """Wrapping mode, as expected by the interpolation routines."""
+    if mode not in ('constant', 'wrap', 'symmetric', 'reflect', 'edge'):
+        raise ValueError("Invalid mode specified.  Please use `constant`, "
+                         "`edge`, `wrap`, `reflect` or `symmetric`.")
+    return ord(mode[0].upper())
+
+
+def _channels_first(image, dtype):
+    """Contiguous copy of a 2-D or 3-D image, with the channels first."""
+    image = np.asarray(image)
+    if image.ndim == 2:
+        image = image[np.newaxis]
+    elif image.ndim == 3:
+        image = np.moveaxis(image, -1, 0)
+    else:
+        raise ValueError("Only 2-D images, with or without channels, are "
+                         "supported.")
+    return np.ascontiguousarray(image, dtype=dtype)
+
+
 cdef inline void _transform_metric(np_floats x, np_floats y, np_floats* H,
                                    np_floats *x_, np_floats *y_) nogil:
     """Apply a metric transformation to a coordinate.
@@ -68,8 +92,9 @@ cdef inline void _transform_projective(np_floats x, np_floats y, np_floats* H,
     y_[0] = (H[3] * x + H[4] * y + H[5]) / z_
 
 
-def _warp_fast(np_floats[:, :] image, np_floats[:, :] H, output_shape=None,
-               int order=1, mode='constant', np_floats cval=0):
+def _warp_fast(image, np_floats[:, :] H, output_shape=None,
+               int order=1, mode='constant', np_floats cval=0,
+               int num_threads=0):
     """Projective transformation (homography).
 
     Perform a projective transformation (homography) of a floating
@@ -92,8 +117,8 @@ def _warp_fast(np_floats[:, :] image, np_floats[:, :] H, output_shape=None,
 
     Parameters
     ----------
-    image : 2-D array
-        Input image.
+    image : 2-D or 3-D array
+        Input image. The channels of a 3-D image are warped together.
     H : array of shape ``(3, 3)``
         Transformation matrix H that defines the homography.
     output_shape : tuple (rows, cols), optional
@@ -110,6 +135,9 @@ def _warp_fast(np_floats[:, :] image, np_floats[:, :] H, output_shape=None,
     cval : string, optional (default 0)
         Used in conjunction with mode 'C' (constant), the value
         outside the image boundaries.
+    num_threads : int, optional
+        Maximum number of threads used to warp the rows of the output image.
+        0 uses the OpenMP default.
 
     Notes
     -----
@@ -121,33 +149,31 @@ def _warp_fast(np_floats[:, :] image, np_floats[:, :] H, output_shape=None,
 
     """
 
-    cdef np_floats[:, ::1] img = np.ascontiguousarray(image)
-    cdef np_floats[:, ::1] M = np.ascontiguousarray(H)
-
     if np_floats is cnp.float32_t:
         dtype = np.float32
     else:
         dtype = np.float64
 
-    if mode not in ('constant', 'wrap', 'symmetric', 'reflect', 'edge'):
-        raise ValueError("Invalid mode specified.  Please use `constant`, "
-                         "`edge`, `wrap`, `reflect` or `symmetric`.")
-    cdef char mode_c = ord(mode[0].upper())
+    cdef np_floats[:, ::1] M = np.ascontiguousarray(H)
+    cdef np_floats[:, :, ::1] img = _channels_first(image, dtype)
+    cdef char mode_c = _mode_char(mode)
 
     cdef Py_ssize_t out_r, out_c
     if output_shape is None:
-        out_r = int(img.shape[0])
-        out_c = int(img.shape[1])
+        out_r = int(img.shape[1])
+        out_c = int(img.shape[2])
     else:
         out_r = int(output_shape[0])
         out_c = int(output_shape[1])
 
-    cdef np_floats[:, ::1] out = np.zeros((out_r, out_c), dtype=dtype)
+    cdef Py_ssize_t channels = img.shape[0]
+    cdef Py_ssize_t rows = img.shape[1]
+    cdef Py_ssize_t cols = img.shape[2]
+    out_array = np.zeros((out_r, out_c, channels), dtype=dtype)
+    cdef np_floats[:, :, ::1] out = out_array
 
-    cdef Py_ssize_t tfr, tfc
+    cdef Py_ssize_t tfr, tfc, k
     cdef np_floats r, c
-    cdef Py_ssize_t rows = img.shape[0]
-    cdef Py_ssize_t cols = img.shape[1]
 
     cdef void (*transform_func)(np_floats, np_floats, np_floats*,
                                 np_floats*, np_floats*) nogil
@@ -159,7 +185,7 @@ def _warp_fast(np_floats[:, :] image, np_floats[:, :] H, output_shape=None,
     else:
         transform_func = _transform_projective
 
-    cdef void (*interp_func)(np_floats*, Py_ssize_t , Py_ssize_t ,
+    cdef void (*interp_func)(np_floats*, Py_ssize_t, Py_ssize_t,
                              np_floats, np_floats, char, np_floats,
                              np_floats*) nogil
     if order == 0:
@@ -175,10 +201,165 @@ def _warp_fast(np_floats[:, :] image, np_floats[:, :] H, output_shape=None,
         raise ValueError("Unsupported interpolation order", order)
 
     with nogil:
-        for tfr in range(out_r):
+        for tfr in prange(out_r, schedule='static', num_threads=num_threads):
             for tfc in range(out_c):
+                # assigned in the loop body to be thread private
+                c = 0
+                r = 0
                 transform_func(tfc, tfr, &M[0, 0], &c, &r)
-                interp_func(&img[0, 0], rows, cols, r, c,
-                            mode_c, cval, &out[tfr, tfc])
+                for k in range(channels):
+                    interp_func(&img[k, 0, 0], rows, cols, r, c,
+                                mode_c, cval, &out[tfr, tfc, k])
+
+    if np.ndim(image) == 2:
+        return out_array[..., 0]
+    return out_array
+
+
+cdef inline void _map_swirl(double x, double y, double* P,
+                            double *x_, double *y_) nogil:
+    """Apply the inverse swirl mapping to a coordinate.
+
+    Parameters
+    ----------
+    x, y : double
+        Input coordinate.
+    P : (5,) *double
+        Center column and row, rotation, strength and decay radius.
+    x_, y_ : *double
+        Output coordinate.
+
+    """
+    cdef double dx = x - P[0]
+    cdef double dy = y - P[1]
+    cdef double rho = sqrt(dx * dx + dy * dy)
+    cdef double theta = P[2] + P[3] * exp(-rho / P[4]) + atan2(dy, dx)
+    x_[0] = P[0] + rho * cos(theta)
+    y_[0] = P[1] + rho * sin(theta)
+
+
+cdef inline void _map_linear_polar(double x, double y, double* P,
+                                   double *x_, double *y_) nogil:
+    """Map a polar coordinate to the cartesian coordinate of the input.
+
+    Parameters
+    ----------
+    x, y : double
+        Input coordinate, the column being the radius and the row the angle.
+    P : (4,) *double
+        Angle and radius scaling factors, center row and column.
+    x_, y_ : *double
+        Output coordinate.
 
-    return np.asarray(out)
+    """
+    cdef double angle = y / P[0]
+    cdef double rho = x / P[1]
+    x_[0] = rho * cos(angle) + P[3]
+    y_[0] = rho * sin(angle) + P[2]
+
+
+cdef inline void _map_log_polar(double x, double y, double* P,
+                                double *x_, double *y_) nogil:
+    """Map a log-polar coordinate to the cartesian coordinate of the input.
+
+    Parameters
+    ----------
+    x, y : double
+        Input coordinate, the column being the log-radius and the row the
+        angle.
+    P : (4,) *double
+        Angle and radius scaling factors, center row and column.
+    x_, y_ : *double
+        Output coordinate.
+
+    """
+    cdef double angle = y / P[0]
+    cdef double rho = exp(x / P[1])
+    x_[0] = rho * cos(angle) + P[3]
+    y_[0] = rho * sin(angle) + P[2]
+
+
+def _warp_map(image, kind, double[::1] params, output_shape,
+              mode='constant', np_floats cval=0, int num_threads=0):
+    """Warp an image with one of the inverse maps of `swirl` and `warp_polar`,
+    using bi-linear interpolation.
+
+    Parameters
+    ----------
+    image : 2-D or 3-D array
+        Input image. The channels of a 3-D image are warped together.
+    kind : {'swirl', 'linear_polar', 'log_polar'}
+        Inverse map, as implemented by `_swirl_mapping`,
+        `_linear_polar_mapping` and `_log_polar_mapping`.
+    params : (P,) array
+        Parameters of the map: center column and row, rotation, strength and
+        decay radius for the swirl; angle and radius scaling factors, center
+        row and column for the polar maps.
+    output_shape : tuple (rows, cols)
+        Shape of the output image.
+    mode : {'constant', 'edge', 'symmetric', 'reflect', 'wrap'}, optional
+        Points outside the boundaries of the input are filled according
+        to the given mode.  Modes match the behaviour of `numpy.pad`.
+    cval : float, optional (default 0)
+        Used in conjunction with mode 'constant', the value outside
+        the image boundaries.
+    num_threads : int, optional
+        Maximum number of threads used to warp the rows of the output image.
+        0 uses the OpenMP default.
+
+    """
+
+    if np_floats is cnp.float32_t:
+        dtype = np.float32
+    else:
+        dtype = np.float64
+
+    cdef np_floats[:, :, ::1] img = _channels_first(image, dtype)
+    cdef char mode_c = _mode_char(mode)
+
+    cdef Py_ssize_t out_r = int(output_shape[0])
+    cdef Py_ssize_t out_c = int(output_shape[1])
+    cdef Py_ssize_t channels = img.shape[0]
+    cdef Py_ssize_t rows = img.shape[1]
+    cdef Py_ssize_t cols = img.shape[2]
+    out_array = np.zeros((out_r, out_c, channels), dtype=dtype)
+    cdef np_floats[:, :, ::1] out = out_array
+
+    cdef Py_ssize_t tfr, tfc, k
+    cdef double r, c
+
+    cdef void (*map_func)(double, double, double*, double*, double*) nogil
+    if kind == 'swirl':
+        map_func = _map_swirl
+        n_params = 5
+    elif kind == 'linear_polar':
+        map_func = _map_linear_polar
+        n_params = 4
+    elif kind == 'log_polar':
+        map_func = _map_log_polar
+        n_params = 4
+    else:
+        raise ValueError("Unsupported map", kind)
+    if params.shape[0] != n_params:
+        raise ValueError("Expected {} parameters, got {}."
+                         .format(n_params, params.shape[0]))
+
+    cdef void (*interp_func)(np_floats*, Py_ssize_t, Py_ssize_t,
+                             double, double, char, np_floats,
+                             np_floats*) nogil
+    interp_func = bilinear_interpolation[np_floats, double, np_floats]
+
+    with nogil:
+        for tfr in prange(out_r, schedule='static', num_threads=num_threads):
+            for tfc in range(out_c):
+                # assigned in the loop body to be thread private
+                c = 0
+                r = 0
+                map_func(tfc, tfr, &params[0], &c, &r)
+                for k in range(channels):
+                    interp_func(&img[k, 0, 0], rows, cols, r, c,
+                                mode_c, cval, &out[tfr, tfc, k])
+
+    if np.ndim(image) == 2:
+        return out_array[..., 0]
+    return out_array
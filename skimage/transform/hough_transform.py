@@ -1,5 +1,7 @@
 import numpy as np
 from scipy.spatial import cKDTree
+from ..draw import circle_perimeter
+from .._shared.fft import fftmodule, next_fast_len
 from ._hough_transform import (_hough_circle,
                                _hough_ellipse,
                                _hough_line,
@@ -69,7 +71,64 @@ def hough_line_peaks(hspace, angles, dists, min_distance=9, min_angle=10,
         return (h, np.array([]), np.array([]))
 
 
-def hough_circle(image, radius, normalize=True, full_output=False):
+def _hough_circle_fft(image, radius, normalize=True, full_output=False):
+    """Circular Hough transform, as FFT correlations of the edge map.
+
+    The accumulator of each radius is the convolution of the edge map with
+    the circle perimeter drawn by `_hough_circle`. The spectrum of the edge
+    map is computed once and shared by all the radii.
+
+    Parameters
+    ----------
+    image : (M, N) ndarray
+        Input image with nonzero values representing edges.
+    radius : (K,) ndarray of intp
+        Radii at which to compute the Hough transform.
+    normalize : boolean, optional (default True)
+        Normalize the accumulator with the number
+        of pixels used to draw the radius.
+    full_output : boolean, optional (default False)
+        Extend the output size by twice the largest
+        radius in order to detect centers outside the
+        input picture.
+
+    Returns
+    -------
+    H : (K, M + 2R, N + 2R) ndarray of float32
+        Hough transform accumulator for each radius.
+    """
+    if image.ndim != 2:
+        raise ValueError('The input image must be 2D.')
+
+    max_radius = radius.max()
+    offset = max_radius if full_output else 0
+    out_shape = (image.shape[0] + 2 * offset, image.shape[1] + 2 * offset)
+    # the linear convolution with a kernel of size 2 * max_radius + 1 is not
+    # affected by the wrap-around of the circular one
+    fft_shape = tuple(next_fast_len(n + 2 * max_radius) for n in image.shape)
+    image_spectrum = fftmodule.rfftn((image != 0).astype(np.float32),
+                                     s=fft_shape)
+    out_slices = tuple(slice(max_radius - offset, max_radius - offset + n)
+                       for n in out_shape)
+
+    acc = np.empty((radius.size,) + out_shape, dtype=np.float32)
+    kernel = np.zeros((2 * max_radius + 1,) * 2, dtype=np.float32)
+    for i, rad in enumerate(radius):
+        circle_r, circle_c = circle_perimeter(max_radius, max_radius, rad)
+        kernel[:] = 0
+        np.add.at(kernel, (circle_r, circle_c), 1)
+        votes = fftmodule.irfftn(image_spectrum * fftmodule.rfftn(kernel,
+                                                                  s=fft_shape),
+                                 s=fft_shape)
+        # the number of votes is an integer
+        np.rint(votes[out_slices], out=acc[i])
+        if normalize:
+            acc[i] /= circle_r.size
+    return acc
+
+
+def hough_circle(image, radius, normalize=True, full_output=False,
+                 method='direct'):
     """Perform a circular Hough transform.
 
     Parameters
@@ -86,13 +145,19 @@ def hough_circle(image, radius, normalize=True, full_output=False):
         Extend the output size by twice the largest
         radius in order to detect centers outside the
         input picture.
+    method : {'direct', 'fft'}, optional
+        With 'direct', the circle of each radius is drawn around each edge
+        pixel. With 'fft', the edge map is correlated with the circles of all
+        the radii by FFT, which is faster for large images with many edge
+        pixels, and the accumulator is in single precision.
 
     Returns
     -------
     H : 3D ndarray (radius index, (M + 2R, N + 2R) ndarray)
         Hough transform accumulator for each radius.
         R designates the larger radius if full_output is True.
-        Otherwise, R = 0.
+        Otherwise, R = 0. The accumulator is in double precision, or single
+        precision with the 'fft' method.
 
     Examples
     --------
@@ -108,12 +173,19 @@ def hough_circle(image, radius, normalize=True, full_output=False):
     (25, 35, 23)
 
     """
-    radius = np.atleast_1d(np.asarray(radius))
-    return _hough_circle(image, radius.astype(np.intp),
-                         normalize=normalize, full_output=full_output)
-
-
-def hough_ellipse(image, threshold=4, accuracy=1, min_size=4, max_size=None):
+    radius = np.atleast_1d(np.asarray(radius)).astype(np.intp)
+    if method == 'direct':
+        return _hough_circle(image, radius, normalize=normalize,
+                             full_output=full_output)
+    elif method == 'fft':
+        return _hough_circle_fft(image, radius, normalize=normalize,
+                                 full_output=full_output)
+    raise ValueError("Unknown method '{}', use 'direct' or "
+                     "'fft'.".format(method))
+
+
+def hough_ellipse(image, threshold=4, accuracy=1, min_size=4, max_size=None,
+                  max_candidates=None, seed=None):
     """Perform an elliptical Hough transform.
 
     Parameters
@@ -130,6 +202,16 @@ def hough_ellipse(image, threshold=4, accuracy=1, min_size=4, max_size=None):
         Maximal minor axis length.
         If None, the value is set to the half of the smaller
         image dimension.
+    max_candidates : int, optional
+        Number of randomly drawn pairs of edge pixels considered as the ends
+        of the major axis. By default, all the pairs are considered, which is
+        quadratic in the number of edge pixels, each pair being tested
+        against every edge pixel. With `max_candidates`, only the pixels
+        closer to the center of a candidate than its semi-major axis vote,
+        for a minor axis of at least `accuracy`.
+    seed : int, optional
+        Seed to initialize the random number generator used with
+        `max_candidates`.
 
     Returns
     -------
@@ -149,6 +231,11 @@ def hough_ellipse(image, threshold=4, accuracy=1, min_size=4, max_size=None):
     >>> result.tolist()
     [(10, 10.0, 10.0, 8.0, 6.0, 0.0)]
 
+    Large edge maps can be processed by only considering randomly drawn
+    pairs of edge pixels:
+
+    >>> result = hough_ellipse(img, threshold=8, max_candidates=1000, seed=0)
+
     Notes
     -----
     The accuracy must be chosen to produce a peak in the accumulator
@@ -162,10 +249,11 @@ def hough_ellipse(image, threshold=4, accuracy=1, min_size=4, max_size=None):
            Conference on. Vol. 2. IEEE, 2002
     """
     return _hough_ellipse(image, threshold=threshold, accuracy=accuracy,
-                          min_size=min_size, max_size=max_size)
+                          min_size=min_size, max_size=max_size,
+                          max_candidates=max_candidates, seed=seed)
 
 
-def hough_line(image, theta=None):
+def hough_line(image, theta=None, num_threads=None):
     """Perform a straight line Hough transform.
 
     Parameters
@@ -176,6 +264,9 @@ def hough_line(image, theta=None):
         Angles at which to compute the transform, in radians.
         Defaults to a vector of 180 angles evenly spaced in the
         range [-pi/2, pi/2).
+    num_threads : int, optional
+        The maximum number of threads to use, the angles being processed in
+        parallel. By default, the OpenMP default is used.
 
     Returns
     -------
@@ -221,7 +312,8 @@ def hough_line(image, theta=None):
         # These values are approximations of pi/2
         theta = np.linspace(-np.pi / 2, np.pi / 2, 180, endpoint=False)
 
-    return _hough_line(image, theta=theta)
+    return _hough_line(image, theta=theta,
+                       num_threads=0 if num_threads is None else num_threads)
 
 
 def probabilistic_hough_line(image, threshold=10, line_length=50, line_gap=10,
@@ -328,19 +420,20 @@ def hough_circle_peaks(hspaces, radii, min_xdistance=1, min_ydistance=1,
     Otherwise, circles will be returned in the order of decreasing voting
     number.
     """
-    from ..feature.peak import _prominent_peaks
+    from ..feature.peak import _prominent_peaks_stack
 
     r = []
     cx = []
     cy = []
     accum = []
 
-    for rad, hp in zip(radii, hspaces):
-        h_p, x_p, y_p = _prominent_peaks(hp,
-                                         min_xdistance=min_xdistance,
-                                         min_ydistance=min_ydistance,
-                                         threshold=threshold,
-                                         num_peaks=num_peaks)
+    # the peaks of all the radii are found in a single pass
+    peaks = _prominent_peaks_stack(np.asarray(hspaces),
+                                   min_xdistance=min_xdistance,
+                                   min_ydistance=min_ydistance,
+                                   threshold=threshold,
+                                   num_peaks=num_peaks)
+    for rad, (h_p, x_p, y_p) in zip(radii, peaks):
         r.extend((rad,)*len(h_p))
         cx.extend(x_p)
         cy.extend(y_p)
@@ -1,7 +1,11 @@
 import math
+from functools import lru_cache
+
 import numpy as np
 from scipy import ndimage as ndi
 from ..transform import resize
+from ._warps import _map_index
+from ._pyramids_cy import _reduce_axis
 from .._shared.utils import convert_to_float
 
 
@@ -315,3 +319,255 @@ def pyramid_laplacian(image, max_layer=-1, downscale=2, sigma=None, order=1,
         current_shape = np.asarray(resized_image.shape)
 
         yield resized_image - smoothed_image
+
+
+# 5-tap binomial filter of Burt and Adelson, approximating a Gaussian filter
+_BINOMIAL_WEIGHTS = np.array([1, 4, 6, 4, 1]) / 16
+
+
+@lru_cache(maxsize=64)
+def _binomial_taps(size, mode, cval):
+    """Taps of the binomial filter at the samples kept by a reduction by 2.
+
+    Parameters
+    ----------
+    size : int
+        Size of the axis to reduce.
+    mode : {'reflect', 'constant', 'edge', 'symmetric', 'wrap'}
+        How to handle the samples outside the axis, as in `numpy.pad`.
+    cval : float
+        Value of the samples outside the axis in the 'constant' mode.
+
+    Returns
+    -------
+    taps : (M, 5) ndarray of intp
+        Indices of the samples filtered for each of the ``M = ceil(size / 2)``
+        output samples.
+    weights : (M, 5) ndarray
+        Corresponding weights.
+    offset : (M,) ndarray
+        Contribution of the samples outside the axis.
+    """
+    out_size = (size + 1) // 2
+    taps = 2 * np.arange(out_size)[:, np.newaxis] + np.arange(-2, 3)
+    taps, valid = _map_index(taps, size, mode)
+    weights = np.tile(_BINOMIAL_WEIGHTS, (out_size, 1))
+    offset = np.zeros(out_size)
+    if valid is not None:
+        offset = cval * np.sum(weights * ~valid, axis=1)
+        weights[~valid] = 0
+    taps = np.ascontiguousarray(taps, dtype=np.intp)
+    for array in (taps, weights, offset):
+        array.setflags(write=False)
+    return taps, weights, offset
+
+
+class PyramidBuilder(object):
+    """Gaussian pyramid builder reusing a single buffer for all its layers.
+
+    All the layers are allocated once, one after the other, in a single
+    contiguous buffer. Each layer is obtained from the previous one by a
+    5-tap binomial filter, which approximates a Gaussian filter of standard
+    deviation 1, evaluated only at the samples kept by the reduction by 2.
+    The filter is applied axis by axis, and the channel axis, if any, is not
+    reduced.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of the images, channel axis included.
+    max_layer : int, optional
+        Number of layers for the pyramid. 0th layer is the original image.
+        Default is -1 which builds all possible layers, i.e. until all the
+        spatial axes have a size of 1.
+    mode : {'reflect', 'constant', 'edge', 'symmetric', 'wrap'}, optional
+        How to handle the samples outside the image, as in `numpy.pad`.
+    cval : float, optional
+        Value to fill past edges of input if mode is 'constant'.
+    channel_axis : int or None, optional
+        If None, the image is assumed to be a grayscale (single channel) image.
+        Otherwise, this parameter indicates which axis of the array
+        corresponds to channels.
+    dtype : {np.float32, np.float64}, optional
+        Data type of the pyramid layers.
+
+    Attributes
+    ----------
+    shapes : tuple of tuple of int
+        Shapes of the layers.
+    buffer : (P,) ndarray
+        Contiguous buffer holding all the layers, flattened one after the
+        other.
+    layers : tuple of ndarray
+        The layers, as views of `buffer`.
+
+    See also
+    --------
+    pyramid_binomial, pyramid_gaussian
+
+    Notes
+    -----
+    The layers are overwritten each time an image is processed, so they
+    should be copied if they are to be kept.
+
+    References
+    ----------
+    .. [1] http://persci.mit.edu/pub_pdfs/pyramid83.pdf
+
+    Examples
+    --------
+    >>> from skimage.transform import PyramidBuilder
+    >>> frames = np.random.rand(5, 64, 48, 3).astype(np.float32)
+    >>> builder = PyramidBuilder((64, 48, 3), max_layer=3, channel_axis=-1,
+    ...                          dtype=np.float32)
+    >>> builder.shapes
+    ((64, 48, 3), (32, 24, 3), (16, 12, 3), (8, 6, 3))
+    >>> for frame in frames:
+    ...     for layer in builder(frame):
+    ...         pass
+    >>> builder.buffer.shape, builder.buffer.dtype
+    ((12240,), dtype('float32'))
+    """
+
+    def __init__(self, shape, max_layer=-1, mode='reflect', cval=0, *,
+                 channel_axis=None, dtype=np.float64):
+        shape = tuple(int(s) for s in shape)
+        if channel_axis is not None:
+            channel_axis = channel_axis % len(shape)
+        self._axes = [ax for ax in range(len(shape)) if ax != channel_axis]
+        self._mode = mode
+        self._cval = float(cval)
+
+        shapes = [shape]
+        while len(shapes) - 1 != max_layer:
+            layer_shape = list(shapes[-1])
+            for ax in self._axes:
+                layer_shape[ax] = (layer_shape[ax] + 1) // 2
+            layer_shape = tuple(layer_shape)
+            # no change to previous pyramid layer
+            if layer_shape == shapes[-1]:
+                break
+            shapes.append(layer_shape)
+        self.shapes = tuple(shapes)
+
+        sizes = [int(np.prod(s)) for s in shapes]
+        starts = np.cumsum([0] + sizes)
+        self.buffer = np.empty(starts[-1], dtype=dtype)
+        self.layers = tuple(self.buffer[start:start + size].reshape(s)
+                            for start, size, s in zip(starts, sizes, shapes))
+
+        # two buffers for the intermediate results of the separable filter,
+        # the largest one being the first layer reduced along its first axis
+        if len(self._axes) > 1 and len(shapes) > 1:
+            size = sizes[0] // shape[self._axes[0]] * shapes[1][self._axes[0]]
+            self._scratch = np.empty((2, size), dtype=dtype)
+
+    def _reduce(self, image, out, num_threads):
+        """Reduce `image` into `out` axis by axis."""
+        for i, ax in enumerate(self._axes):
+            out_shape = image.shape[:ax] + out.shape[ax:ax + 1] \
+                + image.shape[ax + 1:]
+            if i == len(self._axes) - 1:
+                reduced = out
+            else:
+                reduced = self._scratch[i % 2, :int(np.prod(out_shape))]
+                reduced = reduced.reshape(out_shape)
+            taps, weights, offset = _binomial_taps(image.shape[ax],
+                                                   self._mode, self._cval)
+            outer = int(np.prod(image.shape[:ax]))
+            _reduce_axis(image.reshape(outer, image.shape[ax], -1),
+                         reduced.reshape(outer, out_shape[ax], -1),
+                         taps, weights, offset, num_threads)
+            image = reduced
+
+    def __call__(self, image, preserve_range=False, num_threads=None):
+        """Yield the layers of the pyramid formed by an image.
+
+        Parameters
+        ----------
+        image : ndarray
+            Input image, of shape ``shapes[0]``.
+        preserve_range : bool, optional
+            Whether to keep the original range of values. Otherwise, the input
+            image is converted according to the conventions of `img_as_float`.
+            Also see
+            https://scikit-image.org/docs/dev/user_guide/data_types.html
+        num_threads : int, optional
+            The maximum number of threads to use. By default, the OpenMP
+            default is used.
+
+        Returns
+        -------
+        pyramid : generator
+            Generator yielding the layers, as views of `buffer`. Each layer
+            is only computed when requested.
+        """
+        image = np.asarray(image)
+        if image.shape != self.shapes[0]:
+            raise ValueError('Expected an image of shape {}, got {}.'
+                             .format(self.shapes[0], image.shape))
+        num_threads = 0 if num_threads is None else num_threads
+
+        self.layers[0][...] = convert_to_float(image, preserve_range)
+        yield self.layers[0]
+
+        for prev_layer, layer in zip(self.layers[:-1], self.layers[1:]):
+            self._reduce(prev_layer, layer, num_threads)
+            yield layer
+
+
+def pyramid_binomial(image, max_layer=-1, mode='reflect', cval=0,
+                     preserve_range=False, *, channel_axis=None,
+                     num_threads=None):
+    """Yield images of the Gaussian pyramid formed by a 5-tap binomial filter.
+
+    This is a faster alternative to `pyramid_gaussian` with a downscale
+    factor of 2: float32 images are kept in float32, each layer is filtered
+    and reduced in a single pass per axis and all the layers are stored in
+    a single buffer, see `PyramidBuilder`.
+
+    Parameters
+    ----------
+    image : ndarray
+        Input image.
+    max_layer : int, optional
+        Number of layers for the pyramid. 0th layer is the original image.
+        Default is -1 which builds all possible layers.
+    mode : {'reflect', 'constant', 'edge', 'symmetric', 'wrap'}, optional
+        How to handle the samples outside the image, as in `numpy.pad`.
+    cval : float, optional
+        Value to fill past edges of input if mode is 'constant'.
+    preserve_range : bool, optional
+        Whether to keep the original range of values. Otherwise, the input
+        image is converted according to the conventions of `img_as_float`.
+        Also see https://scikit-image.org/docs/dev/user_guide/data_types.html
+    channel_axis : int or None, optional
+        If None, the image is assumed to be a grayscale (single channel) image.
+        Otherwise, this parameter indicates which axis of the array
+        corresponds to channels.
+    num_threads : int, optional
+        The maximum number of threads to use. By default, the OpenMP
+        default is used.
+
+    Returns
+    -------
+    pyramid : generator
+        Generator yielding pyramid layers as float images.
+
+    References
+    ----------
+    .. [1] http://persci.mit.edu/pub_pdfs/pyramid83.pdf
+
+    Examples
+    --------
+    >>> from skimage import data
+    >>> from skimage.transform import pyramid_binomial
+    >>> image = data.astronaut()
+    >>> [layer.shape for layer in pyramid_binomial(image, max_layer=2,
+    ...                                            channel_axis=-1)]
+    [(512, 512, 3), (256, 256, 3), (128, 128, 3)]
+    """
+    image = convert_to_float(np.asarray(image), preserve_range)
+    builder = PyramidBuilder(image.shape, max_layer, mode, cval,
+                             channel_axis=channel_axis, dtype=image.dtype)
+    yield from builder(image, preserve_range=True, num_threads=num_threads)
@@ -2,12 +2,11 @@ import numpy as np
 
 from scipy.interpolate import interp1d
 from scipy.constants import golden_ratio
-from ._warps import warp
-from ._radon_transform import sart_projection_update
+from ._radon_transform import (sart_projection_update, _radon_projections,
+                               _backproject_linear)
 from .._shared.fft import fftmodule
 from .._shared.utils import deprecate_kwarg, convert_to_float
 from warnings import warn
-from functools import partial
 
 if fftmodule is np.fft:
     # fallback from scipy.fft to scipy.fftpack instead of numpy.fft
@@ -21,7 +20,8 @@ else:
 __all__ = ['radon', 'order_angles_golden_ratio', 'iradon', 'iradon_sart']
 
 
-def radon(image, theta=None, circle=True, *, preserve_range=False):
+def radon(image, theta=None, circle=True, *, preserve_range=False,
+          num_threads=None):
     """
     Calculates the radon transform of an image given specified
     projection angles.
@@ -29,8 +29,9 @@ def radon(image, theta=None, circle=True, *, preserve_range=False):
     Parameters
     ----------
     image : array_like
-        Input image. The rotation axis will be located in the pixel with
-        indices ``(image.shape[0] // 2, image.shape[1] // 2)``.
+        Input image, or stack of images along the first axis. The rotation
+        axis will be located in the pixel with indices
+        ``(image.shape[-2] // 2, image.shape[-1] // 2)``.
     theta : array_like, optional
         Projection angles (in degrees). If `None`, the value is set to
         np.arange(180).
@@ -42,13 +43,17 @@ def radon(image, theta=None, circle=True, *, preserve_range=False):
         Whether to keep the original range of values. Otherwise, the input
         image is converted according to the conventions of `img_as_float`.
         Also see https://scikit-image.org/docs/dev/user_guide/data_types.html
+    num_threads : int, optional
+        The maximum number of threads to use, the projection angles being
+        processed in parallel. By default, the OpenMP default is used.
 
     Returns
     -------
     radon_image : ndarray
         Radon transform (sinogram).  The tomography rotation axis will lie
         at the pixel index ``radon_image.shape[0] // 2`` along the 0th
-        dimension of ``radon_image``.
+        dimension of ``radon_image``. For a stack of images, the sinograms
+        are stacked along the first axis.
 
     References
     ----------
@@ -64,13 +69,18 @@ def radon(image, theta=None, circle=True, *, preserve_range=False):
     (https://www.clear.rice.edu/elec431/projects96/DSP/bpanalysis.html)
 
     """
-    if image.ndim != 2:
-        raise ValueError('The input image must be 2-D')
+    if image.ndim not in (2, 3):
+        raise ValueError('The input image must be 2-D, or a stack of 2-D '
+                         'images')
     if theta is None:
         theta = np.arange(180)
 
     image = convert_to_float(image, preserve_range)
 
+    if image.ndim == 3:
+        return np.stack([radon(img, theta, circle, preserve_range=True,
+                               num_threads=num_threads) for img in image])
+
     if circle:
         shape_min = min(image.shape)
         radius = shape_min // 2
@@ -102,17 +112,20 @@ def radon(image, theta=None, circle=True, *, preserve_range=False):
     if padded_image.shape[0] != padded_image.shape[1]:
         raise ValueError('padded_image must be a square')
     center = padded_image.shape[0] // 2
-    radon_image = np.zeros((padded_image.shape[0], len(theta)),
-                           dtype=image.dtype)
 
+    # the inverse rotation of each projection, as used by `warp`
+    matrices = np.empty((len(theta), 2, 3))
     for i, angle in enumerate(np.deg2rad(theta)):
         cos_a, sin_a = np.cos(angle), np.sin(angle)
-        R = np.array([[cos_a, sin_a, -center * (cos_a + sin_a - 1)],
-                      [-sin_a, cos_a, -center * (cos_a - sin_a - 1)],
-                      [0, 0, 1]])
-        rotated = warp(padded_image, R, clip=False)
-        radon_image[:, i] = rotated.sum(0)
-    return radon_image
+        matrices[i] = [[cos_a, sin_a, -center * (cos_a + sin_a - 1)],
+                       [-sin_a, cos_a, -center * (cos_a - sin_a - 1)]]
+
+    projections = np.empty((len(theta), padded_image.shape[0]),
+                           dtype=image.dtype)
+    _radon_projections(np.ascontiguousarray(padded_image),
+                       matrices.astype(image.dtype), projections,
+                       0 if num_threads is None else num_threads)
+    return np.ascontiguousarray(projections.T)
 
 
 def _sinogram_circle_to_square(sinogram):
@@ -185,7 +198,7 @@ def _get_fourier_filter(size, filter_name):
                  removed_version="0.19")
 def iradon(radon_image, theta=None, output_size=None,
            filter_name="ramp", interpolation="linear", circle=True,
-           preserve_range=True):
+           preserve_range=True, *, num_threads=None):
     """Inverse radon transform.
 
     Reconstruct an image from the radon transform, using the filtered
@@ -198,7 +211,8 @@ def iradon(radon_image, theta=None, output_size=None,
         the image corresponds to a projection along a different
         angle. The tomography rotation axis should lie at the pixel
         index ``radon_image.shape[0] // 2`` along the 0th dimension of
-        ``radon_image``.
+        ``radon_image``. A stack of sinograms along the first axis is
+        reconstructed slice by slice.
     theta : array_like, optional
         Reconstruction angles (in degrees). Default: m angles evenly spaced
         between 0 and 180 (if the shape of `radon_image` is (N, M)).
@@ -210,7 +224,9 @@ def iradon(radon_image, theta=None, output_size=None,
         Assign None to use no filter.
     interpolation : str, optional
         Interpolation method used in reconstruction. Methods available:
-        'linear', 'nearest', and 'cubic' ('cubic' is slow).
+        'linear', 'nearest', and 'cubic' ('cubic' is slow). The 'linear'
+        backprojection is compiled and processes the rows of the
+        reconstruction in parallel.
     circle : boolean, optional
         Assume the reconstructed image is zero outside the inscribed circle.
         Also changes the default output_size to match the behaviour of
@@ -219,6 +235,9 @@ def iradon(radon_image, theta=None, output_size=None,
         Whether to keep the original range of values. Otherwise, the input
         image is converted according to the conventions of `img_as_float`.
         Also see https://scikit-image.org/docs/dev/user_guide/data_types.html
+    num_threads : int, optional
+        The maximum number of threads used by the 'linear' backprojection.
+        By default, the OpenMP default is used.
 
     Returns
     -------
@@ -246,8 +265,15 @@ def iradon(radon_image, theta=None, output_size=None,
     projection data. This algorithm is called filtered back projection.
 
     """
+    if radon_image.ndim == 3:
+        return np.stack([iradon(sinogram, theta, output_size, filter_name,
+                                interpolation, circle, preserve_range,
+                                num_threads=num_threads)
+                         for sinogram in radon_image])
+
     if radon_image.ndim != 2:
-        raise ValueError('The input image must be 2-D')
+        raise ValueError('The input image must be 2-D, or a stack of 2-D '
+                         'sinograms')
 
     if theta is None:
         theta = np.linspace(0, 180, radon_image.shape[1], endpoint=False)
@@ -298,14 +324,20 @@ def iradon(radon_image, theta=None, output_size=None,
     xpr, ypr = np.mgrid[:output_size, :output_size] - radius
     x = np.arange(img_shape) - img_shape // 2
 
-    for col, angle in zip(radon_filtered.T, np.deg2rad(theta)):
-        t = ypr * np.cos(angle) - xpr * np.sin(angle)
-        if interpolation == 'linear':
-            interpolant = partial(np.interp, xp=x, fp=col, left=0, right=0)
-        else:
+    if interpolation == 'linear':
+        angles = np.deg2rad(theta)
+        cos_theta = np.array([np.cos(angle) for angle in angles])
+        sin_theta = np.array([np.sin(angle) for angle in angles])
+        _backproject_linear(np.ascontiguousarray(radon_filtered.T,
+                                                 dtype=np.float64),
+                            cos_theta, sin_theta, reconstructed,
+                            0 if num_threads is None else num_threads)
+    else:
+        for col, angle in zip(radon_filtered.T, np.deg2rad(theta)):
+            t = ypr * np.cos(angle) - xpr * np.sin(angle)
             interpolant = interp1d(x, col, kind=interpolation,
                                    bounds_error=False, fill_value=0)
-        reconstructed += interpolant(t)
+            reconstructed += interpolant(t)
 
     if circle:
         out_reconstruction_circle = (xpr ** 2 + ypr ** 2) > radius ** 2
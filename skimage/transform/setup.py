@@ -14,7 +14,8 @@ def configuration(parent_package='', top_path=None):
 
     cython(['_hough_transform.pyx',
             '_warps_cy.pyx',
-            '_radon_transform.pyx'], working_path=base_path)
+            '_radon_transform.pyx',
+            '_pyramids_cy.pyx'], working_path=base_path)
 
     config.add_extension('_hough_transform', sources=['_hough_transform.c'],
                          include_dirs=[get_numpy_include_dirs()])
@@ -24,7 +25,10 @@ def configuration(parent_package='', top_path=None):
 
     config.add_extension('_radon_transform',
                          sources=['_radon_transform.c'],
-                         include_dirs=[get_numpy_include_dirs()])
+                         include_dirs=[get_numpy_include_dirs(), '../_shared'])
+
+    config.add_extension('_pyramids_cy', sources=['_pyramids_cy.c'],
+                         include_dirs=[get_numpy_include_dirs(), '../_shared'])
 
     return config
 
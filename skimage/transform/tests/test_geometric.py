@@ -215,6 +215,43 @@ def test_piecewise_affine():
     assert_almost_equal(tform.inverse(DST), SRC)
 
 
+def test_piecewise_affine_per_triangle():
+    random_state = np.random.RandomState(0)
+    src = 100 * random_state.random_sample((100, 2))
+    dst = src + random_state.normal(size=src.shape)
+    tform = PiecewiseAffineTransform()
+    tform.estimate(src, dst)
+
+    coords = 120 * random_state.random_sample((1000, 2)) - 10
+    for transform, affines, inverse in [(tform, tform.affines, False),
+                                        (tform.inverse, tform.inverse_affines,
+                                         True)]:
+        simplex = tform.find_simplex(coords, inverse=inverse)
+        expected = np.full_like(coords, -1)
+        for index, affine in enumerate(affines):
+            expected[simplex == index] = affine(coords[simplex == index])
+        assert_almost_equal(transform(coords), expected)
+        assert_equal(transform(coords, simplex=simplex),
+                     transform(coords))
+
+
+def test_piecewise_affine_inverse_map():
+    from skimage.transform import warp
+    random_state = np.random.RandomState(0)
+    src = np.array([[0, 0], [0, 40], [60, 0], [60, 40], [20, 30], [35, 10]])
+    tform = PiecewiseAffineTransform()
+    tform.estimate(src, src + random_state.normal(size=src.shape))
+
+    inverse_map = tform.inverse_map((40, 60))
+    image = random_state.random_sample((40, 60))
+    assert_equal(warp(image, inverse_map), warp(image, tform.inverse))
+    with testing.raises(ValueError):
+        warp(image, inverse_map, output_shape=(30, 60))
+    # same number of coordinates, but transposed
+    with testing.raises(ValueError):
+        warp(image, inverse_map, output_shape=(60, 40))
+
+
 def test_fundamental_matrix_estimation():
     src = np.array([1.839035, 1.924743, 0.543582,  0.375221,
                     0.473240, 0.142522, 0.964910,  0.598376,
@@ -570,6 +607,45 @@ def test_estimate_affine_3d():
     _assert_least_squares(tf2, src, dst_noisy)
 
 
+@testing.parametrize('tform_class', [EuclideanTransform, SimilarityTransform,
+                                     AffineTransform, ProjectiveTransform])
+@testing.parametrize('ndim', [2, 3])
+def test_estimate_many(tform_class, ndim):
+    random_state = np.random.RandomState(0)
+    src = 100 * random_state.random_sample((50, 6, ndim))
+    dst = src @ random_state.random_sample((ndim, ndim)) + 3
+    dst += random_state.normal(size=dst.shape)
+    # identical points
+    src[7] = 1
+
+    matrices = tform_class.estimate_many(src, dst)
+    assert matrices.shape == (50, ndim + 1, ndim + 1)
+    assert np.all(np.isnan(matrices[7]))
+    for i in range(50):
+        tform = tform_class(dimensionality=ndim)
+        if tform.estimate(src[i], dst[i]):
+            assert_equal(matrices[i], tform.params)
+
+    matrices = np.delete(matrices, 7, axis=0)
+    src = np.delete(src, 7, axis=0)
+    dst = np.delete(dst, 7, axis=0)
+    forward = tform_class.apply_many(matrices, src)
+    shared = tform_class.apply_many(matrices, src[0])
+    inverse = tform_class.inverse_many(matrices, dst)
+    for i, matrix in enumerate(matrices):
+        tform = tform_class(matrix=matrix)
+        assert_equal(forward[i], tform(src[i]))
+        assert_equal(shared[i], tform(src[0]))
+        assert_equal(inverse[i], tform.inverse(dst[i]))
+
+
+def test_estimate_many_invalid_input():
+    with testing.raises(ValueError):
+        AffineTransform.estimate_many(np.zeros((5, 3, 2)), np.zeros((5, 4, 2)))
+    with testing.raises(ValueError):
+        AffineTransform.estimate_many(np.zeros((3, 2)), np.zeros((3, 2)))
+
+
 def test_fundamental_3d_not_implemented():
     with testing.raises(NotImplementedError):
         _ = FundamentalMatrixTransform(dimensionality=3)
@@ -36,6 +36,29 @@ def test_hough_line_angles():
     assert_equal(len(angles), 10)
 
 
+def test_hough_line_num_threads():
+    rng = np.random.default_rng(0)
+    img = rng.random((50, 70)) > 0.9
+    theta = np.linspace(-np.pi / 2, np.pi / 2, 360, endpoint=False)
+
+    out, angles, d = transform.hough_line(img, theta, num_threads=1)
+    assert out.dtype == np.uint64
+    assert out.flags.c_contiguous
+    assert_equal(out.sum(axis=0), img.sum())
+
+    # reference accumulation, rounding half away from zero
+    y, x = np.nonzero(img)
+    expected = np.zeros_like(out)
+    for j, t in enumerate(theta):
+        dist = x * np.cos(t) + y * np.sin(t)
+        idx = np.trunc(dist + np.copysign(0.5, dist)).astype(int)
+        np.add.at(expected[:, j], idx + (len(d) - 1) // 2, 1)
+    assert_equal(out, expected)
+
+    out2, _, _ = transform.hough_line(img, theta, num_threads=4)
+    assert_equal(out2, out)
+
+
 def test_hough_line_bad_input():
     img = np.zeros(100)
     img[10] = 1
@@ -226,6 +249,29 @@ def test_hough_circle_extended():
     assert_equal(y[0], y_0 + radius)
 
 
+@testing.parametrize('full_output', [False, True])
+@testing.parametrize('normalize', [False, True])
+def test_hough_circle_fft(full_output, normalize):
+    rng = np.random.default_rng(0)
+    img = rng.random((60, 45)) > 0.95
+    rr, cc = circle_perimeter(30, 20, 12, shape=img.shape)
+    img[rr, cc] = 1
+    radii = np.arange(3, 25, 3)
+
+    expected = transform.hough_circle(img, radii, normalize=normalize,
+                                      full_output=full_output)
+    out = transform.hough_circle(img, radii, normalize=normalize,
+                                 full_output=full_output, method='fft')
+    assert out.dtype == np.float32
+    assert_equal(out.shape, expected.shape)
+    assert_almost_equal(out, expected, decimal=6)
+
+
+def test_hough_circle_bad_method():
+    with testing.raises(ValueError):
+        transform.hough_circle(np.ones((5, 5)), 2, method='spline')
+
+
 def test_hough_circle_peaks():
     x_0, y_0, rad_0 = (99, 50, 20)
     img = np.zeros((120, 100), dtype=int)
@@ -376,6 +422,32 @@ def test_hough_ellipse_zero_angle():
     assert_equal(cc, cc2)
 
 
+def test_hough_ellipse_max_candidates():
+    img = np.zeros((120, 140), dtype=np.uint8)
+    rr, cc = ellipse_perimeter(60, 70, 25, 40, orientation=0.4)
+    img[rr, cc] = 1
+    rng = np.random.default_rng(0)
+    img[rng.random(img.shape) > 0.995] = 1
+
+    result = transform.hough_ellipse(img, threshold=60, accuracy=10,
+                                     min_size=10, max_candidates=20000,
+                                     seed=0)
+    assert_equal(result.dtype.names, ('accumulator', 'yc', 'xc', 'a', 'b',
+                                      'orientation'))
+    result.sort(order='accumulator')
+    best = result[-1]
+    assert abs(best['yc'] - 60) <= 1
+    assert abs(best['xc'] - 70) <= 1
+    assert abs(best['a'] - 40) <= 1.5
+    assert abs(best['b'] - 25) <= 1.5
+
+    # the same seed gives the same candidates
+    assert_equal(result, np.sort(
+        transform.hough_ellipse(img, threshold=60, accuracy=10, min_size=10,
+                                max_candidates=20000, seed=0),
+        order='accumulator'))
+
+
 def test_hough_ellipse_non_zero_posangle1():
     # ry > rx, angle in [0:pi/2]
     img = np.zeros((30, 24), dtype=int)
@@ -1,8 +1,10 @@
 import math
 import pytest
 import numpy as np
+from scipy import ndimage as ndi
 from skimage import data
 from skimage.transform import pyramids
+from skimage._shared.utils import _to_ndimage_mode
 
 from skimage._shared import testing
 from skimage._shared.testing import (assert_array_equal, assert_, assert_equal,
@@ -145,3 +147,57 @@ def test_pyramid_gaussian_dtype_support(dtype, expected):
     pyramid = pyramids.pyramid_gaussian(img)
 
     assert np.all([im.dtype == expected for im in pyramid])
+
+
+@pytest.mark.parametrize('mode', ['constant', 'edge', 'symmetric',
+                                  'reflect', 'wrap'])
+def test_pyramid_binomial(mode):
+    img = np.random.rand(37, 20)
+    kernel = np.array([1, 4, 6, 4, 1]) / 16
+    ndi_mode = _to_ndimage_mode(mode)
+    prev_layer = None
+    for layer in pyramids.pyramid_binomial(img, mode=mode, cval=0.5):
+        if prev_layer is not None:
+            expected = ndi.correlate1d(prev_layer, kernel, axis=0,
+                                       mode=ndi_mode, cval=0.5)[::2]
+            expected = ndi.correlate1d(expected, kernel, axis=1,
+                                       mode=ndi_mode, cval=0.5)[:, ::2]
+            assert_almost_equal(layer, expected)
+        prev_layer = layer.copy()
+    assert_equal(layer.shape, (1, 1))
+
+
+@pytest.mark.parametrize('channel_axis', [0, -1])
+def test_pyramid_binomial_channel_axis(channel_axis):
+    img = np.moveaxis(image, -1, channel_axis)
+    layers = list(pyramids.pyramid_binomial(img, max_layer=3,
+                                            channel_axis=channel_axis))
+    assert_equal(len(layers), 4)
+    for c in range(3):
+        gray = np.take(img, c, axis=channel_axis)
+        for layer, gray_layer in zip(layers,
+                                     pyramids.pyramid_binomial(gray,
+                                                               max_layer=3)):
+            assert_almost_equal(np.take(layer, c, axis=channel_axis),
+                                gray_layer)
+
+
+def test_pyramid_builder():
+    img = np.random.rand(16, 8, 3).astype(np.float32)
+    builder = pyramids.PyramidBuilder(img.shape, channel_axis=-1,
+                                      dtype=np.float32)
+    assert_equal(builder.shapes, ((16, 8, 3), (8, 4, 3), (4, 2, 3),
+                                  (2, 1, 3), (1, 1, 3)))
+    assert_equal(builder.buffer.size,
+                 sum(np.prod(shape) for shape in builder.shapes))
+
+    for _ in range(2):
+        layers = list(builder(img))
+        for layer, expected in zip(
+                layers, pyramids.pyramid_binomial(img, channel_axis=-1)):
+            assert layer.dtype == np.float32
+            assert np.shares_memory(layer, builder.buffer)
+            assert_array_equal(layer, expected)
+
+    with testing.raises(ValueError):
+        next(builder(img[:8]))
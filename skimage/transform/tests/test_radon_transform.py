@@ -7,7 +7,7 @@ from skimage.transform import radon, iradon, iradon_sart, rescale
 
 from skimage._shared.utils import convert_to_float
 from skimage._shared import testing
-from skimage._shared.testing import test_parallel
+from skimage._shared.testing import test_parallel, assert_array_equal
 from skimage._shared._warnings import expected_warnings
 
 
@@ -468,6 +468,33 @@ def test_radon_dtype():
     assert radon(img32).dtype == img32.dtype
 
 
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_radon_iradon_stack(dtype):
+    images = np.stack([PHANTOM, PHANTOM[::-1], PHANTOM.T]).astype(dtype)
+    theta = np.linspace(0, 180, 45, endpoint=False)
+
+    sinograms = radon(images, theta)
+    assert sinograms.dtype == dtype
+    for image, sinogram in zip(images, sinograms):
+        assert_array_equal(sinogram, radon(image, theta))
+
+    reconstructed = iradon(sinograms, theta)
+    assert reconstructed.dtype == dtype
+    for sinogram, image in zip(sinograms, reconstructed):
+        assert_array_equal(image, iradon(sinogram, theta))
+
+
+def test_radon_iradon_num_threads():
+    theta = np.linspace(0, 180, 45, endpoint=False)
+    sinogram = radon(PHANTOM, theta)
+    assert_array_equal(radon(PHANTOM, theta, num_threads=1), sinogram)
+    assert_array_equal(radon(PHANTOM, theta, num_threads=3), sinogram)
+
+    reconstructed = iradon(sinogram, theta)
+    assert_array_equal(iradon(sinogram, theta, num_threads=1), reconstructed)
+    assert_array_equal(iradon(sinogram, theta, num_threads=3), reconstructed)
+
+
 @pytest.mark.parametrize("dtype", [np.float32, np.float64])
 def test_iradon_sart_dtype(dtype):
     sinogram = np.zeros((16, 1), dtype=int)
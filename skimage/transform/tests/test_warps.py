@@ -1,7 +1,7 @@
 import numpy as np
 from scipy.ndimage import map_coordinates
 
-from skimage.data import checkerboard, astronaut
+from skimage.data import checkerboard, astronaut, camera
 from skimage.util.dtype import img_as_float
 from skimage.color.colorconv import rgb2gray
 from skimage.draw.draw import circle_perimeter_aa
@@ -13,10 +13,12 @@ from skimage._shared._warnings import expected_warnings
 
 from skimage.transform._warps import (_stackcopy,
                                       _linear_polar_mapping,
+                                      _swirl_mapping,
                                       _log_polar_mapping, warp,
                                       warp_coords, rotate, resize,
                                       rescale, warp_polar, swirl,
-                                      downscale_local_mean)
+                                      downscale_local_mean, WarpPlan,
+                                      resize_separable)
 from skimage.transform._geometric import (AffineTransform,
                                           ProjectiveTransform,
                                           SimilarityTransform)
@@ -76,6 +78,32 @@ def test_warp_matrix():
     outx = warp(x, matrix, order=5)
 
 
+@testing.parametrize('dtype', [np.float32, np.float64])
+@testing.parametrize('order', [0, 1, 3])
+def test_warp_multichannel(dtype, order):
+    image = np.random.rand(20, 30, 3).astype(dtype)
+    tform = ProjectiveTransform(np.array([[1.1, 0.1, -2],
+                                          [-0.1, 0.9, 3],
+                                          [0.001, 0.002, 1]]))
+    warped = warp(image, tform, order=order, output_shape=(25, 35),
+                  clip=False)
+    assert warped.dtype == dtype
+    assert warped.shape == (25, 35, 3)
+    for c in range(3):
+        assert_equal(warped[..., c],
+                     warp(image[..., c], tform, order=order,
+                          output_shape=(25, 35), clip=False))
+
+
+def test_warp_num_threads():
+    image = np.random.rand(40, 50, 3)
+    tform = AffineTransform(rotation=0.3, translation=(5, -3))
+    expected = warp(image, tform, num_threads=1)
+    assert_equal(warp(image, tform, num_threads=4), expected)
+    assert_equal(rotate(image, 17, num_threads=1),
+                 rotate(image, 17, num_threads=2))
+
+
 def test_warp_nd():
     for dim in range(2, 8):
         shape = dim * (5,)
@@ -375,6 +403,49 @@ def test_swirl():
     assert np.mean(np.abs(image[1:-1, 1:-1] - unswirled[1:-1, 1:-1])) < 0.01
 
 
+@testing.parametrize('dtype', [np.float32, np.float64])
+@testing.parametrize('order', [0, 1])
+@testing.parametrize('mode', ['constant', 'edge', 'symmetric', 'reflect',
+                              'wrap'])
+def test_swirl_and_polar_fast(mode, order, dtype):
+    # the compiled maps match map_coordinates, used for other callables
+    image = astronaut()[100:300, 150:320].astype(dtype) / 255
+    swirl_args = dict(center=(80, 120), rotation=0.2, strength=5, radius=90)
+    expected = warp(image, lambda xy: _swirl_mapping(xy, **swirl_args),
+                    order=order, mode=mode, cval=0.3)
+    swirled = swirl(image, order=order, mode=mode, cval=0.3, **swirl_args)
+    assert swirled.dtype == dtype
+    assert_almost_equal(swirled, expected, decimal=5)
+
+    # the default center and output shape give coordinates on rounding ties
+    center = np.array(image.shape[:2]) / 2 - 0.5
+    polar_args = dict(k_angle=360 / (2 * np.pi), center=center,
+                      k_radius=1)
+    expected = warp(image, lambda xy: _linear_polar_mapping(xy, **polar_args),
+                    output_shape=(360, 100), order=order, mode=mode,
+                    cval=0.3)
+    polar = warp_polar(image, radius=100, multichannel=True, order=order,
+                       mode=mode, cval=0.3)
+    assert_almost_equal(polar, expected, decimal=5)
+
+    polar_args['k_radius'] = 100 / np.log(100)
+    expected = warp(image[..., 0],
+                    lambda xy: _log_polar_mapping(xy, **polar_args),
+                    output_shape=(360, 100), order=order, mode=mode,
+                    cval=0.3)
+    polar = warp_polar(image[..., 0], radius=100, scaling='log', order=order,
+                       mode=mode, cval=0.3)
+    assert_almost_equal(polar, expected, decimal=5)
+
+
+def test_swirl_and_polar_num_threads():
+    image = np.random.rand(60, 70, 3)
+    assert_equal(swirl(image, strength=3, radius=40, num_threads=1),
+                 swirl(image, strength=3, radius=40, num_threads=3))
+    assert_equal(warp_polar(image, multichannel=True, num_threads=1),
+                 warp_polar(image, multichannel=True, num_threads=3))
+
+
 def test_const_cval_out_of_range():
     img = np.random.randn(100, 100)
     cval = - 10
@@ -684,3 +755,104 @@ def test_boll_array_warnings():
 
     with expected_warnings(['Input image dtype is bool']):
         warp(img, np.eye(3), order=1)
+
+
+@testing.parametrize('order', [0, 1, 3])
+@testing.parametrize('mode', ['constant', 'edge', 'symmetric', 'reflect',
+                              'wrap'])
+def test_warp_plan(order, mode):
+    rng = np.random.default_rng(0)
+    image = rng.random((30, 40, 3))
+    tform = ProjectiveTransform(np.array([[1.1, 0.2, -5],
+                                          [-0.1, 0.9, 7],
+                                          [0.001, 0.0005, 1]]))
+    plan = WarpPlan(tform, image.shape[:2], output_shape=(35, 28),
+                    order=order, mode=mode, cval=0.3)
+    expected = warp(image, tform, output_shape=(35, 28), order=order,
+                    mode=mode, cval=0.3)
+    assert_almost_equal(plan(image), expected)
+    # the plan can be applied to the channels one by one
+    assert_almost_equal(plan(image[..., 1]),
+                        warp(image[..., 1], tform, output_shape=(35, 28),
+                             order=order, mode=mode, cval=0.3))
+
+
+@testing.parametrize('mode', ['constant', 'edge', 'symmetric', 'reflect',
+                              'wrap'])
+def test_warp_plan_callable_cubic(mode):
+    # warp interpolates non-homographies with cubic splines
+    image = img_as_float(camera()[150:250, 200:300])
+    map_args = dict(center=(40, 60), rotation=0, strength=5, radius=80)
+    plan = WarpPlan(_swirl_mapping, image.shape, order=3, mode=mode,
+                    cval=0.3, map_args=map_args)
+    expected = warp(image, _swirl_mapping, map_args=map_args, order=3,
+                    mode=mode, cval=0.3)
+    assert_almost_equal(plan(image), expected)
+    # the color channels are interpolated independently
+    color = np.stack([image, image[::-1], image.T], axis=-1)
+    assert_almost_equal(plan(color)[..., 1], plan(image[::-1]))
+
+
+def test_warp_plan_coordinates_nd():
+    rng = np.random.default_rng(0)
+    volume = rng.random((10, 11, 12))
+    coords = np.mgrid[:8, :9, :10] * 1.2 - 0.7
+    plan = WarpPlan(coords, volume.shape, mode='reflect')
+    assert plan.output_shape == (8, 9, 10)
+    assert_almost_equal(plan(volume), warp(volume, coords, order=1,
+                                           mode='reflect'))
+    plan = WarpPlan(coords, volume.shape, order=3, mode='edge')
+    assert_almost_equal(plan(volume), warp(volume, coords, order=3,
+                                           mode='edge'))
+
+
+def test_warp_plan_float32():
+    image = astronaut()
+    tform = SimilarityTransform(rotation=0.1, translation=(20, -10))
+    plan = WarpPlan(tform.inverse, image.shape[:2], dtype=np.float32)
+    warped = plan(image)
+    assert warped.dtype == np.float32
+    assert_almost_equal(warped, warp(image, tform.inverse), decimal=5)
+
+    with testing.raises(ValueError):
+        plan(image[:100])
+    with testing.raises(ValueError):
+        WarpPlan(tform, image.shape[:2], order=2)
+
+
+@testing.parametrize('mode', ['constant', 'edge', 'symmetric', 'reflect',
+                              'wrap'])
+@testing.parametrize('output_shape', [(15, 20), (50, 33), (31, 41)])
+def test_resize_separable_linear(mode, output_shape):
+    rng = np.random.default_rng(0)
+    image = rng.random((30, 40, 3))
+    expected = resize(image, output_shape, order=1, mode=mode, cval=0.5,
+                      anti_aliasing=False)
+    resized = resize_separable(image, output_shape, mode=mode, cval=0.5,
+                               anti_aliasing=False)
+    assert resized.shape == output_shape + (3,)
+    assert_almost_equal(resized, expected)
+
+
+@testing.parametrize('kernel', ['linear', 'cubic', 'lanczos'])
+def test_resize_separable_kernels(kernel):
+    # constant images are preserved, with or without anti-aliasing
+    image = np.full((40, 30, 20), 0.25, dtype=np.float32)
+    for output_shape in [(10, 15, 7), (60, 31, 20)]:
+        resized = resize_separable(image, output_shape, kernel=kernel)
+        assert resized.dtype == np.float32
+        assert_almost_equal(resized, 0.25, decimal=6)
+
+    # anti-aliasing removes a pattern that cannot be represented
+    stripes = np.zeros((64, 64))
+    stripes[:, ::2] = 1
+    resized = resize_separable(stripes, (16, 16), kernel=kernel)
+    assert_almost_equal(resized, 0.5, decimal=2)
+
+
+def test_resize_separable_invalid():
+    image = np.zeros((10, 10))
+    with testing.raises(ValueError):
+        resize_separable(image, (5, 5), kernel='quintic')
+    with testing.raises(ValueError):
+        resize_separable(image, (5, 5), dtype=np.int32)